@@ -0,0 +1,71 @@
+"""Microbenchmark for iTaK event bus emission.
+
+Measures emits per second for an event type with 0, 1 and 10 registered
+sync handlers: with the caller-side ``has_handlers`` guard (which skips
+building the event), with an unconditional ``emit`` to handlers running in
+the thread pool, and with the same handlers registered ``inline=True``.
+
+Usage:
+    python scripts/bench_event_bus.py [--iterations 200000]
+"""
+
+import argparse
+import time
+
+from itak.events.base_events import BaseEvent
+from itak.events.event_bus import iTaK_event_bus
+
+
+class _BenchEvent(BaseEvent):
+    type: str = "bench"
+    payload: str = "x"
+
+
+def _bench(iterations: int, guarded: bool) -> float:
+    emit = iTaK_event_bus.emit
+    has_handlers = iTaK_event_bus.has_handlers
+    start = time.perf_counter()
+    future = None
+    for _ in range(iterations):
+        if guarded and not has_handlers(_BenchEvent):
+            continue
+        future = emit(None, _BenchEvent())
+    if future is not None:
+        future.result()
+    return iterations / (time.perf_counter() - start)
+
+
+def _register(handler_count: int, inline: bool) -> None:
+    for i in range(handler_count):
+
+        def handler(source, event, _i=i):
+            pass
+
+        iTaK_event_bus.register_handler(_BenchEvent, handler, inline=inline)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'handlers':>8}  {'guarded emits/s':>16}  "
+        f"{'pooled emits/s':>15}  {'inline emits/s':>15}"
+    )
+    for handler_count in (0, 1, 10):
+        with iTaK_event_bus.scoped_handlers():
+            _register(handler_count, inline=False)
+            guarded = _bench(args.iterations, guarded=True)
+            pooled = _bench(args.iterations, guarded=False)
+        with iTaK_event_bus.scoped_handlers():
+            _register(handler_count, inline=True)
+            inline = _bench(args.iterations, guarded=False)
+        print(
+            f"{handler_count:>8}  {guarded:>16,.0f}  "
+            f"{pooled:>15,.0f}  {inline:>15,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -193,6 +193,10 @@ class A2AServerConfig(BaseModel):
         supports_authenticated_extended_card: Whether agent provides extended card to authenticated users.
         url: Preferred endpoint URL for the agent.
         signatures: JSON Web Signatures for the AgentCard.
+        max_concurrent_tasks: Tasks executed at the same time, each on its own
+            copy of the agent.
+        max_queued_tasks: Tasks that may wait for an execution slot before new
+            requests are rejected.
     """
 
     model_config: ClassVar[ConfigDict] = ConfigDict(extra="forbid")
@@ -272,3 +276,13 @@ class A2AServerConfig(BaseModel):
         default_factory=list,
         description="JSON Web Signatures for the AgentCard",
     )
+    max_concurrent_tasks: int = Field(
+        default=4,
+        ge=1,
+        description="Tasks executed concurrently, each on its own copy of the agent",
+    )
+    max_queued_tasks: int = Field(
+        default=64,
+        ge=0,
+        description="Tasks that may wait for an execution slot before requests are rejected",
+    )
@@ -33,6 +33,9 @@ class PollingHandlerKwargs(BaseHandlerKwargs, total=False):
     agent_branch: Any
     history_length: int
     max_polls: int | None
+    initial_interval: float
+    backoff_factor: float
+    jitter: float
 
 
 class StreamingHandlerKwargs(BaseHandlerKwargs, total=False):
@@ -8,15 +8,32 @@ from pydantic import BaseModel, Field
 class PollingConfig(BaseModel):
     """Configuration for polling-based task updates.
 
+    The first poll is immediate. Later polls back off exponentially from
+    ``initial_interval`` up to ``interval``, with random jitter, unless the
+    remote task's metadata requests a delay (``poll_interval`` or
+    ``retry_after``).
+
     Attributes:
-        interval: Seconds between poll attempts.
+        interval: Maximum seconds between poll attempts.
+        initial_interval: Seconds before the second poll attempt.
+        backoff_factor: Growth of the interval after each poll attempt.
+        jitter: Random spread of each interval, as a fraction of it.
         timeout: Max seconds to poll before raising timeout error.
         max_polls: Max number of poll attempts.
         history_length: Number of messages to retrieve per poll.
     """
 
     interval: float = Field(
-        default=2.0, gt=0, description="Seconds between poll attempts"
+        default=2.0, gt=0, description="Maximum seconds between poll attempts"
+    )
+    initial_interval: float = Field(
+        default=0.25, gt=0, description="Seconds before the second poll attempt"
+    )
+    backoff_factor: float = Field(
+        default=2.0, ge=1, description="Interval growth after each poll attempt"
+    )
+    jitter: float = Field(
+        default=0.1, ge=0, lt=1, description="Random spread of each interval"
     )
     timeout: float | None = Field(default=None, gt=0, description="Max seconds to poll")
     max_polls: int | None = Field(default=None, gt=0, description="Max poll attempts")
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
-import time
 from typing import TYPE_CHECKING, Any
 import uuid
 
@@ -14,7 +12,6 @@ from a2a.types import (
     Message,
     Part,
     Role,
-    TaskQueryParams,
     TaskState,
     TextPart,
 )
@@ -22,17 +19,21 @@ from typing_extensions import Unpack
 
 from itak.a2a.errors import A2APollingTimeoutError
 from itak.a2a.task_helpers import (
-    ACTIONABLE_STATES,
-    TERMINAL_STATES,
     TaskStateResult,
     process_task_state,
     send_message_and_get_task_id,
 )
 from itak.a2a.updates.base import PollingHandlerKwargs
+from itak.a2a.updates.polling.scheduler import (
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_INITIAL_INTERVAL,
+    DEFAULT_JITTER,
+    PollBackoff,
+    get_polling_scheduler,
+)
 from itak.events.event_bus import iTaK_event_bus
 from itak.events.types.a2a_events import (
     A2APollingStartedEvent,
-    A2APollingStatusEvent,
     A2AResponseReceivedEvent,
 )
 
@@ -49,17 +50,27 @@ async def _poll_task_until_complete(
     agent_branch: Any | None = None,
     history_length: int = 100,
     max_polls: int | None = None,
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    jitter: float = DEFAULT_JITTER,
 ) -> A2ATask:
     """Poll task status until terminal state reached.
 
+    Polls run on the event loop's shared ``PollingScheduler``: the first
+    poll is immediate, later ones back off from ``initial_interval`` up to
+    ``polling_interval``.
+
     Args:
         client: A2A client instance
         task_id: Task ID to poll
-        polling_interval: Seconds between poll attempts
+        polling_interval: Maximum seconds between poll attempts
         polling_timeout: Max seconds before timeout
         agent_branch: Agent tree branch for logging
         history_length: Number of messages to retrieve per poll
         max_polls: Max number of poll attempts (None = unlimited)
+        initial_interval: Seconds before the second poll attempt
+        backoff_factor: Growth of the interval after each poll attempt
+        jitter: Random spread of each interval, as a fraction of it
 
     Returns:
         Final task object in terminal state
@@ -67,40 +78,21 @@ async def _poll_task_until_complete(
     Raises:
         A2APollingTimeoutError: If polling exceeds timeout or max_polls
     """
-    start_time = time.monotonic()
-    poll_count = 0
-
-    while True:
-        poll_count += 1
-        task = await client.get_task(
-            TaskQueryParams(id=task_id, history_length=history_length)
-        )
-
-        elapsed = time.monotonic() - start_time
-        iTaK_event_bus.emit(
-            agent_branch,
-            A2APollingStatusEvent(
-                task_id=task_id,
-                state=str(task.status.state.value) if task.status.state else "unknown",
-                elapsed_seconds=elapsed,
-                poll_count=poll_count,
-            ),
-        )
-
-        if task.status.state in TERMINAL_STATES | ACTIONABLE_STATES:
-            return task
-
-        if elapsed > polling_timeout:
-            raise A2APollingTimeoutError(
-                f"Polling timeout after {polling_timeout}s ({poll_count} polls)"
-            )
-
-        if max_polls and poll_count >= max_polls:
-            raise A2APollingTimeoutError(
-                f"Max polls ({max_polls}) exceeded after {elapsed:.1f}s"
-            )
-
-        await asyncio.sleep(polling_interval)
+    backoff = PollBackoff(
+        initial_interval=min(initial_interval, polling_interval),
+        max_interval=polling_interval,
+        factor=backoff_factor,
+        jitter=jitter,
+    )
+    return await get_polling_scheduler().poll_until_complete(
+        client=client,
+        task_id=task_id,
+        backoff=backoff,
+        timeout=polling_timeout,
+        agent_branch=agent_branch,
+        history_length=history_length,
+        max_polls=max_polls,
+    )
 
 
 class PollingHandler:
@@ -135,6 +127,9 @@ class PollingHandler:
         agent_role = kwargs.get("agent_role")
         history_length = kwargs.get("history_length", 100)
         max_polls = kwargs.get("max_polls")
+        initial_interval = kwargs.get("initial_interval", DEFAULT_INITIAL_INTERVAL)
+        backoff_factor = kwargs.get("backoff_factor", DEFAULT_BACKOFF_FACTOR)
+        jitter = kwargs.get("jitter", DEFAULT_JITTER)
         context_id = kwargs.get("context_id")
         task_id = kwargs.get("task_id")
 
@@ -170,6 +165,9 @@ class PollingHandler:
                 agent_branch=agent_branch,
                 history_length=history_length,
                 max_polls=max_polls,
+                initial_interval=initial_interval,
+                backoff_factor=backoff_factor,
+                jitter=jitter,
             )
 
             result = process_task_state(
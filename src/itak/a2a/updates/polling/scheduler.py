@@ -0,0 +1,261 @@
+"""Shared, adaptive scheduler for polling remote A2A task status.
+
+All pending remote tasks on an event loop are polled from one scheduler
+loop. Each task starts with short intervals that back off exponentially up
+to a ceiling, with jitter so concurrent delegations do not poll in
+lockstep, and a server can ask for a specific delay through task metadata.
+Polls that fall due together are sent per client in one batch when the
+client offers a ``get_tasks`` method, and concurrently otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import random
+import time
+from typing import TYPE_CHECKING, Any, Final
+import weakref
+
+from a2a.types import TaskQueryParams
+
+from itak.a2a.errors import A2APollingTimeoutError
+from itak.a2a.task_helpers import ACTIONABLE_STATES, TERMINAL_STATES
+from itak.events.event_bus import iTaK_event_bus
+from itak.events.types.a2a_events import A2APollingStatusEvent
+
+
+if TYPE_CHECKING:
+    from a2a.client import Client
+    from a2a.types import Task as A2ATask
+
+
+POLL_HINT_KEYS: Final[tuple[str, ...]] = ("poll_interval", "retry_after")
+"""Task metadata keys a server can use to request the next poll delay."""
+
+DEFAULT_INITIAL_INTERVAL: Final[float] = 0.25
+DEFAULT_BACKOFF_FACTOR: Final[float] = 2.0
+DEFAULT_JITTER: Final[float] = 0.1
+BATCH_WINDOW: Final[float] = 0.05
+"""Polls due within this many seconds of each other are sent together."""
+
+
+@dataclass(frozen=True)
+class PollBackoff:
+    """Delay schedule for one polled task.
+
+    Attributes:
+        initial_interval: Delay before the second poll.
+        max_interval: Ceiling for backed-off delays.
+        factor: Growth factor applied after every poll.
+        jitter: Random spread applied to each delay, as a fraction of it.
+    """
+
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL
+    max_interval: float = 2.0
+    factor: float = DEFAULT_BACKOFF_FACTOR
+    jitter: float = DEFAULT_JITTER
+
+    def delay(self, poll_count: int, hint: float | None = None) -> float:
+        """Seconds to wait after the ``poll_count``-th poll.
+
+        Args:
+            poll_count: Polls made so far (1 after the first poll).
+            hint: Delay requested by the server, used instead of the backoff.
+        """
+        if hint is not None:
+            return max(0.0, hint)
+        base = min(
+            self.max_interval,
+            self.initial_interval * self.factor ** max(0, poll_count - 1),
+        )
+        if self.jitter:
+            base *= 1 + random.uniform(-self.jitter, self.jitter)  # noqa: S311
+        return max(0.0, base)
+
+
+def _poll_hint(task: A2ATask) -> float | None:
+    metadata = getattr(task, "metadata", None) or {}
+    for key in POLL_HINT_KEYS:
+        value = metadata.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return None
+
+
+@dataclass(eq=False)
+class _PollEntry:
+    client: Client
+    task_id: str
+    backoff: PollBackoff
+    timeout: float
+    max_polls: int | None
+    history_length: int
+    agent_branch: Any
+    future: asyncio.Future[A2ATask]
+    started: float = field(default_factory=time.monotonic)
+    poll_count: int = 0
+
+
+class PollingScheduler:
+    """Polls every pending remote task of one event loop from a single loop."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, _PollEntry]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+        self.requests = 0
+        self.batches = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks waiting for their next poll."""
+        return len(self._heap)
+
+    async def poll_until_complete(
+        self,
+        client: Client,
+        task_id: str,
+        backoff: PollBackoff,
+        timeout: float,
+        agent_branch: Any | None = None,
+        history_length: int = 100,
+        max_polls: int | None = None,
+    ) -> A2ATask:
+        """Poll ``task_id`` until it reaches a terminal or actionable state.
+
+        Raises:
+            A2APollingTimeoutError: If polling exceeds ``timeout`` or
+                ``max_polls``.
+        """
+        entry = _PollEntry(
+            client=client,
+            task_id=task_id,
+            backoff=backoff,
+            timeout=timeout,
+            max_polls=max_polls,
+            history_length=history_length,
+            agent_branch=agent_branch,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._schedule(entry, 0.0)
+        return await entry.future
+
+    def _schedule(self, entry: _PollEntry, delay: float) -> None:
+        loop = asyncio.get_running_loop()
+        heapq.heappush(self._heap, (loop.time() + delay, next(self._seq), entry))
+        self._wakeup.set()
+        if self._runner is None or self._runner.done():
+            self._runner = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._heap:
+            delay = self._heap[0][0] - loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            groups: defaultdict[int, list[_PollEntry]] = defaultdict(list)
+            horizon = loop.time() + BATCH_WINDOW
+            while self._heap and self._heap[0][0] <= horizon:
+                entry = heapq.heappop(self._heap)[2]
+                if not entry.future.done():
+                    groups[id(entry.client)].append(entry)
+            for entries in groups.values():
+                group = loop.create_task(self._poll_group(entries))
+                self._inflight.add(group)
+                group.add_done_callback(self._inflight.discard)
+
+    async def _fetch(self, entries: list[_PollEntry]) -> list[Any]:
+        client = entries[0].client
+        params = [
+            TaskQueryParams(id=e.task_id, history_length=e.history_length)
+            for e in entries
+        ]
+        get_tasks = getattr(client, "get_tasks", None)
+        if len(entries) > 1 and callable(get_tasks):
+            self.requests += 1
+            self.batches += 1
+            try:
+                return list(await get_tasks(params))
+            except Exception as e:
+                return [e] * len(entries)
+        self.requests += len(entries)
+        return await asyncio.gather(
+            *(client.get_task(p) for p in params), return_exceptions=True
+        )
+
+    async def _poll_group(self, entries: list[_PollEntry]) -> None:
+        try:
+            results = await self._fetch(entries)
+            for entry, result in zip(entries, results, strict=True):
+                if entry.future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    entry.future.set_exception(result)
+                    continue
+                self._handle(entry, result)
+        except Exception as e:
+            for entry in entries:
+                if not entry.future.done():
+                    entry.future.set_exception(e)
+
+    def _handle(self, entry: _PollEntry, task: A2ATask) -> None:
+        entry.poll_count += 1
+        elapsed = time.monotonic() - entry.started
+        iTaK_event_bus.emit(
+            entry.agent_branch,
+            A2APollingStatusEvent(
+                task_id=entry.task_id,
+                state=str(task.status.state.value) if task.status.state else "unknown",
+                elapsed_seconds=elapsed,
+                poll_count=entry.poll_count,
+            ),
+        )
+
+        if task.status.state in TERMINAL_STATES | ACTIONABLE_STATES:
+            entry.future.set_result(task)
+            return
+        if elapsed > entry.timeout:
+            entry.future.set_exception(
+                A2APollingTimeoutError(
+                    f"Polling timeout after {entry.timeout}s "
+                    f"({entry.poll_count} polls)"
+                )
+            )
+            return
+        if entry.max_polls and entry.poll_count >= entry.max_polls:
+            entry.future.set_exception(
+                A2APollingTimeoutError(
+                    f"Max polls ({entry.max_polls}) exceeded after {elapsed:.1f}s"
+                )
+            )
+            return
+
+        delay = entry.backoff.delay(entry.poll_count, _poll_hint(task))
+        # Poll once more at the deadline rather than sleeping past it.
+        delay = min(delay, max(0.0, entry.timeout - elapsed) + 0.001)
+        self._schedule(entry, delay)
+
+
+_schedulers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, PollingScheduler
+] = weakref.WeakKeyDictionary()
+
+
+def get_polling_scheduler() -> PollingScheduler:
+    """Return the polling scheduler of the running event loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = PollingScheduler()
+    return scheduler
@@ -0,0 +1,308 @@
+"""Admission control and agent pooling for A2A server task execution.
+
+Incoming A2A requests are admitted into a bounded queue and run with a
+bounded number of concurrent executions. Each execution borrows one of a
+fixed set of agent copies, so concurrent requests never share an agent's
+executor or tools handler. Waiting requests are dispatched round-robin
+across ``context_id`` values so one busy conversation cannot starve others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Final, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from itak.agent import Agent
+
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY: Final[int] = 4
+DEFAULT_MAX_QUEUE_SIZE: Final[int] = 64
+LATENCY_SAMPLES: Final[int] = 1024
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a request arrives while the admission queue is full.
+
+    Attributes:
+        queue_depth: Requests waiting when this one was rejected.
+        retry_after: Suggested seconds to wait before retrying.
+    """
+
+    def __init__(self, queue_depth: int, retry_after: float) -> None:
+        super().__init__(
+            f"Server busy: {queue_depth} requests queued, "
+            f"retry after {retry_after:.1f}s"
+        )
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+
+
+def _percentile(samples: deque[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+@dataclass
+class AdmissionMetrics:
+    """Counters and latency samples of an admission controller.
+
+    Latencies are kept for the most recent ``LATENCY_SAMPLES`` requests.
+
+    Attributes:
+        submitted: Requests received.
+        rejected: Requests turned away because the queue was full.
+        completed: Executions that returned.
+        failed: Executions that raised (including cancellations).
+        queue_depth: Requests currently waiting.
+        in_flight: Executions currently running.
+        max_queue_depth: Highest queue depth seen.
+    """
+
+    submitted: int = 0
+    rejected: int = 0
+    completed: int = 0
+    failed: int = 0
+    queue_depth: int = 0
+    in_flight: int = 0
+    max_queue_depth: int = 0
+    queue_wait: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLES)
+    )
+    run_time: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLES)
+    )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the metrics as a plain dict, with p50/p95 latencies."""
+        return {
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_wait_p50": _percentile(self.queue_wait, 50),
+            "queue_wait_p95": _percentile(self.queue_wait, 95),
+            "run_time_p50": _percentile(self.run_time, 50),
+            "run_time_p95": _percentile(self.run_time, 95),
+        }
+
+
+class AgentPool:
+    """Fixed set of agent copies lent out one request at a time.
+
+    Copies are built with ``Agent.copy()``, which gives each its own
+    executor, tools handler and LLM instance.
+
+    Args:
+        agent: Agent to copy.
+        size: Number of copies.
+    """
+
+    def __init__(self, agent: Agent, size: int) -> None:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.agent = agent
+        self.size = size
+        self._idle: list[Agent] = [agent.copy() for _ in range(size)]
+
+    def acquire(self) -> Agent:
+        """Take an idle copy. Callers must hold one of ``size`` slots."""
+        return self._idle.pop()
+
+    def release(self, agent: Agent) -> None:
+        """Return a copy to the pool."""
+        self._idle.append(agent)
+
+
+@dataclass
+class _Waiter:
+    context_id: str
+    future: asyncio.Future[Agent]
+    enqueued_at: float
+
+
+class AdmissionController:
+    """Bounded, fair admission of A2A executions onto a pool of agents.
+
+    Args:
+        agent: Agent whose copies execute requests.
+        max_concurrency: Executions that may run at the same time, which is
+            also the number of agent copies built.
+        max_queue_size: Requests that may wait for a slot; further requests
+            are rejected with ``AdmissionRejectedError``.
+        pool: Run requests on agent copies. Without a pool every request
+            runs on ``agent`` itself and only the concurrency is bounded.
+    """
+
+    def __init__(
+        self,
+        agent: Agent,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        pool: bool = True,
+    ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must not be negative")
+        self.agent = agent
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.metrics = AdmissionMetrics()
+        self._pool = AgentPool(agent, max_concurrency) if pool else None
+        self._queues: dict[str, deque[_Waiter]] = {}
+        self._ready: deque[str] = deque()
+
+    def _take(self) -> Agent:
+        self.metrics.in_flight += 1
+        return self._pool.acquire() if self._pool is not None else self.agent
+
+    def _give_back(self, agent: Agent) -> None:
+        self.metrics.in_flight -= 1
+        if self._pool is not None:
+            self._pool.release(agent)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting requests, one context at a time."""
+        while self._ready and self.metrics.in_flight < self.max_concurrency:
+            context_id = self._ready.popleft()
+            waiters = self._queues[context_id]
+            waiter = waiters.popleft()
+            if waiters:
+                self._ready.append(context_id)
+            else:
+                del self._queues[context_id]
+            self.metrics.queue_depth -= 1
+            if waiter.future.done():
+                continue
+            self.metrics.queue_wait.append(time.monotonic() - waiter.enqueued_at)
+            waiter.future.set_result(self._take())
+
+    def _retry_after(self) -> float:
+        typical = _percentile(self.metrics.run_time, 50) or 1.0
+        return typical * (self.metrics.queue_depth + 1) / self.max_concurrency
+
+    async def _admit(self, context_id: str) -> Agent:
+        self.metrics.submitted += 1
+        if self.metrics.in_flight < self.max_concurrency and not self._ready:
+            self.metrics.queue_wait.append(0.0)
+            return self._take()
+        if self.metrics.queue_depth >= self.max_queue_size:
+            self.metrics.rejected += 1
+            raise AdmissionRejectedError(self.metrics.queue_depth, self._retry_after())
+
+        waiter = _Waiter(
+            context_id=context_id,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.monotonic(),
+        )
+        waiters = self._queues.get(context_id)
+        if waiters is None:
+            waiters = self._queues[context_id] = deque()
+            self._ready.append(context_id)
+        waiters.append(waiter)
+        self.metrics.queue_depth += 1
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self.metrics.queue_depth
+        )
+        try:
+            return await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Cancelled right after being handed an agent.
+                self._give_back(waiter.future.result())
+            else:
+                self._forget(waiter)
+            raise
+
+    def _forget(self, waiter: _Waiter) -> None:
+        waiters = self._queues.get(waiter.context_id)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        self.metrics.queue_depth -= 1
+        if not waiters:
+            del self._queues[waiter.context_id]
+            self._ready.remove(waiter.context_id)
+
+    @asynccontextmanager
+    async def slot(self, context_id: str) -> AsyncIterator[Agent]:
+        """Wait for an execution slot and yield the agent to run on.
+
+        Args:
+            context_id: Conversation the request belongs to, used for fair
+                scheduling between conversations.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full.
+        """
+        agent = await self._admit(context_id)
+        start = time.monotonic()
+        try:
+            yield agent
+        except BaseException:
+            self.metrics.failed += 1
+            raise
+        else:
+            self.metrics.completed += 1
+        finally:
+            self.metrics.run_time.append(time.monotonic() - start)
+            self._give_back(agent)
+
+    async def run(self, context_id: str, fn: Callable[[Agent], Awaitable[T]]) -> T:
+        """Run ``fn`` on a pooled agent once admitted.
+
+        Args:
+            context_id: Conversation the request belongs to.
+            fn: Coroutine function receiving the agent to execute on.
+
+        Returns:
+            The result of ``fn``.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full.
+        """
+        async with self.slot(context_id) as agent:
+            return await fn(agent)
+
+
+_controllers: dict[str, AdmissionController] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_admission_controller(
+    agent: Agent,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+) -> AdmissionController:
+    """Return the admission controller serving ``agent``, creating it once.
+
+    Settings only apply when the controller is created.
+    """
+    key = str(agent.id)
+    with _controllers_lock:
+        controller = _controllers.get(key)
+        if controller is None:
+            controller = AdmissionController(
+                agent, max_concurrency=max_concurrency, max_queue_size=max_queue_size
+            )
+            _controllers[key] = controller
+        return controller
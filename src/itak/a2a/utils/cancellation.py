@@ -0,0 +1,164 @@
+"""Process-wide dispatch of A2A task cancellation signals.
+
+Running tasks register an ``asyncio.Event`` with the hub instead of each
+running its own watcher. Cancellations published in this process set the
+event directly. With a Redis cache, a single pattern subscription on
+``cancel:*`` receives cancellations published by other processes, so the
+idle cost stays constant however many tasks are in flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+import logging
+import threading
+from typing import Any, Final
+
+
+logger = logging.getLogger(__name__)
+
+CANCEL_CHANNEL_PREFIX: Final[str] = "cancel:"
+FALLBACK_POLL_INTERVAL: Final[float] = 0.1
+
+
+def cancel_key(task_id: str) -> str:
+    """Return the cache key and pub/sub channel for ``task_id``'s cancellation."""
+    return f"{CANCEL_CHANNEL_PREFIX}{task_id}"
+
+
+class CancellationHub:
+    """Dispatches cancel signals to the tasks waiting on them.
+
+    Args:
+        cache: aiocache cache where cancel flags are stored.
+        pubsub: Subscribe to cancel messages published through the cache's
+            Redis client. Without it only in-process signals are seen, which
+            covers the in-memory cache.
+    """
+
+    def __init__(self, cache: Any, pubsub: bool = False) -> None:
+        self.cache = cache
+        self.pubsub = pubsub
+        self._lock = threading.Lock()
+        self._events: defaultdict[
+            str, set[tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+        ] = defaultdict(set)
+        self._listener: asyncio.Task[None] | None = None
+
+    @property
+    def watched(self) -> int:
+        """Number of task ids with at least one waiter."""
+        with self._lock:
+            return len(self._events)
+
+    async def watch(self, task_id: str) -> asyncio.Event:
+        """Register interest in ``task_id`` and return its cancel event.
+
+        The event is already set if the task was cancelled before this call.
+        Pair every call with ``unwatch``.
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        with self._lock:
+            self._events[task_id].add((loop, event))
+        if self.pubsub:
+            self._ensure_listener()
+        if await self.cache.get(cancel_key(task_id)):
+            event.set()
+        return event
+
+    def unwatch(self, task_id: str, event: asyncio.Event) -> None:
+        """Drop a registration made by ``watch``."""
+        with self._lock:
+            waiters = self._events.get(task_id)
+            if waiters is None:
+                return
+            waiters.difference_update({w for w in waiters if w[1] is event})
+            if not waiters:
+                del self._events[task_id]
+
+    def signal(self, task_id: str) -> bool:
+        """Wake every waiter of ``task_id``, from any thread or event loop.
+
+        Returns:
+            Whether any waiter was registered in this process.
+        """
+        with self._lock:
+            waiters = list(self._events.get(task_id, ()))
+        for loop, event in waiters:
+            if loop.is_closed():
+                continue
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                event.set()
+            else:
+                loop.call_soon_threadsafe(event.set)
+        return bool(waiters)
+
+    def _ensure_listener(self) -> None:
+        if self._listener is not None and not self._listener.done():
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Receive cancellations from other processes through one subscription."""
+        try:
+            pubsub = self.cache.client.pubsub()
+            await pubsub.psubscribe(f"{CANCEL_CHANNEL_PREFIX}*")
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                self.signal(channel.removeprefix(CANCEL_CHANNEL_PREFIX))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Cancel subscription failed, polling instead: %s", e)
+            await self._poll()
+
+    async def _poll(self) -> None:
+        """Check all watched tasks' cancel flags with one loop."""
+        while True:
+            with self._lock:
+                task_ids = list(self._events)
+            if task_ids:
+                flags = await self.cache.multi_get([cancel_key(t) for t in task_ids])
+                for task_id, flag in zip(task_ids, flags, strict=True):
+                    if flag:
+                        self.signal(task_id)
+            await asyncio.sleep(FALLBACK_POLL_INTERVAL)
+
+    async def aclose(self) -> None:
+        """Stop the pub/sub listener."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+_hub: CancellationHub | None = None
+_hub_lock = threading.Lock()
+
+
+def get_cancellation_hub() -> CancellationHub:
+    """Return the process-wide hub for the default aiocache cache."""
+    global _hub
+    if _hub is None:
+        from aiocache import SimpleMemoryCache, caches  # type: ignore[import-untyped]
+
+        with _hub_lock:
+            if _hub is None:
+                cache = caches.get("default")
+                _hub = CancellationHub(
+                    cache, pubsub=not isinstance(cache, SimpleMemoryCache)
+                )
+    return _hub
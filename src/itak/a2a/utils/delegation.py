@@ -406,6 +406,9 @@ async def _aexecute_a2a_delegation_impl(
                 "polling_timeout": updates.timeout or float(timeout),
                 "history_length": updates.history_length,
                 "max_polls": updates.max_polls,
+                "initial_interval": updates.initial_interval,
+                "backoff_factor": updates.backoff_factor,
+                "jitter": updates.jitter,
             }
         )
     elif isinstance(updates, PushNotificationConfig):
@@ -22,8 +22,14 @@ from a2a.types import (
 )
 from a2a.utils import new_agent_text_message, new_text_artifact
 from a2a.utils.errors import ServerError
-from aiocache import SimpleMemoryCache, caches  # type: ignore[import-untyped]
+from aiocache import caches  # type: ignore[import-untyped]
 
+from itak.a2a.utils.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    get_admission_controller,
+)
+from itak.a2a.utils.cancellation import cancel_key, get_cancellation_hub
 from itak.events.event_bus import iTaK_event_bus
 from itak.events.types.a2a_events import (
     A2AServerTaskCanceledEvent,
@@ -81,8 +87,9 @@ def cancellable(
 ) -> Callable[P, Coroutine[Any, Any, T]]:
     """Decorator that enables cancellation for A2A task execution.
 
-    Runs a cancellation watcher concurrently with the wrapped function.
-    When a cancel event is published, the execution is cancelled.
+    Registers the task with the process-wide ``CancellationHub`` and waits
+    on its cancel event alongside the wrapped function. When a cancel event
+    is published, the execution is cancelled.
 
     Args:
         fn: The async function to wrap.
@@ -106,34 +113,11 @@ def cancellable(
             return await fn(*args, **kwargs)
 
         task_id = context.task_id
-        cache = caches.get("default")
-
-        async def poll_for_cancel() -> bool:
-            """Poll cache for cancellation flag."""
-            while True:
-                if await cache.get(f"cancel:{task_id}"):
-                    return True
-                await asyncio.sleep(0.1)
-
-        async def watch_for_cancel() -> bool:
-            """Watch for cancellation events via pub/sub or polling."""
-            if isinstance(cache, SimpleMemoryCache):
-                return await poll_for_cancel()
-
-            try:
-                client = cache.client
-                pubsub = client.pubsub()
-                await pubsub.subscribe(f"cancel:{task_id}")
-                async for message in pubsub.listen():
-                    if message["type"] == "message":
-                        return True
-            except Exception as e:
-                logger.warning("Cancel watcher error for task_id=%s: %s", task_id, e)
-                return await poll_for_cancel()
-            return False
+        hub = get_cancellation_hub()
+        cancelled = await hub.watch(task_id)
 
         execute_task = asyncio.create_task(fn(*args, **kwargs))
-        cancel_watch = asyncio.create_task(watch_for_cancel())
+        cancel_watch = asyncio.create_task(cancelled.wait())
 
         try:
             done, _ = await asyncio.wait(
@@ -151,23 +135,45 @@ def cancellable(
             cancel_watch.cancel()
             return execute_task.result()
         finally:
-            await cache.delete(f"cancel:{task_id}")
+            hub.unwatch(task_id, cancelled)
+            await hub.cache.delete(cancel_key(task_id))
 
     return wrapper
 
 
+def _admission_for(agent: Agent) -> AdmissionController:
+    """Return the admission controller for ``agent``, sized by its server config."""
+    from itak.a2a.utils.agent_card import _get_server_config
+
+    server_config = _get_server_config(agent)
+    if server_config is None:
+        return get_admission_controller(agent)
+    return get_admission_controller(
+        agent,
+        max_concurrency=server_config.max_concurrent_tasks,
+        max_queue_size=server_config.max_queued_tasks,
+    )
+
+
 @cancellable
 async def execute(
     agent: Agent,
     context: RequestContext,
     event_queue: EventQueue,
+    admission: AdmissionController | None = None,
 ) -> None:
     """Execute an A2A task using a iTaK agent.
 
+    Requests go through an ``AdmissionController``: at most
+    ``max_concurrent_tasks`` run at once, each on its own copy of ``agent``,
+    and requests beyond ``max_queued_tasks`` waiting are rejected.
+
     Args:
         agent: The iTaK agent to execute the task.
         context: The A2A request context containing the user's message.
         event_queue: The event queue for sending responses back.
+        admission: Admission controller to run on. Defaults to the shared
+            controller for ``agent``, configured from its ``A2AServerConfig``.
 
     TODOs:
         * need to impl both of structured output and file inputs, depends on `file_inputs` for
@@ -176,7 +182,6 @@ async def execute(
         * file inputs ingestion, `file_inputs = get_file_parts(parts=context.message.parts)`
     """
 
-    user_message = context.get_user_input()
     task_id = context.task_id
     context_id = context.context_id
     if task_id is None or context_id is None:
@@ -187,10 +192,39 @@ async def execute(
         )
         raise ServerError(InvalidParamsError(message=msg)) from None
 
+    admission = admission or _admission_for(agent)
+    try:
+        async with admission.slot(context_id) as worker:
+            await _execute_on(agent, worker, context, event_queue)
+    except AdmissionRejectedError as e:
+        iTaK_event_bus.emit(
+            agent,
+            A2AServerTaskFailedEvent(
+                a2a_task_id=task_id, a2a_context_id=context_id, error=str(e)
+            ),
+        )
+        raise ServerError(
+            error=InternalError(
+                message=str(e),
+                data={"retry_after": e.retry_after, "queue_depth": e.queue_depth},
+            )
+        ) from e
+
+
+async def _execute_on(
+    agent: Agent,
+    worker: Agent,
+    context: RequestContext,
+    event_queue: EventQueue,
+) -> None:
+    """Run an admitted request on ``worker``, reporting events as ``agent``."""
+    user_message = context.get_user_input()
+    task_id = cast(str, context.task_id)
+    context_id = cast(str, context.context_id)
     task = Task(
         description=user_message,
         expected_output="Response to the user's request",
-        agent=agent,
+        agent=worker,
     )
 
     iTaK_event_bus.emit(
@@ -199,7 +233,7 @@ async def execute(
     )
 
     try:
-        result = await agent.aexecute_task(task=task, tools=agent.tools)
+        result = await worker.aexecute_task(task=task, tools=worker.tools)
         result_str = str(result)
         history: list[Message] = [context.message] if context.message else []
         history.append(new_agent_text_message(result_str, context_id, task_id))
@@ -263,11 +297,11 @@ async def cancel(
     ):
         return context.current_task
 
-    cache = caches.get("default")
-
-    await cache.set(f"cancel:{task_id}", True, ttl=3600)
-    if not isinstance(cache, SimpleMemoryCache):
-        await cache.client.publish(f"cancel:{task_id}", "cancel")
+    hub = get_cancellation_hub()
+    await hub.cache.set(cancel_key(task_id), True, ttl=3600)
+    hub.signal(task_id)
+    if hub.pubsub:
+        await hub.cache.client.publish(cancel_key(task_id), "cancel")
 
     await event_queue.enqueue_event(
         TaskStatusUpdateEvent(
@@ -63,15 +63,14 @@ from itak.rag.embeddings.types import EmbedderConfig
 from itak.security.fingerprint import Fingerprint
 from itak.tools.agent_tools.agent_tools import AgentTools
 from itak.utilities.agent_utils import (
-    get_tool_names,
     load_agent_from_repository,
     parse_tools,
-    render_text_description_and_args,
 )
 from itak.utilities.constants import TRAINED_AGENTS_DATA_FILE, TRAINING_DATA_FILE
 from itak.utilities.converter import Converter
 from itak.utilities.guardrail_types import GuardrailType
 from itak.utilities.llm_utils import create_llm
+from itak.utilities.prompt_cache import PromptCompiler
 from itak.utilities.prompts import Prompts, StandardPromptResult, SystemPromptResult
 from itak.utilities.token_counter_callback import TokenCalcHandler
 from itak.utilities.training_handler import CrewTrainingHandler
@@ -136,6 +135,7 @@ class Agent(BaseAgent):
     _times_executed: int = PrivateAttr(default=0)
     _mcp_clients: list[Any] = PrivateAttr(default_factory=list)
     _last_messages: list[LLMMessage] = PrivateAttr(default_factory=list)
+    _prompt_compiler: PromptCompiler = PrivateAttr(default_factory=PromptCompiler)
     max_execution_time: int | None = Field(
         default=None,
         description="Maximum execution time for an agent to execute a task",
@@ -170,6 +170,23 @@ class Agent(BaseAgent):
         default=True,
         description="Keep messages under the context window size by summarizing content.",
     )
+    observation_window: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Number of recent tool observations kept verbatim in the prompt. "
+            "Older ones are elided to a recallable stub and folded into a "
+            "running summary. None keeps the full history."
+        ),
+    )
+    max_parallel_tool_calls: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Maximum number of tool calls from a single native function-calling "
+            "response executed concurrently. 1 runs them one after another."
+        ),
+    )
     max_retry_limit: int = Field(
         default=2,
         description="Maximum number of retries for an agent to execute a task when an error occurs.",
@@ -725,15 +742,17 @@ class Agent(BaseAgent):
         raw_tools: list[BaseTool] = tools or self.tools or []
         parsed_tools = parse_tools(raw_tools)
 
-        prompt = Prompts(
-            agent=self,
-            has_tools=len(raw_tools) > 0,
-            i18n=self.i18n,
-            use_system_prompt=self.use_system_prompt,
-            system_template=self.system_template,
-            prompt_template=self.prompt_template,
-            response_template=self.response_template,
-        ).task_execution()
+        prompt = self._prompt_compiler.task_execution(
+            Prompts(
+                agent=self,
+                has_tools=len(raw_tools) > 0,
+                i18n=self.i18n,
+                use_system_prompt=self.use_system_prompt,
+                system_template=self.system_template,
+                prompt_template=self.prompt_template,
+                response_template=self.response_template,
+            )
+        )
 
         stop_words = [self.i18n.slice("observation")]
 
@@ -756,6 +775,9 @@ class Agent(BaseAgent):
                 rpm_limit_fn=rpm_limit_fn,
             )
         else:
+            tools_names, tools_description = self._prompt_compiler.render_tools(
+                parsed_tools
+            )
             self.agent_executor = self.executor_class(
                 llm=cast(BaseLLM, self.llm),
                 task=task,  # type: ignore[arg-type]
@@ -768,8 +790,8 @@ class Agent(BaseAgent):
                 stop_words=stop_words,
                 max_iter=self.max_iter,
                 tools_handler=self.tools_handler,
-                tools_names=get_tool_names(parsed_tools),
-                tools_description=render_text_description_and_args(parsed_tools),
+                tools_names=tools_names,
+                tools_description=tools_description,
                 step_callback=self.step_callback,
                 function_calling_llm=self.function_calling_llm,
                 respect_context_window=self.respect_context_window,
@@ -802,8 +824,10 @@ class Agent(BaseAgent):
         self.agent_executor.original_tools = raw_tools
         self.agent_executor.prompt = prompt
         self.agent_executor.stop = stop_words
-        self.agent_executor.tools_names = get_tool_names(tools)
-        self.agent_executor.tools_description = render_text_description_and_args(tools)
+        (
+            self.agent_executor.tools_names,
+            self.agent_executor.tools_description,
+        ) = self._prompt_compiler.render_tools(tools)
         self.agent_executor.response_model = task.response_model if task else None
 
         self.agent_executor.tools_handler = self.tools_handler
@@ -820,7 +844,9 @@ class Agent(BaseAgent):
             )
 
     def get_delegation_tools(self, agents: list[BaseAgent]) -> list[BaseTool]:
-        agent_tools = AgentTools(agents=agents)
+        agent_tools = AgentTools(
+            agents=agents, parallel_delegation=self.allow_parallel_delegation
+        )
         return agent_tools.tools()
 
     def get_platform_tools(self, apps: list[PlatformAppOrAction]) -> list[BaseTool]:
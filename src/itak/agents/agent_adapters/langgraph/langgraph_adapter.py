@@ -283,7 +283,9 @@ class LangGraphAgentAdapter(BaseAgentAdapter):
         Returns:
             List of delegation tools.
         """
-        agent_tools: AgentTools = AgentTools(agents=agents)
+        agent_tools: AgentTools = AgentTools(
+            agents=agents, parallel_delegation=self.allow_parallel_delegation
+        )
         return agent_tools.tools()
 
     @staticmethod
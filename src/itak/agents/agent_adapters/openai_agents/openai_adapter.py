@@ -232,7 +232,9 @@ class OpenAIAgentAdapter(BaseAgentAdapter):
         Returns:
             List of delegation tools.
         """
-        agent_tools: AgentTools = AgentTools(agents=agents)
+        agent_tools: AgentTools = AgentTools(
+            agents=agents, parallel_delegation=self.allow_parallel_delegation
+        )
         return agent_tools.tools()
 
     def configure_structured_output(self, task: Any) -> None:
@@ -71,6 +71,8 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
         verbose (bool): Verbose mode for the Agent Execution.
         max_rpm (int | None): Maximum number of requests per minute for the agent execution.
         allow_delegation (bool): Allow delegation of tasks to agents.
+        allow_parallel_delegation (bool): Also offer the tool delegating several
+            tasks to coworkers at once.
         tools (list[Any] | None): Tools at the agent's disposal.
         max_iter (int): Maximum iterations for an agent to execute a task.
         agent_executor: An instance of the CrewAgentExecutor class.
@@ -137,6 +139,10 @@ class BaseAgent(BaseModel, ABC, metaclass=AgentMeta):
         default=False,
         description="Enable agent to delegate and ask questions among each other.",
     )
+    allow_parallel_delegation: bool = Field(
+        default=False,
+        description="Also offer the tool delegating several tasks to coworkers at once.",
+    )
     tools: list[BaseTool] | None = Field(
         default_factory=list, description="Tools at agents' disposal"
     )
@@ -14,6 +14,7 @@ from pydantic import BaseModel, GetCoreSchemaHandler, ValidationError
 from pydantic_core import CoreSchema, core_schema
 
 from itak.agents.agent_builder.base_agent_executor_mixin import CrewAgentExecutorMixin
+from itak.agents.message_history import MessageHistory
 from itak.agents.parser import (
     AgentAction,
     AgentFinish,
@@ -28,9 +29,11 @@ from itak.hooks.llm_hooks import (
     get_after_llm_call_hooks,
     get_before_llm_call_hooks,
 )
+from itak.tools.tool_types import ToolResult
 from itak.utilities.agent_utils import (
     aget_llm_response,
     enforce_rpm_limit,
+    exceeds_context_window,
     format_message_for_llm,
     get_llm_response,
     handle_agent_action_core,
@@ -62,7 +65,6 @@ if TYPE_CHECKING:
     from itak.task import Task
     from itak.tools.base_tool import BaseTool
     from itak.tools.structured_tool import CrewStructuredTool
-    from itak.tools.tool_types import ToolResult
     from itak.utilities.prompts import StandardPromptResult, SystemPromptResult
     from itak.utilities.types import LLMMessage
 
@@ -140,6 +142,10 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
         self.response_model = response_model
         self.ask_for_human_input = False
         self.messages: list[LLMMessage] = []
+        observation_window = getattr(agent, "observation_window", None)
+        self.history: MessageHistory | None = (
+            MessageHistory(keep_last=observation_window) if observation_window else None
+        )
         self.iterations = 0
         self.log_error_after = 3
         self.before_llm_call_hooks: list[Callable[..., Any]] = []
@@ -234,6 +240,20 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
 
                 enforce_rpm_limit(self.request_within_rpm_limit)
 
+                # Budget the prompt locally instead of waiting for the provider
+                # to reject it after a full round trip.
+                if self.respect_context_window and exceeds_context_window(
+                    self.messages, self.llm
+                ):
+                    handle_context_length(
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                        i18n=self._i18n,
+                    )
+
                 answer = get_llm_response(
                     llm=self.llm,
                     messages=self.messages,
@@ -273,25 +293,27 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                             )
                         }
 
-                    tool_result = execute_tool_and_check_finality(
-                        agent_action=formatted_answer,
-                        fingerprint_context=fingerprint_context,
-                        tools=self.tools,
-                        i18n=self._i18n,
-                        agent_key=self.agent.key if self.agent else None,
-                        agent_role=self.agent.role if self.agent else None,
-                        tools_handler=self.tools_handler,
-                        task=self.task,
-                        agent=self.agent,
-                        function_calling_llm=self.function_calling_llm,
-                        crew=self.crew,
-                    )
+                    tool_result = self._recall_observation(formatted_answer)
+                    if tool_result is None:
+                        tool_result = execute_tool_and_check_finality(
+                            agent_action=formatted_answer,
+                            fingerprint_context=fingerprint_context,
+                            tools=self.tools,
+                            i18n=self._i18n,
+                            agent_key=self.agent.key if self.agent else None,
+                            agent_role=self.agent.role if self.agent else None,
+                            tools_handler=self.tools_handler,
+                            task=self.task,
+                            agent=self.agent,
+                            function_calling_llm=self.function_calling_llm,
+                            crew=self.crew,
+                        )
                     formatted_answer = self._handle_agent_action(
                         formatted_answer, tool_result
                     )
 
                 self._invoke_step_callback(formatted_answer)  # type: ignore[arg-type]
-                self._append_message(formatted_answer.text)  # type: ignore[union-attr]
+                self._record_step(formatted_answer)  # type: ignore[arg-type]
 
             except OutputParserError as e:
                 formatted_answer = handle_output_parser_exception(  # type: ignore[assignment]
@@ -401,6 +423,20 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
 
                 enforce_rpm_limit(self.request_within_rpm_limit)
 
+                # Budget the prompt locally instead of waiting for the provider
+                # to reject it after a full round trip.
+                if self.respect_context_window and exceeds_context_window(
+                    self.messages, self.llm
+                ):
+                    handle_context_length(
+                        respect_context_window=self.respect_context_window,
+                        printer=self._printer,
+                        messages=self.messages,
+                        llm=self.llm,
+                        callbacks=self.callbacks,
+                        i18n=self._i18n,
+                    )
+
                 answer = await aget_llm_response(
                     llm=self.llm,
                     messages=self.messages,
@@ -440,25 +476,27 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
                             )
                         }
 
-                    tool_result = await aexecute_tool_and_check_finality(
-                        agent_action=formatted_answer,
-                        fingerprint_context=fingerprint_context,
-                        tools=self.tools,
-                        i18n=self._i18n,
-                        agent_key=self.agent.key if self.agent else None,
-                        agent_role=self.agent.role if self.agent else None,
-                        tools_handler=self.tools_handler,
-                        task=self.task,
-                        agent=self.agent,
-                        function_calling_llm=self.function_calling_llm,
-                        crew=self.crew,
-                    )
+                    tool_result = self._recall_observation(formatted_answer)
+                    if tool_result is None:
+                        tool_result = await aexecute_tool_and_check_finality(
+                            agent_action=formatted_answer,
+                            fingerprint_context=fingerprint_context,
+                            tools=self.tools,
+                            i18n=self._i18n,
+                            agent_key=self.agent.key if self.agent else None,
+                            agent_role=self.agent.role if self.agent else None,
+                            tools_handler=self.tools_handler,
+                            task=self.task,
+                            agent=self.agent,
+                            function_calling_llm=self.function_calling_llm,
+                            crew=self.crew,
+                        )
                     formatted_answer = self._handle_agent_action(
                         formatted_answer, tool_result
                     )
 
                 self._invoke_step_callback(formatted_answer)  # type: ignore[arg-type]
-                self._append_message(formatted_answer.text)  # type: ignore[union-attr]
+                self._record_step(formatted_answer)  # type: ignore[arg-type]
 
             except OutputParserError as e:
                 formatted_answer = handle_output_parser_exception(  # type: ignore[assignment]
@@ -525,6 +563,30 @@ class CrewAgentExecutor(CrewAgentExecutorMixin):
             show_logs=self._show_logs,
         )
 
+    def _recall_observation(self, formatted_answer: AgentAction) -> ToolResult | None:
+        """Serve a ``recall_observation`` action from the message history.
+
+        Args:
+            formatted_answer: Agent's action to execute.
+
+        Returns:
+            The stored observation, or None if the action is a regular tool call.
+        """
+        if self.history is None or not self.history.is_recall(formatted_answer):
+            return None
+        return ToolResult(result=self.history.recall(formatted_answer.tool_input))
+
+    def _record_step(self, formatted_answer: AgentAction | AgentFinish) -> None:
+        """Add a finished step to the conversation history.
+
+        Args:
+            formatted_answer: Current agent response.
+        """
+        if self.history is not None and isinstance(formatted_answer, AgentAction):
+            self.history.append_step(self.messages, formatted_answer)
+        else:
+            self._append_message(formatted_answer.text)
+
     def _invoke_step_callback(
         self, formatted_answer: AgentAction | AgentFinish
     ) -> None:
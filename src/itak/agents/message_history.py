@@ -0,0 +1,192 @@
+"""Bounded ReAct message history for agent executors.
+
+Every ReAct step used to stay in the prompt with its full tool observation,
+so prompts grew with each iteration and large observations were re-sent on
+every step. ``MessageHistory`` keeps the last few observations verbatim,
+replaces older ones with a short stub that points at an out-of-band copy,
+and folds the oldest steps into a single summary message that is extended
+incrementally. Agents re-fetch an elided observation through the
+``recall_observation`` action named in each stub.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+import json
+from typing import TYPE_CHECKING, Final
+
+
+if TYPE_CHECKING:
+    from itak.agents.parser import AgentAction
+    from itak.utilities.types import LLMMessage
+
+
+RECALL_TOOL_NAME: Final[str] = "recall_observation"
+OBSERVATION_MARKER: Final[str] = "\nObservation: "
+SUMMARY_HEADER: Final[str] = "Summary of earlier steps:"
+
+
+def _one_line(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+@dataclass(eq=False)
+class _Step:
+    message: LLMMessage
+    prefix: str
+    tool: str
+    tool_input: str
+    observation_id: str
+    observation_size: int
+    preview: str
+    stubbed: bool = False
+
+
+class MessageHistory:
+    """Keeps a ReAct message list close to a constant size.
+
+    Args:
+        keep_last: Steps whose observation stays verbatim in the prompt.
+        keep_stubs: Older steps kept as separate messages with a stubbed
+            observation before they are folded into the summary.
+        preview_chars: Characters of an elided observation shown in its stub.
+        min_elide_chars: Observations shorter than this are never elided.
+        max_stored: Observations kept for recall; the oldest are dropped.
+        max_summary_lines: Folded steps listed in the summary; older lines
+            collapse into a count so the summary stays bounded too.
+    """
+
+    def __init__(
+        self,
+        keep_last: int = 3,
+        keep_stubs: int = 4,
+        preview_chars: int = 200,
+        min_elide_chars: int = 400,
+        max_stored: int = 256,
+        max_summary_lines: int = 12,
+    ) -> None:
+        if keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
+        self.keep_last = keep_last
+        self.keep_stubs = keep_stubs
+        self.preview_chars = preview_chars
+        self.min_elide_chars = min_elide_chars
+        self.max_stored = max_stored
+        self.max_summary_lines = max_summary_lines
+        self._observations: OrderedDict[str, str] = OrderedDict()
+        self._steps: list[_Step] = []
+        self._summary: LLMMessage | None = None
+        self._summary_lines: deque[str] = deque(maxlen=max_summary_lines)
+        self._summarized = 0
+        self._counter = 0
+
+    def store(self, observation: str) -> str:
+        """Store an observation out of band and return its id."""
+        self._counter += 1
+        observation_id = f"obs-{self._counter}"
+        self._observations[observation_id] = observation
+        while len(self._observations) > self.max_stored:
+            self._observations.popitem(last=False)
+        return observation_id
+
+    def recall(self, tool_input: str) -> str:
+        """Return a stored observation for a ``recall_observation`` action.
+
+        Args:
+            tool_input: The action input: an id or ``{"observation_id": id}``.
+        """
+        observation_id = tool_input.strip().strip('"')
+        try:
+            parsed = json.loads(tool_input)
+        except (TypeError, ValueError):
+            parsed = None
+        if isinstance(parsed, dict):
+            observation_id = str(parsed.get("observation_id", "")).strip()
+        observation = self._observations.get(observation_id)
+        if observation is None:
+            known = ", ".join(list(self._observations)[-5:]) or "none"
+            return (
+                f"No stored observation with id '{observation_id}'. "
+                f"Recent ids: {known}."
+            )
+        return observation
+
+    def is_recall(self, action: AgentAction) -> bool:
+        """Whether the agent asked to re-read an elided observation."""
+        return action.tool.strip().casefold() == RECALL_TOOL_NAME
+
+    def append_step(self, messages: list[LLMMessage], action: AgentAction) -> None:
+        """Append a completed ReAct step and compact older steps.
+
+        Args:
+            messages: The executor's message list, modified in place.
+            action: The step, with its observation in ``action.result`` and
+                appended to ``action.text``.
+        """
+        observation = "" if action.result is None else str(action.result)
+        suffix = f"{OBSERVATION_MARKER}{observation}"
+        text = action.text.rstrip()
+        if not action.text.endswith(suffix) or self.is_recall(action):
+            messages.append({"role": "assistant", "content": text})
+            self.compact(messages)
+            return
+        message: LLMMessage = {"role": "assistant", "content": text}
+        messages.append(message)
+        self._steps.append(
+            _Step(
+                message=message,
+                prefix=action.text[: -len(suffix)],
+                tool=action.tool,
+                tool_input=action.tool_input,
+                observation_id=self.store(observation),
+                observation_size=len(observation),
+                preview=_one_line(observation, self.preview_chars),
+            )
+        )
+        self.compact(messages)
+
+    def compact(self, messages: list[LLMMessage]) -> None:
+        """Stub old observations and fold the oldest steps into the summary."""
+        present = {id(message) for message in messages}
+        self._steps = [s for s in self._steps if id(s.message) in present]
+        older = self._steps[: -self.keep_last]
+        for step in older:
+            if not step.stubbed and step.observation_size >= self.min_elide_chars:
+                step.message["content"] = self._stub(step)
+                step.stubbed = True
+
+        fold = older[: max(0, len(older) - self.keep_stubs)]
+        if not fold:
+            return
+        folded = {id(step.message) for step in fold}
+        self._summary_lines.extend(self._summary_line(step) for step in fold)
+        self._summarized += len(fold)
+        if self._summary is None or id(self._summary) not in present:
+            self._summary = {"role": "assistant", "content": SUMMARY_HEADER}
+            position = next(i for i, m in enumerate(messages) if id(m) in folded)
+            messages.insert(position, self._summary)
+        header = [SUMMARY_HEADER]
+        omitted = self._summarized - len(self._summary_lines)
+        if omitted:
+            header.append(f"- ({omitted} earlier steps omitted)")
+        self._summary["content"] = "\n".join([*header, *self._summary_lines])
+        messages[:] = [m for m in messages if id(m) not in folded]
+        self._steps = self._steps[len(fold) :]
+
+    def _stub(self, step: _Step) -> str:
+        recall = json.dumps({"observation_id": step.observation_id})
+        return (
+            f"{step.prefix}{OBSERVATION_MARKER}[{step.observation_id}, "
+            f"{step.observation_size} chars elided] {step.preview}\n"
+            f"(To read it in full, use the tool `{RECALL_TOOL_NAME}` with "
+            f"input {recall}.)"
+        )
+
+    def _summary_line(self, step: _Step) -> str:
+        return (
+            f"- {step.tool}({_one_line(step.tool_input, 80)}) -> "
+            f"[{step.observation_id}, {step.observation_size} chars] "
+            f"{_one_line(step.preview, 60)}"
+        )
@@ -121,6 +121,8 @@ class Crew(FlowTrackable, BaseModel):
         agents: list of agents part of this crew.
         manager_llm: The language model that will run manager agent.
         manager_agent: Custom agent that will be used as manager.
+        allow_parallel_delegation: Whether the hierarchical manager may delegate
+            several tasks to coworkers at once.
         memory: Whether the crew should use memory to store memories of it's
             execution.
         cache: Whether the crew should use a cache to store the results of the
@@ -209,6 +211,10 @@ class Crew(FlowTrackable, BaseModel):
     manager_agent: BaseAgent | None = Field(
         description="Custom agent that will be used as manager.", default=None
     )
+    allow_parallel_delegation: bool = Field(
+        default=False,
+        description="Let the hierarchical manager delegate several tasks at once.",
+    )
     function_calling_llm: str | InstanceOf[LLM] | Any | None = Field(
         description="Language model that will run the agent.", default=None
     )
@@ -1080,6 +1086,8 @@ class Crew(FlowTrackable, BaseModel):
     def _create_manager_agent(self) -> None:
         if self.manager_agent is not None:
             self.manager_agent.allow_delegation = True
+            if self.allow_parallel_delegation:
+                self.manager_agent.allow_parallel_delegation = True
             manager = self.manager_agent
             if manager.tools is not None and len(manager.tools) > 0:
                 self._logger.log(
@@ -1096,8 +1104,12 @@ class Crew(FlowTrackable, BaseModel):
                 role=i18n.retrieve("hierarchical_manager_agent", "role"),
                 goal=i18n.retrieve("hierarchical_manager_agent", "goal"),
                 backstory=i18n.retrieve("hierarchical_manager_agent", "backstory"),
-                tools=AgentTools(agents=self.agents).tools(),
+                tools=AgentTools(
+                    agents=self.agents,
+                    parallel_delegation=self.allow_parallel_delegation,
+                ).tools(),
                 allow_delegation=True,
+                allow_parallel_delegation=self.allow_parallel_delegation,
                 llm=self.manager_llm,
                 verbose=self.verbose,
             )
@@ -36,6 +36,9 @@ from itak.utilities.rw_lock import RWLock
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# (pooled sync handlers, inline sync handlers, async handlers, has dependencies)
+DispatchEntry = tuple[SyncHandlerSet, SyncHandlerSet, AsyncHandlerSet, bool]
+
 
 class iTaKEventsBus:
     """Singleton event bus for handling events in iTaK.
@@ -45,8 +48,10 @@ class iTaKEventsBus:
     in a dedicated background event loop.
 
     Synchronous handlers execute in a thread pool executor to ensure completion
-    before program exit. Asynchronous handlers execute in a dedicated event loop
-    running in a daemon thread, with graceful shutdown waiting for completion.
+    before program exit, unless they were registered with ``inline=True``, in
+    which case they run directly in the emitting thread. Asynchronous handlers
+    execute in a dedicated event loop running in a daemon thread, with graceful
+    shutdown waiting for completion.
 
     Attributes:
         _instance: Singleton instance of the event bus
@@ -54,6 +59,12 @@ class iTaKEventsBus:
         _rwlock: Read-write lock for handler registration and access (instance-level)
         _sync_handlers: Mapping of event types to registered synchronous handlers
         _async_handlers: Mapping of event types to registered asynchronous handlers
+        _inline_handlers: Mapping of event types to the sync handlers that run
+            in the emitting thread instead of the thread pool
+        _dispatch_snapshot: Copy-on-write mapping of event types to their
+            `DispatchEntry`, replaced wholesale on every registration change
+            and read without locking
+        _shutdown_event: Set once shutdown starts; emitters check it lock-free
         _sync_executor: Thread pool executor for running synchronous handlers
         _loop: Dedicated asyncio event loop for async handler execution
         _loop_thread: Background daemon thread running the event loop
@@ -67,8 +78,9 @@ class iTaKEventsBus:
     _async_handlers: dict[type[BaseEvent], AsyncHandlerSet]
     _handler_dependencies: dict[type[BaseEvent], dict[Handler, list[Depends[Any]]]]
     _execution_plan_cache: dict[type[BaseEvent], ExecutionPlan]
+    _dispatch_snapshot: dict[type[BaseEvent], DispatchEntry]
     _console: ConsoleFormatter
-    _shutting_down: bool
+    _shutdown_event: threading.Event
 
     def __new__(cls) -> Self:
         """Create or return the singleton instance.
@@ -89,14 +101,16 @@ class iTaKEventsBus:
         Creates handler dictionaries and starts a dedicated background
         event loop for async handler execution.
         """
-        self._shutting_down = False
+        self._shutdown_event = threading.Event()
         self._rwlock = RWLock()
         self._sync_handlers: dict[type[BaseEvent], SyncHandlerSet] = {}
         self._async_handlers: dict[type[BaseEvent], AsyncHandlerSet] = {}
+        self._inline_handlers: dict[type[BaseEvent], SyncHandlerSet] = {}
         self._handler_dependencies: dict[
             type[BaseEvent], dict[Handler, list[Depends[Any]]]
         ] = {}
         self._execution_plan_cache: dict[type[BaseEvent], ExecutionPlan] = {}
+        self._dispatch_snapshot: dict[type[BaseEvent], DispatchEntry] = {}
         self._sync_executor = ThreadPoolExecutor(
             max_workers=10,
             thread_name_prefix="iTaKSyncHandler",
@@ -116,11 +130,54 @@ class iTaKEventsBus:
         asyncio.set_event_loop(self._loop)
         self._loop.run_forever()
 
+    def _rebuild_dispatch_snapshot(self) -> None:
+        """Publish a fresh handler snapshot for lock-free readers.
+
+        Must be called with the write lock held. The previous snapshot is
+        never mutated, so readers holding a reference to it stay consistent.
+        Stream chunk handlers are always inline to preserve chunk ordering.
+        """
+        snapshot: dict[type[BaseEvent], DispatchEntry] = {}
+        for event_type in self._sync_handlers.keys() | self._async_handlers.keys():
+            sync_handlers = self._sync_handlers.get(event_type, frozenset())
+            if event_type is LLMStreamChunkEvent:
+                inline = sync_handlers
+            else:
+                inline = sync_handlers & self._inline_handlers.get(
+                    event_type, frozenset()
+                )
+            snapshot[event_type] = (
+                sync_handlers - inline,
+                inline,
+                self._async_handlers.get(event_type, frozenset()),
+                event_type in self._handler_dependencies,
+            )
+        self._dispatch_snapshot = snapshot
+
+    def has_handlers(self, event_type: type[BaseEvent]) -> bool:
+        """Check whether any handler is registered for an event type.
+
+        Lock-free and cheap enough for hot paths: emitters can call it before
+        building an event so that nothing is constructed when nobody listens.
+
+        Args:
+            event_type: The event class to check
+
+        Returns:
+            True if at least one sync or async handler is registered
+
+        Example:
+            >>> if iTaK_event_bus.has_handlers(LLMStreamChunkEvent):
+            ...     iTaK_event_bus.emit(self, LLMStreamChunkEvent(chunk=chunk))
+        """
+        return event_type in self._dispatch_snapshot
+
     def _register_handler(
         self,
         event_type: type[BaseEvent],
         handler: Callable[..., Any],
         dependencies: list[Depends[Any]] | None = None,
+        inline: bool = False,
     ) -> None:
         """Register a handler for the given event type.
 
@@ -128,6 +185,7 @@ class iTaKEventsBus:
             event_type: The event class to listen for
             handler: The handler function to register
             dependencies: Optional list of dependencies
+            inline: Run a sync handler in the emitting thread
         """
         with self._rwlock.w_locked():
             if is_async_handler(handler):
@@ -136,6 +194,11 @@ class iTaKEventsBus:
             else:
                 existing_sync = self._sync_handlers.get(event_type, frozenset())
                 self._sync_handlers[event_type] = existing_sync | {handler}
+                if inline:
+                    existing_inline = self._inline_handlers.get(
+                        event_type, frozenset()
+                    )
+                    self._inline_handlers[event_type] = existing_inline | {handler}
 
             if dependencies:
                 if event_type not in self._handler_dependencies:
@@ -143,11 +206,13 @@ class iTaKEventsBus:
                 self._handler_dependencies[event_type][handler] = dependencies
 
             self._execution_plan_cache.pop(event_type, None)
+            self._rebuild_dispatch_snapshot()
 
     def on(
         self,
         event_type: type[BaseEvent],
         depends_on: Depends[Any] | list[Depends[Any]] | None = None,
+        inline: bool = False,
     ) -> Callable[[Callable[P, R]], Callable[P, R]]:
         """Decorator to register an event handler for a specific event type.
 
@@ -155,6 +220,9 @@ class iTaKEventsBus:
             event_type: The event class to listen for
             depends_on: Optional dependency or list of dependencies. Handlers with
                        dependencies will execute after their dependencies complete.
+            inline: Run a sync handler directly in the emitting thread, skipping
+                the thread pool hop. Only for cheap, non-blocking handlers;
+                ignored for event types with dependencies.
 
         Returns:
             Decorator function that registers the handler
@@ -185,7 +253,9 @@ class iTaKEventsBus:
             if depends_on is not None:
                 deps = [depends_on] if isinstance(depends_on, Depends) else depends_on
 
-            self._register_handler(event_type, handler, dependencies=deps)
+            self._register_handler(
+                event_type, handler, dependencies=deps, inline=inline
+            )
             return handler
 
         return decorator
@@ -254,7 +324,7 @@ class iTaKEventsBus:
         event_type = type(event)
 
         with self._rwlock.r_locked():
-            if self._shutting_down:
+            if self._shutdown_event.is_set():
                 return
             cached_plan = self._execution_plan_cache.get(event_type)
             if cached_plan is not None:
@@ -263,7 +333,7 @@ class iTaKEventsBus:
 
         if cached_plan is None:
             with self._rwlock.w_locked():
-                if self._shutting_down:
+                if self._shutdown_event.is_set():
                     return
                 cached_plan = self._execution_plan_cache.get(event_type)
                 if cached_plan is None:
@@ -305,7 +375,8 @@ class iTaKEventsBus:
 
         If handlers have dependencies (registered with depends_on), they execute
         in dependency order. Otherwise, handlers execute as before (sync in thread
-        pool, async fire-and-forget).
+        pool, async fire-and-forget), except that inline sync handlers run in the
+        calling thread before this method returns.
 
         Stream chunk events always execute synchronously to preserve ordering.
 
@@ -315,10 +386,11 @@ class iTaKEventsBus:
 
         Returns:
             Future that completes when handlers finish. Returns:
-            - Future for sync-only handlers (ThreadPoolExecutor future)
+            - Future for pooled sync handlers (ThreadPoolExecutor future)
             - Future for async handlers or mixed handlers (asyncio future)
             - Future for dependency-managed handlers (asyncio future)
-            - None if no handlers or sync stream chunk events
+            - None if no handlers, or only inline sync handlers (which have
+              already run)
 
         Example:
             >>> future = iTaK_event_bus.emit(source, event)
@@ -328,15 +400,17 @@ class iTaKEventsBus:
         """
         event_type = type(event)
 
-        with self._rwlock.r_locked():
-            if self._shutting_down:
-                self._console.print(
-                    "[iTaKEventsBus] Warning: Attempted to emit event during shutdown. Ignoring."
-                )
-                return None
-            has_dependencies = event_type in self._handler_dependencies
-            sync_handlers = self._sync_handlers.get(event_type, frozenset())
-            async_handlers = self._async_handlers.get(event_type, frozenset())
+        if self._shutdown_event.is_set():
+            self._console.print(
+                "[iTaKEventsBus] Warning: Attempted to emit event during shutdown. "
+                "Ignoring."
+            )
+            return None
+
+        entry = self._dispatch_snapshot.get(event_type)
+        if entry is None:
+            return None
+        sync_handlers, inline_handlers, async_handlers, has_dependencies = entry
 
         if has_dependencies:
             return asyncio.run_coroutine_threadsafe(
@@ -344,16 +418,16 @@ class iTaKEventsBus:
                 self._loop,
             )
 
+        if inline_handlers:
+            self._call_handlers(source, event, inline_handlers)
+
         if sync_handlers:
-            if event_type is LLMStreamChunkEvent:
-                self._call_handlers(source, event, sync_handlers)
-            else:
-                ctx = contextvars.copy_context()
-                sync_future = self._sync_executor.submit(
-                    ctx.run, self._call_handlers, source, event, sync_handlers
-                )
-                if not async_handlers:
-                    return sync_future
+            ctx = contextvars.copy_context()
+            sync_future = self._sync_executor.submit(
+                ctx.run, self._call_handlers, source, event, sync_handlers
+            )
+            if not async_handlers:
+                return sync_future
 
         if async_handlers:
             return asyncio.run_coroutine_threadsafe(
@@ -374,13 +448,17 @@ class iTaKEventsBus:
         """
         event_type = type(event)
 
-        with self._rwlock.r_locked():
-            if self._shutting_down:
-                self._console.print(
-                    "[iTaKEventsBus] Warning: Attempted to emit event during shutdown. Ignoring."
-                )
-                return
-            async_handlers = self._async_handlers.get(event_type, frozenset())
+        if self._shutdown_event.is_set():
+            self._console.print(
+                "[iTaKEventsBus] Warning: Attempted to emit event during shutdown. "
+                "Ignoring."
+            )
+            return
+
+        entry = self._dispatch_snapshot.get(event_type)
+        if entry is None:
+            return
+        async_handlers = entry[2]
 
         if async_handlers:
             await self._acall_handlers(source, event, async_handlers)
@@ -389,14 +467,51 @@ class iTaKEventsBus:
         self,
         event_type: type[BaseEvent],
         handler: SyncHandler | AsyncHandler,
+        inline: bool = False,
     ) -> None:
         """Register an event handler for a specific event type.
 
         Args:
             event_type: The event class to listen for
             handler: The handler function to register
+            inline: Run a sync handler directly in the emitting thread
+        """
+        self._register_handler(event_type, handler, inline=inline)
+
+    def unregister_handler(
+        self,
+        event_type: type[BaseEvent],
+        handler: SyncHandler | AsyncHandler,
+    ) -> None:
+        """Remove a previously registered handler for a specific event type.
+
+        Event types left without handlers are dropped entirely so that
+        `has_handlers` reports them as unobserved again.
+
+        Args:
+            event_type: The event class the handler was registered for
+            handler: The handler function to remove
         """
-        self._register_handler(event_type, handler)
+        with self._rwlock.w_locked():
+            for registry in (
+                self._sync_handlers,
+                self._async_handlers,
+                self._inline_handlers,
+            ):
+                remaining = registry.get(event_type, frozenset()) - {handler}
+                if remaining:
+                    registry[event_type] = remaining
+                else:
+                    registry.pop(event_type, None)
+
+            deps = self._handler_dependencies.get(event_type)
+            if deps is not None:
+                deps.pop(handler, None)
+                if not deps:
+                    del self._handler_dependencies[event_type]
+
+            self._execution_plan_cache.pop(event_type, None)
+            self._rebuild_dispatch_snapshot()
 
     def validate_dependencies(self) -> None:
         """Validate all registered handler dependencies.
@@ -441,12 +556,16 @@ class iTaKEventsBus:
         with self._rwlock.w_locked():
             prev_sync = self._sync_handlers
             prev_async = self._async_handlers
+            prev_inline = self._inline_handlers
             prev_deps = self._handler_dependencies
             prev_cache = self._execution_plan_cache
+            prev_snapshot = self._dispatch_snapshot
             self._sync_handlers = {}
             self._async_handlers = {}
+            self._inline_handlers = {}
             self._handler_dependencies = {}
             self._execution_plan_cache = {}
+            self._dispatch_snapshot = {}
 
         try:
             yield
@@ -454,8 +573,10 @@ class iTaKEventsBus:
             with self._rwlock.w_locked():
                 self._sync_handlers = prev_sync
                 self._async_handlers = prev_async
+                self._inline_handlers = prev_inline
                 self._handler_dependencies = prev_deps
                 self._execution_plan_cache = prev_cache
+                self._dispatch_snapshot = prev_snapshot
 
     def shutdown(self, wait: bool = True) -> None:
         """Gracefully shutdown the event loop and wait for all tasks to finish.
@@ -465,7 +586,7 @@ class iTaKEventsBus:
                   If False, cancel all pending tasks immediately.
         """
         with self._rwlock.w_locked():
-            self._shutting_down = True
+            self._shutdown_event.set()
             loop = getattr(self, "_loop", None)
 
         if loop is None or loop.is_closed():
@@ -504,7 +625,9 @@ class iTaKEventsBus:
         with self._rwlock.w_locked():
             self._sync_handlers.clear()
             self._async_handlers.clear()
+            self._inline_handlers.clear()
             self._execution_plan_cache.clear()
+            self._dispatch_snapshot = {}
 
 
 iTaK_event_bus: Final[iTaKEventsBus] = iTaKEventsBus()
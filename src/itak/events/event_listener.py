@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from io import StringIO
 from typing import TYPE_CHECKING, Any
 
 from pydantic import Field, PrivateAttr
@@ -107,8 +106,6 @@ class EventListener(BaseEventListener):
     _telemetry: Telemetry = PrivateAttr(default_factory=lambda: Telemetry())
     logger: Logger = Logger(verbose=True, default_color=EMITTER_COLOR)
     execution_spans: dict[Task, Any] = Field(default_factory=dict)
-    next_chunk: int = 0
-    text_stream: StringIO = StringIO()
     knowledge_retrieval_in_progress: bool = False
     knowledge_query_in_progress: bool = False
 
@@ -403,8 +400,7 @@ class EventListener(BaseEventListener):
 
         @iTaK_event_bus.on(LLMCallStartedEvent)
         def on_llm_call_started(_: Any, event: LLMCallStartedEvent) -> None:
-            self.text_stream = StringIO()
-            self.next_chunk = 0
+            self.formatter.handle_llm_call_started()
 
         @iTaK_event_bus.on(LLMCallCompletedEvent)
         def on_llm_call_completed(_: Any, event: LLMCallCompletedEvent) -> None:
@@ -417,16 +413,7 @@ class EventListener(BaseEventListener):
 
         @iTaK_event_bus.on(LLMStreamChunkEvent)
         def on_llm_stream_chunk(_: Any, event: LLMStreamChunkEvent) -> None:
-            self.text_stream.write(event.chunk)
-            self.text_stream.seek(self.next_chunk)
-            self.text_stream.read()
-            self.next_chunk = self.text_stream.tell()
-
-            accumulated_text = self.text_stream.getvalue()
-            self.formatter.handle_llm_stream_chunk(
-                accumulated_text,
-                event.call_type,
-            )
+            self.formatter.handle_llm_stream_chunk(event.chunk, event.call_type)
 
         # ----------- LLM GUARDRAIL EVENTS -----------
 
@@ -50,13 +50,19 @@ class LLMCallStartedEvent(LLMEventBase):
 
 
 class LLMCallCompletedEvent(LLMEventBase):
-    """Event emitted when a LLM call completes"""
+    """Event emitted when a LLM call completes
+
+    Attributes:
+        cached: True when the response was served from the LLM response cache
+            instead of the provider
+    """
 
     type: str = "llm_call_completed"
     messages: str | list[dict[str, Any]] | None = None
     response: Any
     call_type: LLMCallType
     model: str | None = None
+    cached: bool = False
 
 
 class LLMCallFailedEvent(LLMEventBase):
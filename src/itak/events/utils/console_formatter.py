@@ -6,6 +6,8 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
+from itak.events.utils.stream_renderer import StreamRenderer
+
 
 class ConsoleFormatter:
     tool_usage_counts: ClassVar[dict[str, int]] = {}
@@ -25,6 +27,9 @@ class ConsoleFormatter:
         self._is_streaming: bool = False
         self._just_streamed_final_answer: bool = False
         self._last_stream_call_type: Any = None
+        self._stream_renderer = StreamRenderer(max_lines=20)
+        self._stream_panel: Panel | None = None
+        self._stream_panel_key: tuple[int, Any] | None = None
 
     def create_panel(self, content: Text, title: str, style: str = "blue") -> Panel:
         """Create a standardized panel with consistent styling."""
@@ -406,15 +411,17 @@ To enable tracing, do any one of these:
 
     def handle_llm_stream_chunk(
         self,
-        accumulated_text: str,
+        chunk: str,
         call_type: Any = None,
     ) -> None:
         """Handle LLM stream chunk event - display streaming text in a panel.
 
+        Only appends the chunk to a bounded line buffer; the panel itself is
+        rebuilt by the Live refresh thread at a fixed frame rate, so the cost
+        on the emitting thread does not grow with the length of the answer.
+
         Args:
             chunk: The new chunk of text received.
-            accumulated_text: All text accumulated so far.
-            crew_tree: Unused (kept for API compatibility).
             call_type: The type of LLM call (LLM_CALL or TOOL_CALL).
         """
         if not self.verbose:
@@ -423,18 +430,30 @@ To enable tracing, do any one of these:
         self._is_streaming = True
         self._last_stream_call_type = call_type
 
-        display_text = accumulated_text
-        max_lines = 20
-        lines = display_text.split("\n")
-        if len(lines) > max_lines:
-            display_text = "\n".join(lines[-max_lines:])
-            display_text = "...\n" + display_text
+        if not self._streaming_live:
+            self._stream_renderer.reset()
+            self._stream_renderer.append(chunk)
+            self._streaming_live = Live(
+                console=self.console,
+                refresh_per_second=10,
+                get_renderable=self._render_stream_panel,
+            )
+            self._streaming_live.start()
+        else:
+            self._stream_renderer.append(chunk)
 
-        content = Text()
+    def _render_stream_panel(self) -> Panel:
+        """Build the streaming panel, reusing the last one if nothing changed."""
+        key = (self._stream_renderer.version, self._last_stream_call_type)
+        if self._stream_panel is not None and key == self._stream_panel_key:
+            return self._stream_panel
 
         from itak.events.types.llm_events import LLMCallType
 
-        if call_type == LLMCallType.TOOL_CALL:
+        display_text = self._stream_renderer.render()
+        content = Text()
+
+        if self._last_stream_call_type == LLMCallType.TOOL_CALL:
             content.append(display_text, style="yellow")
             title = "🔧 Tool Arguments"
             border_style = "yellow"
@@ -443,20 +462,18 @@ To enable tracing, do any one of these:
             title = "✅ Agent Final Answer"
             border_style = "green"
 
-        streaming_panel = Panel(
+        self._stream_panel = Panel(
             content,
             title=title,
             border_style=border_style,
             padding=(1, 2),
         )
+        self._stream_panel_key = key
+        return self._stream_panel
 
-        if not self._streaming_live:
-            self._streaming_live = Live(
-                streaming_panel, console=self.console, refresh_per_second=10
-            )
-            self._streaming_live.start()
-        else:
-            self._streaming_live.update(streaming_panel, refresh=True)
+    def handle_llm_call_started(self) -> None:
+        """Handle LLM call started event - drop text streamed by earlier calls."""
+        self._stream_renderer.reset()
 
     def handle_llm_stream_completed(self) -> None:
         """Handle completion of LLM streaming - stop the streaming live display."""
@@ -0,0 +1,85 @@
+"""Incremental buffer for rendering streamed LLM output.
+
+Keeps only the tail of a streamed answer so that each chunk costs time
+proportional to the chunk, not to everything received so far.
+"""
+
+from collections import deque
+import threading
+
+
+class StreamRenderer:
+    """Ring buffer of the last ``max_lines`` lines of a streamed response.
+
+    Chunks are appended from the emitting thread while a renderer thread
+    (the rich ``Live`` refresh loop) reads snapshots, so all access goes
+    through a small lock. ``version`` increases on every change, letting the
+    reader skip rebuilding its renderable when nothing new arrived.
+
+    Attributes:
+        max_lines: Number of trailing lines kept for display
+        version: Monotonic change counter
+    """
+
+    def __init__(self, max_lines: int = 20) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            max_lines: Number of trailing lines kept for display
+        """
+        self.max_lines = max_lines
+        self.version = 0
+        self._lines: deque[str] = deque(maxlen=max_lines)
+        self._partial: list[str] = []
+        self._truncated = False
+        self._lock = threading.Lock()
+
+    def append(self, chunk: str) -> None:
+        """Append a streamed chunk to the buffer.
+
+        Args:
+            chunk: The new text received from the stream
+        """
+        if not chunk:
+            return
+
+        with self._lock:
+            head, *rest = chunk.split("\n")
+            self._partial.append(head)
+            for line in rest:
+                if len(self._lines) == self.max_lines:
+                    self._truncated = True
+                self._lines.append("".join(self._partial))
+                self._partial = [line]
+            self.version += 1
+
+    def reset(self) -> None:
+        """Discard all buffered text."""
+        with self._lock:
+            self._lines.clear()
+            self._partial = []
+            self._truncated = False
+            self.version += 1
+
+    def render(self) -> str:
+        """Return the text currently visible in the buffer.
+
+        Returns:
+            The last ``max_lines`` lines, prefixed with ``...`` when earlier
+            lines have been dropped
+        """
+        with self._lock:
+            # Collapse the unfinished line so a long line streamed in many
+            # small chunks is joined once rather than on every frame.
+            if len(self._partial) > 1:
+                self._partial = ["".join(self._partial)]
+            lines = list(self._lines)
+            lines.extend(self._partial)
+            if len(lines) > self.max_lines:
+                lines = lines[-self.max_lines :]
+                truncated = True
+            else:
+                truncated = self._truncated
+
+        text = "\n".join(lines)
+        return "...\n" + text if truncated else text
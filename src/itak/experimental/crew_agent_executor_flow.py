@@ -28,6 +28,7 @@ from itak.hooks.llm_hooks import (
 )
 from itak.utilities.agent_utils import (
     enforce_rpm_limit,
+    exceeds_context_window,
     format_message_for_llm,
     get_llm_response,
     handle_agent_action_core,
@@ -257,6 +258,11 @@ class CrewAgentExecutorFlow(Flow[AgentReActState], CrewAgentExecutorMixin):
         try:
             enforce_rpm_limit(self.request_within_rpm_limit)
 
+            if self.respect_context_window and exceeds_context_window(
+                self.state.messages, self.llm
+            ):
+                return "context_error"
+
             answer = get_llm_response(
                 llm=self.llm,
                 messages=list(self.state.messages),
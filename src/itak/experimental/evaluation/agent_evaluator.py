@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 import threading
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +25,7 @@ from itak.experimental.evaluation.base_evaluator import (
 )
 from itak.experimental.evaluation.evaluation_display import EvaluationDisplayFormatter
 from itak.experimental.evaluation.evaluation_listener import (
+    LITE_TASK_ID,
     create_evaluation_callbacks,
 )
 from itak.task import Task
@@ -49,9 +51,11 @@ class AgentEvaluator:
         self,
         agents: list[Agent] | list[BaseAgent],
         evaluators: Sequence[BaseEvaluator] | None = None,
+        max_metric_workers: int | None = None,
     ):
         self.agents: list[Agent] | list[BaseAgent] = agents
         self.evaluators: Sequence[BaseEvaluator] | None = evaluators
+        self.max_metric_workers = max_metric_workers
 
         self.callback = create_evaluation_callbacks()
         self.console_formatter = ConsoleFormatter()
@@ -76,6 +80,18 @@ class AgentEvaluator:
             cast(Any, self._handle_lite_agent_completed),
         )
 
+    def close(self) -> None:
+        """Unsubscribe this evaluator from the event bus."""
+        from typing import cast
+
+        iTaK_event_bus.unregister_handler(
+            TaskCompletedEvent, cast(Any, self._handle_task_completed)
+        )
+        iTaK_event_bus.unregister_handler(
+            LiteAgentExecutionCompletedEvent,
+            cast(Any, self._handle_lite_agent_completed),
+        )
+
     def _handle_task_completed(self, source: Any, event: TaskCompletedEvent) -> None:
         if event.task is None:
             raise ValueError("TaskCompletedEvent must have a task")
@@ -138,7 +154,7 @@ class AgentEvaluator:
         if agent_id in self._execution_state.agent_evaluators:
             state = ExecutionState()
             state.current_agent_id = agent_id
-            state.current_task_id = "lite_task"
+            state.current_task_id = LITE_TASK_ID
 
             target_agent = None
             for agent in self.agents:
@@ -209,7 +225,13 @@ class AgentEvaluator:
         self,
         strategy: AggregationStrategy = AggregationStrategy.SIMPLE_AVERAGE,
         include_evaluation_feedback: bool = True,
+        display: bool = True,
     ) -> dict[str, AgentAggregatedEvaluationResult]:
+        if not display:
+            # Swapping the global handlers out (as the display path does) would
+            # silence other crews running concurrently, so aggregate only.
+            return self._aggregate_results(strategy)
+
         agent_results = {}
         with iTaK_event_bus.scoped_handlers():
             task_results = self.get_evaluation_results()
@@ -240,6 +262,21 @@ class AgentEvaluator:
 
         return agent_results
 
+    def _aggregate_results(
+        self, strategy: AggregationStrategy
+    ) -> dict[str, AgentAggregatedEvaluationResult]:
+        agent_results = {}
+        for agent_role, results in self.get_evaluation_results().items():
+            if not results:
+                continue
+            agent_results[agent_role] = self.display_formatter._aggregate_agent_results(
+                agent_id=results[0].agent_id,
+                agent_role=agent_role,
+                results=results,
+                strategy=strategy,
+            )
+        return agent_results
+
     def display_evaluation_with_feedback(self) -> None:
         self.display_formatter.display_evaluation_with_feedback(
             self._execution_state.iterations_results
@@ -261,7 +298,8 @@ class AgentEvaluator:
         if self.evaluators is None:
             raise ValueError("Evaluators must be initialized")
         task_id = str(task.id) if task else None
-        for evaluator in self.evaluators:
+
+        def _run_evaluator(evaluator: BaseEvaluator) -> EvaluationScore | None:
             try:
                 self.emit_evaluation_started_event(
                     agent_role=agent.role, agent_id=str(agent.id), task_id=task_id
@@ -272,7 +310,6 @@ class AgentEvaluator:
                     execution_trace=execution_trace,
                     final_output=final_output,
                 )
-                result.metrics[evaluator.metric_category] = score
                 self.emit_evaluation_completed_event(
                     agent_role=agent.role,
                     agent_id=str(agent.id),
@@ -280,7 +317,8 @@ class AgentEvaluator:
                     metric_category=evaluator.metric_category,
                     score=score,
                 )
-            except Exception as e:  # noqa: PERF203
+                return score
+            except Exception as e:
                 self.emit_evaluation_failed_event(
                     agent_role=agent.role,
                     agent_id=str(agent.id),
@@ -290,6 +328,18 @@ class AgentEvaluator:
                 self.console_formatter.print(
                     f"Error in {evaluator.metric_category.value} evaluator: {e!s}"
                 )
+                return None
+
+        # Metrics are independent LLM judgements, so run them concurrently.
+        max_workers = self.max_metric_workers or len(self.evaluators) or 1
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="iTaKMetric"
+        ) as pool:
+            scores = list(pool.map(_run_evaluator, self.evaluators))
+
+        for evaluator, score in zip(self.evaluators, scores, strict=True):
+            if score is not None:
+                result.metrics[evaluator.metric_category] = score
 
         return result
 
@@ -341,7 +391,11 @@ class AgentEvaluator:
         )
 
 
-def create_default_evaluator(agents: list[Agent] | list[BaseAgent], llm: None = None):
+def create_default_evaluator(
+    agents: list[Agent] | list[BaseAgent],
+    llm: None = None,
+    max_metric_workers: int | None = None,
+):
     from itak.experimental.evaluation import (
         GoalAlignmentEvaluator,
         ParameterExtractionEvaluator,
@@ -360,4 +414,6 @@ def create_default_evaluator(agents: list[Agent] | list[BaseAgent], llm: None =
         ReasoningEfficiencyEvaluator(llm=llm),
     ]
 
-    return AgentEvaluator(evaluators=evaluators, agents=agents)
+    return AgentEvaluator(
+        evaluators=evaluators, agents=agents, max_metric_workers=max_metric_workers
+    )
@@ -22,6 +22,9 @@ from itak.events.types.tool_usage_events import (
 from itak.task import Task
 
 
+LITE_TASK_ID = "lite_task"
+
+
 class EvaluationTraceCallback(BaseEventListener):
     """Event listener for collecting execution traces for evaluation.
 
@@ -42,6 +45,7 @@ class EvaluationTraceCallback(BaseEventListener):
         if not hasattr(self, "_initialized") or not self._initialized:
             super().__init__()
             self.traces = {}
+            self._pending_llm_calls: dict[str, dict[str, Any]] = {}
             self.current_agent_id = None
             self.current_task_id = None
             self._initialized = True
@@ -61,12 +65,16 @@ class EvaluationTraceCallback(BaseEventListener):
 
         @event_bus.on(LiteAgentExecutionCompletedEvent)
         def on_lite_agent_completed(source, event: LiteAgentExecutionCompletedEvent):
-            self.on_lite_agent_finish(event.output)
+            self.on_lite_agent_finish(event.output, agent_id=event.agent_info["id"])
 
         @event_bus.on(ToolUsageFinishedEvent)
         def on_tool_completed(source, event: ToolUsageFinishedEvent):
             self.on_tool_use(
-                event.tool_name, event.tool_args, event.output, success=True
+                event.tool_name,
+                event.tool_args,
+                event.output,
+                success=True,
+                trace_key=self._event_trace_key(event),
             )
 
         @event_bus.on(ToolUsageErrorEvent)
@@ -77,6 +85,7 @@ class EvaluationTraceCallback(BaseEventListener):
                 event.error,
                 success=False,
                 error_type="usage_error",
+                trace_key=self._event_trace_key(event),
             )
 
         @event_bus.on(ToolExecutionErrorEvent)
@@ -87,6 +96,7 @@ class EvaluationTraceCallback(BaseEventListener):
                 event.error,
                 success=False,
                 error_type="execution_error",
+                trace_key=self._event_trace_key(event),
             )
 
         @event_bus.on(ToolSelectionErrorEvent)
@@ -97,6 +107,7 @@ class EvaluationTraceCallback(BaseEventListener):
                 event.error,
                 success=False,
                 error_type="selection_error",
+                trace_key=self._event_trace_key(event),
             )
 
         @event_bus.on(ToolValidateInputErrorEvent)
@@ -107,19 +118,49 @@ class EvaluationTraceCallback(BaseEventListener):
                 event.error,
                 success=False,
                 error_type="validation_error",
+                trace_key=self._event_trace_key(event),
             )
 
         @event_bus.on(LLMCallStartedEvent)
         def on_llm_call_started(source, event: LLMCallStartedEvent):
-            self.on_llm_call_start(event.messages, event.tools)
+            self.on_llm_call_start(
+                event.messages, event.tools, trace_key=self._event_trace_key(event)
+            )
 
         @event_bus.on(LLMCallCompletedEvent)
         def on_llm_call_completed(source, event: LLMCallCompletedEvent):
-            self.on_llm_call_end(event.messages, event.response)
+            self.on_llm_call_end(
+                event.messages, event.response, trace_key=self._event_trace_key(event)
+            )
+
+    @staticmethod
+    def _event_trace_key(event: Any) -> str | None:
+        """Trace key from the agent and task ids carried by an event.
+
+        Routing by the event's own ids keeps traces of crews that run
+        concurrently (e.g. parallel experiment test cases) apart. Events of
+        an agent without a task belong to its lite-agent trace.
+        """
+        agent_id = getattr(event, "agent_id", None)
+        if agent_id is None and getattr(event, "agent", None) is not None:
+            agent_id = getattr(event.agent, "id", None)
+        if agent_id is None:
+            return None
+        task_id = getattr(event, "task_id", None) or LITE_TASK_ID
+        return f"{agent_id}_{task_id}"
+
+    def _resolve_trace_key(self, trace_key: str | None) -> str | None:
+        # Only events that do not say which agent they came from fall back to
+        # the shared "current" ids, which concurrent runs overwrite.
+        if trace_key is not None:
+            return trace_key
+        if not self.current_agent_id or not self.current_task_id:
+            return None
+        return f"{self.current_agent_id}_{self.current_task_id}"
 
     def on_lite_agent_start(self, agent_info: dict[str, Any]):
         self.current_agent_id = agent_info["id"]
-        self.current_task_id = "lite_task"
+        self.current_task_id = LITE_TASK_ID
 
         trace_key = f"{self.current_agent_id}_{self.current_task_id}"
         self._init_trace(
@@ -162,8 +203,8 @@ class EvaluationTraceCallback(BaseEventListener):
         self.current_agent_id = None
         self.current_task_id = None
 
-    def on_lite_agent_finish(self, output: Any):
-        trace_key = f"{self.current_agent_id}_lite_task"
+    def on_lite_agent_finish(self, output: Any, agent_id: str | None = None):
+        trace_key = f"{agent_id or self.current_agent_id}_{LITE_TASK_ID}"
         if trace_key in self.traces:
             self.traces[trace_key]["final_output"] = output
             self.traces[trace_key]["end_time"] = datetime.now()
@@ -177,11 +218,9 @@ class EvaluationTraceCallback(BaseEventListener):
         result: Any,
         success: bool = True,
         error_type: str | None = None,
+        trace_key: str | None = None,
     ):
-        if not self.current_agent_id or not self.current_task_id:
-            return
-
-        trace_key = f"{self.current_agent_id}_{self.current_task_id}"
+        trace_key = self._resolve_trace_key(trace_key)
         if trace_key in self.traces:
             tool_use = {
                 "tool": tool_name,
@@ -202,15 +241,13 @@ class EvaluationTraceCallback(BaseEventListener):
         self,
         messages: str | Sequence[dict[str, Any]] | None,
         tools: Sequence[dict[str, Any]] | None = None,
+        trace_key: str | None = None,
     ):
-        if not self.current_agent_id or not self.current_task_id:
-            return
-
-        trace_key = f"{self.current_agent_id}_{self.current_task_id}"
+        trace_key = self._resolve_trace_key(trace_key)
         if trace_key not in self.traces:
             return
 
-        self.current_llm_call = {
+        self._pending_llm_calls[trace_key] = {
             "messages": messages,
             "tools": tools,
             "start_time": datetime.now(),
@@ -219,12 +256,12 @@ class EvaluationTraceCallback(BaseEventListener):
         }
 
     def on_llm_call_end(
-        self, messages: str | list[dict[str, Any]] | None, response: Any
+        self,
+        messages: str | list[dict[str, Any]] | None,
+        response: Any,
+        trace_key: str | None = None,
     ):
-        if not self.current_agent_id or not self.current_task_id:
-            return
-
-        trace_key = f"{self.current_agent_id}_{self.current_task_id}"
+        trace_key = self._resolve_trace_key(trace_key)
         if trace_key not in self.traces:
             return
 
@@ -234,8 +271,9 @@ class EvaluationTraceCallback(BaseEventListener):
 
         current_time = datetime.now()
         start_time = None
-        if hasattr(self, "current_llm_call") and self.current_llm_call:
-            start_time = self.current_llm_call.get("start_time")
+        pending_call = self._pending_llm_calls.pop(trace_key, None)
+        if pending_call:
+            start_time = pending_call.get("start_time")
 
         if not start_time:
             start_time = current_time
@@ -249,9 +287,6 @@ class EvaluationTraceCallback(BaseEventListener):
 
         self.traces[trace_key]["llm_calls"].append(llm_call)
 
-        if hasattr(self, "current_llm_call"):
-            self.current_llm_call = {}
-
     def get_trace(self, agent_id: str, task_id: str) -> dict[str, Any] | None:
         trace_key = f"{agent_id}_{task_id}"
         return self.traces.get(trace_key)
@@ -4,7 +4,10 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from itak.experimental.evaluation.experiment.result import ExperimentResults
+from itak.experimental.evaluation.experiment.result import (
+    ExperimentResult,
+    ExperimentResults,
+)
 
 
 class ExperimentResultsDisplay:
@@ -28,6 +31,17 @@ class ExperimentResultsDisplay:
 
         self.console.print(table)
 
+    def test_case_result(self, result: ExperimentResult, completed: int, total: int):
+        status = "[green]PASS[/green]" if result.passed else "[red]FAIL[/red]"
+        score = (
+            f"{result.score:.2f}"
+            if isinstance(result.score, (int, float))
+            else ", ".join(f"{k}={v:.2f}" for k, v in result.score.items())
+        )
+        self.console.print(
+            f"[{completed}/{total}] {status} {result.identifier} (score: {score})"
+        )
+
     def comparison_summary(self, comparison: dict[str, Any], baseline_timestamp: str):
         self.console.print(
             Panel(
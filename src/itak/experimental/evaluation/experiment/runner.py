@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from hashlib import md5
+import json
+import os
+import threading
 from typing import TYPE_CHECKING, Any
 
 from itak.agents.agent_builder.base_agent import BaseAgent
@@ -24,10 +28,36 @@ if TYPE_CHECKING:
 
 
 class ExperimentRunner:
-    def __init__(self, dataset: list[dict[str, Any]]):
+    """Runs a dataset of test cases against a crew or agents and scores them.
+
+    Each test case runs against its own copy of the crew (or agents) with a
+    dedicated evaluator. Copies get fresh agent ids, and evaluators only
+    react to events from the agents they were created for, so test cases can
+    run concurrently without seeing each other's events.
+
+    Args:
+        dataset: Test cases, each with ``inputs``, ``expected_score`` and an
+            optional ``identifier``.
+        max_workers: Number of test cases run concurrently.
+        results_path: Optional JSONL file. Every finished test case is
+            appended to it, and cases already recorded there are skipped, so an
+            interrupted run resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        dataset: list[dict[str, Any]],
+        max_workers: int = 1,
+        results_path: str | None = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.dataset = dataset or []
+        self.max_workers = max_workers
+        self.results_path = results_path
         self.evaluator: AgentEvaluator | None = None
         self.display = ExperimentResultsDisplay()
+        self._results_lock = threading.Lock()
 
     def run(
         self,
@@ -40,44 +70,139 @@ class ExperimentRunner:
 
         if agents is None:
             raise ValueError("Agents must be provided either directly or via a crew")
-        self.evaluator = create_default_evaluator(agents=agents)
 
-        results = []
+        identifiers = self._identifiers()
+        completed_results = self._load_completed_results()
+        results: dict[str, ExperimentResult] = {}
+        pending: list[tuple[str, dict[str, Any]]] = []
+        for identifier, test_case in zip(identifiers, self.dataset, strict=True):
+            if identifier in completed_results:
+                results[identifier] = completed_results[identifier]
+            else:
+                pending.append((identifier, test_case))
 
-        for test_case in self.dataset:
-            self.evaluator.reset_iterations_results()
-            result = self._run_test_case(test_case=test_case, crew=crew, agents=agents)
-            results.append(result)
+        total = len(self.dataset)
+        if results:
+            self.display.console.print(
+                f"[dim]Resuming experiment: {len(results)}/{total} test cases "
+                f"already completed[/dim]"
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="iTaKExperiment"
+        ) as pool:
+            futures = {
+                pool.submit(
+                    self._run_test_case,
+                    test_case=test_case,
+                    agents=agents,
+                    crew=crew,
+                    identifier=identifier,
+                ): identifier
+                for identifier, test_case in pending
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                results[futures[future]] = result
+                self._persist_result(result)
+                self.display.test_case_result(result, len(results), total)
 
-        experiment_results = ExperimentResults(results)
+        experiment_results = ExperimentResults(
+            [results[identifier] for identifier in identifiers]
+        )
 
         if print_summary:
             self.display.summary(experiment_results)
 
         return experiment_results
 
+    @staticmethod
+    def _identifier(test_case: dict[str, Any]) -> str:
+        if test_case.get("identifier"):
+            return test_case["identifier"]
+        return md5(str(test_case).encode(), usedforsecurity=False).hexdigest()
+
+    def _identifiers(self) -> list[str]:
+        """Return one identifier per test case, in dataset order.
+
+        Generated identifiers stay the bare hash used by saved baselines;
+        repeated identical test cases get a ``-<n>`` suffix to keep them apart.
+
+        Raises:
+            ValueError: If two test cases declare the same identifier.
+        """
+        identifiers = []
+        occurrences: dict[str, int] = {}
+        for test_case in self.dataset:
+            identifier = self._identifier(test_case)
+            count = occurrences.get(identifier, 0)
+            occurrences[identifier] = count + 1
+            if count:
+                if test_case.get("identifier"):
+                    raise ValueError(f"Duplicate test case identifier: {identifier}")
+                identifier = f"{identifier}-{count}"
+            identifiers.append(identifier)
+        return identifiers
+
+    def _load_completed_results(self) -> dict[str, ExperimentResult]:
+        if not self.results_path or not os.path.exists(self.results_path):
+            return {}
+
+        completed: dict[str, ExperimentResult] = {}
+        with open(self.results_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    result = ExperimentResult.model_validate_json(line)
+                except ValueError:
+                    # A run killed mid-write can leave a truncated last line.
+                    continue
+                completed[result.identifier] = result
+        return completed
+
+    def _persist_result(self, result: ExperimentResult) -> None:
+        if not self.results_path:
+            return
+
+        line = json.dumps(result.model_dump(exclude={"agent_evaluations"}))
+        with self._results_lock, open(self.results_path, "a") as f:
+            f.write(line + "\n")
+            f.flush()
+
     def _run_test_case(
         self,
         test_case: dict[str, Any],
         agents: list[Agent] | list[BaseAgent],
         crew: Crew | None = None,
+        identifier: str | None = None,
     ) -> ExperimentResult:
+        from itak.agent import Agent
+
         inputs = test_case["inputs"]
         expected_score = test_case["expected_score"]
-        identifier = (
-            test_case.get("identifier")
-            or md5(str(test_case).encode(), usedforsecurity=False).hexdigest()
+        identifier = identifier or self._identifier(test_case)
+
+        # Parallel cases must not share agents: the copies carry fresh ids,
+        # which is what scopes each evaluator to its own test case.
+        case_crew = crew.copy() if crew else None
+        case_agents = (
+            case_crew.agents if case_crew else [agent.copy() for agent in agents]
         )
+        evaluator = create_default_evaluator(agents=case_agents)
+        if self.max_workers == 1:
+            self.evaluator = evaluator
 
         try:
             self.display.console.print(
                 f"[dim]Running crew with input: {str(inputs)[:50]}...[/dim]"
             )
             self.display.console.print("\n")
-            if crew:
-                crew.kickoff(inputs=inputs)
+            if case_crew:
+                case_crew.kickoff(inputs=inputs)
             else:
-                for agent in agents:
+                for agent in case_agents:
                     if isinstance(agent, Agent):
                         agent.kickoff(**inputs)
                     else:
@@ -85,9 +210,9 @@ class ExperimentRunner:
                             f"Agent {agent} is not an instance of Agent and cannot be kicked off directly"
                         )
 
-            if self.evaluator is None:
-                raise ValueError("Evaluator must be initialized")
-            agent_evaluations = self.evaluator.get_agent_evaluation()
+            agent_evaluations = evaluator.get_agent_evaluation(
+                display=self.max_workers == 1
+            )
 
             actual_score = self._extract_scores(agent_evaluations)
 
@@ -110,6 +235,8 @@ class ExperimentRunner:
                 expected_score=expected_score,
                 passed=False,
             )
+        finally:
+            evaluator.close()
 
     def _extract_scores(
         self, agent_evaluations: dict[str, AgentAggregatedEvaluationResult]
@@ -58,8 +58,12 @@ def run_experiment(
     crew: Crew | None = None,
     agents: list[Agent] | None = None,
     verbose: bool = False,
+    max_workers: int = 1,
+    results_path: str | None = None,
 ) -> ExperimentResults:
-    runner = ExperimentRunner(dataset=dataset)
+    runner = ExperimentRunner(
+        dataset=dataset, max_workers=max_workers, results_path=results_path
+    )
 
     return runner.run(agents=agents, crew=crew, print_summary=verbose)
 
@@ -1559,7 +1559,9 @@ class Flow(Generic[T], metaclass=FlowMeta):
                 kwargs or {}
             )
 
-            if not self.suppress_flow_events:
+            if not self.suppress_flow_events and iTaK_event_bus.has_handlers(
+                MethodExecutionStartedEvent
+            ):
                 future = iTaK_event_bus.emit(
                     self,
                     MethodExecutionStartedEvent(
@@ -1586,7 +1588,9 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
             self._completed_methods.add(method_name)
 
-            if not self.suppress_flow_events:
+            if not self.suppress_flow_events and iTaK_event_bus.has_handlers(
+                MethodExecutionFinishedEvent
+            ):
                 future = iTaK_event_bus.emit(
                     self,
                     MethodExecutionFinishedEvent(
@@ -1613,7 +1617,9 @@ class Flow(Generic[T], metaclass=FlowMeta):
                     self._persistence = SQLiteFlowPersistence()
 
                 # Emit paused event (not failed)
-                if not self.suppress_flow_events:
+                if not self.suppress_flow_events and iTaK_event_bus.has_handlers(
+                    MethodExecutionPausedEvent
+                ):
                     future = iTaK_event_bus.emit(
                         self,
                         MethodExecutionPausedEvent(
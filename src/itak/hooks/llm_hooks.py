@@ -37,8 +37,15 @@ class LLMCallHookContext:
         crew: Reference to the crew instance (None for direct LLM calls or LiteAgent)
         llm: Reference to the LLM instance
         iterations: Current iteration count (0 for direct LLM calls)
-        response: LLM response string (only set for after_llm_call hooks).
+        response: LLM response string (set for after_llm_call hooks).
             Can be modified by returning a new string from after_llm_call hook.
+            A before_llm_call hook may set it to short-circuit the call: the
+            provider is skipped and the after_llm_call hooks receive this
+            response instead (used by itak.llms.cache.LLMResponseCache).
+        tools: Tools offered to the model: the executor's tools, or the tool
+            schemas passed to a direct LLM call (None when there are none)
+        available_functions: Functions a direct LLM call executes for the
+            model's tool calls (None for executor calls)
     """
 
     executor: CrewAgentExecutor | LiteAgent | None
@@ -49,6 +56,8 @@ class LLMCallHookContext:
     llm: BaseLLM | None | str | Any
     iterations: int
     response: str | None
+    tools: list[Any] | None
+    available_functions: dict[str, Any] | None
 
     def __init__(
         self,
@@ -59,6 +68,8 @@ class LLMCallHookContext:
         agent: Any | None = None,
         task: Any | None = None,
         crew: Any | None = None,
+        tools: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
     ) -> None:
         """Initialize hook context with executor reference or direct parameters.
 
@@ -70,6 +81,9 @@ class LLMCallHookContext:
             agent: Optional agent reference (for direct LLM calls when executor is None)
             task: Optional task reference (for direct LLM calls when executor is None)
             crew: Optional crew reference (for direct LLM calls when executor is None)
+            tools: Optional tool schemas (for direct LLM calls when executor is None)
+            available_functions: Optional functions executing tool calls (for
+                direct LLM calls when executor is None)
         """
         if executor is not None:
             # Existing path: extract from executor
@@ -77,6 +91,8 @@ class LLMCallHookContext:
             self.messages = executor.messages
             self.llm = executor.llm
             self.iterations = executor.iterations
+            self.tools = getattr(executor, "tools", None)
+            self.available_functions = None
             # Handle CrewAgentExecutor vs LiteAgent differences
             if hasattr(executor, "agent"):
                 self.agent = executor.agent
@@ -100,6 +116,8 @@ class LLMCallHookContext:
             self.task = task
             self.crew = crew
             self.iterations = 0
+            self.tools = tools
+            self.available_functions = available_functions
 
         self.response = response
 
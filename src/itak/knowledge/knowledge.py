@@ -5,6 +5,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from itak.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from itak.knowledge.storage.knowledge_storage import KnowledgeStorage
 from itak.rag.embeddings.types import EmbedderConfig
+from itak.rag.hybrid import HybridSearchConfig
 from itak.rag.types import SearchResult
 
 
@@ -18,6 +19,7 @@ class Knowledge(BaseModel):
         sources: list[BaseKnowledgeSource] = Field(default_factory=list)
         storage: KnowledgeStorage | None = Field(default=None)
         embedder: EmbedderConfig | None = None
+        hybrid_search: HybridSearchConfig | bool = False
     """
 
     sources: list[BaseKnowledgeSource] = Field(default_factory=list)
@@ -25,6 +27,7 @@ class Knowledge(BaseModel):
     storage: KnowledgeStorage | None = Field(default=None)
     embedder: EmbedderConfig | None = None
     collection_name: str | None = None
+    hybrid_search: HybridSearchConfig | bool = False
 
     def __init__(
         self,
@@ -32,14 +35,18 @@ class Knowledge(BaseModel):
         sources: list[BaseKnowledgeSource],
         embedder: EmbedderConfig | None = None,
         storage: KnowledgeStorage | None = None,
+        hybrid_search: HybridSearchConfig | bool = False,
         **data: object,
     ) -> None:
         super().__init__(**data)
+        self.hybrid_search = hybrid_search
         if storage:
             self.storage = storage
         else:
             self.storage = KnowledgeStorage(
-                embedder=embedder, collection_name=collection_name
+                embedder=embedder,
+                collection_name=collection_name,
+                hybrid_search=hybrid_search,
             )
         self.sources = sources
 
@@ -0,0 +1,216 @@
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Any
+import uuid
+
+from pydantic import Field, PrivateAttr
+
+from itak.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from itak.knowledge.source.directory_loader import (
+    DirectoryLoader,
+    FileParser,
+    IngestManifest,
+    LoaderResult,
+    manifest_directory,
+)
+from itak.rag.chunking import StructureAwareChunker, format_for_path
+from itak.rag.types import BaseRecord
+from itak.utilities.constants import KNOWLEDGE_DIRECTORY
+from itak.utilities.logger import Logger
+
+
+class DirectoryKnowledgeSource(BaseKnowledgeSource):
+    """A knowledge source that incrementally ingests a whole directory tree.
+
+    Files are discovered lazily, parsed in a thread pool and saved per file:
+    every chunk carries the file's ``source`` path in its metadata and a
+    stable id derived from the file, so re-ingesting a changed file replaces
+    its chunks. Files whose ``(mtime, size)`` is unchanged since the last
+    ingest are skipped without being read.
+
+    Chunks of a file that shrank are overwritten up to its new chunk count;
+    the vector store API has no delete-by-id, so trailing chunks from the
+    old version stay until the collection is reset.
+    """
+
+    directory: Path | str = Field(description="Directory to ingest")
+    recursive: bool = Field(default=True)
+    include_extensions: list[str] | None = Field(
+        default=None, description="Only ingest files with these extensions"
+    )
+    ignore_patterns: list[str] = Field(
+        default_factory=list, description="Extra gitignore-style patterns to skip"
+    )
+    respect_gitignore: bool = Field(default=True)
+    max_workers: int | None = Field(default=None)
+    batch_size: int = Field(
+        default=64, description="Number of chunks saved to storage per call"
+    )
+    incremental: bool = Field(
+        default=True, description="Skip files unchanged since the last ingest"
+    )
+    parsers: dict[str, FileParser] = Field(default_factory=dict)
+    chunker: StructureAwareChunker | None = Field(
+        default=None,
+        description="Token-sized, structure-aware chunker; "
+        "defaults to fixed-width character chunks",
+    )
+
+    _logger: Logger = PrivateAttr(default_factory=lambda: Logger(verbose=True))
+    _loader: DirectoryLoader | None = PrivateAttr(default=None)
+
+    def model_post_init(self, _: Any) -> None:
+        """Post-initialization method to validate the directory."""
+        self.validate_content()
+
+    def validate_content(self) -> None:
+        """Validate that the directory exists."""
+        path = self._resolve_directory()
+        if not path.is_dir():
+            raise ValueError(f"Directory not found: {path}")
+
+    def _resolve_directory(self) -> Path:
+        if isinstance(self.directory, str):
+            path = Path(self.directory)
+            if not path.is_absolute() and not path.exists():
+                return Path(KNOWLEDGE_DIRECTORY) / path
+            return path
+        return self.directory
+
+    def _storage_collection(self) -> str:
+        name = getattr(self.storage, "collection_name", None) or self.collection_name
+        return f"knowledge_{name}" if name else "knowledge"
+
+    def _manifest(self, root: Path) -> IngestManifest:
+        if not self.incremental:
+            return IngestManifest()
+        digest = hashlib.sha256(str(root).encode()).hexdigest()[:16]
+        return IngestManifest(
+            manifest_directory(self._storage_collection()) / f"{digest}.json"
+        )
+
+    def _create_loader(self) -> DirectoryLoader:
+        root = self._resolve_directory().resolve()
+        self._loader = DirectoryLoader(
+            root,
+            recursive=self.recursive,
+            include_extensions=self.include_extensions,
+            ignore_patterns=self.ignore_patterns,
+            respect_gitignore=self.respect_gitignore,
+            max_workers=self.max_workers,
+            parsers=self.parsers,
+            manifest=self._manifest(root),
+        )
+        return self._loader
+
+    @staticmethod
+    def _chunk_id(file_id: str, index: int) -> str:
+        """Stable id of a file's chunk, as a UUID so that Qdrant accepts it."""
+        digest = hashlib.sha256(f"{file_id}:{index}".encode()).hexdigest()
+        return str(uuid.UUID(hex=digest[:32]))
+
+    def _to_records(self, result: LoaderResult) -> list[BaseRecord]:
+        if self.chunker is None:
+            pieces = [(chunk, {}) for chunk in self._chunk_text(result.content)]
+        else:
+            pieces = [
+                (chunk.text, {**chunk.metadata, "start_index": chunk.start})
+                for chunk in self.chunker.iter_chunks(
+                    result.content, format_for_path(result.path)
+                )
+            ]
+        return [
+            {
+                "doc_id": self._chunk_id(result.doc_id, index),
+                "content": text,
+                "metadata": {
+                    **result.metadata,
+                    **extra,
+                    "file_id": result.doc_id,
+                    "chunk_index": index,
+                },
+            }
+            for index, (text, extra) in enumerate(pieces)
+        ]
+
+    def _log_failure(self, result: LoaderResult) -> None:
+        self._logger.log(
+            "warning",
+            f"Skipping {result.relative_path}: {result.error}",
+            color="yellow",
+        )
+
+    def _finish(self, loader: DirectoryLoader) -> None:
+        manifest = loader.manifest
+        if manifest is None:
+            return
+        for key in loader.removed_files():
+            manifest.forget(key)
+        manifest.save()
+
+    def add(self) -> None:
+        """Ingest new and changed files, saving chunks as files are parsed."""
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        loader = self._create_loader()
+        batch: list[BaseRecord] = []
+        ingested: list[tuple[LoaderResult, int]] = []
+
+        def flush() -> None:
+            if batch:
+                self.storage.save(batch)  # type: ignore[union-attr]
+                batch.clear()
+            for result, chunk_count in ingested:
+                loader.mark_loaded(result, doc_id=result.doc_id, chunks=chunk_count)
+            ingested.clear()
+
+        for result in loader.load():
+            if not result.ok:
+                self._log_failure(result)
+                continue
+            records = self._to_records(result)
+            batch.extend(records)
+            ingested.append((result, len(records)))
+            if len(batch) >= self.batch_size:
+                flush()
+        flush()
+        self._finish(loader)
+
+    async def aadd(self) -> None:
+        """Ingest new and changed files asynchronously.
+
+        Results are pulled from the loader in a worker thread so the event
+        loop is not blocked while files are parsed.
+        """
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        loader = self._create_loader()
+        batch: list[BaseRecord] = []
+        ingested: list[tuple[LoaderResult, int]] = []
+
+        async def flush() -> None:
+            if batch:
+                await self.storage.asave(batch)  # type: ignore[union-attr]
+                batch.clear()
+            for result, chunk_count in ingested:
+                loader.mark_loaded(result, doc_id=result.doc_id, chunks=chunk_count)
+            ingested.clear()
+
+        results = loader.load()
+        while (result := await asyncio.to_thread(next, results, None)) is not None:
+            if not result.ok:
+                self._log_failure(result)
+                continue
+            records = self._to_records(result)
+            batch.extend(records)
+            ingested.append((result, len(records)))
+            if len(batch) >= self.batch_size:
+                await flush()
+        await flush()
+        self._finish(loader)
+
+    @property
+    def skipped_unchanged(self) -> int:
+        """Number of files skipped as unchanged during the last ingest."""
+        return self._loader.skipped_unchanged if self._loader else 0
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
-    from itak.rag.types import SearchResult
+    from itak.rag.types import BaseRecord, SearchResult
 
 
 class BaseKnowledgeStorage(ABC):
@@ -32,11 +32,11 @@ class BaseKnowledgeStorage(ABC):
         """Search for documents in the knowledge base asynchronously."""
 
     @abstractmethod
-    def save(self, documents: list[str]) -> None:
+    def save(self, documents: list[str] | list[BaseRecord]) -> None:
         """Save documents to the knowledge base."""
 
     @abstractmethod
-    async def asave(self, documents: list[str]) -> None:
+    async def asave(self, documents: list[str] | list[BaseRecord]) -> None:
         """Save documents to the knowledge base asynchronously."""
 
     @abstractmethod
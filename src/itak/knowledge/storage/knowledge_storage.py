@@ -3,23 +3,54 @@ import traceback
 from typing import Any, cast
 import warnings
 
+from itak.knowledge.source.directory_loader import clear_manifests
 from itak.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
 from itak.rag.chromadb.config import ChromaDBConfig
 from itak.rag.chromadb.types import ChromaEmbeddingFunctionWrapper
 from itak.rag.config.utils import get_rag_client
 from itak.rag.core.base_client import BaseClient
 from itak.rag.core.base_embeddings_provider import BaseEmbeddingsProvider
-from itak.rag.embeddings.factory import build_embedder
+from itak.rag.embeddings.registry import get_shared_embedder
 from itak.rag.embeddings.types import ProviderSpec
 from itak.rag.factory import create_client
+from itak.rag.hybrid import HybridRetriever, HybridSearchConfig
 from itak.rag.types import BaseRecord, SearchResult
 from itak.utilities.logger import Logger
 
 
+def _merge_results(
+    per_query: list[list[SearchResult]], limit: int
+) -> list[SearchResult]:
+    """Merge per-query results, keeping each document's best score."""
+    best: dict[str, SearchResult] = {}
+    for results in per_query:
+        for result in results:
+            current = best.get(result["id"])
+            if current is None or result["score"] > current["score"]:
+                best[result["id"]] = result
+    return sorted(best.values(), key=lambda r: r["score"], reverse=True)[:limit]
+
+
+def _to_records(documents: list[str] | list[BaseRecord]) -> list[BaseRecord]:
+    """Wrap plain strings as records; records are passed through unchanged."""
+    return [
+        {"content": doc} if isinstance(doc, str) else doc for doc in documents
+    ]
+
+
 class KnowledgeStorage(BaseKnowledgeStorage):
     """
     Extends Storage to handle embeddings for memory entries, improving
     search efficiency.
+
+    With ``hybrid_search`` enabled, saved documents are also written to a BM25
+    index and searches fuse keyword and vector results (see
+    ``itak.rag.hybrid.HybridRetriever``). Only documents saved while hybrid
+    search is enabled are in the BM25 index.
+
+    Without hybrid search, several queries are sent to the vector store as
+    one batched ``search_many`` call and the results are merged; hybrid
+    search joins them into a single query text.
     """
 
     def __init__(
@@ -29,9 +60,14 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         | type[BaseEmbeddingsProvider[Any]]
         | None = None,
         collection_name: str | None = None,
+        hybrid_search: HybridSearchConfig | bool = False,
     ) -> None:
         self.collection_name = collection_name
         self._client: BaseClient | None = None
+        if hybrid_search is True:
+            hybrid_search = HybridSearchConfig()
+        self.hybrid_search: HybridSearchConfig | None = hybrid_search or None
+        self._retriever: HybridRetriever | None = None
 
         warnings.filterwarnings(
             "ignore",
@@ -40,7 +76,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         )
 
         if embedder:
-            embedding_function = build_embedder(embedder)  # type: ignore[arg-type]
+            embedding_function = get_shared_embedder(embedder)
             config = ChromaDBConfig(
                 embedding_function=cast(
                     ChromaEmbeddingFunctionWrapper, embedding_function
@@ -52,6 +88,15 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         """Get the appropriate client - instance-specific or global."""
         return self._client if self._client else get_rag_client()
 
+    def _get_retriever(self) -> HybridRetriever | None:
+        """Get the hybrid retriever when hybrid search is enabled."""
+        if self.hybrid_search is None:
+            return None
+        client = self._get_client()
+        if self._retriever is None or self._retriever.client is not client:
+            self._retriever = HybridRetriever(client, self.hybrid_search)
+        return self._retriever
+
     def search(
         self,
         query: list[str],
@@ -71,6 +116,26 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             )
             query_text = " ".join(query) if len(query) > 1 else query[0]
 
+            retriever = self._get_retriever()
+            if retriever is not None:
+                return retriever.search(
+                    collection_name=collection_name,
+                    query=query_text,
+                    limit=limit,
+                    metadata_filter=metadata_filter,
+                    score_threshold=score_threshold,
+                )
+
+            if len(query) > 1:
+                per_query = client.search_many(
+                    collection_name=collection_name,
+                    queries=query,
+                    limit=limit,
+                    metadata_filter=metadata_filter,
+                    score_threshold=score_threshold,
+                )
+                return _merge_results(per_query, limit)
+
             return client.search(
                 collection_name=collection_name,
                 query=query_text,
@@ -92,13 +157,18 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 if self.collection_name
                 else "knowledge"
             )
-            client.delete_collection(collection_name=collection_name)
+            retriever = self._get_retriever()
+            if retriever is not None:
+                retriever.delete_collection(collection_name)
+            else:
+                client.delete_collection(collection_name=collection_name)
+            clear_manifests(collection_name)
         except Exception as e:
             logging.error(
                 f"Error during knowledge reset: {e!s}\n{traceback.format_exc()}"
             )
 
-    def save(self, documents: list[str]) -> None:
+    def save(self, documents: list[str] | list[BaseRecord]) -> None:
         try:
             client = self._get_client()
             collection_name = (
@@ -108,11 +178,15 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             )
             client.get_or_create_collection(collection_name=collection_name)
 
-            rag_documents: list[BaseRecord] = [{"content": doc} for doc in documents]
+            rag_documents = _to_records(documents)
 
-            client.add_documents(
-                collection_name=collection_name, documents=rag_documents
-            )
+            retriever = self._get_retriever()
+            if retriever is not None:
+                retriever.add_documents(collection_name, rag_documents)
+            else:
+                client.add_documents(
+                    collection_name=collection_name, documents=rag_documents
+                )
         except Exception as e:
             if "dimension mismatch" in str(e).lower():
                 Logger(verbose=True).log(
@@ -158,6 +232,26 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             )
             query_text = " ".join(query) if len(query) > 1 else query[0]
 
+            retriever = self._get_retriever()
+            if retriever is not None:
+                return await retriever.asearch(
+                    collection_name=collection_name,
+                    query=query_text,
+                    limit=limit,
+                    metadata_filter=metadata_filter,
+                    score_threshold=score_threshold,
+                )
+
+            if len(query) > 1:
+                per_query = await client.asearch_many(
+                    collection_name=collection_name,
+                    queries=query,
+                    limit=limit,
+                    metadata_filter=metadata_filter,
+                    score_threshold=score_threshold,
+                )
+                return _merge_results(per_query, limit)
+
             return await client.asearch(
                 collection_name=collection_name,
                 query=query_text,
@@ -171,11 +265,12 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             )
             return []
 
-    async def asave(self, documents: list[str]) -> None:
+    async def asave(self, documents: list[str] | list[BaseRecord]) -> None:
         """Save documents to the knowledge base asynchronously.
 
         Args:
-            documents: List of document strings to save.
+            documents: Document strings, or records carrying their own
+                ``doc_id`` and metadata.
         """
         try:
             client = self._get_client()
@@ -186,11 +281,15 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             )
             await client.aget_or_create_collection(collection_name=collection_name)
 
-            rag_documents: list[BaseRecord] = [{"content": doc} for doc in documents]
+            rag_documents = _to_records(documents)
 
-            await client.aadd_documents(
-                collection_name=collection_name, documents=rag_documents
-            )
+            retriever = self._get_retriever()
+            if retriever is not None:
+                await retriever.aadd_documents(collection_name, rag_documents)
+            else:
+                await client.aadd_documents(
+                    collection_name=collection_name, documents=rag_documents
+                )
         except Exception as e:
             if "dimension mismatch" in str(e).lower():
                 Logger(verbose=True).log(
@@ -215,7 +314,12 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 if self.collection_name
                 else "knowledge"
             )
-            await client.adelete_collection(collection_name=collection_name)
+            retriever = self._get_retriever()
+            if retriever is not None:
+                await retriever.adelete_collection(collection_name)
+            else:
+                await client.adelete_collection(collection_name=collection_name)
+            clear_manifests(collection_name)
         except Exception as e:
             logging.error(
                 f"Error during knowledge reset: {e!s}\n{traceback.format_exc()}"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from collections.abc import Callable
 from datetime import datetime
@@ -45,6 +46,7 @@ from itak.llms.constants import (
     GEMINI_MODELS,
     OPENAI_MODELS,
 )
+from itak.llms.tool_prefetch import MISSING, ToolPrefetcher
 from itak.utilities import InternalInstructor
 from itak.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededError,
@@ -336,6 +338,7 @@ class FunctionArgs(BaseModel):
 
 
 class AccumulatedToolArgs(BaseModel):
+    id: str = ""
     function: FunctionArgs = Field(default_factory=FunctionArgs)
 
 
@@ -399,6 +402,13 @@ class LLM(BaseLLM):
             try:
                 # Remove 'provider' from kwargs if it exists to avoid duplicate keyword argument
                 kwargs_copy = {k: v for k, v in kwargs.items() if k != "provider"}
+                # LiteLLM-only option; forwarded, it becomes an invalid API param.
+                if kwargs_copy.pop("speculative_tool_calls", False):
+                    logger.warning(
+                        "speculative_tool_calls is only supported by the LiteLLM "
+                        "fallback and is ignored for the native %s provider",
+                        provider,
+                    )
                 return cast(
                     Self,
                     native_class(model=model_string, provider=provider, **kwargs_copy),
@@ -587,12 +597,19 @@ class LLM(BaseLLM):
         stream: bool = False,
         interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None = None,
         thinking: AnthropicThinkingConfig | dict[str, Any] | None = None,
+        speculative_tool_calls: bool = False,
         **kwargs: Any,
     ) -> None:
         """Initialize LLM instance.
 
         Note: This __init__ method is only called for fallback instances.
         Native provider instances handle their own initialization in their respective classes.
+
+        With ``speculative_tool_calls`` and ``stream`` enabled, read-only and
+        idempotent tools start running as soon as their streamed arguments are
+        complete, instead of after the response ends. The option is LiteLLM-only:
+        native providers ignore it with a warning (pass ``is_litellm=True`` to
+        use it with their models).
         """
         super().__init__(
             model=model,
@@ -628,6 +645,7 @@ class LLM(BaseLLM):
         }
         self.is_anthropic = self._is_anthropic_model(model)
         self.stream = stream
+        self.speculative_tool_calls = speculative_tool_calls
         self.interceptor = interceptor
 
         litellm.drop_params = True
@@ -739,6 +757,9 @@ class LLM(BaseLLM):
         accumulated_tool_args: defaultdict[int, AccumulatedToolArgs] = defaultdict(
             AccumulatedToolArgs
         )
+        prefetcher = self._create_tool_prefetcher(
+            available_functions, from_task, from_agent
+        )
 
         # --- 2) Make sure stream is set to True and include usage metrics
         params["stream"] = True
@@ -807,6 +828,7 @@ class LLM(BaseLLM):
                                         available_functions=available_functions,
                                         from_task=from_task,
                                         from_agent=from_agent,
+                                        prefetcher=prefetcher,
                                     )
 
                                     if result is not None:
@@ -821,15 +843,16 @@ class LLM(BaseLLM):
                     # Add the chunk content to the full response
                     full_response += chunk_content
 
-                    iTaK_event_bus.emit(
-                        self,
-                        event=LLMStreamChunkEvent(
-                            chunk=chunk_content,
-                            from_task=from_task,
-                            from_agent=from_agent,
-                            call_type=LLMCallType.LLM_CALL,
-                        ),
-                    )
+                    if iTaK_event_bus.has_handlers(LLMStreamChunkEvent):
+                        iTaK_event_bus.emit(
+                            self,
+                            event=LLMStreamChunkEvent(
+                                chunk=chunk_content,
+                                from_task=from_task,
+                                from_agent=from_agent,
+                                call_type=LLMCallType.LLM_CALL,
+                            ),
+                        )
             # --- 4) Fallback to non-streaming if no content received
             if not full_response.strip() and chunk_count == 0:
                 logging.warning(
@@ -930,6 +953,18 @@ class LLM(BaseLLM):
                 self._track_token_usage_internal(usage_info)
             self._handle_streaming_callbacks(callbacks, usage_info, last_chunk)
 
+            # --- 8) Join tool calls that were started while streaming
+            if prefetcher is not None and accumulated_tool_args:
+                tool_result = self._join_streamed_tool_calls(
+                    accumulated_tool_args,
+                    prefetcher,
+                    available_functions or {},
+                    from_task,
+                    from_agent,
+                )
+                if tool_result is not None:
+                    return tool_result
+
             if not tool_calls or not available_functions:
 
                 if response_model and self.is_litellm:
@@ -998,6 +1033,97 @@ class LLM(BaseLLM):
                 ),
             )
             raise Exception(f"Failed to get streaming response: {e!s}") from e
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
+
+    def _create_tool_prefetcher(
+        self,
+        available_functions: dict[str, Any] | None,
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+    ) -> ToolPrefetcher | None:
+        """Create a prefetcher for one streamed response, if enabled.
+
+        Args:
+            available_functions: Dict of available functions
+            from_task: Optional task object
+            from_agent: Optional agent object
+
+        Returns:
+            A prefetcher, or None if speculative tool calls are disabled.
+        """
+        if not self.speculative_tool_calls or not available_functions:
+            return None
+
+        def execute(name: str, arguments: dict[str, Any]) -> Any:
+            return self._execute_tool_call(
+                AccumulatedToolArgs(
+                    function=FunctionArgs(name=name, arguments=json.dumps(arguments))
+                ),
+                available_functions,
+                from_task,
+                from_agent,
+            )
+
+        return ToolPrefetcher(execute, available_functions)
+
+    def _join_streamed_tool_calls(
+        self,
+        accumulated_tool_args: dict[int, AccumulatedToolArgs],
+        prefetcher: ToolPrefetcher,
+        available_functions: dict[str, Any],
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+    ) -> Any:
+        """Collect the results of every tool call of a streamed response.
+
+        Calls started speculatively are joined; the others, and speculative
+        calls whose arguments changed afterwards, run now.
+
+        Args:
+            accumulated_tool_args: Tool calls accumulated from the stream
+            prefetcher: Prefetcher used while streaming
+            available_functions: Dict of available functions
+            from_task: Optional task object
+            from_agent: Optional agent object
+
+        Returns:
+            The result of the tool calls, or None if no tool call was made
+        """
+        indexed = [
+            (index, tool_call)
+            for index, tool_call in sorted(accumulated_tool_args.items())
+            if tool_call.function.name
+        ]
+        if not indexed:
+            return None
+        tool_calls = [tool_call for _, tool_call in indexed]
+        results = [
+            prefetcher.result(
+                index, tool_call.function.name, tool_call.function.arguments
+            )
+            for index, tool_call in indexed
+        ]
+        pending = [i for i, result in enumerate(results) if result is MISSING]
+        executed = self._dispatch_tool_calls(
+            [tool_calls[i] for i in pending],
+            [tool_calls[i].function.name for i in pending],
+            lambda tool_call: self._execute_tool_call(
+                tool_call, available_functions, from_task, from_agent
+            ),
+            available_functions,
+            from_agent,
+        )
+        for i, result in zip(pending, executed, strict=True):
+            results[i] = result
+        return self._combine_tool_results(
+            [
+                (tool_call.id or f"call_{i}", tool_call.function.name)
+                for i, tool_call in enumerate(tool_calls)
+            ],
+            results,
+        )
 
     def _handle_streaming_tool_calls(
         self,
@@ -1006,10 +1132,14 @@ class LLM(BaseLLM):
         available_functions: dict[str, Any] | None = None,
         from_task: Task | None = None,
         from_agent: Agent | None = None,
+        prefetcher: ToolPrefetcher | None = None,
     ) -> Any:
         for tool_call in tool_calls:
             current_tool_accumulator = accumulated_tool_args[tool_call.index]
 
+            if getattr(tool_call, "id", None):
+                current_tool_accumulator.id = tool_call.id
+
             if tool_call.function.name:
                 current_tool_accumulator.function.name = tool_call.function.name
 
@@ -1018,16 +1148,26 @@ class LLM(BaseLLM):
                     tool_call.function.arguments
                 )
 
-            iTaK_event_bus.emit(
-                self,
-                event=LLMStreamChunkEvent(
-                    tool_call=tool_call.to_dict(),
-                    chunk=tool_call.function.arguments,
-                    from_task=from_task,
-                    from_agent=from_agent,
-                    call_type=LLMCallType.TOOL_CALL,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(LLMStreamChunkEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=LLMStreamChunkEvent(
+                        tool_call=tool_call.to_dict(),
+                        chunk=tool_call.function.arguments,
+                        from_task=from_task,
+                        from_agent=from_agent,
+                        call_type=LLMCallType.TOOL_CALL,
+                    ),
+                )
+
+            if prefetcher is not None:
+                # Results are joined once the stream ends.
+                prefetcher.offer(
+                    tool_call.index,
+                    current_tool_accumulator.function.name,
+                    current_tool_accumulator.function.arguments,
+                )
+                continue
 
             if (
                 current_tool_accumulator.function.name
@@ -1369,6 +1509,9 @@ class LLM(BaseLLM):
         accumulated_tool_args: defaultdict[int, AccumulatedToolArgs] = defaultdict(
             AccumulatedToolArgs
         )
+        prefetcher = self._create_tool_prefetcher(
+            available_functions, from_task, from_agent
+        )
 
         params["stream"] = True
         params["stream_options"] = {"include_usage": True}
@@ -1424,20 +1567,28 @@ class LLM(BaseLLM):
                                             ].function.arguments += (
                                                 tool_call.function.arguments
                                             )
+                                        if prefetcher is not None:
+                                            accumulated = accumulated_tool_args[idx]
+                                            prefetcher.offer(
+                                                idx,
+                                                accumulated.function.name,
+                                                accumulated.function.arguments,
+                                            )
 
                 except (AttributeError, KeyError, IndexError, TypeError):
                     pass
 
                 if chunk_content:
                     full_response += chunk_content
-                    iTaK_event_bus.emit(
-                        self,
-                        event=LLMStreamChunkEvent(
-                            chunk=chunk_content,
-                            from_task=from_task,
-                            from_agent=from_agent,
-                        ),
-                    )
+                    if iTaK_event_bus.has_handlers(LLMStreamChunkEvent):
+                        iTaK_event_bus.emit(
+                            self,
+                            event=LLMStreamChunkEvent(
+                                chunk=chunk_content,
+                                from_task=from_task,
+                                from_agent=from_agent,
+                            ),
+                        )
 
             if callbacks and len(callbacks) > 0 and usage_info:
                 for callback in callbacks:
@@ -1452,6 +1603,18 @@ class LLM(BaseLLM):
             if usage_info:
                 self._track_token_usage_internal(usage_info)
 
+            if prefetcher is not None and accumulated_tool_args:
+                result = await asyncio.to_thread(
+                    self._join_streamed_tool_calls,
+                    accumulated_tool_args,
+                    prefetcher,
+                    available_functions or {},
+                    from_task,
+                    from_agent,
+                )
+                if result is not None:
+                    return result
+
             if accumulated_tool_args and available_functions:
                 # Convert accumulated tool args to ChatCompletionDeltaToolCall objects
                 tool_calls_list: list[ChatCompletionDeltaToolCall] = [
@@ -1501,6 +1664,9 @@ class LLM(BaseLLM):
                 )
                 return full_response
             raise
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
 
     def _handle_tool_call(
         self,
@@ -1509,7 +1675,10 @@ class LLM(BaseLLM):
         from_task: Task | None = None,
         from_agent: Agent | None = None,
     ) -> Any:
-        """Handle a tool call from the LLM.
+        """Handle the tool calls from the LLM.
+
+        Every tool call of the response is executed, concurrently where the
+        tools allow it, and the results are returned in call order.
 
         Args:
             tool_calls: List of tool calls from the LLM
@@ -1518,14 +1687,48 @@ class LLM(BaseLLM):
             from_agent: Optional Agent that invoked the LLM
 
         Returns:
-            The result of the tool call, or None if no tool call was made
+            The result of the tool calls, or None if no tool call was made
         """
         # --- 1) Validate tool calls and available functions
         if not tool_calls or not available_functions:
             return None
 
-        # --- 2) Extract function name from first tool call
-        tool_call = tool_calls[0]
+        # --- 2) Execute every tool call and keep the model's order
+        results = self._dispatch_tool_calls(
+            tool_calls,
+            [tool_call.function.name for tool_call in tool_calls],
+            lambda tool_call: self._execute_tool_call(
+                tool_call, available_functions, from_task, from_agent
+            ),
+            available_functions,
+            from_agent,
+        )
+        return self._combine_tool_results(
+            [
+                (getattr(tool_call, "id", None) or f"call_{i}", tool_call.function.name)
+                for i, tool_call in enumerate(tool_calls)
+            ],
+            results,
+        )
+
+    def _execute_tool_call(
+        self,
+        tool_call: Any,
+        available_functions: dict[str, Any],
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+    ) -> Any:
+        """Execute a single tool call from the LLM.
+
+        Args:
+            tool_call: Tool call from the LLM
+            available_functions: Dict of available functions
+            from_task: Optional Task that invoked the LLM
+            from_agent: Optional Agent that invoked the LLM
+
+        Returns:
+            The result of the tool call, or None if it could not be executed
+        """
         function_name = tool_call.function.name
         function_args = {}  # Initialize to empty dict to avoid unbound variable
 
@@ -1653,8 +1856,16 @@ class LLM(BaseLLM):
                     msg_role: Literal["assistant"] = "assistant"
                     message["role"] = msg_role
 
-        if not self._invoke_before_llm_call_hooks(messages, from_agent):
+        hook_result = self._invoke_before_llm_call_hooks(
+            messages,
+            from_agent,
+            tools=tools,
+            available_functions=available_functions,
+        )
+        if hook_result is False:
             raise ValueError("LLM call blocked by before_llm_call hook")
+        if isinstance(hook_result, str):
+            return self._invoke_after_llm_call_hooks(messages, hook_result, from_agent)
 
         # --- 5) Set up callbacks if provided
         with suppress_warnings():
@@ -2107,6 +2318,7 @@ class LLM(BaseLLM):
                 "callbacks",
                 "reasoning_effort",
                 "stream",
+                "speculative_tool_calls",
                 "stop",
             ]
         }
@@ -2134,6 +2346,7 @@ class LLM(BaseLLM):
             callbacks=self.callbacks,
             reasoning_effort=self.reasoning_effort,
             stream=self.stream,
+            speculative_tool_calls=self.speculative_tool_calls,
             stop=self.stop,
             **filtered_params,
         )
@@ -2169,6 +2382,7 @@ class LLM(BaseLLM):
                 "callbacks",
                 "reasoning_effort",
                 "stream",
+                "speculative_tool_calls",
                 "stop",
             ]
         }
@@ -2202,6 +2416,7 @@ class LLM(BaseLLM):
             callbacks=copy.deepcopy(self.callbacks, memo) if self.callbacks else None,
             reasoning_effort=self.reasoning_effort,
             stream=self.stream,
+            speculative_tool_calls=self.speculative_tool_calls,
             stop=copy.deepcopy(self.stop, memo) if self.stop else None,
             **filtered_params,
         )
@@ -7,11 +7,14 @@ in iTaK, including common functionality for native SDK implementations.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
 from datetime import datetime
 import json
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, TypeVar, cast
 
 from pydantic import BaseModel
 
@@ -41,6 +44,35 @@ if TYPE_CHECKING:
 DEFAULT_CONTEXT_WINDOW_SIZE: Final[int] = 4096
 DEFAULT_SUPPORTS_STOP_WORDS: Final[bool] = True
 _JSON_EXTRACTION_PATTERN: Final[re.Pattern[str]] = re.compile(r"\{.*}", re.DOTALL)
+DEFAULT_MAX_PARALLEL_TOOL_CALLS: Final[int] = 4
+
+_CallT = TypeVar("_CallT")
+_ResultT = TypeVar("_ResultT")
+
+
+class NativeToolCall(NamedTuple):
+    """One tool call from a native function-calling response."""
+
+    id: str
+    name: str
+    arguments: dict[str, Any]
+
+
+def _is_parallel_safe(fn: Any) -> bool:
+    """Whether a callable may run concurrently with other tool calls.
+
+    Bound methods of tools defer to the tool's ``parallel_safe`` flag, and
+    structured tools to the ``BaseTool`` they were built from. Tools with a
+    ``max_usage_count`` run serially so their usage checks cannot race.
+    """
+    owner = getattr(fn, "__self__", fn)
+    tool = getattr(owner, "_original_tool", None) or owner
+    if any(
+        getattr(candidate, "max_usage_count", None) is not None
+        for candidate in (owner, tool)
+    ):
+        return False
+    return bool(getattr(tool, "parallel_safe", True))
 
 
 class BaseLLM(ABC):
@@ -108,6 +140,7 @@ class BaseLLM(ABC):
             "completion_tokens": 0,
             "successful_requests": 0,
             "cached_prompt_tokens": 0,
+            "cached_responses": 0,
         }
 
     @property
@@ -368,6 +401,9 @@ class BaseLLM(ABC):
         if not hasattr(iTaK_event_bus, "emit"):
             raise ValueError("iTaK_event_bus does not have an emit method") from None
 
+        if not iTaK_event_bus.has_handlers(LLMStreamChunkEvent):
+            return
+
         iTaK_event_bus.emit(
             self,
             event=LLMStreamChunkEvent(
@@ -477,6 +513,162 @@ class BaseLLM(ABC):
 
             return None
 
+    @staticmethod
+    def _parse_tool_arguments(arguments: str | None) -> dict[str, Any]:
+        """Decode the JSON arguments of a native tool call.
+
+        Args:
+            arguments: Raw JSON arguments from the provider.
+
+        Returns:
+            The decoded arguments, or an empty dict if they are not valid JSON.
+        """
+        try:
+            return json.loads(arguments or "{}")
+        except json.JSONDecodeError as e:
+            logging.error(f"Failed to parse tool arguments: {e}")
+            return {}
+
+    def _dispatch_tool_calls(
+        self,
+        tool_calls: Sequence[_CallT],
+        names: Sequence[str],
+        execute: Callable[[_CallT], _ResultT],
+        available_functions: dict[str, Any],
+        from_agent: Agent | None = None,
+    ) -> list[_ResultT]:
+        """Run the tool calls of one response, concurrently where safe.
+
+        Calls to tools that are not parallel-safe run one at a time on the
+        calling thread; the rest share a pool capped by the agent's
+        ``max_parallel_tool_calls``.
+
+        Args:
+            tool_calls: Provider tool calls in the order the model returned them.
+            names: Function name of each tool call.
+            execute: Runs one tool call.
+            available_functions: Dict of available functions
+            from_agent: Optional agent object
+
+        Returns:
+            One result per tool call, in the original call order.
+        """
+        limit = getattr(
+            from_agent, "max_parallel_tool_calls", DEFAULT_MAX_PARALLEL_TOOL_CALLS
+        )
+        parallel = [
+            i
+            for i, name in enumerate(names)
+            if _is_parallel_safe(available_functions.get(name))
+        ]
+        if limit <= 1 or len(parallel) <= 1:
+            return [execute(call) for call in tool_calls]
+
+        results: dict[int, _ResultT] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(limit, len(parallel)), thread_name_prefix="tool-call"
+        ) as pool:
+            futures: dict[int, Future[_ResultT]] = {
+                i: pool.submit(contextvars.copy_context().run, execute, tool_calls[i])
+                for i in parallel
+            }
+            for i, call in enumerate(tool_calls):
+                if i not in futures:
+                    results[i] = execute(call)
+            for i, future in futures.items():
+                results[i] = future.result()
+        return [results[i] for i in range(len(tool_calls))]
+
+    def _handle_tool_executions(
+        self,
+        tool_calls: Sequence[NativeToolCall],
+        available_functions: dict[str, Any],
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+    ) -> list[str | None]:
+        """Execute every tool call of one response.
+
+        Each call goes through ``_handle_tool_execution``, so events are
+        emitted per call.
+
+        Args:
+            tool_calls: Tool calls in the order the model returned them.
+            available_functions: Dict of available functions
+            from_task: Optional task object
+            from_agent: Optional agent object
+
+        Returns:
+            One result per tool call, in the original call order.
+        """
+
+        def execute(call: NativeToolCall) -> str | None:
+            return self._handle_tool_execution(
+                function_name=call.name,
+                function_args=call.arguments,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+
+        return self._dispatch_tool_calls(
+            tool_calls,
+            [call.name for call in tool_calls],
+            execute,
+            available_functions,
+            from_agent,
+        )
+
+    @staticmethod
+    def _combine_tool_results(
+        tool_calls: Sequence[tuple[str, str]], results: Sequence[Any]
+    ) -> Any:
+        """Combine the results of the tool calls of one response.
+
+        Args:
+            tool_calls: ``(id, name)`` of each tool call, in call order.
+            results: Result of each tool call.
+
+        Returns:
+            The result of a single call as is, the labelled results of several
+            calls in call order, or None if no call produced a result.
+        """
+        if len(results) == 1:
+            return results[0]
+        combined = [
+            f"Result of {name} (call {call_id}):\n{result}"
+            for (call_id, name), result in zip(tool_calls, results, strict=True)
+            if result is not None
+        ]
+        return "\n\n".join(combined) if combined else None
+
+    def _handle_tool_calls(
+        self,
+        tool_calls: Sequence[NativeToolCall],
+        available_functions: dict[str, Any],
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+    ) -> str | None:
+        """Execute all tool calls of a response and combine their results.
+
+        Args:
+            tool_calls: Tool calls in the order the model returned them.
+            available_functions: Dict of available functions
+            from_task: Optional task object
+            from_agent: Optional agent object
+
+        Returns:
+            The combined result, or None if no call produced a result.
+        """
+        results = self._handle_tool_executions(
+            tool_calls, available_functions, from_task, from_agent
+        )
+        return cast(
+            "str | None",
+            self._combine_tool_results(
+                [(call.id, call.name) for call in tool_calls], results
+            ),
+        )
+
     def _format_messages(self, messages: str | list[LLMMessage]) -> list[LLMMessage]:
         """Convert messages to standard format.
 
@@ -601,7 +793,9 @@ class BaseLLM(ABC):
         self,
         messages: list[LLMMessage],
         from_agent: Agent | None = None,
-    ) -> bool:
+        tools: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+    ) -> bool | str:
         """Invoke before_llm_call hooks for direct LLM calls (no agent context).
 
         This method should be called by native provider implementations before
@@ -610,16 +804,23 @@ class BaseLLM(ABC):
         Args:
             messages: The messages being sent to the LLM
             from_agent: The agent making the call (None for direct calls)
+            tools: Tool schemas offered to the model
+            available_functions: Functions executing the model's tool calls
 
         Returns:
-            True if LLM call should proceed, False if blocked by hook
+            True if LLM call should proceed, False if blocked by hook, or the
+            response string a hook set on the context (e.g. a cache hit), in
+            which case the provider call should be skipped
 
         Example:
             >>> # In a native provider's call() method:
-            >>> if from_agent is None and not self._invoke_before_llm_call_hooks(
-            ...     messages, from_agent
-            ... ):
+            >>> hook_result = self._invoke_before_llm_call_hooks(messages, from_agent)
+            >>> if hook_result is False:
             ...     raise ValueError("LLM call blocked by hook")
+            >>> if isinstance(hook_result, str):
+            ...     return self._invoke_after_llm_call_hooks(
+            ...         messages, hook_result, from_agent
+            ...     )
         """
         # Only invoke hooks for direct calls (no agent context)
         if from_agent is not None:
@@ -642,6 +843,8 @@ class BaseLLM(ABC):
             agent=None,
             task=None,
             crew=None,
+            tools=tools,
+            available_functions=available_functions,
         )
         printer = Printer()
 
@@ -660,6 +863,9 @@ class BaseLLM(ABC):
                 color="yellow",
             )
 
+        if isinstance(hook_context.response, str):
+            return hook_context.response
+
         return True
 
     def _invoke_after_llm_call_hooks(
@@ -0,0 +1,491 @@
+"""Response cache for LLM calls, built on the before/after LLM call hooks.
+
+Identical prompts in retries, ``kickoff_for_each`` runs, evals and tests are
+served from a local SQLite store instead of paying for another provider round
+trip. A record/replay mode lets whole crews rerun offline against previously
+recorded responses.
+
+Example:
+    >>> from itak.llms.cache import LLMResponseCache
+    >>> cache = LLMResponseCache(ttl_seconds=3600)
+    >>> cache.install()  # registers global before/after LLM call hooks
+    >>> crew.kickoff()
+    >>> cache.uninstall()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Final, Literal
+
+import numpy as np
+from pydantic import BaseModel
+
+from itak.events.event_bus import iTaK_event_bus
+from itak.events.types.llm_events import LLMCallCompletedEvent, LLMCallType
+from itak.utilities.paths import db_storage_path
+from itak.utilities.printer import Printer
+from itak.utilities.prompt_cache import tool_args_json
+
+
+if TYPE_CHECKING:
+    from itak.hooks.llm_hooks import LLMCallHookContext
+
+
+CacheMode = Literal["read_write", "record", "replay"]
+EmbedderCallable = Callable[[Sequence[str]], Sequence[Sequence[float]]]
+
+# LLM attributes that change the response for identical messages.
+_KEY_PARAMS: Final[tuple[str, ...]] = (
+    "temperature",
+    "top_p",
+    "n",
+    "stop",
+    "max_tokens",
+    "max_completion_tokens",
+    "presence_penalty",
+    "frequency_penalty",
+    "seed",
+    "response_format",
+    "reasoning_effort",
+)
+
+# Message fields that influence the completion.
+_MESSAGE_FIELDS: Final[tuple[str, ...]] = (
+    "role",
+    "content",
+    "name",
+    "tool_calls",
+    "tool_call_id",
+)
+
+# Most recently used entries compared against a semantic lookup.
+DEFAULT_SEMANTIC_SCAN_LIMIT: Final[int] = 512
+
+_served_key: ContextVar[str | None] = ContextVar("_llm_cache_served_key", default=None)
+# (messages digest, key, scope) of the request seen by the last before hook.
+# Direct-call after hooks do not get the call's tools, so they reuse its key.
+_pending_request: ContextVar[tuple[str, str, str] | None] = ContextVar(
+    "_llm_cache_pending_request", default=None
+)
+
+
+def _normalize_messages(messages: Sequence[Any]) -> list[dict[str, Any]]:
+    """Reduce messages to the fields that influence the completion."""
+    normalized = []
+    for message in messages:
+        if not isinstance(message, dict):
+            normalized.append({"content": str(message)})
+            continue
+        item = {
+            key: value.strip() if isinstance(value, str) else value
+            for key, value in message.items()
+            if value is not None and key in _MESSAGE_FIELDS
+        }
+        normalized.append(item)
+    return normalized
+
+
+def _prompt_text(messages: list[dict[str, Any]]) -> str:
+    """Flatten normalized messages into the text used for semantic matching."""
+    lines = []
+    for message in messages:
+        content = message.get("content")
+        if not isinstance(content, str):
+            content = json.dumps(content, sort_keys=True, default=str)
+        lines.append(f"{message.get('role', '')}: {content}")
+    return "\n".join(lines)
+
+
+def _hash(payload: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _encode_embedding(vector: Sequence[float]) -> bytes:
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+
+def _decode_embedding(stored: bytes | str) -> np.ndarray:
+    """Decode a stored embedding, accepting the JSON text of older entries."""
+    if isinstance(stored, str):
+        return np.asarray(json.loads(stored), dtype=np.float32)
+    return np.frombuffer(stored, dtype=np.float32)
+
+
+def _describe_tool(tool: Any) -> Any:
+    """Reduce a tool to what the model sees: name, description and arguments."""
+    if isinstance(tool, dict):
+        return tool
+    schema = getattr(tool, "args_schema", None)
+    args = (
+        tool_args_json(schema)
+        if isinstance(schema, type) and issubclass(schema, BaseModel)
+        else None
+    )
+    return {
+        "name": getattr(tool, "name", str(tool)),
+        "description": getattr(tool, "description", ""),
+        "args": args,
+    }
+
+
+class LLMResponseCache:
+    """SQLite-backed exact-match and semantic cache for LLM responses.
+
+    Entries are keyed by a hash of (model, normalized messages, tools,
+    sampling params). Lookups that miss the exact tier can optionally fall
+    back to an embedding-similarity tier scoped to the same model, tools and
+    params, which compares the prompt against the ``semantic_scan_limit``
+    most recently used entries of that scope.
+
+    Modes:
+        read_write: serve hits, store misses (default)
+        record: always call the provider and store every response
+        replay: only serve from the cache; a miss blocks the LLM call
+
+    Attributes:
+        db_path: Path of the SQLite database file.
+        mode: Cache mode, see above.
+        ttl_seconds: Maximum age of a usable entry, None for no expiry.
+        max_entries: Maximum number of stored entries, evicted LRU.
+        embedder: Optional callable embedding a batch of texts.
+        similarity_threshold: Minimum cosine similarity for a semantic hit.
+        semantic_scan_limit: Number of recent entries a semantic lookup scans.
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that fell through to the provider.
+    """
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        mode: CacheMode = "read_write",
+        ttl_seconds: float | None = None,
+        max_entries: int | None = 10_000,
+        embedder: EmbedderCallable | None = None,
+        similarity_threshold: float = 0.95,
+        semantic_scan_limit: int = DEFAULT_SEMANTIC_SCAN_LIMIT,
+    ) -> None:
+        """Initialize the cache and create its table if needed.
+
+        Args:
+            db_path: Optional path to the database file.
+            mode: One of "read_write", "record" or "replay".
+            ttl_seconds: Maximum age of a usable entry, None for no expiry.
+            max_entries: Maximum number of stored entries, None for unbounded.
+            embedder: Optional callable enabling the semantic tier.
+            similarity_threshold: Minimum cosine similarity for a semantic hit.
+            semantic_scan_limit: Number of most recently used entries of the
+                scope a semantic lookup compares against.
+        """
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "llm_response_cache.db")
+        self.db_path = db_path
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.semantic_scan_limit = semantic_scan_limit
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._printer = Printer()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._initialize_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _initialize_db(self) -> None:
+        """Initialize the SQLite database and create the cache table."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT NOT NULL,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    embedding BLOB,
+                    created_at REAL NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("DROP INDEX IF EXISTS idx_llm_cache_scope")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_scope_recent "
+                "ON llm_response_cache (scope, last_used_at)"
+            )
+
+    @staticmethod
+    def build_key(
+        model: str,
+        messages: Sequence[Any],
+        tools: Sequence[Any] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[str, str]:
+        """Build the (exact key, semantic scope) pair for a request.
+
+        Args:
+            model: Model identifier.
+            messages: Messages sent to the model.
+            tools: Tool definitions available to the model.
+            params: Sampling parameters that affect the response.
+
+        Returns:
+            Tuple of the exact-match key and the scope hash shared by
+            requests that only differ in their messages.
+        """
+        scope = _hash({"model": model, "tools": tools or [], "params": params or {}})
+        key = _hash({"scope": scope, "messages": _normalize_messages(messages)})
+        return key, scope
+
+    @staticmethod
+    def _describe_request(
+        context: LLMCallHookContext,
+    ) -> tuple[str, list[Any], dict[str, Any]]:
+        llm = context.llm
+        model = llm if isinstance(llm, str) else getattr(llm, "model", str(llm))
+        params = {
+            name: getattr(llm, name)
+            for name in _KEY_PARAMS
+            if getattr(llm, name, None) is not None
+        }
+        tools = [_describe_tool(tool) for tool in (context.tools or [])]
+        if context.available_functions:
+            params["available_functions"] = sorted(context.available_functions)
+        return model, tools, params
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(
+        self,
+        key: str,
+        scope: str | None = None,
+        prompt: str | None = None,
+    ) -> str | None:
+        """Return a cached response for the key, or a semantic match.
+
+        Args:
+            key: Exact-match key from `build_key`.
+            scope: Scope hash from `build_key`, required for the semantic tier.
+            prompt: Flattened prompt text, required for the semantic tier.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and self._is_expired(row[1], now):
+                conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                row = None
+            if row is not None:
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_used_at = ? WHERE key = ?",
+                    (now, key),
+                )
+                return row[0]
+
+        if self.embedder is None or scope is None or prompt is None:
+            return None
+        return self._semantic_get(scope, prompt, now)
+
+    def _semantic_get(self, scope: str, prompt: str, now: float) -> str | None:
+        embedded = self.embedder([prompt])  # type: ignore[misc]
+        query = np.asarray(embedded[0], dtype=np.float32)
+        min_created_at = now - self.ttl_seconds if self.ttl_seconds is not None else 0
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, embedding FROM llm_response_cache "
+                "WHERE scope = ? AND embedding IS NOT NULL AND created_at >= ? "
+                "ORDER BY last_used_at DESC LIMIT ?",
+                (scope, min_created_at, self.semantic_scan_limit),
+            ).fetchall()
+            rows = [
+                (key, vector)
+                for key, embedding in rows
+                if (vector := _decode_embedding(embedding)).shape == query.shape
+            ]
+            if not rows:
+                return None
+
+            matrix = np.stack([vector for _, vector in rows])
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+            norms[norms == 0] = np.inf
+            scores = matrix @ query / norms
+            best = int(np.argmax(scores))
+            if scores[best] < self.similarity_threshold:
+                return None
+
+            best_key = rows[best][0]
+            row = conn.execute(
+                "SELECT response FROM llm_response_cache WHERE key = ?",
+                (best_key,),
+            ).fetchone()
+            conn.execute(
+                "UPDATE llm_response_cache SET last_used_at = ? WHERE key = ?",
+                (now, best_key),
+            )
+        return row[0]
+
+    def set(
+        self,
+        key: str,
+        response: str,
+        scope: str = "",
+        model: str | None = None,
+        prompt: str | None = None,
+    ) -> None:
+        """Store a response and evict least recently used entries over the limit.
+
+        Args:
+            key: Exact-match key from `build_key`.
+            response: The response text to store.
+            scope: Scope hash from `build_key`.
+            model: Model identifier, kept for inspection.
+            prompt: Flattened prompt text, embedded when the semantic tier is on.
+        """
+        embedding = None
+        if self.embedder is not None and prompt is not None:
+            embedding = _encode_embedding(self.embedder([prompt])[0])
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache "
+                "(key, scope, model, response, embedding, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, scope, model, response, embedding, now, now),
+            )
+            if self.max_entries is not None:
+                conn.execute(
+                    "DELETE FROM llm_response_cache WHERE key IN ("
+                    "SELECT key FROM llm_response_cache ORDER BY last_used_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        """Delete every cached response."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_response_cache")
+
+    def before_llm_call(self, context: LLMCallHookContext) -> bool | None:
+        """before_llm_call hook serving cached responses.
+
+        Sets ``context.response`` on a hit, which makes the caller skip the
+        provider call. In replay mode a miss blocks the call.
+        """
+        _served_key.set(None)
+        model, tools, params = self._describe_request(context)
+        key, scope = self.build_key(model, context.messages, tools, params)
+        messages = _normalize_messages(context.messages)
+        _pending_request.set((_hash(messages), key, scope))
+        if self.mode == "record":
+            return None
+
+        prompt = _prompt_text(messages)
+        response = self.get(key, scope, prompt)
+
+        if response is None:
+            self.misses += 1
+            if self.mode == "replay":
+                self._printer.print(
+                    content=(
+                        f"LLM cache replay miss for model {model} (key {key[:12]})"
+                    ),
+                    color="red",
+                )
+                return False
+            return None
+
+        self.hits += 1
+        _served_key.set(key)
+        context.response = response
+        self._record_hit(context, model, response)
+        return None
+
+    def after_llm_call(self, context: LLMCallHookContext) -> str | None:
+        """after_llm_call hook storing fresh responses."""
+        served = _served_key.get()
+        pending = _pending_request.get()
+        _served_key.set(None)
+        _pending_request.set(None)
+        if self.mode == "replay" or not isinstance(context.response, str):
+            return None
+
+        model, tools, params = self._describe_request(context)
+        messages = _normalize_messages(context.messages)
+        if pending is not None and pending[0] == _hash(messages):
+            _, key, scope = pending
+        else:
+            key, scope = self.build_key(model, context.messages, tools, params)
+        if served == key:
+            return None
+
+        prompt = _prompt_text(messages) if self.embedder is not None else None
+        try:
+            self.set(key, context.response, scope=scope, model=model, prompt=prompt)
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM cache error while storing response: {e}",
+                color="red",
+            )
+        return None
+
+    def _record_hit(
+        self, context: LLMCallHookContext, model: str, response: str
+    ) -> None:
+        """Count a cache hit in the LLM's usage metrics and emit a completed event."""
+        token_usage = getattr(context.llm, "_token_usage", None)
+        if isinstance(token_usage, dict):
+            token_usage["cached_responses"] = token_usage.get("cached_responses", 0) + 1
+
+        if iTaK_event_bus.has_handlers(LLMCallCompletedEvent):
+            iTaK_event_bus.emit(
+                context.llm,
+                LLMCallCompletedEvent(
+                    messages=context.messages,  # type: ignore[arg-type]
+                    response=response,
+                    call_type=LLMCallType.LLM_CALL,
+                    model=model,
+                    from_task=context.task,
+                    from_agent=context.agent,
+                    cached=True,
+                ),
+            )
+
+    def install(self) -> None:
+        """Register this cache as global before/after LLM call hooks."""
+        from itak.hooks.llm_hooks import (
+            register_after_llm_call_hook,
+            register_before_llm_call_hook,
+        )
+
+        register_before_llm_call_hook(self.before_llm_call)
+        register_after_llm_call_hook(self.after_llm_call)
+
+    def uninstall(self) -> None:
+        """Remove this cache's global hooks."""
+        from itak.hooks.llm_hooks import (
+            unregister_after_llm_call_hook,
+            unregister_before_llm_call_hook,
+        )
+
+        unregister_before_llm_call_hook(self.before_llm_call)
+        unregister_after_llm_call_hook(self.after_llm_call)
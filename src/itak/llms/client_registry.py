@@ -0,0 +1,382 @@
+"""Process-wide registry of provider SDK clients and their connection pools.
+
+Every native LLM used to build its own SDK client, each with a private
+connection pool, so a crew of agents on the same model kept one pool per
+agent. The registry hands out a single client per
+``(provider, base URL, credentials hash, transport config, interceptor)``,
+so LLM instances that talk to the same endpoint share keep-alive connections.
+
+SDK clients (``OpenAI``, ``Anthropic``, boto3) are thread-safe, so sync clients
+are shared process-wide. Async HTTP connections are bound to the event loop
+that opened them, so async clients are created lazily, once per running loop;
+an async client requested outside any loop keeps one pool per loop it is used
+from. Entries built for an interceptor are released once the interceptor is
+garbage collected.
+
+When an LLM has an interceptor, its requests go through an
+``itak.llms.hooks.transport`` transport wrapping the shared pool. The
+interceptor therefore sees the pooled requests and responses, including
+``response.extensions["http_version"]``, which shows connection reuse and
+HTTP/2 at the transport level.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+from collections.abc import Callable, Coroutine, Mapping
+from dataclasses import dataclass
+import hashlib
+import importlib.util
+import json
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+import weakref
+
+import httpx
+
+from itak.llms.hooks.transport import AsyncHTTPTransport, HTTPTransport
+
+
+if TYPE_CHECKING:
+    from itak.llms.hooks.base import BaseInterceptor
+
+
+T = TypeVar("T")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection pool settings shared by every client built from a registry entry.
+
+    Attributes:
+        max_connections: Maximum concurrent connections per pool.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection is kept alive.
+        http2: Negotiate HTTP/2 when the ``h2`` package is installed.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = HTTP2_AVAILABLE
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def _fingerprint(config: Mapping[str, Any]) -> str:
+    """Hash client configuration so credentials never appear in registry keys."""
+    payload = json.dumps(dict(config), sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _PerLoopAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport keeping one connection pool per event loop.
+
+    Lets a single async client be built outside any loop and then used from
+    several: each loop gets its own pool, so no connection ever crosses loops.
+
+    Args:
+        build: Creates the transport for a newly seen loop.
+    """
+
+    def __init__(self, build: Callable[[], httpx.AsyncBaseTransport]) -> None:
+        self._build = build
+        self._transports: dict[
+            int, tuple[asyncio.AbstractEventLoop, httpx.AsyncBaseTransport]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def _transport(self) -> httpx.AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for key in [k for k, (lp, _) in self._transports.items() if lp.is_closed()]:
+                del self._transports[key]
+            entry = self._transports.get(id(loop))
+            if entry is None:
+                entry = self._transports[id(loop)] = (loop, self._build())
+            return entry[1]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the pool of the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._transports.pop(id(loop), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    def close_idle(self) -> None:
+        """Close the pools of loops that are neither running nor closed."""
+        with self._lock:
+            entries, self._transports = list(self._transports.values()), {}
+        for loop, transport in entries:
+            _close_on_loop(loop, transport.aclose())
+
+
+def _close_on_loop(
+    loop: asyncio.AbstractEventLoop, closing: Coroutine[Any, Any, None]
+) -> None:
+    """Run an ``aclose()`` on its idle loop; connections of busy loops are dropped."""
+    if loop.is_closed() or loop.is_running():
+        closing.close()
+        return
+    try:
+        loop.run_until_complete(closing)
+    except Exception:  # noqa: S110
+        pass
+
+
+class ClientRegistry:
+    """Shares SDK clients and HTTP connection pools across LLM instances.
+
+    Args:
+        transport_config: Pool settings used for HTTP clients built by the
+            registry.
+    """
+
+    def __init__(self, transport_config: TransportConfig | None = None) -> None:
+        self.transport_config = transport_config or TransportConfig()
+        self._clients: dict[tuple[Any, ...], Any] = {}
+        # HTTP clients built for each entry of ``_clients``, with the loop an
+        # async one is bound to.
+        self._http_clients: dict[
+            tuple[Any, ...],
+            tuple[httpx.Client | httpx.AsyncClient, asyncio.AbstractEventLoop | None],
+        ] = {}
+        # Interceptors are part of the key by identity. They are only watched
+        # weakly: once one is collected its entries are released, before its
+        # id can be reused.
+        self._interceptor_ids: set[int] = set()
+        self._released_interceptors: list[int] = []
+        self._lock = threading.Lock()
+
+    def _key(
+        self,
+        provider: str,
+        config: Mapping[str, Any],
+        interceptor: BaseInterceptor[Any, Any] | None,
+        *extra: Any,
+    ) -> tuple[Any, ...]:
+        if interceptor is not None and id(interceptor) not in self._interceptor_ids:
+            self._interceptor_ids.add(id(interceptor))
+            # list.append is atomic, so the finalizer is safe to run from the
+            # garbage collector at any point, even while the lock is held.
+            weakref.finalize(
+                interceptor, self._released_interceptors.append, id(interceptor)
+            )
+        return (
+            provider,
+            _fingerprint(config),
+            id(interceptor) if interceptor is not None else None,
+            self.transport_config,
+            *extra,
+        )
+
+    def _transport_kwargs(self) -> dict[str, Any]:
+        config = self.transport_config
+        return {"limits": config.limits(), "http2": config.http2}
+
+    def _http_client(
+        self, interceptor: BaseInterceptor[Any, Any] | None
+    ) -> httpx.Client:
+        transport = (
+            # Weakly, so the shared client does not keep its interceptor alive.
+            HTTPTransport(
+                interceptor=weakref.proxy(interceptor), **self._transport_kwargs()
+            )
+            if interceptor is not None
+            else httpx.HTTPTransport(**self._transport_kwargs())
+        )
+        return httpx.Client(transport=transport, follow_redirects=True)
+
+    def _async_transport(
+        self, interceptor: BaseInterceptor[Any, Any] | None
+    ) -> httpx.AsyncBaseTransport:
+        if interceptor is not None:
+            return AsyncHTTPTransport(
+                interceptor=weakref.proxy(interceptor), **self._transport_kwargs()
+            )
+        return httpx.AsyncHTTPTransport(**self._transport_kwargs())
+
+    def _get_or_build(
+        self,
+        key: tuple[Any, ...],
+        factory: Callable[[Any], T],
+        build_http_client: Callable[[], httpx.Client | httpx.AsyncClient],
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> T:
+        client = self._clients.get(key)
+        if client is None:
+            http_client = build_http_client()
+            client = factory(http_client)
+            self._clients[key] = client
+            self._http_clients[key] = (http_client, loop)
+        return client
+
+    def client(
+        self,
+        provider: str,
+        factory: Callable[[httpx.Client], T],
+        config: Mapping[str, Any],
+        interceptor: BaseInterceptor[Any, Any] | None = None,
+    ) -> T:
+        """Return the shared sync SDK client for a provider configuration.
+
+        Args:
+            provider: Provider name, part of the registry key.
+            factory: Builds the SDK client around the given pooled HTTP client.
+            config: Everything that distinguishes one client from another
+                (base URL, credentials, headers, retries, ...).
+            interceptor: Optional interceptor wrapped around the pool.
+
+        Returns:
+            A client shared with every caller passing an equal key.
+        """
+        with self._lock:
+            stale = self._release_collected_interceptors()
+            key = self._key(provider, config, interceptor, "sync")
+            client = self._get_or_build(
+                key, factory, lambda: self._http_client(interceptor)
+            )
+        self._close_http_clients(stale)
+        return client
+
+    def async_client(
+        self,
+        provider: str,
+        factory: Callable[[httpx.AsyncClient], T],
+        config: Mapping[str, Any],
+        interceptor: BaseInterceptor[Any, Any] | None = None,
+    ) -> T:
+        """Return the shared async SDK client for the current event loop.
+
+        Outside a running loop the client is shared as well, but its HTTP
+        client opens a separate pool for every loop it is later used from.
+        """
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            self._evict_closed_loops()
+            stale = self._release_collected_interceptors()
+            if loop is None:
+                key = self._key(provider, config, interceptor, "async", None)
+                client = self._get_or_build(
+                    key,
+                    factory,
+                    lambda: httpx.AsyncClient(
+                        transport=_PerLoopAsyncTransport(
+                            lambda: self._async_transport(interceptor)
+                        ),
+                        follow_redirects=True,
+                    ),
+                )
+            else:
+                key = self._key(provider, config, interceptor, "async", id(loop))
+                client = self._get_or_build(
+                    key,
+                    factory,
+                    lambda: httpx.AsyncClient(
+                        transport=self._async_transport(interceptor),
+                        follow_redirects=True,
+                    ),
+                    loop,
+                )
+        self._close_http_clients(stale)
+        return client
+
+    def shared(
+        self, provider: str, factory: Callable[[], T], config: Mapping[str, Any]
+    ) -> T:
+        """Return a shared client whose SDK manages its own connection pool.
+
+        Used for clients such as boto3 that cannot take an ``httpx`` client.
+        """
+        with self._lock:
+            key = self._key(provider, config, None, "shared")
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+            return client
+
+    def _pop_entries(
+        self, predicate: Callable[[tuple[Any, ...]], bool]
+    ) -> list[tuple[httpx.Client | httpx.AsyncClient, Any]]:
+        keys = [key for key in self._clients if predicate(key)]
+        for key in keys:
+            del self._clients[key]
+        return [
+            self._http_clients.pop(key) for key in keys if key in self._http_clients
+        ]
+
+    def _release_collected_interceptors(
+        self,
+    ) -> list[tuple[httpx.Client | httpx.AsyncClient, Any]]:
+        if not self._released_interceptors:
+            return []
+        released = set()
+        while self._released_interceptors:
+            released.add(self._released_interceptors.pop())
+        self._interceptor_ids -= released
+        return self._pop_entries(lambda key: key[2] in released)
+
+    def _evict_closed_loops(self) -> None:
+        closed = {
+            id(loop)
+            for _, loop in self._http_clients.values()
+            if loop is not None and loop.is_closed()
+        }
+        if not closed:
+            return
+        # Connections of a closed loop cannot be used or closed gracefully.
+        self._pop_entries(
+            lambda key: len(key) > 5 and key[4] == "async" and key[5] in closed
+        )
+
+    @staticmethod
+    def _close_http_clients(
+        http_clients: list[tuple[httpx.Client | httpx.AsyncClient, Any]],
+    ) -> None:
+        for http_client, loop in http_clients:
+            if isinstance(http_client, httpx.Client):
+                http_client.close()
+            elif loop is not None:
+                _close_on_loop(loop, http_client.aclose())
+            elif isinstance(http_client._transport, _PerLoopAsyncTransport):
+                http_client._transport.close_idle()
+
+    def close(self) -> None:
+        """Close every pooled connection and forget all shared clients."""
+        with self._lock:
+            http_clients = list(self._http_clients.values())
+            self._http_clients.clear()
+            self._clients.clear()
+        self._close_http_clients(http_clients)
+
+
+_registry: ClientRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Return the process-wide ``ClientRegistry``."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ClientRegistry()
+                atexit.register(_registry.close)
+    return _registry
@@ -0,0 +1,436 @@
+"""Hedged, failover-aware routing across several LLMs.
+
+``HedgedLLM`` sends each call to a primary model. If no answer arrives
+within the primary's recent latency percentile, it sends the same request
+to the next model and returns whichever answers first. Failed calls move on
+to the next model, and models whose circuit breaker is open are skipped
+until they recover. Per-model latency histograms drive the hedge delay, so
+it follows each provider's actual tail instead of a fixed timeout.
+
+Example:
+    >>> from itak import LLM
+    >>> from itak.llms.hedging import HedgedLLM
+    >>> llm = HedgedLLM(LLM(model="gpt-4o"), fallbacks=[LLM(model="claude-sonnet-4")])
+    >>> agent = Agent(role="...", goal="...", backstory="...", llm=llm)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import contextvars
+from dataclasses import dataclass
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from itak.llms.base_llm import BaseLLM
+from itak.types.usage_metrics import UsageMetrics
+from itak.utilities.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pydantic import BaseModel
+
+    from itak.agent.core import Agent
+    from itak.task import Task
+    from itak.tools.base_tool import BaseTool
+    from itak.utilities.types import LLMMessage
+
+
+HISTOGRAM_MIN_SECONDS: Final[float] = 0.01
+HISTOGRAM_GROWTH: Final[float] = 1.2
+HISTOGRAM_BUCKETS: Final[int] = 64
+"""Bucket bounds grow geometrically from 10 ms to roughly 1.4 hours."""
+
+DEFAULT_MIN_SAMPLES: Final[int] = 20
+
+_BUCKET_BOUNDS: Final[list[float]] = [
+    HISTOGRAM_MIN_SECONDS * HISTOGRAM_GROWTH**i for i in range(HISTOGRAM_BUCKETS)
+]
+
+
+class LatencyHistogram:
+    """Thread-safe log-bucketed latency histogram.
+
+    Percentiles are read from bucket upper bounds, within one bucket
+    (20%) of the true value, using constant memory.
+    """
+
+    def __init__(self) -> None:
+        self._counts = [0] * (HISTOGRAM_BUCKETS + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        """Add one latency sample."""
+        index = bisect_left(_BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+
+    def percentile(self, pct: float) -> float | None:
+        """Latency below which ``pct`` percent of samples fall.
+
+        Returns:
+            The bucket upper bound, or ``None`` without samples.
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            target = max(1, math.ceil(pct / 100 * self.count))
+            seen = 0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if seen >= target:
+                    break
+        if index >= HISTOGRAM_BUCKETS:
+            return _BUCKET_BOUNDS[-1] * HISTOGRAM_GROWTH
+        return _BUCKET_BOUNDS[index]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return sample count and p50/p95/p99 latencies."""
+        return {
+            "count": self.count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+_histograms: dict[str, LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def _route_name(llm: BaseLLM) -> str:
+    return f"{llm.provider}/{llm.model}"
+
+
+def get_latency_histogram(name: str) -> LatencyHistogram:
+    """Return the process-wide latency histogram for a model route name."""
+    with _histograms_lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = LatencyHistogram()
+        return histogram
+
+
+@dataclass(frozen=True)
+class _Route:
+    llm: BaseLLM
+    circuit: CircuitBreaker
+    histogram: LatencyHistogram
+
+
+class HedgedLLM(BaseLLM):
+    """Routes calls across a primary LLM and fallbacks with hedging.
+
+    Hedging sends a duplicate request, so it is skipped for calls that pass
+    ``available_functions``: the wrapped LLM would execute tools itself and
+    could run them twice. Those calls still fail over to the next model.
+
+    Stop words set on the wrapper (as agent executors do) are added to every
+    routed model's own stop words.
+
+    Args:
+        primary: Model tried first.
+        fallbacks: Models hedged to or failed over to, in order.
+        hedge_percentile: Primary latency percentile after which a hedged
+            request is sent.
+        hedge_delay: Fixed hedge delay in seconds, overriding the percentile.
+        min_hedge_delay: Lower bound for the percentile-derived delay.
+        initial_hedge_delay: Delay used until ``min_samples`` latencies are
+            known; ``None`` disables hedging until then.
+        min_samples: Samples needed before the percentile is trusted.
+        max_hedges: Maximum extra in-flight requests per call.
+        failure_threshold: Consecutive failures that open a model's circuit.
+        recovery_timeout: Seconds an open circuit waits before a trial call.
+    """
+
+    def __init__(
+        self,
+        primary: BaseLLM,
+        fallbacks: list[BaseLLM] | None = None,
+        hedge_percentile: float = 95.0,
+        hedge_delay: float | None = None,
+        min_hedge_delay: float = 0.05,
+        initial_hedge_delay: float | None = None,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        max_hedges: int = 1,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+    ) -> None:
+        self.routes: list[_Route] = []
+        super().__init__(
+            model=primary.model,
+            temperature=primary.temperature,
+            provider=primary.provider,
+            stop=list(primary.stop),
+        )
+        self.hedge_percentile = hedge_percentile
+        self.hedge_delay = hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_samples = min_samples
+        self.max_hedges = max_hedges
+        self.routes = [
+            _Route(
+                llm=llm,
+                circuit=get_circuit(
+                    f"llm:{_route_name(llm)}",
+                    failure_threshold=failure_threshold,
+                    recovery_timeout=recovery_timeout,
+                ),
+                histogram=get_latency_histogram(_route_name(llm)),
+            )
+            for llm in [primary, *(fallbacks or [])]
+        ]
+        self._route_stops = [list(route.llm.stop) for route in self.routes]
+        self.stop = self._stop
+        self.hedges_sent = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    @property  # type: ignore[override]
+    def stop(self) -> list[str]:
+        """Stop words added to every routed model's own stop words."""
+        return self._stop
+
+    @stop.setter
+    def stop(self, value: list[str]) -> None:
+        self._stop = list(value)
+        for route, own in zip(self.routes, getattr(self, "_route_stops", [])):
+            route.llm.stop = list(dict.fromkeys([*own, *self._stop]))
+
+    @property
+    def primary(self) -> BaseLLM:
+        """The model tried first."""
+        return self.routes[0].llm
+
+    def _hedge_after(self, route: _Route) -> float | None:
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        if route.histogram.count < self.min_samples:
+            return self.initial_hedge_delay
+        delay = route.histogram.percentile(self.hedge_percentile)
+        return None if delay is None else max(self.min_hedge_delay, delay)
+
+    def _available(self) -> Iterator[_Route]:
+        """Yield routes whose circuit admits a call, reserving the call."""
+        for route in self.routes:
+            if route.circuit.acquire():
+                yield route
+
+    @staticmethod
+    def _invoke(route: _Route, kwargs: dict[str, Any]) -> Any:
+        start = time.monotonic()
+        try:
+            result = route.llm.call(**kwargs)
+        except Exception as e:
+            route.circuit.record_failure(e)
+            raise
+        route.histogram.record(time.monotonic() - start)
+        route.circuit.record_success()
+        return result
+
+    @staticmethod
+    async def _ainvoke(route: _Route, kwargs: dict[str, Any]) -> Any:
+        start = time.monotonic()
+        try:
+            result = await route.llm.acall(**kwargs)
+        except asyncio.CancelledError:
+            # Lost the hedge race: says nothing about the provider's health.
+            route.circuit.release()
+            raise
+        except Exception as e:
+            route.circuit.record_failure(e)
+            raise
+        route.histogram.record(time.monotonic() - start)
+        route.circuit.record_success()
+        return result
+
+    def call(
+        self,
+        messages: str | list[LLMMessage],
+        tools: list[dict[str, BaseTool]] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+        response_model: type[BaseModel] | None = None,
+    ) -> str | Any:
+        """Call the primary model, hedging and failing over as configured.
+
+        Raises:
+            CircuitOpenError: If every model's circuit is open.
+            Exception: The last model error if every model failed.
+        """
+        kwargs = {
+            "messages": messages,
+            "tools": tools,
+            "callbacks": callbacks,
+            "available_functions": available_functions,
+            "from_task": from_task,
+            "from_agent": from_agent,
+            "response_model": response_model,
+        }
+        can_hedge = not available_functions
+        routes = self._available()
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.routes), thread_name_prefix="itak-hedge"
+        )
+        pending: dict[Future[Any], _Route] = {}
+        hedged: set[Future[Any]] = set()
+        last_error: BaseException | None = None
+
+        def launch(hedge: bool) -> bool:
+            route = next(routes, None)
+            if route is None:
+                return False
+            ctx = contextvars.copy_context()
+            future = executor.submit(ctx.run, self._invoke, route, kwargs)
+            pending[future] = route
+            if hedge:
+                hedged.add(future)
+            return True
+
+        try:
+            if not launch(hedge=False):
+                raise CircuitOpenError("All LLM circuits are open")
+            first = next(iter(pending.values()))
+            while pending:
+                timeout = None
+                if can_hedge and len(hedged) < self.max_hedges:
+                    timeout = self._hedge_after(first)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    if launch(hedge=True):
+                        self.hedges_sent += 1
+                    else:
+                        can_hedge = False
+                    continue
+                for future in done:
+                    pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if future in hedged:
+                        self.hedge_wins += 1
+                    return result
+                if not pending and launch(hedge=False):
+                    self.failovers += 1
+        finally:
+            # Losing requests cannot be interrupted; their results are dropped.
+            executor.shutdown(wait=False)
+        raise last_error or CircuitOpenError("All LLM circuits are open")
+
+    async def acall(
+        self,
+        messages: str | list[LLMMessage],
+        tools: list[dict[str, BaseTool]] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Task | None = None,
+        from_agent: Agent | None = None,
+        response_model: type[BaseModel] | None = None,
+    ) -> str | Any:
+        """Async version of ``call``; losing hedged requests are cancelled."""
+        kwargs = {
+            "messages": messages,
+            "tools": tools,
+            "callbacks": callbacks,
+            "available_functions": available_functions,
+            "from_task": from_task,
+            "from_agent": from_agent,
+            "response_model": response_model,
+        }
+        can_hedge = not available_functions
+        routes = self._available()
+        pending: dict[asyncio.Task[Any], _Route] = {}
+        hedged: set[asyncio.Task[Any]] = set()
+        last_error: BaseException | None = None
+
+        def launch(hedge: bool) -> bool:
+            route = next(routes, None)
+            if route is None:
+                return False
+            task = asyncio.create_task(self._ainvoke(route, kwargs))
+            pending[task] = route
+            if hedge:
+                hedged.add(task)
+            return True
+
+        try:
+            if not launch(hedge=False):
+                raise CircuitOpenError("All LLM circuits are open")
+            first = next(iter(pending.values()))
+            while pending:
+                timeout = None
+                if can_hedge and len(hedged) < self.max_hedges:
+                    timeout = self._hedge_after(first)
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if launch(hedge=True):
+                        self.hedges_sent += 1
+                    else:
+                        can_hedge = False
+                    continue
+                for task in done:
+                    pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if task in hedged:
+                        self.hedge_wins += 1
+                    return result
+                if not pending and launch(hedge=False):
+                    self.failovers += 1
+        finally:
+            for task in pending:
+                task.cancel()
+        raise last_error or CircuitOpenError("All LLM circuits are open")
+
+    def supports_function_calling(self) -> bool:
+        """Whether the primary model supports native function calling."""
+        supports = getattr(self.primary, "supports_function_calling", None)
+        return bool(supports()) if callable(supports) else False
+
+    def supports_stop_words(self) -> bool:
+        return self.primary.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        """Smallest context window of all routes, so any of them can answer."""
+        return min(route.llm.get_context_window_size() for route in self.routes)
+
+    def get_token_usage_summary(self) -> UsageMetrics:
+        """Token usage summed over all routed models."""
+        totals: dict[str, int] = {}
+        for route in self.routes:
+            usage = route.llm.get_token_usage_summary().model_dump()
+            for key, value in usage.items():
+                totals[key] = totals.get(key, 0) + value
+        return UsageMetrics(**totals)
+
+    def latency_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Latency percentiles and circuit state per routed model."""
+        return {
+            _route_name(route.llm): {
+                **route.histogram.snapshot(),
+                "circuit": route.circuit.state.value,
+            }
+            for route in self.routes
+        }
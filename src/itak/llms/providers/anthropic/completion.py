@@ -9,8 +9,12 @@ from anthropic.types import ThinkingBlock
 from pydantic import BaseModel
 
 from itak.events.types.llm_events import LLMCallType
-from itak.llms.base_llm import BaseLLM
-from itak.llms.hooks.transport import AsyncHTTPTransport, HTTPTransport
+from itak.llms.base_llm import BaseLLM, NativeToolCall
+from itak.llms.client_registry import get_client_registry
+from itak.llms.providers.utils.prompt_caching import (
+    PromptCachePlanner,
+    apply_anthropic_cache_control,
+)
 from itak.utilities.agent_utils import is_context_length_exceeded
 from itak.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededError,
@@ -58,6 +62,7 @@ class AnthropicCompletion(BaseLLM):
         client_params: dict[str, Any] | None = None,
         interceptor: BaseInterceptor[httpx.Request, httpx.Response] | None = None,
         thinking: AnthropicThinkingConfig | None = None,
+        prompt_caching: bool = True,
         **kwargs: Any,
     ):
         """Initialize Anthropic chat completion client.
@@ -75,6 +80,8 @@ class AnthropicCompletion(BaseLLM):
             stream: Enable streaming responses
             client_params: Additional parameters for the Anthropic client
             interceptor: HTTP interceptor for modifying requests/responses at transport level.
+            prompt_caching: Mark the stable system prompt, tools and message
+                prefix with cache_control breakpoints.
             **kwargs: Additional parameters
         """
         super().__init__(
@@ -88,15 +95,18 @@ class AnthropicCompletion(BaseLLM):
         self.timeout = timeout
         self.max_retries = max_retries
 
-        self.client = Anthropic(**self._get_client_params())
-
-        async_client_params = self._get_client_params()
-        if self.interceptor:
-            async_transport = AsyncHTTPTransport(interceptor=self.interceptor)
-            async_http_client = httpx.AsyncClient(transport=async_transport)
-            async_client_params["http_client"] = async_http_client
-
-        self.async_client = AsyncAnthropic(**async_client_params)
+        client_params = self._get_client_params()
+        if "http_client" in client_params:
+            # A caller-supplied HTTP client opts out of the shared pools.
+            self.client = Anthropic(**client_params)
+        else:
+            self.client = get_client_registry().client(
+                "anthropic",
+                lambda http_client: Anthropic(**client_params, http_client=http_client),
+                client_params,
+                self.interceptor,
+            )
+        self._async_client: AsyncAnthropic | None = None
 
         # Store completion parameters
         self.max_tokens = max_tokens
@@ -105,6 +115,8 @@ class AnthropicCompletion(BaseLLM):
         self.stop_sequences = stop_sequences or []
         self.thinking = thinking
         self.previous_thinking_blocks: list[ThinkingBlock] = []
+        self.prompt_caching = prompt_caching
+        self._prompt_cache_planner = PromptCachePlanner()
         # Model-specific settings
         self.is_claude_3 = "claude-3" in model.lower()
         self.supports_tools = True
@@ -133,6 +145,27 @@ class AnthropicCompletion(BaseLLM):
         else:
             self.stop_sequences = []
 
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        """Async client, created lazily and shared per event loop."""
+        if self._async_client is not None:
+            return self._async_client
+
+        client_params = self._get_client_params()
+        if "http_client" in client_params:
+            self._async_client = AsyncAnthropic(**client_params)
+            return self._async_client
+        return get_client_registry().async_client(
+            "anthropic",
+            lambda http_client: AsyncAnthropic(**client_params, http_client=http_client),
+            client_params,
+            self.interceptor,
+        )
+
+    @async_client.setter
+    def async_client(self, value: AsyncAnthropic) -> None:
+        self._async_client = value
+
     def _get_client_params(self) -> dict[str, Any]:
         """Get client parameters."""
 
@@ -148,11 +181,6 @@ class AnthropicCompletion(BaseLLM):
             "max_retries": self.max_retries,
         }
 
-        if self.interceptor:
-            transport = HTTPTransport(interceptor=self.interceptor)
-            http_client = httpx.Client(transport=transport)
-            client_params["http_client"] = http_client  # type: ignore[assignment]
-
         if self.client_params:
             client_params.update(self.client_params)
 
@@ -197,8 +225,18 @@ class AnthropicCompletion(BaseLLM):
                 messages
             )
 
-            if not self._invoke_before_llm_call_hooks(formatted_messages, from_agent):
+            hook_result = self._invoke_before_llm_call_hooks(
+                formatted_messages,
+                from_agent,
+                tools=tools,
+                available_functions=available_functions,
+            )
+            if hook_result is False:
                 raise ValueError("LLM call blocked by before_llm_call hook")
+            if isinstance(hook_result, str):
+                return self._invoke_after_llm_call_hooks(
+                    formatted_messages, hook_result, from_agent
+                )
 
             # Prepare completion parameters
             completion_params = self._prepare_completion_params(
@@ -344,6 +382,19 @@ class AnthropicCompletion(BaseLLM):
 
         return params
 
+    def _with_cache_control(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Add prompt caching breakpoints to request params when enabled.
+
+        Args:
+            params: Parameters about to be sent to the messages API
+
+        Returns:
+            The params to send, left untouched when caching is disabled
+        """
+        if not self.prompt_caching:
+            return params
+        return apply_anthropic_cache_control(params, self._prompt_cache_planner)
+
     def _convert_tools_for_interference(
         self, tools: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
@@ -497,7 +548,9 @@ class AnthropicCompletion(BaseLLM):
             params["tool_choice"] = {"type": "tool", "name": "structured_output"}
 
         try:
-            response: Message = self.client.messages.create(**params)
+            response: Message = self.client.messages.create(
+                **self._with_cache_control(params)
+            )
 
         except Exception as e:
             if is_context_length_exceeded(e):
@@ -601,7 +654,9 @@ class AnthropicCompletion(BaseLLM):
         current_tool_calls: dict[int, dict[str, Any]] = {}
 
         # Make streaming API call
-        with self.client.messages.stream(**stream_params) as stream:
+        with self.client.messages.stream(
+            **self._with_cache_control(stream_params)
+        ) as stream:
             for event in stream:
                 if hasattr(event, "delta") and hasattr(event.delta, "text"):
                     text_delta = event.delta.text
@@ -748,28 +803,30 @@ class AnthropicCompletion(BaseLLM):
         Returns:
             List of tool result dictionaries in Anthropic format
         """
-        tool_results = []
-
-        for tool_use in tool_uses:
-            function_name = tool_use.name
-            function_args = tool_use.input
-
-            result = self._handle_tool_execution(
-                function_name=function_name,
-                function_args=cast(dict[str, Any], function_args),
-                available_functions=available_functions,
-                from_task=from_task,
-                from_agent=from_agent,
-            )
+        results = self._handle_tool_executions(
+            [
+                NativeToolCall(
+                    id=tool_use.id,
+                    name=tool_use.name,
+                    arguments=cast(dict[str, Any], tool_use.input),
+                )
+                for tool_use in tool_uses
+            ],
+            available_functions,
+            from_task,
+            from_agent,
+        )
 
-            tool_result = {
+        tool_results = [
+            {
                 "type": "tool_result",
                 "tool_use_id": tool_use.id,
                 "content": str(result)
                 if result is not None
                 else "Tool execution completed",
             }
-            tool_results.append(tool_result)
+            for tool_use, result in zip(tool_uses, results, strict=True)
+        ]
 
         return tool_results
 
@@ -829,7 +886,9 @@ class AnthropicCompletion(BaseLLM):
 
         try:
             # Send tool results back to Claude for final response
-            final_response: Message = self.client.messages.create(**follow_up_params)
+            final_response: Message = self.client.messages.create(
+                **self._with_cache_control(follow_up_params)
+            )
 
             # Track token usage for follow-up call
             follow_up_usage = self._extract_anthropic_token_usage(final_response)
@@ -904,7 +963,9 @@ class AnthropicCompletion(BaseLLM):
             params["tool_choice"] = {"type": "tool", "name": "structured_output"}
 
         try:
-            response: Message = await self.async_client.messages.create(**params)
+            response: Message = await self.async_client.messages.create(
+                **self._with_cache_control(params)
+            )
 
         except Exception as e:
             if is_context_length_exceeded(e):
@@ -994,7 +1055,9 @@ class AnthropicCompletion(BaseLLM):
 
         current_tool_calls: dict[int, dict[str, Any]] = {}
 
-        async with self.async_client.messages.stream(**stream_params) as stream:
+        async with self.async_client.messages.stream(
+            **self._with_cache_control(stream_params)
+        ) as stream:
             async for event in stream:
                 if hasattr(event, "delta") and hasattr(event.delta, "text"):
                     text_delta = event.delta.text
@@ -1142,7 +1205,7 @@ class AnthropicCompletion(BaseLLM):
 
         try:
             final_response: Message = await self.async_client.messages.create(
-                **follow_up_params
+                **self._with_cache_control(follow_up_params)
             )
 
             follow_up_usage = self._extract_anthropic_token_usage(final_response)
@@ -1223,11 +1286,17 @@ class AnthropicCompletion(BaseLLM):
         """Extract token usage from Anthropic response."""
         if hasattr(response, "usage") and response.usage:
             usage = response.usage
-            input_tokens = getattr(usage, "input_tokens", 0)
+            # input_tokens excludes tokens read from or written to the prompt
+            # cache, so add them back to get the full prompt size.
+            cached_tokens = (getattr(usage, "cache_read_input_tokens", 0) or 0) + (
+                getattr(usage, "cache_creation_input_tokens", 0) or 0
+            )
+            input_tokens = getattr(usage, "input_tokens", 0) + cached_tokens
             output_tokens = getattr(usage, "output_tokens", 0)
             return {
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
                 "total_tokens": input_tokens + output_tokens,
+                "cached_prompt_tokens": cached_tokens,
             }
         return {"total_tokens": 0}
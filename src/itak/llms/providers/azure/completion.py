@@ -43,7 +43,7 @@ try:
     )
 
     from itak.events.types.llm_events import LLMCallType
-    from itak.llms.base_llm import BaseLLM
+    from itak.llms.base_llm import BaseLLM, NativeToolCall
 
 except ImportError:
     raise ImportError(
@@ -302,8 +302,18 @@ class AzureCompletion(BaseLLM):
             # Format messages for Azure
             formatted_messages = self._format_messages_for_azure(messages)
 
-            if not self._invoke_before_llm_call_hooks(formatted_messages, from_agent):
+            hook_result = self._invoke_before_llm_call_hooks(
+                formatted_messages,
+                from_agent,
+                tools=tools,
+                available_functions=available_functions,
+            )
+            if hook_result is False:
                 raise ValueError("LLM call blocked by before_llm_call hook")
+            if isinstance(hook_result, str):
+                return self._invoke_after_llm_call_hooks(
+                    formatted_messages, hook_result, from_agent
+                )
 
             # Prepare completion parameters
             completion_params = self._prepare_completion_params(
@@ -606,20 +616,18 @@ class AzureCompletion(BaseLLM):
 
         # Handle tool calls
         if message.tool_calls and available_functions:
-            tool_call = message.tool_calls[0]  # Handle first tool call
-            if isinstance(tool_call, ChatCompletionsToolCall):
-                function_name = tool_call.function.name
-
-                try:
-                    function_args = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError as e:
-                    logging.error(f"Failed to parse tool arguments: {e}")
-                    function_args = {}
-
-                # Execute tool
-                result = self._handle_tool_execution(
-                    function_name=function_name,
-                    function_args=function_args,
+            tool_calls = [
+                NativeToolCall(
+                    id=tool_call.id,
+                    name=tool_call.function.name,
+                    arguments=self._parse_tool_arguments(tool_call.function.arguments),
+                )
+                for tool_call in message.tool_calls
+                if isinstance(tool_call, ChatCompletionsToolCall)
+            ]
+            if tool_calls:
+                result = self._handle_tool_calls(
+                    tool_calls=tool_calls,
                     available_functions=available_functions,
                     from_task=from_task,
                     from_agent=from_agent,
@@ -12,6 +12,12 @@ from typing_extensions import Required
 
 from itak.events.types.llm_events import LLMCallType
 from itak.llms.base_llm import BaseLLM
+from itak.llms.client_registry import get_client_registry
+from itak.llms.providers.utils.prompt_caching import (
+    PromptCachePlanner,
+    apply_bedrock_cache_points,
+    supports_bedrock_prompt_caching,
+)
 from itak.utilities.agent_utils import is_context_length_exceeded
 from itak.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededError,
@@ -172,6 +178,7 @@ class BedrockCompletion(BaseLLM):
         additional_model_request_fields: dict[str, Any] | None = None,
         additional_model_response_field_paths: list[str] | None = None,
         interceptor: BaseInterceptor[Any, Any] | None = None,
+        prompt_caching: bool | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize AWS Bedrock completion client.
@@ -192,6 +199,9 @@ class BedrockCompletion(BaseLLM):
             additional_model_request_fields: Model-specific request parameters
             additional_model_response_field_paths: Custom response field paths
             interceptor: HTTP interceptor (not yet supported for Bedrock).
+            prompt_caching: Add cachePoint blocks after the stable system
+                prompt, tools and message prefix. Defaults to enabled for
+                models that support prompt caching.
             **kwargs: Additional parameters
         """
         if interceptor is not None:
@@ -211,26 +221,35 @@ class BedrockCompletion(BaseLLM):
             **kwargs,
         )
 
-        # Initialize Bedrock client with proper configuration
-        session = Session(
-            aws_access_key_id=aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=aws_secret_access_key
+        session_params = {
+            "aws_access_key_id": aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID"),
+            "aws_secret_access_key": aws_secret_access_key
             or os.getenv("AWS_SECRET_ACCESS_KEY"),
-            aws_session_token=aws_session_token or os.getenv("AWS_SESSION_TOKEN"),
-            region_name=region_name,
-        )
+            "aws_session_token": aws_session_token or os.getenv("AWS_SESSION_TOKEN"),
+            "region_name": region_name,
+        }
 
-        # Configure client with timeouts and retries following AWS best practices
-        config = Config(
-            read_timeout=300,
-            retries={
-                "max_attempts": 3,
-                "mode": "adaptive",
-            },
-            tcp_keepalive=True,
-        )
+        pool_size = get_client_registry().transport_config.max_connections
+
+        def _create_client() -> Any:
+            session = Session(**session_params)
+            # Configure client with timeouts and retries following AWS best practices
+            config = Config(
+                read_timeout=300,
+                retries={
+                    "max_attempts": 3,
+                    "mode": "adaptive",
+                },
+                tcp_keepalive=True,
+                max_pool_connections=pool_size,
+            )
+            return session.client("bedrock-runtime", config=config)
 
-        self.client = session.client("bedrock-runtime", config=config)
+        # boto3 clients are thread-safe, so LLMs with the same credentials and
+        # region share one client and its connection pool.
+        self.client = get_client_registry().shared(
+            "bedrock", _create_client, session_params
+        )
         self.region_name = region_name
 
         self.aws_access_key_id = aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID")
@@ -264,6 +283,13 @@ class BedrockCompletion(BaseLLM):
         # Handle inference profiles for newer models
         self.model_id = model
 
+        self.prompt_caching = (
+            supports_bedrock_prompt_caching(model)
+            if prompt_caching is None
+            else prompt_caching
+        )
+        self._prompt_cache_planner = PromptCachePlanner()
+
     @property
     def stop(self) -> list[str]:
         """Get stop sequences sent to the API."""
@@ -315,8 +341,18 @@ class BedrockCompletion(BaseLLM):
                 messages
             )
 
-            if not self._invoke_before_llm_call_hooks(formatted_messages, from_agent):
+            hook_result = self._invoke_before_llm_call_hooks(
+                formatted_messages,
+                from_agent,
+                tools=tools,
+                available_functions=available_functions,
+            )
+            if hook_result is False:
                 raise ValueError("LLM call blocked by before_llm_call hook")
+            if isinstance(hook_result, str):
+                return self._invoke_after_llm_call_hooks(
+                    formatted_messages, hook_result, from_agent
+                )
 
             # Prepare request body
             body: BedrockConverseRequestBody = {
@@ -514,13 +550,14 @@ class BedrockCompletion(BaseLLM):
                     raise ValueError(f"Invalid message format at index {i}")
 
             # Call Bedrock Converse API with proper error handling
+            request_messages, request_body = self._with_cache_points(messages, body)
             response = self.client.converse(
                 modelId=self.model_id,
                 messages=cast(
                     "Sequence[MessageTypeDef | MessageOutputTypeDef]",
-                    cast(object, messages),
+                    cast(object, request_messages),
                 ),
-                **body,
+                **request_body,
             )
 
             # Track token usage according to AWS response format
@@ -691,13 +728,14 @@ class BedrockCompletion(BaseLLM):
         accumulated_tool_input = ""
 
         try:
+            request_messages, request_body = self._with_cache_points(messages, body)
             response = self.client.converse_stream(
                 modelId=self.model_id,
                 messages=cast(
                     "Sequence[MessageTypeDef | MessageOutputTypeDef]",
-                    cast(object, messages),
+                    cast(object, request_messages),
                 ),
-                **body,  # type: ignore[arg-type]
+                **request_body,  # type: ignore[arg-type]
             )
 
             stream = response.get("stream")
@@ -905,13 +943,14 @@ class BedrockCompletion(BaseLLM):
                     raise ValueError(f"Invalid message format at index {i}")
 
             async_client = await self._ensure_async_client()
+            request_messages, request_body = self._with_cache_points(messages, body)
             response = await async_client.converse(
                 modelId=self.model_id,
                 messages=cast(
                     "Sequence[MessageTypeDef | MessageOutputTypeDef]",
-                    cast(object, messages),
+                    cast(object, request_messages),
                 ),
-                **body,
+                **request_body,
             )
 
             if "usage" in response:
@@ -1065,13 +1104,14 @@ class BedrockCompletion(BaseLLM):
 
         try:
             async_client = await self._ensure_async_client()
+            request_messages, request_body = self._with_cache_points(messages, body)
             response = await async_client.converse_stream(
                 modelId=self.model_id,
                 messages=cast(
                     "Sequence[MessageTypeDef | MessageOutputTypeDef]",
-                    cast(object, messages),
+                    cast(object, request_messages),
                 ),
-                **body,
+                **request_body,
             )
 
             stream = response.get("stream")
@@ -1248,6 +1288,31 @@ class BedrockCompletion(BaseLLM):
             from_agent,
         )
 
+    def _with_cache_points(
+        self, messages: list[LLMMessage], body: BedrockConverseRequestBody
+    ) -> tuple[list[LLMMessage], BedrockConverseRequestBody]:
+        """Add prompt caching cache points to a Converse request when enabled.
+
+        Args:
+            messages: Converse-formatted messages about to be sent
+            body: Request body about to be sent
+
+        Returns:
+            The messages and body to send, untouched when caching is disabled
+        """
+        if not self.prompt_caching:
+            return messages, body
+        marked_messages, marked_body = apply_bedrock_cache_points(
+            self.model_id,
+            cast("list[dict[str, Any]]", messages),
+            cast("dict[str, Any]", body),
+            self._prompt_cache_planner,
+        )
+        return (
+            cast("list[LLMMessage]", marked_messages),
+            cast("BedrockConverseRequestBody", marked_body),
+        )
+
     def _format_messages_for_converse(
         self, messages: str | list[LLMMessage]
     ) -> tuple[list[LLMMessage], str | None]:
@@ -1406,12 +1471,19 @@ class BedrockCompletion(BaseLLM):
         """Track token usage from Bedrock response."""
         input_tokens = usage.get("inputTokens", 0)
         output_tokens = usage.get("outputTokens", 0)
-        total_tokens = usage.get("totalTokens", input_tokens + output_tokens)
+        # inputTokens excludes prompt cache reads and writes.
+        cached_tokens = usage.get("cacheReadInputTokens", 0) + usage.get(
+            "cacheWriteInputTokens", 0
+        )
+        total_tokens = usage.get(
+            "totalTokens", input_tokens + cached_tokens + output_tokens
+        )
 
-        self._token_usage["prompt_tokens"] += input_tokens
+        self._token_usage["prompt_tokens"] += input_tokens + cached_tokens
         self._token_usage["completion_tokens"] += output_tokens
         self._token_usage["total_tokens"] += total_tokens
         self._token_usage["successful_requests"] += 1
+        self._token_usage["cached_prompt_tokens"] += cached_tokens
 
     def supports_function_calling(self) -> bool:
         """Check if the model supports function calling."""
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, Literal, cast
 from pydantic import BaseModel
 
 from itak.events.types.llm_events import LLMCallType
-from itak.llms.base_llm import BaseLLM
+from itak.llms.base_llm import BaseLLM, NativeToolCall
 from itak.utilities.agent_utils import is_context_length_exceeded
 from itak.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededError,
@@ -251,8 +251,18 @@ class GeminiCompletion(BaseLLM):
 
             messages_for_hooks = self._convert_contents_to_dict(formatted_content)
 
-            if not self._invoke_before_llm_call_hooks(messages_for_hooks, from_agent):
+            hook_result = self._invoke_before_llm_call_hooks(
+                messages_for_hooks,
+                from_agent,
+                tools=tools,
+                available_functions=available_functions,
+            )
+            if hook_result is False:
                 raise ValueError("LLM call blocked by before_llm_call hook")
+            if isinstance(hook_result, str):
+                return self._invoke_after_llm_call_hooks(
+                    messages_for_hooks, hook_result, from_agent
+                )
 
             config = self._prepare_generation_config(
                 system_instruction, tools, response_model
@@ -606,27 +616,27 @@ class GeminiCompletion(BaseLLM):
         if response.candidates and (self.tools or available_functions):
             candidate = response.candidates[0]
             if candidate.content and candidate.content.parts:
-                for part in candidate.content.parts:
-                    if part.function_call:
-                        function_name = part.function_call.name
-                        if function_name is None:
-                            continue
-                        function_args = (
-                            dict(part.function_call.args)
-                            if part.function_call.args
-                            else {}
-                        )
-
-                        result = self._handle_tool_execution(
-                            function_name=function_name,
-                            function_args=function_args,
-                            available_functions=available_functions or {},
-                            from_task=from_task,
-                            from_agent=from_agent,
-                        )
-
-                        if result is not None:
-                            return result
+                tool_calls = [
+                    NativeToolCall(
+                        id=part.function_call.id or f"call_{index}",
+                        name=part.function_call.name,
+                        arguments=dict(part.function_call.args)
+                        if part.function_call.args
+                        else {},
+                    )
+                    for index, part in enumerate(candidate.content.parts)
+                    if part.function_call and part.function_call.name is not None
+                ]
+                if tool_calls:
+                    result = self._handle_tool_calls(
+                        tool_calls=tool_calls,
+                        available_functions=available_functions or {},
+                        from_task=from_task,
+                        from_agent=from_agent,
+                    )
+
+                    if result is not None:
+                        return result
 
         content = response.text or ""
         content = self._apply_stop_words(content)
@@ -740,22 +750,20 @@ class GeminiCompletion(BaseLLM):
 
         # Handle completed function calls
         if function_calls and available_functions:
-            for call_data in function_calls.values():
-                function_name = call_data["name"]
-                function_args = call_data["args"]
-
-                # Skip if function_name is None
-                if not isinstance(function_name, str):
-                    continue
-
-                # Ensure function_args is a dict
-                if not isinstance(function_args, dict):
-                    function_args = {}
-
-                # Execute tool
-                result = self._handle_tool_execution(
-                    function_name=function_name,
-                    function_args=function_args,
+            tool_calls = [
+                NativeToolCall(
+                    id=call_data.get("id") or f"call_{index}",
+                    name=call_data["name"],
+                    arguments=call_data["args"]
+                    if isinstance(call_data["args"], dict)
+                    else {},
+                )
+                for index, call_data in function_calls.items()
+                if isinstance(call_data["name"], str)
+            ]
+            if tool_calls:
+                result = self._handle_tool_calls(
+                    tool_calls=tool_calls,
                     available_functions=available_functions,
                     from_task=from_task,
                     from_agent=from_agent,
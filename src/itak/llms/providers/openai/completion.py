@@ -15,8 +15,8 @@ from openai.types.chat.chat_completion_chunk import ChoiceDelta
 from pydantic import BaseModel
 
 from itak.events.types.llm_events import LLMCallType
-from itak.llms.base_llm import BaseLLM
-from itak.llms.hooks.transport import AsyncHTTPTransport, HTTPTransport
+from itak.llms.base_llm import BaseLLM, NativeToolCall
+from itak.llms.client_registry import get_client_registry
 from itak.utilities.agent_utils import is_context_length_exceeded
 from itak.utilities.exceptions.context_window_exceeding_exception import (
     LLMContextLengthExceededError,
@@ -95,20 +95,17 @@ class OpenAICompletion(BaseLLM):
         )
 
         client_config = self._get_client_params()
-        if self.interceptor:
-            transport = HTTPTransport(interceptor=self.interceptor)
-            http_client = httpx.Client(transport=transport)
-            client_config["http_client"] = http_client
-
-        self.client = OpenAI(**client_config)
-
-        async_client_config = self._get_client_params()
-        if self.interceptor:
-            async_transport = AsyncHTTPTransport(interceptor=self.interceptor)
-            async_http_client = httpx.AsyncClient(transport=async_transport)
-            async_client_config["http_client"] = async_http_client
-
-        self.async_client = AsyncOpenAI(**async_client_config)
+        if "http_client" in client_config:
+            # A caller-supplied HTTP client opts out of the shared pools.
+            self.client = OpenAI(**client_config)
+        else:
+            self.client = get_client_registry().client(
+                "openai",
+                lambda http_client: OpenAI(**client_config, http_client=http_client),
+                client_config,
+                self.interceptor,
+            )
+        self._async_client: AsyncOpenAI | None = None
 
         # Completion parameters
         self.top_p = top_p
@@ -125,6 +122,27 @@ class OpenAICompletion(BaseLLM):
         self.is_o1_model = "o1" in model.lower()
         self.is_gpt4_model = "gpt-4" in model.lower()
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async client, created lazily and shared per event loop."""
+        if self._async_client is not None:
+            return self._async_client
+
+        client_config = self._get_client_params()
+        if "http_client" in client_config:
+            self._async_client = AsyncOpenAI(**client_config)
+            return self._async_client
+        return get_client_registry().async_client(
+            "openai",
+            lambda http_client: AsyncOpenAI(**client_config, http_client=http_client),
+            client_config,
+            self.interceptor,
+        )
+
+    @async_client.setter
+    def async_client(self, value: AsyncOpenAI) -> None:
+        self._async_client = value
+
     def _get_client_params(self) -> dict[str, Any]:
         """Get OpenAI client parameters."""
 
@@ -190,8 +208,18 @@ class OpenAICompletion(BaseLLM):
 
             formatted_messages = self._format_messages(messages)
 
-            if not self._invoke_before_llm_call_hooks(formatted_messages, from_agent):
+            hook_result = self._invoke_before_llm_call_hooks(
+                formatted_messages,
+                from_agent,
+                tools=tools,
+                available_functions=available_functions,
+            )
+            if hook_result is False:
                 raise ValueError("LLM call blocked by before_llm_call hook")
+            if isinstance(hook_result, str):
+                return self._invoke_after_llm_call_hooks(
+                    formatted_messages, hook_result, from_agent
+                )
 
             completion_params = self._prepare_completion_params(
                 messages=formatted_messages, tools=tools
@@ -429,18 +457,18 @@ class OpenAICompletion(BaseLLM):
             message = choice.message
 
             if message.tool_calls and available_functions:
-                tool_call = message.tool_calls[0]
-                function_name = tool_call.function.name
-
-                try:
-                    function_args = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError as e:
-                    logging.error(f"Failed to parse tool arguments: {e}")
-                    function_args = {}
-
-                result = self._handle_tool_execution(
-                    function_name=function_name,
-                    function_args=function_args,
+                tool_calls = [
+                    NativeToolCall(
+                        id=tool_call.id,
+                        name=tool_call.function.name,
+                        arguments=self._parse_tool_arguments(
+                            tool_call.function.arguments
+                        ),
+                    )
+                    for tool_call in message.tool_calls
+                ]
+                result = self._handle_tool_calls(
+                    tool_calls=tool_calls,
                     available_functions=available_functions,
                     from_task=from_task,
                     from_agent=from_agent,
@@ -726,18 +754,18 @@ class OpenAICompletion(BaseLLM):
             message = choice.message
 
             if message.tool_calls and available_functions:
-                tool_call = message.tool_calls[0]
-                function_name = tool_call.function.name
-
-                try:
-                    function_args = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError as e:
-                    logging.error(f"Failed to parse tool arguments: {e}")
-                    function_args = {}
-
-                result = self._handle_tool_execution(
-                    function_name=function_name,
-                    function_args=function_args,
+                tool_calls = [
+                    NativeToolCall(
+                        id=tool_call.id,
+                        name=tool_call.function.name,
+                        arguments=self._parse_tool_arguments(
+                            tool_call.function.arguments
+                        ),
+                    )
+                    for tool_call in message.tool_calls
+                ]
+                result = self._handle_tool_calls(
+                    tool_calls=tool_calls,
                     available_functions=available_functions,
                     from_task=from_task,
                     from_agent=from_agent,
@@ -0,0 +1,206 @@
+"""Provider-native prompt caching breakpoints.
+
+Agent loops resend the same system prompt, tool schemas and growing message
+history on every iteration. Anthropic (``cache_control``) and Bedrock
+(``cachePoint``) can reuse the processed prefix of such a request if the
+request marks where cacheable prefixes end. These helpers add those marks to a
+request payload without mutating the caller's messages, so hooks and response
+caches keep seeing the messages exactly as the agent produced them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import json
+import threading
+from typing import Any, Final
+
+
+ANTHROPIC_MAX_BREAKPOINTS: Final[int] = 4
+BEDROCK_MAX_CACHE_POINTS: Final[int] = 4
+
+_ANTHROPIC_EPHEMERAL: Final[dict[str, str]] = {"type": "ephemeral"}
+_BEDROCK_CACHE_POINT: Final[dict[str, Any]] = {"cachePoint": {"type": "default"}}
+_UNCACHEABLE_ANTHROPIC_BLOCKS: Final[frozenset[str]] = frozenset(
+    {"thinking", "redacted_thinking"}
+)
+
+# Bedrock rejects cachePoint blocks for models without prompt caching.
+_BEDROCK_CACHING_MODELS: Final[tuple[str, ...]] = (
+    "anthropic.claude-3-5-haiku",
+    "anthropic.claude-3-7-sonnet",
+    "anthropic.claude-sonnet-4",
+    "anthropic.claude-opus-4",
+    "anthropic.claude-haiku-4",
+    "amazon.nova",
+)
+
+
+def supports_bedrock_prompt_caching(model_id: str) -> bool:
+    """Whether the Bedrock model accepts ``cachePoint`` blocks."""
+    model_id = model_id.lower()
+    return any(model in model_id for model in _BEDROCK_CACHING_MODELS)
+
+
+def supports_bedrock_tool_caching(model_id: str) -> bool:
+    """Whether the Bedrock model accepts a ``cachePoint`` in its tool config."""
+    return "anthropic.claude" in model_id.lower()
+
+
+class PromptCachePlanner:
+    """Picks message breakpoints from the request history of a single LLM.
+
+    The last message is always marked, so the next request can read the whole
+    current prompt from the cache. When part of the history changed since the
+    previous request (for example after summarization), the end of the prefix
+    that is still unchanged is marked as well, so that prefix is read back even
+    when it lies too far behind the last breakpoint for the provider's lookback.
+    """
+
+    def __init__(self) -> None:
+        self._previous: tuple[int, ...] = ()
+        self._lock = threading.Lock()
+
+    def breakpoints(
+        self, messages: Sequence[dict[str, Any]], max_breakpoints: int
+    ) -> list[int]:
+        """Return the message indices to mark, in ascending order.
+
+        Args:
+            messages: Messages of the request about to be sent.
+            max_breakpoints: Breakpoints left after system and tool marks.
+
+        Returns:
+            Indices into ``messages``.
+        """
+        fingerprints = tuple(_fingerprint(message) for message in messages)
+        with self._lock:
+            previous = self._previous
+            self._previous = fingerprints
+
+        if not messages or max_breakpoints <= 0:
+            return []
+
+        last = len(messages) - 1
+        indices = [last]
+
+        stable = 0
+        for before, now in zip(previous, fingerprints, strict=False):
+            if before != now:
+                break
+            stable += 1
+        if 0 < stable < len(previous) and stable - 1 < last:
+            indices.insert(0, stable - 1)
+
+        return indices[-max_breakpoints:]
+
+
+def _fingerprint(message: dict[str, Any]) -> int:
+    content = message.get("content")
+    if not isinstance(content, str):
+        content = json.dumps(content, sort_keys=True, default=str)
+    return hash((message.get("role"), content))
+
+
+def _mark_anthropic_message(message: dict[str, Any]) -> dict[str, Any]:
+    content = message.get("content")
+    if isinstance(content, str):
+        if not content:
+            return message
+        return {
+            **message,
+            "content": [
+                {"type": "text", "text": content, "cache_control": _ANTHROPIC_EPHEMERAL}
+            ],
+        }
+
+    if not isinstance(content, list) or not content:
+        return message
+
+    block = content[-1]
+    if (
+        not isinstance(block, dict)
+        or block.get("type") in _UNCACHEABLE_ANTHROPIC_BLOCKS
+        or (block.get("type") == "text" and not block.get("text"))
+    ):
+        return message
+    return {
+        **message,
+        "content": [*content[:-1], {**block, "cache_control": _ANTHROPIC_EPHEMERAL}],
+    }
+
+
+def apply_anthropic_cache_control(
+    params: dict[str, Any], planner: PromptCachePlanner
+) -> dict[str, Any]:
+    """Return a copy of Anthropic ``messages.create`` params with breakpoints.
+
+    Marks the tool list, the system prompt and the stable message prefix,
+    within Anthropic's limit of four breakpoints per request.
+    """
+    params = dict(params)
+    budget = ANTHROPIC_MAX_BREAKPOINTS
+
+    tools = params.get("tools")
+    if tools:
+        params["tools"] = [
+            *tools[:-1],
+            {**tools[-1], "cache_control": _ANTHROPIC_EPHEMERAL},
+        ]
+        budget -= 1
+
+    system = params.get("system")
+    if isinstance(system, str) and system:
+        params["system"] = [
+            {"type": "text", "text": system, "cache_control": _ANTHROPIC_EPHEMERAL}
+        ]
+        budget -= 1
+
+    messages = list(params.get("messages") or [])
+    for index in planner.breakpoints(messages, budget):
+        messages[index] = _mark_anthropic_message(messages[index])
+    params["messages"] = messages
+
+    return params
+
+
+def apply_bedrock_cache_points(
+    model_id: str,
+    messages: Sequence[dict[str, Any]],
+    body: dict[str, Any],
+    planner: PromptCachePlanner,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Return copies of Converse ``messages`` and ``body`` with cache points.
+
+    Cache points are appended after the system blocks, after the tool list
+    (Claude models only) and after the stable message prefix, within Bedrock's
+    limit of four per request.
+    """
+    body = dict(body)
+    budget = BEDROCK_MAX_CACHE_POINTS
+
+    system = body.get("system")
+    if system:
+        body["system"] = [*system, _BEDROCK_CACHE_POINT]
+        budget -= 1
+
+    tool_config = body.get("toolConfig")
+    if (
+        tool_config
+        and tool_config.get("tools")
+        and supports_bedrock_tool_caching(model_id)
+    ):
+        body["toolConfig"] = {
+            **tool_config,
+            "tools": [*tool_config["tools"], _BEDROCK_CACHE_POINT],
+        }
+        budget -= 1
+
+    marked = list(messages)
+    for index in planner.breakpoints(marked, budget):
+        message = marked[index]
+        content = message.get("content")
+        if isinstance(content, list) and content:
+            marked[index] = {**message, "content": [*content, _BEDROCK_CACHE_POINT]}
+
+    return marked, body
@@ -0,0 +1,129 @@
+"""Speculative execution of tool calls while a response is still streaming.
+
+A streamed tool call is usually complete well before the response ends:
+arguments of later calls, or trailing text, keep the stream open. With
+prefetching enabled, a call whose JSON arguments have become valid starts
+running in the background as soon as they do, and its result is joined when
+the stream ends. Only tools that declare themselves both ``read_only`` and
+``idempotent`` are started early, since a speculative call may run even if
+the final arguments turn out different and its result is discarded.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+import json
+import logging
+from typing import Any, Final
+
+
+DEFAULT_PREFETCH_WORKERS: Final[int] = 4
+
+MISSING: Final[object] = object()
+"""Returned by ``ToolPrefetcher.result`` when no usable result exists."""
+
+
+def is_speculable(fn: Any) -> bool:
+    """Whether a callable may run before its tool call is confirmed.
+
+    Bound methods of tools defer to the tool's ``read_only`` and
+    ``idempotent`` flags, and structured tools to the ``BaseTool`` they were
+    built from. Plain functions can set the same attributes.
+    """
+    owner = getattr(fn, "__self__", fn)
+    tool = getattr(owner, "_original_tool", None) or owner
+    return bool(getattr(tool, "read_only", False)) and bool(
+        getattr(tool, "idempotent", False)
+    )
+
+
+class ToolPrefetcher:
+    """Starts eligible tool calls of one streamed response early.
+
+    Args:
+        execute: Runs one tool call from its name and decoded arguments.
+        available_functions: Functions the response may call.
+        max_workers: Tool calls prefetched concurrently.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[str, dict[str, Any]], Any],
+        available_functions: dict[str, Any],
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+    ) -> None:
+        self._execute = execute
+        self._available_functions = available_functions
+        self._max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._started: dict[int, tuple[str, str, Future[Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def started(self) -> int:
+        """Number of tool calls started speculatively."""
+        return len(self._started)
+
+    def offer(self, index: int, name: str, arguments: str) -> bool:
+        """Start a streamed tool call if it is complete and eligible.
+
+        Args:
+            index: Position of the tool call in the response.
+            name: Function name streamed so far.
+            arguments: JSON arguments streamed so far.
+
+        Returns:
+            True if the call is running speculatively.
+        """
+        if index in self._started:
+            return True
+        fn = self._available_functions.get(name)
+        if fn is None or not arguments or not is_speculable(fn):
+            return False
+        try:
+            parsed = json.loads(arguments)
+        except json.JSONDecodeError:
+            return False
+        if not isinstance(parsed, dict):
+            return False
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="tool-prefetch"
+            )
+        future = self._pool.submit(
+            contextvars.copy_context().run, self._execute, name, parsed
+        )
+        self._started[index] = (name, arguments, future)
+        return True
+
+    def result(self, index: int, name: str, arguments: str) -> Any:
+        """Join a speculative call, if it matches the final tool call.
+
+        Args:
+            index: Position of the tool call in the response.
+            name: Final function name.
+            arguments: Final JSON arguments.
+
+        Returns:
+            The speculative result, or ``MISSING`` if the call was not started
+            or its name or arguments changed after it started.
+        """
+        started = self._started.get(index)
+        if started is None:
+            return MISSING
+        started_name, started_arguments, future = started
+        if (started_name, started_arguments) != (name, arguments):
+            logging.debug(f"Discarding speculative result of tool call {index}")
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        return future.result()
+
+    def close(self) -> None:
+        """Release the worker threads; unjoined calls finish in the background."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
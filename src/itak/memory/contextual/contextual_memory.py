@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from itak.memory import (
     EntityMemory,
@@ -9,12 +9,16 @@ from itak.memory import (
     LongTermMemory,
     ShortTermMemory,
 )
+from itak.utilities.token_accounting import get_token_accountant
 
 
 if TYPE_CHECKING:
     from itak.agent import Agent
     from itak.task import Task
 
+# Share of the agent's context window that recalled memories may occupy.
+MEMORY_CONTEXT_WINDOW_SHARE: Final[float] = 0.25
+
 
 class ContextualMemory:
     """Aggregates and retrieves context from multiple memory sources."""
@@ -69,7 +73,7 @@ class ContextualMemory:
             self._fetch_entity_context(query),
             self._fetch_external_context(query),
         ]
-        return "\n".join(filter(None, context_parts))
+        return self._fit_to_budget("\n".join(filter(None, context_parts)))
 
     async def abuild_context_for_task(self, task: Task, context: str) -> str:
         """Build contextual information for a task asynchronously.
@@ -94,7 +98,18 @@ class ContextualMemory:
             self._afetch_external_context(query),
         )
 
-        return "\n".join(filter(None, results))
+        return self._fit_to_budget("\n".join(filter(None, results)))
+
+    def _fit_to_budget(self, memory: str) -> str:
+        """Trim recalled memories so they cannot crowd out the task prompt."""
+        llm = getattr(self.agent, "llm", None)
+        if not memory or not hasattr(llm, "get_context_window_size"):
+            return memory
+
+        budget = int(llm.get_context_window_size() * MEMORY_CONTEXT_WINDOW_SHARE)
+        return get_token_accountant().truncate(
+            memory, budget, getattr(llm, "model", None)
+        )
 
     def _fetch_stm_context(self, query: str) -> str:
         """
@@ -89,15 +89,16 @@ class EntityMemory(Memory):
         is_batch = len(items) > 1
 
         metadata = {"entity_count": len(items)} if is_batch else items[0].metadata
-        iTaK_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                metadata=metadata,
-                source_type="entity_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
+        if iTaK_event_bus.has_handlers(MemorySaveStartedEvent):
+            iTaK_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    metadata=metadata,
+                    source_type="entity_memory",
+                    from_agent=self.agent,
+                    from_task=self.task,
+                ),
+            )
 
         start_time = time.time()
         saved_count = 0
@@ -136,17 +137,18 @@ class EntityMemory(Memory):
                 emit_value = f"{items[0].name}({items[0].type}): {items[0].description}"
                 metadata = items[0].metadata
 
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=emit_value,
-                    metadata=metadata,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="entity_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=emit_value,
+                        metadata=metadata,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="entity_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
 
             if errors:
                 raise Exception(
@@ -159,16 +161,17 @@ class EntityMemory(Memory):
                 if is_batch
                 else items[0].metadata
             )
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    metadata=fail_metadata,
-                    error=str(e),
-                    source_type="entity_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        metadata=fail_metadata,
+                        error=str(e),
+                        source_type="entity_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
             raise
 
     def search(
@@ -187,50 +190,53 @@ class EntityMemory(Memory):
         Returns:
             List of matching memory entries.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=query,
-                limit=limit,
-                score_threshold=score_threshold,
-                source_type="entity_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = super().search(
-                query=query, limit=limit, score_threshold=score_threshold
-            )
-
+        if iTaK_event_bus.has_handlers(MemoryQueryStartedEvent):
             iTaK_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=query,
-                    results=results,
                     limit=limit,
                     score_threshold=score_threshold,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="entity_memory",
                     from_agent=self.agent,
                     from_task=self.task,
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = super().search(
+                query=query, limit=limit, score_threshold=score_threshold
+            )
+
+            if iTaK_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=query,
+                        results=results,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="entity_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
+
             return results
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemoryQueryFailedEvent(
-                    query=query,
-                    limit=limit,
-                    score_threshold=score_threshold,
-                    error=str(e),
-                    source_type="entity_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemoryQueryFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryFailedEvent(
+                        query=query,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        error=str(e),
+                        source_type="entity_memory",
+                    ),
+                )
             raise
 
     async def asave(
@@ -251,15 +257,16 @@ class EntityMemory(Memory):
         is_batch = len(items) > 1
 
         metadata = {"entity_count": len(items)} if is_batch else items[0].metadata
-        iTaK_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                metadata=metadata,
-                source_type="entity_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
+        if iTaK_event_bus.has_handlers(MemorySaveStartedEvent):
+            iTaK_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    metadata=metadata,
+                    source_type="entity_memory",
+                    from_agent=self.agent,
+                    from_task=self.task,
+                ),
+            )
 
         start_time = time.time()
         saved_count = 0
@@ -298,17 +305,18 @@ class EntityMemory(Memory):
                 emit_value = f"{items[0].name}({items[0].type}): {items[0].description}"
                 metadata = items[0].metadata
 
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=emit_value,
-                    metadata=metadata,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="entity_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=emit_value,
+                        metadata=metadata,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="entity_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
 
             if errors:
                 raise Exception(
@@ -321,16 +329,17 @@ class EntityMemory(Memory):
                 if is_batch
                 else items[0].metadata
             )
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    metadata=fail_metadata,
-                    error=str(e),
-                    source_type="entity_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        metadata=fail_metadata,
+                        error=str(e),
+                        source_type="entity_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
             raise
 
     async def asearch(
@@ -349,50 +358,53 @@ class EntityMemory(Memory):
         Returns:
             List of matching memory entries.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=query,
-                limit=limit,
-                score_threshold=score_threshold,
-                source_type="entity_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = await super().asearch(
-                query=query, limit=limit, score_threshold=score_threshold
-            )
-
+        if iTaK_event_bus.has_handlers(MemoryQueryStartedEvent):
             iTaK_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=query,
-                    results=results,
                     limit=limit,
                     score_threshold=score_threshold,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="entity_memory",
                     from_agent=self.agent,
                     from_task=self.task,
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = await super().asearch(
+                query=query, limit=limit, score_threshold=score_threshold
+            )
+
+            if iTaK_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=query,
+                        results=results,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="entity_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
+
             return results
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemoryQueryFailedEvent(
-                    query=query,
-                    limit=limit,
-                    score_threshold=score_threshold,
-                    error=str(e),
-                    source_type="entity_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemoryQueryFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryFailedEvent(
+                        query=query,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        error=str(e),
+                        source_type="entity_memory",
+                    ),
+                )
             raise
 
     def reset(self) -> None:
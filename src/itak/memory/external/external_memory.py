@@ -64,16 +64,17 @@ class ExternalMemory(Memory):
         metadata: dict[str, Any] | None = None,
     ) -> None:
         """Saves a value into the external storage."""
-        iTaK_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                value=value,
-                metadata=metadata,
-                source_type="external_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
+        if iTaK_event_bus.has_handlers(MemorySaveStartedEvent):
+            iTaK_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    value=value,
+                    metadata=metadata,
+                    source_type="external_memory",
+                    from_agent=self.agent,
+                    from_task=self.task,
+                ),
+            )
 
         start_time = time.time()
         try:
@@ -84,29 +85,31 @@ class ExternalMemory(Memory):
             )
             super().save(value=item.value, metadata=item.metadata)
 
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=value,
-                    metadata=metadata,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="external_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=value,
+                        metadata=metadata,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="external_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    value=value,
-                    metadata=metadata,
-                    error=str(e),
-                    source_type="external_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        value=value,
+                        metadata=metadata,
+                        error=str(e),
+                        source_type="external_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
             raise
 
     def search(
@@ -125,50 +128,53 @@ class ExternalMemory(Memory):
         Returns:
             List of matching memory entries.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=query,
-                limit=limit,
-                score_threshold=score_threshold,
-                source_type="external_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = super().search(
-                query=query, limit=limit, score_threshold=score_threshold
-            )
-
+        if iTaK_event_bus.has_handlers(MemoryQueryStartedEvent):
             iTaK_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=query,
-                    results=results,
                     limit=limit,
                     score_threshold=score_threshold,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="external_memory",
                     from_agent=self.agent,
                     from_task=self.task,
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = super().search(
+                query=query, limit=limit, score_threshold=score_threshold
+            )
+
+            if iTaK_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=query,
+                        results=results,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="external_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
+
             return results
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemoryQueryFailedEvent(
-                    query=query,
-                    limit=limit,
-                    score_threshold=score_threshold,
-                    error=str(e),
-                    source_type="external_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemoryQueryFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryFailedEvent(
+                        query=query,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        error=str(e),
+                        source_type="external_memory",
+                    ),
+                )
             raise
 
     async def asave(
@@ -182,16 +188,17 @@ class ExternalMemory(Memory):
             value: The value to save.
             metadata: Optional metadata to associate with the value.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                value=value,
-                metadata=metadata,
-                source_type="external_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
+        if iTaK_event_bus.has_handlers(MemorySaveStartedEvent):
+            iTaK_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    value=value,
+                    metadata=metadata,
+                    source_type="external_memory",
+                    from_agent=self.agent,
+                    from_task=self.task,
+                ),
+            )
 
         start_time = time.time()
         try:
@@ -202,29 +209,31 @@ class ExternalMemory(Memory):
             )
             await super().asave(value=item.value, metadata=item.metadata)
 
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=value,
-                    metadata=metadata,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="external_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=value,
+                        metadata=metadata,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="external_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    value=value,
-                    metadata=metadata,
-                    error=str(e),
-                    source_type="external_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        value=value,
+                        metadata=metadata,
+                        error=str(e),
+                        source_type="external_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
             raise
 
     async def asearch(
@@ -243,50 +252,53 @@ class ExternalMemory(Memory):
         Returns:
             List of matching memory entries.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=query,
-                limit=limit,
-                score_threshold=score_threshold,
-                source_type="external_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = await super().asearch(
-                query=query, limit=limit, score_threshold=score_threshold
-            )
-
+        if iTaK_event_bus.has_handlers(MemoryQueryStartedEvent):
             iTaK_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=query,
-                    results=results,
                     limit=limit,
                     score_threshold=score_threshold,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="external_memory",
                     from_agent=self.agent,
                     from_task=self.task,
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = await super().asearch(
+                query=query, limit=limit, score_threshold=score_threshold
+            )
+
+            if iTaK_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=query,
+                        results=results,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="external_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
+
             return results
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemoryQueryFailedEvent(
-                    query=query,
-                    limit=limit,
-                    score_threshold=score_threshold,
-                    error=str(e),
-                    source_type="external_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemoryQueryFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryFailedEvent(
+                        query=query,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        error=str(e),
+                        source_type="external_memory",
+                    ),
+                )
             raise
 
     def reset(self) -> None:
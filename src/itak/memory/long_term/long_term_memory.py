@@ -34,17 +34,18 @@ class LongTermMemory(Memory):
         super().__init__(storage=storage)
 
     def save(self, item: LongTermMemoryItem) -> None:  # type: ignore # BUG?: Signature of "save" incompatible with supertype "Memory"
-        iTaK_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                value=item.task,
-                metadata=item.metadata,
-                agent_role=item.agent,
-                source_type="long_term_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
+        if iTaK_event_bus.has_handlers(MemorySaveStartedEvent):
+            iTaK_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    value=item.task,
+                    metadata=item.metadata,
+                    agent_role=item.agent,
+                    source_type="long_term_memory",
+                    from_agent=self.agent,
+                    from_task=self.task,
+                ),
+            )
 
         start_time = time.time()
         try:
@@ -59,29 +60,31 @@ class LongTermMemory(Memory):
                 datetime=item.datetime,
             )
 
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=item.task,
-                    metadata=item.metadata,
-                    agent_role=item.agent,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="long_term_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=item.task,
+                        metadata=item.metadata,
+                        agent_role=item.agent,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="long_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    value=item.task,
-                    metadata=item.metadata,
-                    agent_role=item.agent,
-                    error=str(e),
-                    source_type="long_term_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        value=item.task,
+                        metadata=item.metadata,
+                        agent_role=item.agent,
+                        error=str(e),
+                        source_type="long_term_memory",
+                    ),
+                )
             raise
 
     def search(  # type: ignore[override]
@@ -98,45 +101,48 @@ class LongTermMemory(Memory):
         Returns:
             List of matching memory entries.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=task,
-                limit=latest_n,
-                source_type="long_term_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = self.storage.load(task, latest_n)
-
+        if iTaK_event_bus.has_handlers(MemoryQueryStartedEvent):
             iTaK_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=task,
-                    results=results,
                     limit=latest_n,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="long_term_memory",
                     from_agent=self.agent,
                     from_task=self.task,
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = self.storage.load(task, latest_n)
+
+            if iTaK_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=task,
+                        results=results,
+                        limit=latest_n,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="long_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
+
             return results or []
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemoryQueryFailedEvent(
-                    query=task,
-                    limit=latest_n,
-                    error=str(e),
-                    source_type="long_term_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemoryQueryFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryFailedEvent(
+                        query=task,
+                        limit=latest_n,
+                        error=str(e),
+                        source_type="long_term_memory",
+                    ),
+                )
             raise
 
     async def asave(self, item: LongTermMemoryItem) -> None:  # type: ignore[override]
@@ -145,17 +151,18 @@ class LongTermMemory(Memory):
         Args:
             item: The LongTermMemoryItem to save.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                value=item.task,
-                metadata=item.metadata,
-                agent_role=item.agent,
-                source_type="long_term_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
+        if iTaK_event_bus.has_handlers(MemorySaveStartedEvent):
+            iTaK_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    value=item.task,
+                    metadata=item.metadata,
+                    agent_role=item.agent,
+                    source_type="long_term_memory",
+                    from_agent=self.agent,
+                    from_task=self.task,
+                ),
+            )
 
         start_time = time.time()
         try:
@@ -170,29 +177,31 @@ class LongTermMemory(Memory):
                 datetime=item.datetime,
             )
 
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=item.task,
-                    metadata=item.metadata,
-                    agent_role=item.agent,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="long_term_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=item.task,
+                        metadata=item.metadata,
+                        agent_role=item.agent,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="long_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    value=item.task,
-                    metadata=item.metadata,
-                    agent_role=item.agent,
-                    error=str(e),
-                    source_type="long_term_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        value=item.task,
+                        metadata=item.metadata,
+                        agent_role=item.agent,
+                        error=str(e),
+                        source_type="long_term_memory",
+                    ),
+                )
             raise
 
     async def asearch(  # type: ignore[override]
@@ -209,45 +218,48 @@ class LongTermMemory(Memory):
         Returns:
             List of matching memory entries.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=task,
-                limit=latest_n,
-                source_type="long_term_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = await self.storage.aload(task, latest_n)
-
+        if iTaK_event_bus.has_handlers(MemoryQueryStartedEvent):
             iTaK_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=task,
-                    results=results,
                     limit=latest_n,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="long_term_memory",
                     from_agent=self.agent,
                     from_task=self.task,
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = await self.storage.aload(task, latest_n)
+
+            if iTaK_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=task,
+                        results=results,
+                        limit=latest_n,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="long_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
+
             return results or []
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemoryQueryFailedEvent(
-                    query=task,
-                    limit=latest_n,
-                    error=str(e),
-                    source_type="long_term_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemoryQueryFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryFailedEvent(
+                        query=task,
+                        limit=latest_n,
+                        error=str(e),
+                        source_type="long_term_memory",
+                    ),
+                )
             raise
 
     def reset(self) -> None:
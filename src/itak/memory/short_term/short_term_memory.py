@@ -73,16 +73,17 @@ class ShortTermMemory(Memory):
         value: Any,
         metadata: dict[str, Any] | None = None,
     ) -> None:
-        iTaK_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                value=value,
-                metadata=metadata,
-                source_type="short_term_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
+        if iTaK_event_bus.has_handlers(MemorySaveStartedEvent):
+            iTaK_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    value=value,
+                    metadata=metadata,
+                    source_type="short_term_memory",
+                    from_agent=self.agent,
+                    from_task=self.task,
+                ),
+            )
 
         start_time = time.time()
         try:
@@ -98,30 +99,32 @@ class ShortTermMemory(Memory):
 
             super().save(value=item.data, metadata=item.metadata)
 
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=value,
-                    metadata=metadata,
-                    # agent_role=agent,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="short_term_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=value,
+                        metadata=metadata,
+                        # agent_role=agent,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="short_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    value=value,
-                    metadata=metadata,
-                    error=str(e),
-                    source_type="short_term_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        value=value,
+                        metadata=metadata,
+                        error=str(e),
+                        source_type="short_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
             raise
 
     def search(
@@ -140,50 +143,53 @@ class ShortTermMemory(Memory):
         Returns:
             List of matching memory entries.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=query,
-                limit=limit,
-                score_threshold=score_threshold,
-                source_type="short_term_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = self.storage.search(
-                query=query, limit=limit, score_threshold=score_threshold
-            )
-
+        if iTaK_event_bus.has_handlers(MemoryQueryStartedEvent):
             iTaK_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=query,
-                    results=results,
                     limit=limit,
                     score_threshold=score_threshold,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="short_term_memory",
                     from_agent=self.agent,
                     from_task=self.task,
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = self.storage.search(
+                query=query, limit=limit, score_threshold=score_threshold
+            )
+
+            if iTaK_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=query,
+                        results=results,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="short_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
+
             return list(results)
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemoryQueryFailedEvent(
-                    query=query,
-                    limit=limit,
-                    score_threshold=score_threshold,
-                    error=str(e),
-                    source_type="short_term_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemoryQueryFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryFailedEvent(
+                        query=query,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        error=str(e),
+                        source_type="short_term_memory",
+                    ),
+                )
             raise
 
     async def asave(
@@ -197,16 +203,17 @@ class ShortTermMemory(Memory):
             value: The value to save.
             metadata: Optional metadata to associate with the value.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                value=value,
-                metadata=metadata,
-                source_type="short_term_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
+        if iTaK_event_bus.has_handlers(MemorySaveStartedEvent):
+            iTaK_event_bus.emit(
+                self,
+                event=MemorySaveStartedEvent(
+                    value=value,
+                    metadata=metadata,
+                    source_type="short_term_memory",
+                    from_agent=self.agent,
+                    from_task=self.task,
+                ),
+            )
 
         start_time = time.time()
         try:
@@ -222,29 +229,31 @@ class ShortTermMemory(Memory):
 
             await super().asave(value=item.data, metadata=item.metadata)
 
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=value,
-                    metadata=metadata,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="short_term_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveCompletedEvent(
+                        value=value,
+                        metadata=metadata,
+                        save_time_ms=(time.time() - start_time) * 1000,
+                        source_type="short_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    value=value,
-                    metadata=metadata,
-                    error=str(e),
-                    source_type="short_term_memory",
-                    from_agent=self.agent,
-                    from_task=self.task,
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemorySaveFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        value=value,
+                        metadata=metadata,
+                        error=str(e),
+                        source_type="short_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
             raise
 
     async def asearch(
@@ -263,50 +272,53 @@ class ShortTermMemory(Memory):
         Returns:
             List of matching memory entries.
         """
-        iTaK_event_bus.emit(
-            self,
-            event=MemoryQueryStartedEvent(
-                query=query,
-                limit=limit,
-                score_threshold=score_threshold,
-                source_type="short_term_memory",
-                from_agent=self.agent,
-                from_task=self.task,
-            ),
-        )
-
-        start_time = time.time()
-        try:
-            results = await self.storage.asearch(
-                query=query, limit=limit, score_threshold=score_threshold
-            )
-
+        if iTaK_event_bus.has_handlers(MemoryQueryStartedEvent):
             iTaK_event_bus.emit(
                 self,
-                event=MemoryQueryCompletedEvent(
+                event=MemoryQueryStartedEvent(
                     query=query,
-                    results=results,
                     limit=limit,
                     score_threshold=score_threshold,
-                    query_time_ms=(time.time() - start_time) * 1000,
                     source_type="short_term_memory",
                     from_agent=self.agent,
                     from_task=self.task,
                 ),
             )
 
+        start_time = time.time()
+        try:
+            results = await self.storage.asearch(
+                query=query, limit=limit, score_threshold=score_threshold
+            )
+
+            if iTaK_event_bus.has_handlers(MemoryQueryCompletedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryCompletedEvent(
+                        query=query,
+                        results=results,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        query_time_ms=(time.time() - start_time) * 1000,
+                        source_type="short_term_memory",
+                        from_agent=self.agent,
+                        from_task=self.task,
+                    ),
+                )
+
             return list(results)
         except Exception as e:
-            iTaK_event_bus.emit(
-                self,
-                event=MemoryQueryFailedEvent(
-                    query=query,
-                    limit=limit,
-                    score_threshold=score_threshold,
-                    error=str(e),
-                    source_type="short_term_memory",
-                ),
-            )
+            if iTaK_event_bus.has_handlers(MemoryQueryFailedEvent):
+                iTaK_event_bus.emit(
+                    self,
+                    event=MemoryQueryFailedEvent(
+                        query=query,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        error=str(e),
+                        source_type="short_term_memory",
+                    ),
+                )
             raise
 
     def reset(self) -> None:
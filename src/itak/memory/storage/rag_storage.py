@@ -8,7 +8,7 @@ import warnings
 from itak.rag.chromadb.config import ChromaDBConfig
 from itak.rag.chromadb.types import ChromaEmbeddingFunctionWrapper
 from itak.rag.config.utils import get_rag_client
-from itak.rag.embeddings.factory import build_embedder
+from itak.rag.embeddings.registry import get_shared_embedder
 from itak.rag.factory import create_client
 from itak.rag.storage.base_rag_storage import BaseRAGStorage
 from itak.utilities.constants import MAX_FILE_NAME_LENGTH
@@ -57,10 +57,10 @@ class RAGStorage(BaseRAGStorage):
         )
 
         if self.embedder_config:
-            embedding_function = build_embedder(self.embedder_config)
-
             try:
-                _ = embedding_function(["test"])
+                embedding_function = get_shared_embedder(
+                    self.embedder_config, warm_up=True
+                )
             except Exception as e:
                 provider = (
                     self.embedder_config["provider"]
@@ -3,23 +3,29 @@
 import logging
 from typing import Any
 
+from chromadb.api.models.AsyncCollection import AsyncCollection
+from chromadb.api.models.Collection import Collection
 from chromadb.api.types import (
     EmbeddingFunction as ChromaEmbeddingFunction,
     QueryResult,
 )
+from chromadb.errors import NotFoundError
 from typing_extensions import Unpack
 
 from itak.rag.chromadb.types import (
     ChromaDBClientType,
     ChromaDBCollectionCreateParams,
+    ChromaDBCollectionSearchManyParams,
     ChromaDBCollectionSearchParams,
 )
 from itak.rag.chromadb.utils import (
     _create_batch_slice,
+    _extract_search_many_params,
     _extract_search_params,
     _is_async_client,
     _is_sync_client,
     _prepare_documents_for_chromadb,
+    _process_many_query_results,
     _process_query_results,
     _sanitize_collection_name,
 )
@@ -67,6 +73,68 @@ class ChromaDBClient(BaseClient):
         self.default_limit = default_limit
         self.default_score_threshold = default_score_threshold
         self.default_batch_size = default_batch_size
+        self._collections: dict[str, Collection | AsyncCollection] = {}
+
+    def _get_collection(self, collection_name: str) -> Collection:
+        """Return the cached handle for a collection, creating it if needed."""
+        name = _sanitize_collection_name(collection_name)
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self.client.get_or_create_collection(  # type: ignore[union-attr]
+                name=name,
+                embedding_function=self.embedding_function,
+            )
+            self._collections[name] = collection
+        return collection  # type: ignore[return-value]
+
+    async def _aget_collection(self, collection_name: str) -> AsyncCollection:
+        """Return the cached async handle for a collection, creating it if needed."""
+        name = _sanitize_collection_name(collection_name)
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = await self.client.get_or_create_collection(  # type: ignore[misc]
+                name=name,
+                embedding_function=self.embedding_function,
+            )
+            self._collections[name] = collection
+        return collection  # type: ignore[return-value]
+
+    def _forget_collection(self, collection_name: str) -> None:
+        self._collections.pop(_sanitize_collection_name(collection_name), None)
+
+    def _query(
+        self, collection_name: str, **query_kwargs: Any
+    ) -> tuple[Collection, QueryResult]:
+        """Query a cached collection, refreshing the handle if it went stale.
+
+        A collection deleted and recreated by another client invalidates the
+        cached handle, so a single retry is made with a fresh one.
+        """
+        collection = self._get_collection(collection_name)
+        with suppress_logging(
+            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
+        ):
+            try:
+                return collection, collection.query(**query_kwargs)
+            except NotFoundError:
+                self._forget_collection(collection_name)
+                collection = self._get_collection(collection_name)
+                return collection, collection.query(**query_kwargs)
+
+    async def _aquery(
+        self, collection_name: str, **query_kwargs: Any
+    ) -> tuple[AsyncCollection, QueryResult]:
+        """Async counterpart of ``_query``."""
+        collection = await self._aget_collection(collection_name)
+        with suppress_logging(
+            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
+        ):
+            try:
+                return collection, await collection.query(**query_kwargs)
+            except NotFoundError:
+                self._forget_collection(collection_name)
+                collection = await self._aget_collection(collection_name)
+                return collection, await collection.query(**query_kwargs)
 
     def create_collection(
         self, **kwargs: Unpack[ChromaDBCollectionCreateParams]
@@ -110,6 +178,7 @@ class ChromaDBClient(BaseClient):
         if "hnsw:space" not in metadata:
             metadata["hnsw:space"] = "cosine"
 
+        self._forget_collection(kwargs["collection_name"])
         self.client.create_collection(
             name=_sanitize_collection_name(kwargs["collection_name"]),
             configuration=kwargs.get("configuration"),  # type: ignore[arg-type]
@@ -167,6 +236,7 @@ class ChromaDBClient(BaseClient):
         if "hnsw:space" not in metadata:
             metadata["hnsw:space"] = "cosine"
 
+        self._forget_collection(kwargs["collection_name"])
         await self.client.create_collection(
             name=_sanitize_collection_name(kwargs["collection_name"]),
             configuration=kwargs.get("configuration"),  # type: ignore[arg-type]
@@ -218,6 +288,7 @@ class ChromaDBClient(BaseClient):
         if "hnsw:space" not in metadata:
             metadata["hnsw:space"] = "cosine"
 
+        self._forget_collection(kwargs["collection_name"])
         return self.client.get_or_create_collection(
             name=_sanitize_collection_name(kwargs["collection_name"]),
             configuration=kwargs.get("configuration"),  # type: ignore[arg-type]
@@ -271,6 +342,7 @@ class ChromaDBClient(BaseClient):
         if "hnsw:space" not in metadata:
             metadata["hnsw:space"] = "cosine"
 
+        self._forget_collection(kwargs["collection_name"])
         return await self.client.get_or_create_collection(
             name=_sanitize_collection_name(kwargs["collection_name"]),
             configuration=kwargs.get("configuration") or None,  # type: ignore[arg-type]
@@ -313,10 +385,7 @@ class ChromaDBClient(BaseClient):
         if not documents:
             raise ValueError("Documents list cannot be empty")
 
-        collection = self.client.get_or_create_collection(
-            name=_sanitize_collection_name(collection_name),
-            embedding_function=self.embedding_function,
-        )
+        collection = self._get_collection(collection_name)
 
         prepared = _prepare_documents_for_chromadb(documents)
 
@@ -363,10 +432,7 @@ class ChromaDBClient(BaseClient):
         if not documents:
             raise ValueError("Documents list cannot be empty")
 
-        collection = await self.client.get_or_create_collection(
-            name=_sanitize_collection_name(collection_name),
-            embedding_function=self.embedding_function,
-        )
+        collection = await self._aget_collection(collection_name)
         prepared = _prepare_documents_for_chromadb(documents)
 
         for i in range(0, len(prepared.ids), batch_size):
@@ -419,23 +485,16 @@ class ChromaDBClient(BaseClient):
 
         params = _extract_search_params(kwargs)
 
-        collection = self.client.get_or_create_collection(
-            name=_sanitize_collection_name(params.collection_name),
-            embedding_function=self.embedding_function,
-        )
-
         where = params.where if params.where is not None else params.metadata_filter
 
-        with suppress_logging(
-            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
-        ):
-            results: QueryResult = collection.query(
-                query_texts=[params.query],
-                n_results=params.limit,
-                where=where,
-                where_document=params.where_document,
-                include=params.include,
-            )
+        collection, results = self._query(
+            params.collection_name,
+            query_texts=[params.query],
+            n_results=params.limit,
+            where=where,
+            where_document=params.where_document,
+            include=params.include,
+        )
 
         return _process_query_results(
             collection=collection,
@@ -482,25 +541,129 @@ class ChromaDBClient(BaseClient):
 
         params = _extract_search_params(kwargs)
 
-        collection = await self.client.get_or_create_collection(
-            name=_sanitize_collection_name(params.collection_name),
-            embedding_function=self.embedding_function,
+        where = params.where if params.where is not None else params.metadata_filter
+
+        collection, results = await self._aquery(
+            params.collection_name,
+            query_texts=[params.query],
+            n_results=params.limit,
+            where=where,
+            where_document=params.where_document,
+            include=params.include,
         )
 
+        return _process_query_results(
+            collection=collection,
+            results=results,
+            params=params,
+        )
+
+    def search_many(
+        self, **kwargs: Unpack[ChromaDBCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for similar documents for several queries in one round trip.
+
+        The embedding function is called once with every query and ChromaDB
+        answers all of them with a single ``collection.query`` call.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional filter for metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+            where: Optional ChromaDB where clause for metadata filtering.
+            where_document: Optional ChromaDB where clause for document content filtering.
+            include: Optional list of fields to include in results.
+
+        Returns:
+            One list of SearchResult dicts per query, in query order.
+
+        Raises:
+            TypeError: If AsyncClientAPI is used instead of ClientAPI for sync operations.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_sync_client(self.client):
+            raise TypeError(
+                "Synchronous method search_many() requires a ClientAPI. "
+                "Use asearch_many() for AsyncClientAPI."
+            )
+
+        if "limit" not in kwargs:
+            kwargs["limit"] = self.default_limit
+        if "score_threshold" not in kwargs:
+            kwargs["score_threshold"] = self.default_score_threshold
+
+        params = _extract_search_many_params(kwargs)
+        if not params.queries:
+            return []
+
         where = params.where if params.where is not None else params.metadata_filter
 
-        with suppress_logging(
-            "chromadb.segment.impl.vector.local_persistent_hnsw", logging.ERROR
-        ):
-            results: QueryResult = await collection.query(
-                query_texts=[params.query],
-                n_results=params.limit,
-                where=where,
-                where_document=params.where_document,
-                include=params.include,
+        collection, results = self._query(
+            params.collection_name,
+            query_texts=params.queries,
+            n_results=params.limit,
+            where=where,
+            where_document=params.where_document,
+            include=params.include,
+        )
+
+        return _process_many_query_results(
+            collection=collection,
+            results=results,
+            params=params,
+        )
+
+    async def asearch_many(
+        self, **kwargs: Unpack[ChromaDBCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for similar documents for several queries asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional filter for metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+            where: Optional ChromaDB where clause for metadata filtering.
+            where_document: Optional ChromaDB where clause for document content filtering.
+            include: Optional list of fields to include in results.
+
+        Returns:
+            One list of SearchResult dicts per query, in query order.
+
+        Raises:
+            TypeError: If ClientAPI is used instead of AsyncClientAPI for async operations.
+            ConnectionError: If unable to connect to ChromaDB server.
+        """
+        if not _is_async_client(self.client):
+            raise TypeError(
+                "Asynchronous method asearch_many() requires an AsyncClientAPI. "
+                "Use search_many() for ClientAPI."
             )
 
-        return _process_query_results(
+        if "limit" not in kwargs:
+            kwargs["limit"] = self.default_limit
+        if "score_threshold" not in kwargs:
+            kwargs["score_threshold"] = self.default_score_threshold
+
+        params = _extract_search_many_params(kwargs)
+        if not params.queries:
+            return []
+
+        where = params.where if params.where is not None else params.metadata_filter
+
+        collection, results = await self._aquery(
+            params.collection_name,
+            query_texts=params.queries,
+            n_results=params.limit,
+            where=where,
+            where_document=params.where_document,
+            include=params.include,
+        )
+
+        return _process_many_query_results(
             collection=collection,
             results=results,
             params=params,
@@ -531,6 +694,7 @@ class ChromaDBClient(BaseClient):
             )
 
         collection_name = kwargs["collection_name"]
+        self._forget_collection(collection_name)
         self.client.delete_collection(name=_sanitize_collection_name(collection_name))
 
     async def adelete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
@@ -561,6 +725,7 @@ class ChromaDBClient(BaseClient):
             )
 
         collection_name = kwargs["collection_name"]
+        self._forget_collection(collection_name)
         await self.client.delete_collection(
             name=_sanitize_collection_name(collection_name)
         )
@@ -586,6 +751,7 @@ class ChromaDBClient(BaseClient):
                 "Use areset() for AsyncClientAPI."
             )
 
+        self._collections.clear()
         self.client.reset()
 
     async def areset(self) -> None:
@@ -612,4 +778,5 @@ class ChromaDBClient(BaseClient):
                 "Use reset() for ClientAPI."
             )
 
+        self._collections.clear()
         await self.client.reset()
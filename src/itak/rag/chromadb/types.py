@@ -17,7 +17,11 @@ from chromadb.api.types import (
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
-from itak.rag.core.base_client import BaseCollectionParams, BaseCollectionSearchParams
+from itak.rag.core.base_client import (
+    BaseCollectionParams,
+    BaseCollectionSearchManyParams,
+    BaseCollectionSearchParams,
+)
 
 
 ChromaDBClientType = ClientAPI | AsyncClientAPI
@@ -76,6 +80,30 @@ class ExtractedSearchParams(NamedTuple):
     include: Include
 
 
+class ExtractedSearchManyParams(NamedTuple):
+    """Extracted parameters for a batched ChromaDB collection search.
+
+    Attributes:
+        collection_name: Name of the collection to search
+        queries: Search query texts
+        limit: Maximum number of results per query
+        metadata_filter: Optional metadata filter
+        score_threshold: Optional minimum similarity score
+        where: Optional ChromaDB where clause
+        where_document: Optional ChromaDB document filter
+        include: Fields to include in results
+    """
+
+    collection_name: str
+    queries: list[str]
+    limit: int
+    metadata_filter: dict[str, Any] | None
+    score_threshold: float | None
+    where: Where | None
+    where_document: WhereDocument | None
+    include: Include
+
+
 class ChromaDBCollectionCreateParams(BaseCollectionParams, total=False):
     """Parameters for creating a ChromaDB collection.
 
@@ -100,3 +128,14 @@ class ChromaDBCollectionSearchParams(BaseCollectionSearchParams, total=False):
     where: Where
     where_document: WhereDocument
     include: Include
+
+
+class ChromaDBCollectionSearchManyParams(BaseCollectionSearchManyParams, total=False):
+    """Parameters for a batched search of a ChromaDB collection.
+
+    Adds the same ChromaDB-specific options as ChromaDBCollectionSearchParams.
+    """
+
+    where: Where
+    where_document: WhereDocument
+    include: Include
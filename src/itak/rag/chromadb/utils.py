@@ -3,7 +3,7 @@
 from collections.abc import Mapping
 import hashlib
 import json
-from typing import Literal, TypeGuard, cast
+from typing import Any, Literal, TypeGuard, cast
 
 from chromadb.api import AsyncClientAPI, ClientAPI
 from chromadb.api.models.AsyncCollection import AsyncCollection
@@ -22,7 +22,9 @@ from itak.rag.chromadb.constants import (
 )
 from itak.rag.chromadb.types import (
     ChromaDBClientType,
+    ChromaDBCollectionSearchManyParams,
     ChromaDBCollectionSearchParams,
+    ExtractedSearchManyParams,
     ExtractedSearchParams,
     PreparedDocuments,
 )
@@ -164,6 +166,35 @@ def _extract_search_params(
     )
 
 
+def _extract_search_many_params(
+    kwargs: ChromaDBCollectionSearchManyParams,
+) -> ExtractedSearchManyParams:
+    """Extract batched search parameters from kwargs.
+
+    Args:
+        kwargs: Keyword arguments containing search parameters.
+
+    Returns:
+        ExtractedSearchManyParams with all extracted parameters.
+    """
+    return ExtractedSearchManyParams(
+        collection_name=kwargs["collection_name"],
+        queries=list(kwargs["queries"]),
+        limit=kwargs.get("limit", 10),
+        metadata_filter=kwargs.get("metadata_filter"),
+        score_threshold=kwargs.get("score_threshold"),
+        where=kwargs.get("where"),
+        where_document=kwargs.get("where_document"),
+        include=cast(
+            Include,
+            kwargs.get(
+                "include",
+                ["metadatas", "documents", "distances"],
+            ),
+        ),
+    )
+
+
 def _convert_distance_to_score(
     distance: float,
     distance_metric: Literal["l2", "cosine", "ip"],
@@ -194,6 +225,7 @@ def _convert_chromadb_results_to_search_results(
     include: Include,
     distance_metric: Literal["l2", "cosine", "ip"],
     score_threshold: float | None = None,
+    query_index: int = 0,
 ) -> list[SearchResult]:
     """Convert ChromaDB query results to SearchResult format.
 
@@ -202,6 +234,7 @@ def _convert_chromadb_results_to_search_results(
         include: List of fields that were included in the query.
         distance_metric: The distance metric used by the collection.
         score_threshold: Optional minimum similarity score (0-1) for results.
+        query_index: Which query of a batched query to convert.
 
     Returns:
         List of SearchResult dicts containing id, content, metadata, and score.
@@ -210,22 +243,16 @@ def _convert_chromadb_results_to_search_results(
 
     include_strings = list(include) if include else []
 
-    ids = results["ids"][0] if results.get("ids") else []
-
-    documents_list = results.get("documents")
-    documents = (
-        documents_list[0] if documents_list and "documents" in include_strings else []
-    )
-
-    metadatas_list = results.get("metadatas")
-    metadatas = (
-        metadatas_list[0] if metadatas_list and "metadatas" in include_strings else []
-    )
+    def _row(field: str) -> list[Any]:
+        rows = results.get(field)
+        if not rows or len(rows) <= query_index:
+            return []
+        return rows[query_index] or []
 
-    distances_list = results.get("distances")
-    distances = (
-        distances_list[0] if distances_list and "distances" in include_strings else []
-    )
+    ids = _row("ids")
+    documents = _row("documents") if "documents" in include_strings else []
+    metadatas = _row("metadatas") if "metadatas" in include_strings else []
+    distances = _row("distances") if "distances" in include_strings else []
 
     for i, doc_id in enumerate(ids):
         if not distances or i >= len(distances):
@@ -252,6 +279,16 @@ def _convert_chromadb_results_to_search_results(
     return search_results
 
 
+def _get_distance_metric(
+    collection: Collection | AsyncCollection,
+) -> Literal["l2", "cosine", "ip"]:
+    """Read the distance metric a collection was created with."""
+    return cast(
+        Literal["l2", "cosine", "ip"],
+        collection.metadata.get("hnsw:space", "l2") if collection.metadata else "l2",
+    )
+
+
 def _process_query_results(
     collection: Collection | AsyncCollection,
     results: QueryResult,
@@ -267,20 +304,42 @@ def _process_query_results(
     Returns:
         List of SearchResult dicts containing id, content, metadata, and score.
     """
-
-    distance_metric = cast(
-        Literal["l2", "cosine", "ip"],
-        collection.metadata.get("hnsw:space", "l2") if collection.metadata else "l2",
-    )
-
     return _convert_chromadb_results_to_search_results(
         results=results,
         include=params.include,
-        distance_metric=distance_metric,
+        distance_metric=_get_distance_metric(collection),
         score_threshold=params.score_threshold,
     )
 
 
+def _process_many_query_results(
+    collection: Collection | AsyncCollection,
+    results: QueryResult,
+    params: ExtractedSearchManyParams,
+) -> list[list[SearchResult]]:
+    """Split batched ChromaDB query results into one result list per query.
+
+    Args:
+        collection: The ChromaDB collection (sync or async) that was queried.
+        results: Raw query results from ChromaDB for all queries.
+        params: The search parameters used for the query.
+
+    Returns:
+        One list of SearchResult dicts per query, in query order.
+    """
+    distance_metric = _get_distance_metric(collection)
+    return [
+        _convert_chromadb_results_to_search_results(
+            results=results,
+            include=params.include,
+            distance_metric=distance_metric,
+            score_threshold=params.score_threshold,
+            query_index=index,
+        )
+        for index in range(len(params.queries))
+    ]
+
+
 def _is_ipv4_pattern(name: str) -> bool:
     """Check if a string matches an IPv4 address pattern.
 
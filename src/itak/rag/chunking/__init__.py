@@ -0,0 +1,16 @@
+"""Structure-aware, token-sized chunking for RAG ingestion."""
+
+from itak.rag.chunking.chunker import (
+    Chunk,
+    ChunkFormat,
+    StructureAwareChunker,
+    format_for_path,
+)
+
+
+__all__ = [
+    "Chunk",
+    "ChunkFormat",
+    "StructureAwareChunker",
+    "format_for_path",
+]
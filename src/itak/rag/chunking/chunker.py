@@ -0,0 +1,460 @@
+"""Structure-aware, token-sized text chunker.
+
+Line-level cut points are found in a single regex pass over the source and
+ranked by strength (section > paragraph > line). Each chunk is then cut at
+the strongest candidate that keeps it within the token budget; sentence,
+word and finally hard cuts are only searched for, locally, inside spans
+with no usable line break.
+
+Chunks are ``(start, end)`` offsets into the source; text is only copied
+when ``Chunk.text`` is read.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import re
+from typing import Any, Final, Literal
+
+from itak.utilities.token_accounting import HeuristicTokenizer, Tokenizer
+
+
+ChunkFormat = Literal["text", "markdown", "csv", "json"]
+
+LEVEL_SECTION: Final[int] = 0
+LEVEL_PARAGRAPH: Final[int] = 1
+LEVEL_LINE: Final[int] = 2
+
+_FORMAT_BY_SUFFIX: Final[dict[str, ChunkFormat]] = {
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".mdx": "markdown",
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".json": "json",
+}
+
+_NEWLINE_RE: Final[re.Pattern[str]] = re.compile(r"\n(?:[ \t]*\n)?")
+_SENTENCE_END_RE: Final[re.Pattern[str]] = re.compile(r"[.!?][\"')\]]?[ \t]+")
+_FENCE_RE: Final[re.Pattern[str]] = re.compile(r"[ \t]{0,3}(?:```|~~~)")
+_CSV_ROW_RE: Final[re.Pattern[str]] = re.compile(r'"(?:[^"]|"")*"|\n')
+_HEADING_RE: Final[re.Pattern[str]] = re.compile(r"(#{1,6})[ \t]+(.*)")
+_WHITESPACE: Final[str] = " \t\n"
+
+
+def format_for_path(path: str | Path) -> ChunkFormat:
+    """Pick the chunking format for a file from its suffix."""
+    return _FORMAT_BY_SUFFIX.get(Path(path).suffix.lower(), "text")
+
+
+@dataclass(frozen=True, slots=True)
+class Chunk:
+    """A span of the source text.
+
+    Attributes:
+        source: The full source text (shared, not copied).
+        start: Offset of the first character of the chunk.
+        end: Offset one past the last character of the chunk.
+        token_count: Tokens in ``text`` according to the chunker's tokenizer.
+        metadata: Structural context, e.g. ``heading_path`` or ``json_path``.
+        prefix: Text prepended on materialization, e.g. a CSV header row.
+    """
+
+    source: str = field(repr=False)
+    start: int
+    end: int
+    token_count: int
+    metadata: dict[str, Any] = field(default_factory=dict)
+    prefix: str = ""
+
+    @property
+    def text(self) -> str:
+        """Materialize the chunk text."""
+        return self.prefix + self.source[self.start : self.end]
+
+
+class _Boundaries:
+    """Sorted cut positions with their strength levels."""
+
+    __slots__ = ("levels", "positions")
+
+    def __init__(self) -> None:
+        self.positions = array("q")
+        self.levels = bytearray()
+
+    def add(self, position: int, level: int) -> None:
+        if self.positions and self.positions[-1] >= position:
+            if self.positions[-1] == position:
+                self.levels[-1] = min(self.levels[-1], level)
+            return
+        self.positions.append(position)
+        self.levels.append(level)
+
+    def best(self, lo: int, hi: int) -> int | None:
+        """Return the strongest, then furthest, cut in ``(lo, hi]``."""
+        first = bisect_right(self.positions, lo)
+        last = bisect_right(self.positions, hi)
+        if first >= last:
+            return None
+        best_index = first
+        for i in range(first, last):
+            if self.levels[i] <= self.levels[best_index]:
+                best_index = i
+        return self.positions[best_index]
+
+    def first_at_or_after(self, position: int, before: int) -> int | None:
+        i = bisect_left(self.positions, position)
+        if i < len(self.positions) and self.positions[i] < before:
+            return self.positions[i]
+        return None
+
+
+class StructureAwareChunker:
+    """Split text into token-bounded chunks along its structure.
+
+    Formats:
+        - ``text``: paragraphs, then lines, then sentences and words.
+        - ``markdown``: additionally cuts before headings, never inside code
+          fences, and records the enclosing ``heading_path``.
+        - ``csv``: cuts between rows (quoted newlines respected) and prepends
+          the header row to every chunk after the first.
+        - ``json``: cuts between top-level array items or object members and
+          records the ``json_path`` of the first one; invalid JSON is
+          chunked as text.
+
+    Args:
+        max_tokens: Maximum tokens per chunk.
+        overlap_tokens: Approximate tokens repeated at the start of the next
+            chunk, aligned to a boundary.
+        tokenizer: Tokenizer used for sizing. Defaults to the dependency-free
+            ``HeuristicTokenizer``.
+        min_fill: Fraction of the budget a chunk should fill before a weaker
+            boundary is preferred over a stronger, earlier one.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 512,
+        overlap_tokens: int = 0,
+        tokenizer: Tokenizer | None = None,
+        min_fill: float = 0.5,
+    ) -> None:
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError("overlap_tokens must be in [0, max_tokens)")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.tokenizer = tokenizer or HeuristicTokenizer()
+        self.min_fill = min_fill
+
+    def chunk(self, text: str, format: ChunkFormat = "text") -> list[Chunk]:
+        """Split ``text`` into chunks.
+
+        Args:
+            text: Source text.
+            format: Structure to respect; see the class docstring.
+
+        Returns:
+            Chunks in source order.
+        """
+        return list(self.iter_chunks(text, format))
+
+    def split_text(self, text: str, format: ChunkFormat = "text") -> list[str]:
+        """Split ``text`` and return the materialized chunk texts."""
+        return [chunk.text for chunk in self.iter_chunks(text, format)]
+
+    def iter_chunks(self, text: str, format: ChunkFormat = "text") -> Iterator[Chunk]:
+        """Lazily split ``text`` into chunks.
+
+        Args:
+            text: Source text.
+            format: Structure to respect; see the class docstring.
+
+        Yields:
+            Chunks in source order.
+        """
+        if not text:
+            return
+        if format == "markdown":
+            yield from self._chunk_markdown(text)
+        elif format == "csv":
+            yield from self._chunk_csv(text)
+        elif format == "json":
+            yield from self._chunk_json(text)
+        else:
+            yield from self._pack(text, 0, self._scan_text(text), "")
+
+    def _scan_text(self, text: str) -> _Boundaries:
+        boundaries = _Boundaries()
+        for match in _NEWLINE_RE.finditer(text):
+            level = LEVEL_PARAGRAPH if match.end() - match.start() > 1 else LEVEL_LINE
+            boundaries.add(match.end(), level)
+        return boundaries
+
+    def _fit(self, text: str, start: int, prefix_tokens: int) -> tuple[int, int]:
+        """Return the furthest end (and its token count) within the budget."""
+        budget = self.max_tokens - prefix_tokens
+        if budget <= 0:
+            raise ValueError("prefix alone exceeds max_tokens")
+        remaining = len(text) - start
+        # Start from a generous character guess and grow it until the budget
+        # is exceeded, so each chunk only counts text near its own window.
+        size = min(remaining, budget * 8)
+        tokens = self.tokenizer.count(text[start : start + size])
+        while tokens <= budget and size < remaining:
+            size = min(remaining, size * 2)
+            tokens = self.tokenizer.count(text[start : start + size])
+        if tokens <= budget:
+            return start + size, tokens
+        # Token density is close to uniform locally, so a proportional guess
+        # converges in one or two recounts.
+        while tokens > budget and size > 1:
+            size = max(1, min(size - 1, int(size * budget / tokens * 0.95)))
+            tokens = self.tokenizer.count(text[start : start + size])
+        return start + size, tokens
+
+    def _pack(
+        self,
+        text: str,
+        start: int,
+        boundaries: _Boundaries,
+        prefix: str,
+        metadata_for: Any = None,
+    ) -> Iterator[Chunk]:
+        prefix_tokens = self.tokenizer.count(prefix) if prefix else 0
+        length = len(text)
+        while start < length:
+            while start < length and text[start] in _WHITESPACE:
+                start += 1
+            if start >= length:
+                return
+            window_end, _ = self._fit(text, start, prefix_tokens)
+            if window_end >= length:
+                cut = length
+            else:
+                min_pos = start + int((window_end - start) * self.min_fill)
+                cut = self._choose_cut(text, start, min_pos, window_end, boundaries)
+            end = cut
+            while end > start and text[end - 1] in _WHITESPACE:
+                end -= 1
+            if end > start:
+                tokens = self.tokenizer.count(text[start:end]) + prefix_tokens
+                yield Chunk(
+                    text,
+                    start,
+                    end,
+                    tokens,
+                    metadata_for(start, end) if metadata_for else {},
+                    prefix,
+                )
+            start = self._next_start(text, start, cut, boundaries)
+
+    def _choose_cut(
+        self,
+        text: str,
+        start: int,
+        min_pos: int,
+        window_end: int,
+        boundaries: _Boundaries,
+    ) -> int:
+        """Pick where to end a chunk starting at ``start``.
+
+        Preference: the strongest scanned boundary in the filled part of the
+        window, then the last sentence end there, then any earlier scanned
+        boundary, then the last whitespace, then a hard cut.
+        """
+        # Every candidate lies after ``start`` so that packing always advances.
+        cut = boundaries.best(max(start, min_pos - 1), window_end)
+        if cut is not None:
+            return cut
+        sentence_end = None
+        for match in _SENTENCE_END_RE.finditer(text, min_pos, window_end):
+            sentence_end = match.end()
+        if sentence_end is not None:
+            return sentence_end
+        cut = boundaries.best(start, min_pos - 1)
+        if cut is not None:
+            return cut
+        space = max(
+            text.rfind(" ", start + 1, window_end),
+            text.rfind("\t", start + 1, window_end),
+        )
+        return space + 1 if space > start else window_end
+
+    def _next_start(
+        self, text: str, start: int, cut: int, boundaries: _Boundaries
+    ) -> int:
+        if not self.overlap_tokens or cut >= len(text):
+            return cut
+        overlap_chars = self.overlap_tokens * (cut - start) // max(
+            1, self.tokenizer.count(text[start:cut])
+        )
+        target = max(start + 1, cut - overlap_chars)
+        aligned = boundaries.first_at_or_after(target, cut)
+        if aligned is None:
+            space = text.find(" ", target, cut)
+            aligned = space + 1 if space != -1 else cut
+        return aligned if aligned > start else cut
+
+    def _chunk_markdown(self, text: str) -> Iterator[Chunk]:
+        boundaries = _Boundaries()
+        headings: list[tuple[int, int, str]] = []
+        in_fence = False
+
+        # A heading is kept with the content that follows it: cuts between a
+        # heading line and the next non-blank line are suppressed.
+        heading_line_end = -1
+
+        def line_start(pos: int, suppressed: bool) -> None:
+            """Classify the line starting at ``pos`` (after a newline)."""
+            nonlocal in_fence, heading_line_end
+            if _FENCE_RE.match(text, pos):
+                if in_fence:
+                    # Closing fence: cut after its line, not before it.
+                    line_end = text.find("\n", pos)
+                    if line_end != -1:
+                        boundaries.add(line_end + 1, LEVEL_PARAGRAPH)
+                elif not suppressed:
+                    boundaries.add(pos, LEVEL_PARAGRAPH)
+                in_fence = not in_fence
+                return
+            if in_fence or not text.startswith("#", pos):
+                return
+            line_end = text.find("\n", pos)
+            if line_end == -1:
+                line_end = len(text)
+            match = _HEADING_RE.match(text, pos, line_end)
+            if match:
+                boundaries.add(pos, LEVEL_SECTION)
+                headings.append((pos, len(match.group(1)), match.group(2).strip()))
+                heading_line_end = line_end
+
+        line_start(0, False)
+        previous_end = 0
+        suppressed = False
+        for match in _NEWLINE_RE.finditer(text):
+            pos = match.end()
+            if match.start() == heading_line_end:
+                suppressed = True
+            elif suppressed and text[previous_end : match.start()].strip():
+                suppressed = False
+            if not in_fence and not suppressed:
+                para = pos - match.start() > 1
+                boundaries.add(pos, LEVEL_PARAGRAPH if para else LEVEL_LINE)
+            previous_end = pos
+            line_start(pos, suppressed)
+
+        starts = [h[0] for h in headings]
+        # Heading path in effect after each heading, built in one pass.
+        paths: list[str] = []
+        stack: list[tuple[int, str]] = []
+        for _, level, title in headings:
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, title))
+            paths.append(" > ".join(t for _, t in stack))
+
+        def metadata_for(start: int, _end: int) -> dict[str, Any]:
+            index = bisect_right(starts, start) - 1
+            return {"heading_path": paths[index]} if index >= 0 else {}
+
+        return self._pack(text, 0, boundaries, "", metadata_for)
+
+    def _chunk_csv(self, text: str) -> Iterator[Chunk]:
+        row_ends = [m.end() for m in _CSV_ROW_RE.finditer(text) if m.group() == "\n"]
+        if not row_ends or row_ends[0] >= len(text):
+            yield from self._pack(text, 0, _Boundaries(), "")
+            return
+        header = text[: row_ends[0]]
+        if not header.endswith("\n"):
+            header += "\n"
+        boundaries = _Boundaries()
+        for pos in row_ends[1:]:
+            boundaries.add(pos, LEVEL_LINE)
+
+        def metadata_for(start: int, end: int) -> dict[str, Any]:
+            return {
+                "row_start": bisect_right(row_ends, start),
+                "row_end": bisect_left(row_ends, end) + 1,
+            }
+
+        first = True
+        for chunk in self._pack(text, row_ends[0], boundaries, header, metadata_for):
+            if first:
+                # The first chunk already follows the header in the source.
+                first = False
+                chunk = Chunk(
+                    text,
+                    0,
+                    chunk.end,
+                    chunk.token_count,
+                    chunk.metadata,
+                )
+            yield chunk
+
+    def _chunk_json(self, text: str) -> Iterator[Chunk]:
+        units = _json_units(text)
+        if units is None:
+            yield from self._pack(text, 0, self._scan_text(text), "")
+            return
+        boundaries = self._scan_text(text)
+        merged = _Boundaries()
+        unit_ends = {end for _, end, _ in units}
+        unit_starts = [start for start, _, _ in units]
+        line_positions = list(boundaries.positions)
+        for pos, level in sorted(
+            [(end, LEVEL_SECTION) for end in unit_ends]
+            + list(zip(line_positions, boundaries.levels, strict=True))
+        ):
+            merged.add(pos, level)
+
+        def metadata_for(start: int, _end: int) -> dict[str, Any]:
+            index = max(0, bisect_right(unit_starts, start) - 1)
+            return {"json_path": units[index][2]}
+
+        yield from self._pack(text, 0, merged, "", metadata_for)
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
+
+def _json_units(text: str) -> list[tuple[int, int, str]] | None:
+    """Return ``(start, end, path)`` spans of top-level JSON members."""
+    decoder = json.JSONDecoder()
+    pos = _skip_ws(text, 0)
+    if pos >= len(text) or text[pos] not in "[{":
+        return None
+    is_array = text[pos] == "["
+    closing = "]" if is_array else "}"
+    pos = _skip_ws(text, pos + 1)
+    units: list[tuple[int, int, str]] = []
+    try:
+        while pos < len(text) and text[pos] != closing:
+            start = pos
+            if is_array:
+                path = f"$[{len(units)}]"
+            else:
+                key, pos = decoder.raw_decode(text, pos)
+                pos = _skip_ws(text, pos)
+                if text[pos] != ":":
+                    return None
+                pos = _skip_ws(text, pos + 1)
+                path = f"$.{key}"
+            _, pos = decoder.raw_decode(text, pos)
+            pos = _skip_ws(text, pos)
+            if pos < len(text) and text[pos] == ",":
+                pos += 1
+            units.append((start, pos, path))
+            pos = _skip_ws(text, pos)
+    except (json.JSONDecodeError, IndexError):
+        return None
+    return units or None
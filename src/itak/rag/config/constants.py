@@ -5,5 +5,5 @@ from typing import Final
 
 DISCRIMINATOR: Final[str] = "provider"
 
-DEFAULT_RAG_CONFIG_PATH: Final[str] = "iTaK.rag.chromadb.config"
+DEFAULT_RAG_CONFIG_PATH: Final[str] = "itak.rag.chromadb.config"
 DEFAULT_RAG_CONFIG_CLASS: Final[str] = "ChromaDBConfig"
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Protocol
 if TYPE_CHECKING:
     from itak.rag.chromadb.client import ChromaDBClient
     from itak.rag.chromadb.config import ChromaDBConfig
+    from itak.rag.embedded.client import EmbeddedClient
+    from itak.rag.embedded.config import EmbeddedConfig
     from itak.rag.qdrant.client import QdrantClient
     from itak.rag.qdrant.config import QdrantConfig
 
@@ -26,3 +28,11 @@ class QdrantFactoryModule(Protocol):
     def create_client(self, config: QdrantConfig) -> QdrantClient:
         """Creates a Qdrant client from configuration."""
         ...
+
+
+class EmbeddedFactoryModule(Protocol):
+    """Protocol for embedded vector store factory module."""
+
+    def create_client(self, config: EmbeddedConfig) -> EmbeddedClient:
+        """Creates an embedded vector store client from configuration."""
+        ...
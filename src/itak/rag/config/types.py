@@ -15,6 +15,9 @@ if TYPE_CHECKING:
     from itak.rag.qdrant.config import QdrantConfig as QdrantConfig_
 
     QdrantConfig = QdrantConfig_
+    from itak.rag.embedded.config import EmbeddedConfig as EmbeddedConfig_
+
+    EmbeddedConfig = EmbeddedConfig_
 else:
     try:
         from itak.rag.chromadb.config import ChromaDBConfig
@@ -30,7 +33,9 @@ else:
             MissingQdrantConfig as QdrantConfig,
         )
 
-SupportedProviderConfig: TypeAlias = ChromaDBConfig | QdrantConfig
+    from itak.rag.embedded.config import EmbeddedConfig
+
+SupportedProviderConfig: TypeAlias = ChromaDBConfig | QdrantConfig | EmbeddedConfig
 RagConfigType: TypeAlias = Annotated[
     SupportedProviderConfig, Field(discriminator=DISCRIMINATOR)
 ]
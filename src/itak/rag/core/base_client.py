@@ -63,6 +63,22 @@ class BaseCollectionSearchParams(BaseCollectionParams, total=False):
     score_threshold: float
 
 
+class BaseCollectionSearchManyParams(BaseCollectionParams, total=False):
+    """Parameters for running several queries against one collection at once.
+
+    Attributes:
+        queries: The text queries to search for (required).
+        limit: Maximum number of results to return per query.
+        metadata_filter: Filter results by metadata fields.
+        score_threshold: Minimum similarity score for results (0-1).
+    """
+
+    queries: Required[list[str]]
+    limit: int
+    metadata_filter: dict[str, Any] | None
+    score_threshold: float
+
+
 @runtime_checkable
 class BaseClient(Protocol):
     """Protocol for vector store client implementations.
@@ -362,6 +378,67 @@ class BaseClient(Protocol):
         """
         ...
 
+    @abstractmethod
+    def search_many(
+        self, **kwargs: Unpack[BaseCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for similar documents for several queries in one round trip.
+
+        All queries are embedded in a single batch and sent to the backend as
+        one vectorized query, which is considerably cheaper than calling
+        ``search`` once per query.
+
+        Keyword Args:
+            collection_name: The name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional metadata filter applied to every query.
+            score_threshold: Optional minimum similarity score threshold.
+
+        Returns:
+            One list of SearchResult dictionaries per query, in the order of
+            ``queries``.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to the vector database backend.
+
+        Example:
+            >>> from itak.rag.chromadb.client import ChromaDBClient
+            >>> client = ChromaDBClient()
+            >>>
+            >>> per_query = client.search_many(
+            ...     collection_name="my_docs",
+            ...     queries=["What is machine learning?", "What is a neuron?"],
+            ...     limit=5,
+            ... )
+            >>> for results in per_query:
+            ...     print([result["id"] for result in results])
+        """
+        ...
+
+    @abstractmethod
+    async def asearch_many(
+        self, **kwargs: Unpack[BaseCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for similar documents for several queries asynchronously.
+
+        Keyword Args:
+            collection_name: The name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional metadata filter applied to every query.
+            score_threshold: Optional minimum similarity score threshold.
+
+        Returns:
+            One list of SearchResult dictionaries per query, in query order.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to the vector database backend.
+        """
+        ...
+
     @abstractmethod
     def delete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
         """Delete a collection and all its data.
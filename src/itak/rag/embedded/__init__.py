@@ -0,0 +1 @@
+"""Embedded NumPy vector store backed by memory-mapped files."""
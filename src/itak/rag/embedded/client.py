@@ -0,0 +1,352 @@
+"""Embedded vector store client implementation."""
+
+import asyncio
+from typing import Any
+
+import numpy as np
+from typing_extensions import Unpack
+
+from itak.rag.core.base_client import (
+    BaseClient,
+    BaseCollectionAddParams,
+    BaseCollectionParams,
+    BaseCollectionSearchManyParams,
+    BaseCollectionSearchParams,
+)
+from itak.rag.embedded.store import EmbeddedVectorStore, VectorCollection
+from itak.rag.embedded.types import EmbeddedCollectionCreateParams, EmbeddingFunction
+from itak.rag.embedded.utils import (
+    _prepare_documents,
+    _sanitize_collection_name,
+    _similarity_to_score,
+)
+from itak.rag.types import SearchResult
+
+
+class EmbeddedClient(BaseClient):
+    """In-process implementation of the BaseClient protocol.
+
+    Stores vectors in memory-mapped files under a local directory and answers
+    queries with NumPy: a BLAS matrix product over all vectors for small
+    collections, an IVF index once a collection grows past
+    ``index_threshold``. Needs no server and no extra dependencies.
+
+    Async methods run the same work in a worker thread.
+
+    Attributes:
+        client: The underlying EmbeddedVectorStore.
+        embedding_function: Batch function turning texts into vectors.
+        default_limit: Default number of results to return in searches.
+        default_score_threshold: Default minimum score for search results.
+    """
+
+    def __init__(
+        self,
+        client: EmbeddedVectorStore,
+        embedding_function: EmbeddingFunction,
+        default_limit: int = 5,
+        default_score_threshold: float = 0.6,
+        default_batch_size: int = 100,
+    ) -> None:
+        """Initialize EmbeddedClient with a store and embedding function.
+
+        Args:
+            client: Store holding the collections.
+            embedding_function: Embedding function for text to vector conversion.
+            default_limit: Default number of results to return in searches.
+            default_score_threshold: Default minimum score for search results.
+            default_batch_size: Default batch size for adding documents.
+        """
+        self.client = client
+        self.embedding_function = embedding_function
+        self.default_limit = default_limit
+        self.default_score_threshold = default_score_threshold
+        self.default_batch_size = default_batch_size
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        return np.asarray(self.embedding_function(texts), dtype=np.float32)
+
+    def _existing(self, collection_name: str) -> VectorCollection:
+        name = _sanitize_collection_name(collection_name)
+        if not self.client.exists(name):
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+        return self.client.get(name)
+
+    def create_collection(
+        self, **kwargs: Unpack[EmbeddedCollectionCreateParams]
+    ) -> None:
+        """Create a new collection.
+
+        Keyword Args:
+            collection_name: Name of the collection to create. Must be unique.
+            metadata: Optional metadata stored with the collection.
+            index_threshold: Optional per-collection IVF index threshold.
+
+        Raises:
+            ValueError: If collection with the same name already exists.
+        """
+        collection_name = kwargs["collection_name"]
+        name = _sanitize_collection_name(collection_name)
+        if self.client.exists(name):
+            raise ValueError(f"Collection '{collection_name}' already exists")
+        self.client.create(
+            name, kwargs.get("metadata"), kwargs.get("index_threshold")
+        )
+
+    async def acreate_collection(
+        self, **kwargs: Unpack[EmbeddedCollectionCreateParams]
+    ) -> None:
+        """Create a new collection asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to create. Must be unique.
+            metadata: Optional metadata stored with the collection.
+            index_threshold: Optional per-collection IVF index threshold.
+
+        Raises:
+            ValueError: If collection with the same name already exists.
+        """
+        await asyncio.to_thread(self.create_collection, **kwargs)
+
+    def get_or_create_collection(
+        self, **kwargs: Unpack[EmbeddedCollectionCreateParams]
+    ) -> VectorCollection:
+        """Get an existing collection or create it if it doesn't exist.
+
+        Keyword Args:
+            collection_name: Name of the collection to get or create.
+            metadata: Optional metadata stored with a newly created collection.
+            index_threshold: Optional per-collection IVF index threshold.
+
+        Returns:
+            The VectorCollection.
+        """
+        name = _sanitize_collection_name(kwargs["collection_name"])
+        if self.client.exists(name):
+            return self.client.get(name)
+        return self.client.create(
+            name, kwargs.get("metadata"), kwargs.get("index_threshold")
+        )
+
+    async def aget_or_create_collection(
+        self, **kwargs: Unpack[EmbeddedCollectionCreateParams]
+    ) -> VectorCollection:
+        """Get an existing collection or create it if it doesn't exist asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to get or create.
+            metadata: Optional metadata stored with a newly created collection.
+            index_threshold: Optional per-collection IVF index threshold.
+
+        Returns:
+            The VectorCollection.
+        """
+        return await asyncio.to_thread(self.get_or_create_collection, **kwargs)
+
+    def add_documents(self, **kwargs: Unpack[BaseCollectionAddParams]) -> None:
+        """Add documents with their embeddings to a collection.
+
+        Performs an upsert operation - documents with existing IDs are replaced.
+        Creates the collection if it does not exist yet.
+
+        Keyword Args:
+            collection_name: The name of the collection to add documents to.
+            documents: List of BaseRecord dicts containing document data.
+            batch_size: Optional batch size for embedding documents (default: 100)
+
+        Raises:
+            ValueError: If documents list is empty or the embedding dimension
+                does not match the collection.
+        """
+        collection_name = kwargs["collection_name"]
+        documents = kwargs["documents"]
+        batch_size = kwargs.get("batch_size", self.default_batch_size)
+
+        if not documents:
+            raise ValueError("Documents list cannot be empty")
+
+        collection = self.get_or_create_collection(collection_name=collection_name)
+        ids, texts, metadatas = _prepare_documents(documents)
+
+        for i in range(0, len(ids), batch_size):
+            batch = slice(i, i + batch_size)
+            collection.upsert(
+                ids[batch], texts[batch], metadatas[batch], self._embed(texts[batch])
+            )
+
+    async def aadd_documents(self, **kwargs: Unpack[BaseCollectionAddParams]) -> None:
+        """Add documents with their embeddings to a collection asynchronously.
+
+        Keyword Args:
+            collection_name: The name of the collection to add documents to.
+            documents: List of BaseRecord dicts containing document data.
+            batch_size: Optional batch size for embedding documents (default: 100)
+
+        Raises:
+            ValueError: If documents list is empty or the embedding dimension
+                does not match the collection.
+        """
+        await asyncio.to_thread(self.add_documents, **kwargs)
+
+    def _search(
+        self,
+        collection_name: str,
+        queries: list[str],
+        limit: int,
+        metadata_filter: dict[str, Any] | None,
+        score_threshold: float | None,
+    ) -> list[list[SearchResult]]:
+        collection = self._existing(collection_name)
+        if not queries:
+            return []
+        matches = collection.search(self._embed(queries), limit, metadata_filter)
+
+        per_query: list[list[SearchResult]] = []
+        for query_matches in matches:
+            results: list[SearchResult] = []
+            for doc_id, content, metadata, similarity in query_matches:
+                score = _similarity_to_score(similarity)
+                if score_threshold and score < score_threshold:
+                    continue
+                results.append(
+                    {
+                        "id": doc_id,
+                        "content": content,
+                        "metadata": metadata,
+                        "score": score,
+                    }
+                )
+            per_query.append(results)
+        return per_query
+
+    def search(
+        self, **kwargs: Unpack[BaseCollectionSearchParams]
+    ) -> list[SearchResult]:
+        """Search for similar documents using a query.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            query: The text query to search for.
+            limit: Maximum number of results to return (default: 5).
+            metadata_filter: Optional equality filter on metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+
+        Returns:
+            List of SearchResult dicts containing id, content, metadata, and score.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+        """
+        return self._search(
+            kwargs["collection_name"],
+            [kwargs["query"]],
+            kwargs.get("limit", self.default_limit),
+            kwargs.get("metadata_filter"),
+            kwargs.get("score_threshold", self.default_score_threshold),
+        )[0]
+
+    async def asearch(
+        self, **kwargs: Unpack[BaseCollectionSearchParams]
+    ) -> list[SearchResult]:
+        """Search for similar documents using a query asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            query: The text query to search for.
+            limit: Maximum number of results to return (default: 5).
+            metadata_filter: Optional equality filter on metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+
+        Returns:
+            List of SearchResult dicts containing id, content, metadata, and score.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+        """
+        return await asyncio.to_thread(self.search, **kwargs)
+
+    def search_many(
+        self, **kwargs: Unpack[BaseCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for similar documents for several queries at once.
+
+        All queries are embedded in one call and scored with one matrix
+        product.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional equality filter on metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+
+        Returns:
+            One list of SearchResult dicts per query, in query order.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+        """
+        return self._search(
+            kwargs["collection_name"],
+            list(kwargs["queries"]),
+            kwargs.get("limit", self.default_limit),
+            kwargs.get("metadata_filter"),
+            kwargs.get("score_threshold", self.default_score_threshold),
+        )
+
+    async def asearch_many(
+        self, **kwargs: Unpack[BaseCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for similar documents for several queries asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional equality filter on metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+
+        Returns:
+            One list of SearchResult dicts per query, in query order.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+        """
+        return await asyncio.to_thread(self.search_many, **kwargs)
+
+    def delete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
+        """Delete a collection and all its data.
+
+        Keyword Args:
+            collection_name: Name of the collection to delete.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+        """
+        collection_name = kwargs["collection_name"]
+        self._existing(collection_name)
+        self.client.delete(_sanitize_collection_name(collection_name))
+
+    async def adelete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
+        """Delete a collection and all its data asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to delete.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+        """
+        await asyncio.to_thread(self.delete_collection, **kwargs)
+
+    def reset(self) -> None:
+        """Reset the vector store by deleting all collections and data."""
+        for name in self.client.names():
+            self.client.delete(name)
+
+    async def areset(self) -> None:
+        """Reset the vector store asynchronously, deleting all collections."""
+        await asyncio.to_thread(self.reset)
+
+    def close(self) -> None:
+        """Release the in-memory state of loaded collections; files are kept."""
+        self.client.release()
@@ -0,0 +1,33 @@
+"""Embedded vector store configuration model."""
+
+from dataclasses import field
+from typing import Literal, cast
+
+from pydantic.dataclasses import dataclass as pyd_dataclass
+
+from itak.rag.config.base import BaseRagConfig
+from itak.rag.embedded.constants import DEFAULT_INDEX_THRESHOLD, DEFAULT_STORAGE_PATH
+from itak.rag.embedded.embedding import HashingEmbeddingFunction
+from itak.rag.embedded.types import EmbeddedEmbeddingFunctionWrapper
+
+
+def _default_embedding_function() -> EmbeddedEmbeddingFunctionWrapper:
+    """Create default embedding function.
+
+    Returns:
+        Feature-hashing embedding function, so the embedded store works
+        without any model download, external service or vector database.
+    """
+    return cast(EmbeddedEmbeddingFunctionWrapper, HashingEmbeddingFunction())
+
+
+@pyd_dataclass(frozen=True)
+class EmbeddedConfig(BaseRagConfig):
+    """Configuration for the embedded vector store client."""
+
+    provider: Literal["embedded"] = field(default="embedded", init=False)
+    path: str = DEFAULT_STORAGE_PATH
+    index_threshold: int = DEFAULT_INDEX_THRESHOLD
+    embedding_function: EmbeddedEmbeddingFunctionWrapper = field(
+        default_factory=_default_embedding_function
+    )
@@ -0,0 +1,33 @@
+"""Constants for the embedded vector store."""
+
+import os
+from typing import Final
+
+from itak.utilities.paths import db_storage_path
+
+
+DEFAULT_STORAGE_PATH: Final[str] = os.path.join(db_storage_path(), "embedded")
+
+VECTORS_FILE: Final[str] = "vectors.f32"
+LOG_FILE: Final[str] = "records.jsonl"
+META_FILE: Final[str] = "collection.json"
+# Compaction writes both files next to the originals; renaming the new log to
+# COMPACTED_LOG_FILE commits it, so a crash on either side is recoverable.
+COMPACTING_SUFFIX: Final[str] = ".compacting"
+COMPACTED_LOG_FILE: Final[str] = "records.compacted.jsonl"
+
+# Below this many live vectors a brute-force scan beats building an index.
+DEFAULT_INDEX_THRESHOLD: Final[int] = 20_000
+# Rows appended after an index build are scanned directly until they reach
+# this share of the indexed rows, then the index is rebuilt.
+INDEX_REBUILD_RATIO: Final[float] = 0.1
+IVF_KMEANS_ITERATIONS: Final[int] = 8
+IVF_TRAINING_POINTS_PER_LIST: Final[int] = 64
+# Tombstoned rows are compacted away once there are at least this many and
+# they outnumber the live rows by COMPACTION_TOMBSTONE_RATIO.
+COMPACTION_MIN_TOMBSTONES: Final[int] = 1024
+COMPACTION_TOMBSTONE_RATIO: Final[float] = 1.0
+COMPACTION_CHUNK_ROWS: Final[int] = 8192
+
+# Dimension of the dependency-free default hashing embedding.
+DEFAULT_HASHING_DIMENSIONS: Final[int] = 512
@@ -0,0 +1,54 @@
+"""Dependency-free default embedding function for the embedded store."""
+
+import re
+import zlib
+
+import numpy as np
+
+from itak.rag.embedded.constants import DEFAULT_HASHING_DIMENSIONS
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class HashingEmbeddingFunction:
+    """Embeds texts by feature hashing their words and character trigrams.
+
+    A lexical embedding: texts sharing words or word fragments score as
+    similar, synonyms do not. It needs nothing beyond NumPy and is stable
+    across processes, which makes it a safe default; configure a model-based
+    embedding function for semantic search.
+
+    Args:
+        dimensions: Length of the produced vectors.
+    """
+
+    def __init__(self, dimensions: int = DEFAULT_HASHING_DIMENSIONS) -> None:
+        self.dimensions = dimensions
+
+    def _features(self, text: str) -> list[str]:
+        features = []
+        for word in _TOKEN_PATTERN.findall(text.lower()):
+            features.append(word)
+            padded = f"<{word}>"
+            features.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+        return features
+
+    def __call__(self, input: list[str]) -> list[list[float]]:
+        """Convert texts to unit-length embedding vectors.
+
+        Args:
+            input: Texts to embed.
+
+        Returns:
+            One embedding vector per text.
+        """
+        vectors = np.zeros((len(input), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(input):
+            for feature in self._features(text):
+                digest = zlib.crc32(feature.encode())
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                vectors[row, digest % self.dimensions] += sign
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).tolist()
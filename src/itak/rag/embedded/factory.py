@@ -0,0 +1,23 @@
+"""Factory functions for creating embedded vector store clients."""
+
+from itak.rag.embedded.client import EmbeddedClient
+from itak.rag.embedded.config import EmbeddedConfig
+from itak.rag.embedded.store import EmbeddedVectorStore
+
+
+def create_client(config: EmbeddedConfig) -> EmbeddedClient:
+    """Create an EmbeddedClient from configuration.
+
+    Args:
+        config: Embedded store configuration object.
+
+    Returns:
+        Configured EmbeddedClient instance.
+    """
+    return EmbeddedClient(
+        client=EmbeddedVectorStore(config.path, config.index_threshold),
+        embedding_function=config.embedding_function,
+        default_limit=config.limit,
+        default_score_threshold=config.score_threshold,
+        default_batch_size=config.batch_size,
+    )
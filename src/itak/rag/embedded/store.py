@@ -0,0 +1,537 @@
+"""Memory-mapped vector storage for the embedded RAG backend.
+
+Each collection is a directory holding three files:
+
+- ``vectors.f32``: unit-normalized float32 vectors, one row per record,
+  append-only and read through ``numpy.memmap``;
+- ``records.jsonl``: an append log of upserts and deletes carrying the
+  document ids, contents and metadata;
+- ``collection.json``: vector dimension and collection metadata.
+
+Replaced and deleted rows are tombstoned rather than rewritten, so writes
+only ever append; once tombstones outnumber live rows the files are rewritten
+without them. Only ids, log offsets and metadata are held in memory, contents
+are read back from the log for the rows a search returns. Collections are
+loaded on first use and can be released again, which leaves nothing but the
+files behind while a collection is idle.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import json
+import os
+from pathlib import Path
+import shutil
+import threading
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from itak.rag.embedded.constants import (
+    COMPACTED_LOG_FILE,
+    COMPACTING_SUFFIX,
+    COMPACTION_CHUNK_ROWS,
+    COMPACTION_MIN_TOMBSTONES,
+    COMPACTION_TOMBSTONE_RATIO,
+    INDEX_REBUILD_RATIO,
+    IVF_KMEANS_ITERATIONS,
+    IVF_TRAINING_POINTS_PER_LIST,
+    LOG_FILE,
+    META_FILE,
+    VECTORS_FILE,
+)
+
+
+FloatArray = npt.NDArray[np.float32]
+
+
+def _normalize(vectors: FloatArray) -> FloatArray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _top_k(scores: FloatArray, k: int) -> npt.NDArray[np.intp]:
+    """Indices of the ``k`` largest scores, best first."""
+    if k >= len(scores):
+        return np.argsort(-scores)
+    part = np.argpartition(-scores, k)[:k]
+    return part[np.argsort(-scores[part])]
+
+
+class MetadataColumns:
+    """Metadata stored column-wise, one value list per key aligned with rows.
+
+    Filters compare whole columns at once instead of walking per-row dicts.
+    """
+
+    def __init__(self) -> None:
+        self._columns: dict[str, list[Any]] = {}
+        self._arrays: dict[str, npt.NDArray[Any]] = {}
+        self._rows = 0
+
+    def append(self, metadata: dict[str, Any]) -> None:
+        for key in metadata.keys() - self._columns.keys():
+            self._columns[key] = [None] * self._rows
+        for key, column in self._columns.items():
+            column.append(metadata.get(key))
+        self._rows += 1
+        self._arrays.clear()
+
+    def mask(self, metadata_filter: dict[str, Any]) -> npt.NDArray[np.bool_]:
+        """Boolean mask of rows whose metadata matches every filter value."""
+        mask = np.ones(self._rows, dtype=bool)
+        for key, value in metadata_filter.items():
+            if key not in self._columns:
+                return np.zeros(self._rows, dtype=bool)
+            array = self._arrays.get(key)
+            if array is None:
+                array = np.empty(self._rows, dtype=object)
+                array[:] = self._columns[key]
+                self._arrays[key] = array
+            mask &= array == value
+        return mask
+
+
+class IVFIndex:
+    """Inverted-file index over unit vectors, trained with spherical k-means.
+
+    Args:
+        vectors: Vectors to index.
+        rows: Row numbers of ``vectors`` in the collection.
+        nlist: Number of clusters.
+        seed: Random seed for training.
+    """
+
+    def __init__(
+        self,
+        vectors: FloatArray,
+        rows: npt.NDArray[np.intp],
+        nlist: int,
+        seed: int = 0,
+    ) -> None:
+        rng = np.random.default_rng(seed)
+        nlist = max(1, min(nlist, len(rows)))
+        sample_size = min(len(rows), nlist * IVF_TRAINING_POINTS_PER_LIST)
+        sample = vectors[rng.choice(len(rows), size=sample_size, replace=False)]
+
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)]
+        for _ in range(IVF_KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = sample[assignment == cluster]
+                if len(members):
+                    centroids[cluster] = members.mean(axis=0)
+            centroids = _normalize(centroids)
+
+        self.centroids = centroids.astype(np.float32)
+        assignment = np.concatenate(
+            [
+                np.argmax(vectors[start : start + 8192] @ self.centroids.T, axis=1)
+                for start in range(0, len(rows), 8192)
+            ]
+        )
+        order = np.argsort(assignment, kind="stable")
+        bounds = np.searchsorted(assignment[order], np.arange(nlist + 1))
+        self.lists = [rows[order[bounds[i] : bounds[i + 1]]] for i in range(nlist)]
+        self.indexed_rows = int(rows.max()) + 1 if len(rows) else 0
+        self.size = len(rows)
+
+    def candidates(self, query: FloatArray, nprobe: int) -> npt.NDArray[np.intp]:
+        probes = _top_k(self.centroids @ query, nprobe)
+        return np.concatenate([self.lists[p] for p in probes])
+
+
+class VectorCollection:
+    """A single on-disk collection; see the module docstring for the layout.
+
+    Args:
+        path: Collection directory.
+        index_threshold: Live vector count from which an IVF index is used.
+    """
+
+    def __init__(self, path: Path, index_threshold: int) -> None:
+        self.path = path
+        self.index_threshold = index_threshold
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._release_state()
+
+    def _release_state(self) -> None:
+        self._dim: int | None = None
+        self._vectors: np.memmap[Any, np.dtype[np.float32]] | None = None
+        self._ids: list[str] = []
+        # Byte offset of each row's log entry; contents are read from the log
+        # on demand instead of being held in memory.
+        self._offsets: list[int] = []
+        self._metadata = MetadataColumns()
+        self._row_of: dict[str, int] = {}
+        self._alive: npt.NDArray[np.bool_] = np.zeros(0, dtype=bool)
+        self._index: IVFIndex | None = None
+        self.metadata: dict[str, Any] = {}
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.path / VECTORS_FILE
+
+    @property
+    def _log_path(self) -> Path:
+        return self.path / LOG_FILE
+
+    def _write_meta(self) -> None:
+        (self.path / META_FILE).write_text(
+            json.dumps({"dim": self._dim, "metadata": self.metadata})
+        )
+
+    def create(self, metadata: dict[str, Any] | None = None) -> None:
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._release_state()
+            self.metadata = dict(metadata or {})
+            self._write_meta()
+            self._loaded = True
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._release_state()
+        self._recover_compaction()
+        meta = json.loads((self.path / META_FILE).read_text())
+        self._dim = meta.get("dim")
+        self.metadata = meta.get("metadata", {})
+
+        alive: list[bool] = []
+        if self._log_path.exists():
+            intact = self._replay_log(alive)
+            if intact < self._log_path.stat().st_size:
+                # Cut off a torn final write; otherwise the next append would
+                # be glued onto it and lost on the following load.
+                with self._log_path.open("r+b") as f:
+                    f.truncate(intact)
+        self._alive = np.array(alive, dtype=bool)
+
+        # Vectors are written before their log entry, so a crash can leave
+        # unlogged trailing rows; drop them so row numbers stay aligned.
+        if self._dim and self._vectors_path.exists():
+            expected = len(self._ids) * self._dim * 4
+            if self._vectors_path.stat().st_size > expected:
+                with self._vectors_path.open("r+b") as f:
+                    f.truncate(expected)
+        self._loaded = True
+
+    def _replay_log(self, alive: list[bool]) -> int:
+        """Apply the log to the in-memory state.
+
+        Returns:
+            Length in bytes of the intact part of the log.
+        """
+        offset = 0
+        with self._log_path.open("rb") as log:
+            for line in log:
+                if not line.endswith(b"\n"):
+                    break  # every entry is written with its newline
+                if line.strip():
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn write; everything before it is intact
+                    if entry["op"] == "upsert":
+                        self._append_row(entry, offset, alive)
+                    elif entry["op"] == "delete":
+                        row = self._row_of.pop(entry["id"], None)
+                        if row is not None:
+                            alive[row] = False
+                offset += len(line)
+        return offset
+
+    def _append_row(
+        self, entry: dict[str, Any], offset: int, alive: list[bool]
+    ) -> None:
+        previous = self._row_of.get(entry["id"])
+        if previous is not None:
+            alive[previous] = False
+        self._row_of[entry["id"]] = len(self._ids)
+        self._ids.append(entry["id"])
+        self._offsets.append(offset)
+        self._metadata.append(entry.get("metadata") or {})
+        alive.append(True)
+
+    def _matrix(self) -> FloatArray:
+        if not self._ids or not self._dim:
+            return np.zeros((0, self._dim or 0), dtype=np.float32)
+        if self._vectors is None or len(self._vectors) != len(self._ids):
+            self._vectors = np.memmap(
+                self._vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(len(self._ids), self._dim),
+            )
+        return self._vectors
+
+    def release(self) -> None:
+        """Drop in-memory state; the next access reloads it from disk."""
+        with self._lock:
+            self._loaded = False
+            self._release_state()
+
+    def count(self) -> int:
+        with self._lock:
+            self._load()
+            return int(self._alive.sum())
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        contents: Sequence[str],
+        metadatas: Sequence[dict[str, Any]],
+        embeddings: FloatArray,
+    ) -> None:
+        """Append records, tombstoning earlier rows with the same ids."""
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32))
+        if vectors.ndim != 2 or len(vectors) != len(ids):
+            raise ValueError("Expected one embedding per document")
+        with self._lock:
+            self._load()
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+                self._write_meta()
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension mismatch: collection has {self._dim}, "
+                    f"got {vectors.shape[1]}"
+                )
+
+            with self._vectors_path.open("ab") as f:
+                f.write(vectors.tobytes())
+            entries = [
+                {"op": "upsert", "id": doc_id, "content": content, "metadata": metadata}
+                for doc_id, content, metadata in zip(
+                    ids, contents, metadatas, strict=True
+                )
+            ]
+            lines = [(json.dumps(entry) + "\n").encode() for entry in entries]
+            with self._log_path.open("ab") as log:
+                offset = log.tell()
+                log.writelines(lines)
+
+            alive = self._alive.tolist()
+            for entry, line in zip(entries, lines, strict=True):
+                self._append_row(entry, offset, alive)
+                offset += len(line)
+            self._alive = np.array(alive, dtype=bool)
+
+            tombstones = len(self._ids) - int(self._alive.sum())
+            if tombstones >= COMPACTION_MIN_TOMBSTONES and tombstones > (
+                COMPACTION_TOMBSTONE_RATIO * (len(self._ids) - tombstones)
+            ):
+                self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the collection files without tombstoned rows.
+
+        The rewritten files are committed by renaming the new log into place,
+        so a crash at any point leaves either the old or the new collection.
+        """
+        with self._lock:
+            self._load()
+            rows = np.flatnonzero(self._alive)
+            if len(rows) == len(self._ids):
+                return
+            vectors_tmp = self.path / (VECTORS_FILE + COMPACTING_SUFFIX)
+            log_tmp = self.path / (LOG_FILE + COMPACTING_SUFFIX)
+
+            matrix = self._matrix()
+            with vectors_tmp.open("wb") as f:
+                for start in range(0, len(rows), COMPACTION_CHUNK_ROWS):
+                    chunk = rows[start : start + COMPACTION_CHUNK_ROWS]
+                    f.write(np.asarray(matrix[chunk]).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            with self._log_path.open("rb") as log, log_tmp.open("wb") as f:
+                for row in rows:
+                    log.seek(self._offsets[row])
+                    f.write(log.readline())
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._vectors = None
+            os.replace(log_tmp, self.path / COMPACTED_LOG_FILE)
+            self.release()
+            self._load()
+
+    def _recover_compaction(self) -> None:
+        """Finish a committed compaction or discard an uncommitted one."""
+        vectors_tmp = self.path / (VECTORS_FILE + COMPACTING_SUFFIX)
+        committed = self.path / COMPACTED_LOG_FILE
+        if committed.exists():
+            if vectors_tmp.exists():
+                os.replace(vectors_tmp, self._vectors_path)
+            os.replace(committed, self._log_path)
+        else:
+            vectors_tmp.unlink(missing_ok=True)
+            (self.path / (LOG_FILE + COMPACTING_SUFFIX)).unlink(missing_ok=True)
+
+    def _live_index(self) -> IVFIndex | None:
+        live = int(self._alive.sum())
+        if live < self.index_threshold:
+            self._index = None
+            return None
+        index = self._index
+        tail = len(self._ids) - index.indexed_rows if index else 0
+        if index is None or tail > index.size * INDEX_REBUILD_RATIO:
+            rows = np.flatnonzero(self._alive)
+            index = IVFIndex(
+                np.asarray(self._matrix()[rows]), rows, int(np.sqrt(live))
+            )
+            self._index = index
+        return index
+
+    def query(
+        self,
+        query_embeddings: FloatArray,
+        limit: int,
+        metadata_filter: dict[str, Any] | None = None,
+        nprobe: int | None = None,
+    ) -> list[list[tuple[int, float]]]:
+        """Return ``(row, cosine similarity)`` pairs per query, best first.
+
+        Row numbers are only valid until the next compaction; use ``search``
+        to resolve them to records atomically.
+        """
+        queries = _normalize(np.atleast_2d(np.asarray(query_embeddings, np.float32)))
+        with self._lock:
+            self._load()
+            matrix = self._matrix()
+            if not len(matrix) or limit <= 0:
+                return [[] for _ in queries]
+            if queries.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension mismatch: collection has {self._dim}, "
+                    f"got {queries.shape[1]}"
+                )
+
+            valid = self._alive.copy()
+            if metadata_filter:
+                valid &= self._metadata.mask(metadata_filter)
+
+            index = self._live_index()
+            if index is None:
+                similarities = matrix @ queries.T
+                similarities[~valid] = -np.inf
+                results = []
+                for column in similarities.T:
+                    top = _top_k(column, limit)
+                    results.append(
+                        [(int(row), float(column[row])) for row in top if valid[row]]
+                    )
+                return results
+
+            probes = nprobe or max(1, int(np.sqrt(len(index.lists))))
+            tail = np.arange(index.indexed_rows, len(self._ids))
+            results = []
+            for query in queries:
+                rows = np.concatenate([index.candidates(query, probes), tail])
+                rows = rows[valid[rows]]
+                if not len(rows):
+                    results.append([])
+                    continue
+                scores = np.asarray(matrix[rows]) @ query
+                top = _top_k(scores, limit)
+                results.append([(int(rows[i]), float(scores[i])) for i in top])
+            return results
+
+    def search(
+        self,
+        query_embeddings: FloatArray,
+        limit: int,
+        metadata_filter: dict[str, Any] | None = None,
+        nprobe: int | None = None,
+    ) -> list[list[tuple[str, str, dict[str, Any], float]]]:
+        """Return ``(id, content, metadata, cosine similarity)`` per query."""
+        with self._lock:
+            matches = self.query(query_embeddings, limit, metadata_filter, nprobe)
+            records = iter(self.records([row for rows in matches for row, _ in rows]))
+        return [
+            [(*next(records), similarity) for _, similarity in query_matches]
+            for query_matches in matches
+        ]
+
+    def records(
+        self, rows: Sequence[int]
+    ) -> list[tuple[str, str, dict[str, Any]]]:
+        """Return ``(id, content, metadata)`` for each row, read from the log."""
+        with self._lock:
+            self._load()
+            if not rows:
+                return []
+            records = []
+            with self._log_path.open("rb") as log:
+                for row in rows:
+                    log.seek(self._offsets[row])
+                    entry = json.loads(log.readline())
+                    metadata = entry.get("metadata") or {}
+                    records.append((self._ids[row], entry["content"], metadata))
+            return records
+
+
+class EmbeddedVectorStore:
+    """Directory of collections backed by memory-mapped vector files.
+
+    Args:
+        path: Root directory; each collection is a subdirectory.
+        index_threshold: Default live vector count from which collections
+            search through an IVF index instead of a brute-force scan.
+    """
+
+    def __init__(self, path: str, index_threshold: int) -> None:
+        self.path = Path(path)
+        self.index_threshold = index_threshold
+        self._collections: dict[str, VectorCollection] = {}
+        self._lock = threading.Lock()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def exists(self, name: str) -> bool:
+        return (self.path / name / META_FILE).exists()
+
+    def get(self, name: str) -> VectorCollection:
+        with self._lock:
+            collection = self._collections.get(name)
+            if collection is None:
+                collection = VectorCollection(self.path / name, self.index_threshold)
+                self._collections[name] = collection
+            return collection
+
+    def create(
+        self,
+        name: str,
+        metadata: dict[str, Any] | None = None,
+        index_threshold: int | None = None,
+    ) -> VectorCollection:
+        collection = self.get(name)
+        if index_threshold is not None:
+            collection.index_threshold = index_threshold
+        collection.create(metadata)
+        return collection
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            collection = self._collections.pop(name, None)
+        if collection is not None:
+            collection.release()
+        shutil.rmtree(self.path / name, ignore_errors=True)
+
+    def names(self) -> list[str]:
+        return sorted(
+            child.name
+            for child in self.path.iterdir()
+            if (child / META_FILE).exists()
+        )
+
+    def release(self) -> None:
+        """Release the in-memory state of every loaded collection."""
+        with self._lock:
+            collections = list(self._collections.values())
+        for collection in collections:
+            collection.release()
@@ -0,0 +1,52 @@
+"""Type definitions specific to the embedded vector store."""
+
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+from itak.rag.core.base_client import BaseCollectionParams
+
+
+class EmbeddingFunction(Protocol):
+    """Protocol for batch embedding functions, as used by ChromaDB."""
+
+    def __call__(self, input: list[str]) -> Sequence[Sequence[float]]:
+        """Convert texts to embedding vectors.
+
+        Args:
+            input: Texts to embed.
+
+        Returns:
+            One embedding vector per text.
+        """
+        ...
+
+
+class EmbeddedEmbeddingFunctionWrapper(EmbeddingFunction):
+    """Base class for embedded store EmbeddingFunction for Pydantic validation."""
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, _source_type: Any, _handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        """Generate Pydantic core schema for the embedding function.
+
+        This allows Pydantic to handle the EmbeddingFunction type
+        without requiring arbitrary_types_allowed=True.
+        """
+        return core_schema.any_schema()
+
+
+class EmbeddedCollectionCreateParams(BaseCollectionParams, total=False):
+    """Parameters for creating an embedded store collection.
+
+    Attributes:
+        metadata: Optional metadata stored with the collection.
+        index_threshold: Live vector count above which an IVF index is used;
+            overrides the client default for this collection.
+    """
+
+    metadata: dict[str, Any]
+    index_threshold: int
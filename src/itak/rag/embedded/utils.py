@@ -0,0 +1,80 @@
+"""Utility functions for the embedded vector store client."""
+
+import hashlib
+import json
+import re
+from typing import Any
+
+from itak.rag.types import BaseRecord
+
+
+_INVALID_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
+
+
+def _sanitize_collection_name(name: str) -> str:
+    """Turn a collection name into a safe directory name.
+
+    Names that had to be changed get a short hash suffix so distinct names
+    never map to the same directory.
+
+    Args:
+        name: Collection name as given by the caller.
+
+    Returns:
+        Directory name for the collection.
+    """
+    sanitized = _INVALID_CHARS_PATTERN.sub("_", name) or "default_collection"
+    if sanitized != name:
+        digest = hashlib.md5(name.encode(), usedforsecurity=False).hexdigest()[:8]
+        sanitized = f"{sanitized}_{digest}"
+    return sanitized
+
+
+def _prepare_documents(
+    documents: list[BaseRecord],
+) -> tuple[list[str], list[str], list[dict[str, Any]]]:
+    """Extract ids, texts and metadata from documents, deduplicating by id.
+
+    Ids default to a content hash, matching the ChromaDB client, so switching
+    backends keeps document ids stable.
+
+    Args:
+        documents: Documents to prepare.
+
+    Returns:
+        Parallel lists of ids, texts and metadata dicts.
+    """
+    prepared: dict[str, tuple[str, dict[str, Any]]] = {}
+    for doc in documents:
+        metadata = doc.get("metadata") or {}
+        if isinstance(metadata, list):
+            metadata = metadata[0] if metadata else {}
+        metadata = dict(metadata)
+
+        if "doc_id" in doc:
+            doc_id = str(doc["doc_id"])
+        elif "doc_id" in metadata:
+            doc_id = str(metadata["doc_id"])
+        else:
+            content_for_hash = doc["content"]
+            if metadata:
+                content_for_hash = (
+                    f"{content_for_hash}|{json.dumps(metadata, sort_keys=True)}"
+                )
+            doc_id = hashlib.sha256(content_for_hash.encode()).hexdigest()
+        prepared[doc_id] = (doc["content"], metadata)
+
+    ids = list(prepared)
+    return (
+        ids,
+        [prepared[doc_id][0] for doc_id in ids],
+        [prepared[doc_id][1] for doc_id in ids],
+    )
+
+
+def _similarity_to_score(similarity: float) -> float:
+    """Map cosine similarity in [-1, 1] to a score in [0, 1].
+
+    Matches the scores of the ChromaDB (cosine space) and Qdrant clients.
+    """
+    return max(0.0, min(1.0, (similarity + 1.0) / 2.0))
@@ -86,25 +86,25 @@ T = TypeVar("T", bound=EmbeddingFunction[Any])
 
 
 PROVIDER_PATHS = {
-    "azure": "iTaK.rag.embeddings.providers.microsoft.azure.AzureProvider",
-    "amazon-bedrock": "iTaK.rag.embeddings.providers.aws.bedrock.BedrockProvider",
-    "cohere": "iTaK.rag.embeddings.providers.cohere.cohere_provider.CohereProvider",
-    "custom": "iTaK.rag.embeddings.providers.custom.custom_provider.CustomProvider",
-    "google-generativeai": "iTaK.rag.embeddings.providers.google.generative_ai.GenerativeAiProvider",
-    "google": "iTaK.rag.embeddings.providers.google.generative_ai.GenerativeAiProvider",
-    "google-vertex": "iTaK.rag.embeddings.providers.google.vertex.VertexAIProvider",
-    "huggingface": "iTaK.rag.embeddings.providers.huggingface.huggingface_provider.HuggingFaceProvider",
-    "instructor": "iTaK.rag.embeddings.providers.instructor.instructor_provider.InstructorProvider",
-    "jina": "iTaK.rag.embeddings.providers.jina.jina_provider.JinaProvider",
-    "ollama": "iTaK.rag.embeddings.providers.ollama.ollama_provider.OllamaProvider",
-    "onnx": "iTaK.rag.embeddings.providers.onnx.onnx_provider.ONNXProvider",
-    "openai": "iTaK.rag.embeddings.providers.openai.openai_provider.OpenAIProvider",
-    "openclip": "iTaK.rag.embeddings.providers.openclip.openclip_provider.OpenCLIPProvider",
-    "roboflow": "iTaK.rag.embeddings.providers.roboflow.roboflow_provider.RoboflowProvider",
-    "sentence-transformer": "iTaK.rag.embeddings.providers.sentence_transformer.sentence_transformer_provider.SentenceTransformerProvider",
-    "text2vec": "iTaK.rag.embeddings.providers.text2vec.text2vec_provider.Text2VecProvider",
-    "voyageai": "iTaK.rag.embeddings.providers.voyageai.voyageai_provider.VoyageAIProvider",
-    "watsonx": "iTaK.rag.embeddings.providers.ibm.watsonx.WatsonXProvider",
+    "azure": "itak.rag.embeddings.providers.microsoft.azure.AzureProvider",
+    "amazon-bedrock": "itak.rag.embeddings.providers.aws.bedrock.BedrockProvider",
+    "cohere": "itak.rag.embeddings.providers.cohere.cohere_provider.CohereProvider",
+    "custom": "itak.rag.embeddings.providers.custom.custom_provider.CustomProvider",
+    "google-generativeai": "itak.rag.embeddings.providers.google.generative_ai.GenerativeAiProvider",
+    "google": "itak.rag.embeddings.providers.google.generative_ai.GenerativeAiProvider",
+    "google-vertex": "itak.rag.embeddings.providers.google.vertex.VertexAIProvider",
+    "huggingface": "itak.rag.embeddings.providers.huggingface.huggingface_provider.HuggingFaceProvider",
+    "instructor": "itak.rag.embeddings.providers.instructor.instructor_provider.InstructorProvider",
+    "jina": "itak.rag.embeddings.providers.jina.jina_provider.JinaProvider",
+    "ollama": "itak.rag.embeddings.providers.ollama.ollama_provider.OllamaProvider",
+    "onnx": "itak.rag.embeddings.providers.onnx.onnx_provider.ONNXProvider",
+    "openai": "itak.rag.embeddings.providers.openai.openai_provider.OpenAIProvider",
+    "openclip": "itak.rag.embeddings.providers.openclip.openclip_provider.OpenCLIPProvider",
+    "roboflow": "itak.rag.embeddings.providers.roboflow.roboflow_provider.RoboflowProvider",
+    "sentence-transformer": "itak.rag.embeddings.providers.sentence_transformer.sentence_transformer_provider.SentenceTransformerProvider",
+    "text2vec": "itak.rag.embeddings.providers.text2vec.text2vec_provider.Text2VecProvider",
+    "voyageai": "itak.rag.embeddings.providers.voyageai.voyageai_provider.VoyageAIProvider",
+    "watsonx": "itak.rag.embeddings.providers.ibm.watsonx.WatsonXProvider",
 }
 
 
@@ -0,0 +1,310 @@
+"""Process-wide registry of shared, micro-batched embedding functions.
+
+``build_embedder`` creates a fresh embedding function on every call, which
+for local providers means loading model weights again for every storage.
+The registry builds one embedding function per provider spec per process,
+warms it up once, and (for local models by default) puts a micro-batching
+queue in front of it so concurrent single-text embeds from many agents are
+coalesced into one forward pass.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Final
+
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+from itak.rag.core.base_embeddings_provider import BaseEmbeddingsProvider
+from itak.rag.embeddings.factory import PROVIDER_PATHS, build_embedder
+
+
+LOCAL_PROVIDERS: Final[frozenset[str]] = frozenset(
+    {"sentence-transformer", "onnx", "instructor", "text2vec", "openclip"}
+)
+"""Providers that run a model in-process and benefit from micro-batching."""
+
+DEFAULT_MAX_BATCH_SIZE: Final[int] = 64
+WARM_UP_INPUT: Final[list[str]] = ["test"]
+
+_STOP: Final = object()
+
+_PROVIDER_NAMES: Final[dict[str, str]] = {
+    path: name for name, path in reversed(PROVIDER_PATHS.items())
+}
+"""Provider class path to provider name; the first listed name wins."""
+
+
+class MicroBatchingEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Coalesce concurrent embed calls into batched calls to one function.
+
+    A single worker thread drains the request queue: every call that
+    arrives while a batch is being embedded is folded into the next batch,
+    up to ``max_batch_size`` texts. With ``max_wait_ms`` above zero the
+    worker also waits that long for more requests before embedding a
+    partial batch.
+
+    The wrapper reports the wrapped function's ``name`` and config, so
+    vector stores treat it as the underlying embedding function.
+
+    Args:
+        embedding_function: Function to wrap.
+        max_batch_size: Maximum texts per batched call.
+        max_wait_ms: Extra time to wait for a batch to fill.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction[Documents],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = 0.0,
+    ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        self.embedding_function = embedding_function
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
+        self._pid = os.getpid()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        texts = list(input)
+        if (
+            not texts
+            or len(texts) >= self.max_batch_size
+            or threading.current_thread() is self._worker
+        ):
+            self.batches += 1
+            return self.embedding_function(texts)
+        return self.submit(texts).result()
+
+    def embed_query(self, input: Documents) -> Embeddings:
+        return self.__call__(input)
+
+    async def aembed(self, texts: list[str]) -> Embeddings:
+        """Embed texts without blocking the event loop."""
+        if not texts:
+            return []
+        return await asyncio.wrap_future(self.submit(texts))
+
+    def submit(self, texts: list[str]) -> Future[Embeddings]:
+        """Queue texts for the next batch and return a future for their vectors."""
+        future: Future[Embeddings] = Future()
+        self._ensure_worker()
+        self._queue.put((texts, future))
+        return future
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked child: the parent's worker thread does not exist here.
+                self._pid = os.getpid()
+                self._queue = queue.SimpleQueue()
+                self._worker = None
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="itak-embed-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _collect(self, first: tuple[list[str], Future[Embeddings]]) -> list[Any]:
+        batch = [first]
+        size = len(first[0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = self._collect(first)
+            texts = [text for item_texts, _ in batch for text in item_texts]
+            try:
+                vectors = self.embedding_function(texts)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            offset = 0
+            for item_texts, future in batch:
+                future.set_result(list(vectors[offset : offset + len(item_texts)]))
+                offset += len(item_texts)
+
+    def close(self) -> None:
+        """Stop the worker thread after it drains queued requests."""
+        with self._lock:
+            if self._worker is not None:
+                self._queue.put(_STOP)
+                self._worker = None
+
+    def name(self) -> str:  # type: ignore[override]
+        return self.embedding_function.name()
+
+    def get_config(self) -> dict[str, Any]:
+        return self.embedding_function.get_config()
+
+    def default_space(self) -> Any:
+        return self.embedding_function.default_space()
+
+    def supported_spaces(self) -> Any:
+        return self.embedding_function.supported_spaces()
+
+    def is_legacy(self) -> bool:
+        return self.embedding_function.is_legacy()
+
+    def validate_config_update(
+        self, old_config: dict[str, Any], new_config: dict[str, Any]
+    ) -> None:
+        self.embedding_function.validate_config_update(old_config, new_config)
+
+    def __getattr__(self, name: str) -> Any:
+        inner = self.__dict__.get("embedding_function")
+        if inner is None:
+            raise AttributeError(name)
+        return getattr(inner, name)
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    return f"{type(value).__qualname__}@{id(value):x}"
+
+
+def _spec_key(spec: Any) -> str:
+    """Build a stable key identifying an embedder spec within this process."""
+    if isinstance(spec, BaseEmbeddingsProvider):
+        data = {
+            "provider": _json_default(type(spec)),
+            "config": spec.model_dump(exclude={"embedding_callable"}),
+            "callable": _json_default(spec.embedding_callable),
+        }
+    elif isinstance(spec, dict):
+        data = spec
+    else:
+        return _json_default(spec)
+    return json.dumps(data, sort_keys=True, default=_json_default)
+
+
+def _provider_name(spec: Any) -> str:
+    """Return the factory name of a provider dict, instance or class spec."""
+    if isinstance(spec, dict):
+        return str(spec.get("provider", ""))
+    cls = spec if isinstance(spec, type) else type(spec)
+    for base in cls.__mro__:
+        name = _PROVIDER_NAMES.get(f"{base.__module__}.{base.__qualname__}")
+        if name is not None:
+            return name
+    return ""
+
+
+class EmbedderRegistry:
+    """Shares one embedding function per provider spec per process.
+
+    Specs are keyed by their content, so two storages configured with equal
+    dicts (or equal provider instances) get the same embedding function and
+    the model is loaded once.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._build_locks: dict[str, threading.Lock] = {}
+        self._embedders: dict[str, EmbeddingFunction[Any]] = {}
+
+    def get(
+        self,
+        spec: Any,
+        warm_up: bool = False,
+        micro_batching: bool | None = None,
+    ) -> EmbeddingFunction[Any]:
+        """Return the shared embedding function for ``spec``.
+
+        Args:
+            spec: Provider spec dict or provider instance, as accepted by
+                ``build_embedder``.
+            warm_up: Run one probe embedding the first time the function is
+                built, surfacing configuration errors early. Failed builds are
+                not cached.
+            micro_batching: Wrap the function in a
+                ``MicroBatchingEmbeddingFunction``. ``None`` enables it for
+                in-process model providers (see ``LOCAL_PROVIDERS``).
+
+        Returns:
+            The shared embedding function.
+        """
+        if micro_batching is None:
+            micro_batching = _provider_name(spec) in LOCAL_PROVIDERS
+        key = f"{micro_batching}:{_spec_key(spec)}"
+        embedder = self._embedders.get(key)
+        if embedder is not None:
+            return embedder
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            embedder = self._embedders.get(key)
+            if embedder is not None:
+                return embedder
+            embedder = build_embedder(spec)
+            if warm_up:
+                embedder(WARM_UP_INPUT)
+            if micro_batching:
+                embedder = MicroBatchingEmbeddingFunction(embedder)
+            self._embedders[key] = embedder
+            return embedder
+
+    def clear(self) -> None:
+        """Drop all shared embedding functions."""
+        with self._lock:
+            embedders = list(self._embedders.values())
+            self._embedders.clear()
+            self._build_locks.clear()
+        for embedder in embedders:
+            if isinstance(embedder, MicroBatchingEmbeddingFunction):
+                embedder.close()
+
+
+_registry = EmbedderRegistry()
+
+
+def get_embedder_registry() -> EmbedderRegistry:
+    """Return the process-wide embedder registry."""
+    return _registry
+
+
+def get_shared_embedder(
+    spec: Any, warm_up: bool = False, micro_batching: bool | None = None
+) -> EmbeddingFunction[Any]:
+    """Return the shared embedding function for ``spec``.
+
+    See ``EmbedderRegistry.get``.
+    """
+    return _registry.get(spec, warm_up=warm_up, micro_batching=micro_batching)
@@ -4,6 +4,7 @@ from typing import cast
 
 from itak.rag.config.optional_imports.protocols import (
     ChromaFactoryModule,
+    EmbeddedFactoryModule,
     QdrantFactoryModule,
 )
 from itak.rag.config.types import RagConfigType
@@ -28,7 +29,7 @@ def create_client(config: RagConfigType) -> BaseClient:
         chromadb_mod = cast(
             ChromaFactoryModule,
             require(
-                "iTaK.rag.chromadb.factory",
+                "itak.rag.chromadb.factory",
                 purpose="The 'chromadb' provider",
             ),
         )
@@ -38,10 +39,20 @@ def create_client(config: RagConfigType) -> BaseClient:
         qdrant_mod = cast(
             QdrantFactoryModule,
             require(
-                "iTaK.rag.qdrant.factory",
+                "itak.rag.qdrant.factory",
                 purpose="The 'qdrant' provider",
             ),
         )
         return qdrant_mod.create_client(config)
 
+    if config.provider == "embedded":
+        embedded_mod = cast(
+            EmbeddedFactoryModule,
+            require(
+                "itak.rag.embedded.factory",
+                purpose="The 'embedded' provider",
+            ),
+        )
+        return embedded_mod.create_client(config)
+
     raise ValueError(f"Unsupported provider: {config.provider}")
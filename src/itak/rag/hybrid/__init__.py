@@ -0,0 +1,17 @@
+"""Hybrid BM25 + vector retrieval with rank fusion and local reranking."""
+
+from itak.rag.hybrid.bm25_index import BM25Index
+from itak.rag.hybrid.fusion import maximal_marginal_relevance, reciprocal_rank_fusion
+from itak.rag.hybrid.rerankers import BaseReranker, CrossEncoderReranker
+from itak.rag.hybrid.retriever import HybridRetriever, HybridSearchConfig
+
+
+__all__ = [
+    "BM25Index",
+    "BaseReranker",
+    "CrossEncoderReranker",
+    "HybridRetriever",
+    "HybridSearchConfig",
+    "maximal_marginal_relevance",
+    "reciprocal_rank_fusion",
+]
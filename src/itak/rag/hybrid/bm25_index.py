@@ -0,0 +1,200 @@
+"""On-disk BM25 inverted index kept alongside vector store collections."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import json
+from pathlib import Path
+import re
+import sqlite3
+import threading
+from typing import Any
+
+from itak.rag.types import SearchResult
+from itak.utilities.paths import db_storage_path
+
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def _match_expression(query: str) -> str | None:
+    """Build an FTS5 MATCH expression that ORs every term of the query.
+
+    Each term is quoted, so identifiers such as ``get_user_id`` or ``E1234``
+    are matched as phrases instead of being parsed as FTS5 syntax.
+    """
+    terms = dict.fromkeys(_TOKEN_PATTERN.findall(query.lower()))
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+class BM25Index:
+    """Incrementally maintained BM25 index backed by SQLite FTS5.
+
+    Documents of every collection live in one database file. Upserts and
+    deletes are keyed by ``(collection, doc_id)``, so adding documents only
+    touches the affected rows, and queries are answered by FTS5's ``bm25``
+    ranking without loading the index into memory.
+
+    Args:
+        db_path: Optional path to the database file. Defaults to
+            ``bm25_index.db`` in the iTaK storage directory.
+    """
+
+    def __init__(self, db_path: str | None = None) -> None:
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "bm25_index.db")
+        self.db_path = db_path
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._initialize_db()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _initialize_db(self) -> None:
+        conn = self._connection()
+        with conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS bm25_documents (
+                    id INTEGER PRIMARY KEY,
+                    collection TEXT NOT NULL,
+                    doc_id TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    metadata TEXT NOT NULL DEFAULT '{}',
+                    UNIQUE (collection, doc_id)
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS bm25_terms USING fts5(
+                    content, content='bm25_documents', content_rowid='id'
+                );
+                CREATE TRIGGER IF NOT EXISTS bm25_documents_ai
+                AFTER INSERT ON bm25_documents BEGIN
+                    INSERT INTO bm25_terms(rowid, content)
+                    VALUES (new.id, new.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS bm25_documents_ad
+                AFTER DELETE ON bm25_documents BEGIN
+                    INSERT INTO bm25_terms(bm25_terms, rowid, content)
+                    VALUES ('delete', old.id, old.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS bm25_documents_au
+                AFTER UPDATE ON bm25_documents BEGIN
+                    INSERT INTO bm25_terms(bm25_terms, rowid, content)
+                    VALUES ('delete', old.id, old.content);
+                    INSERT INTO bm25_terms(rowid, content)
+                    VALUES (new.id, new.content);
+                END;
+                """
+            )
+
+    def upsert(
+        self,
+        collection_name: str,
+        documents: Iterable[tuple[str, str, dict[str, Any]]],
+    ) -> None:
+        """Add or replace documents in a collection.
+
+        Args:
+            collection_name: Collection the documents belong to.
+            documents: ``(doc_id, content, metadata)`` tuples.
+        """
+        rows = [
+            (collection_name, doc_id, content, json.dumps(metadata, default=str))
+            for doc_id, content, metadata in documents
+        ]
+        if not rows:
+            return
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO bm25_documents (collection, doc_id, content, metadata)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (collection, doc_id) DO UPDATE SET
+                    content = excluded.content,
+                    metadata = excluded.metadata
+                """,
+                rows,
+            )
+
+    def search(
+        self,
+        collection_name: str,
+        query: str,
+        limit: int,
+        metadata_filter: dict[str, Any] | None = None,
+    ) -> list[SearchResult]:
+        """Return the best BM25 matches for a query, best first.
+
+        Scores are BM25 scores squashed into ``[0, 1)``.
+
+        Args:
+            collection_name: Collection to search.
+            query: Free-text query.
+            limit: Maximum number of results.
+            metadata_filter: Optional equality filters on metadata fields.
+
+        Returns:
+            List of SearchResult dicts.
+        """
+        expression = _match_expression(query)
+        if expression is None or limit <= 0:
+            return []
+
+        sql = """
+            SELECT d.doc_id, d.content, d.metadata, bm25(bm25_terms) AS rank
+            FROM bm25_terms
+            JOIN bm25_documents AS d ON d.id = bm25_terms.rowid
+            WHERE bm25_terms MATCH ? AND d.collection = ?
+        """
+        params: list[Any] = [expression, collection_name]
+        for key, value in (metadata_filter or {}).items():
+            sql += " AND json_extract(d.metadata, ?) = ?"
+            params.extend([f'$."{key}"', value])
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        try:
+            rows = self._connection().execute(sql, params).fetchall()
+        except sqlite3.OperationalError:
+            return []
+
+        results: list[SearchResult] = []
+        for doc_id, content, metadata, rank in rows:
+            relevance = max(0.0, -rank)
+            results.append(
+                {
+                    "id": doc_id,
+                    "content": content,
+                    "metadata": json.loads(metadata),
+                    "score": relevance / (1.0 + relevance),
+                }
+            )
+        return results
+
+    def delete_collection(self, collection_name: str) -> None:
+        """Remove every document of a collection from the index."""
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "DELETE FROM bm25_documents WHERE collection = ?", (collection_name,)
+            )
+
+    def count(self, collection_name: str) -> int:
+        """Return the number of indexed documents in a collection."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*) FROM bm25_documents WHERE collection = ?",
+                (collection_name,),
+            )
+            .fetchone()
+        )
+        return int(row[0]) if row else 0
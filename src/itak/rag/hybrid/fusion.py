@@ -0,0 +1,101 @@
+"""Rank fusion and diversification of search results."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import re
+
+from itak.rag.types import SearchResult
+
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Sequence[Sequence[SearchResult]],
+    k: int = 60,
+    weights: Sequence[float] | None = None,
+) -> list[SearchResult]:
+    """Merge ranked result lists with weighted reciprocal-rank fusion.
+
+    A document scores ``sum(weight / (k + rank))`` over the lists it appears
+    in, so agreement between retrievers matters more than raw scores, which
+    are not comparable between BM25 and vector similarity.
+
+    Args:
+        ranked_lists: Result lists, each ordered best first.
+        k: Rank damping constant; larger values flatten the rank curve.
+        weights: Optional weight per list. Defaults to 1.0 for every list.
+
+    Returns:
+        The union of all results, best first, with ``score`` replaced by the
+        fused score normalized to ``[0, 1]``.
+    """
+    if weights is None:
+        weights = [1.0] * len(ranked_lists)
+    if len(weights) != len(ranked_lists):
+        raise ValueError("weights must have one entry per ranked list")
+
+    best_possible = sum(weight / (k + 1) for weight in weights) or 1.0
+    fused: dict[str, float] = {}
+    documents: dict[str, SearchResult] = {}
+    for results, weight in zip(ranked_lists, weights, strict=True):
+        for rank, result in enumerate(results, 1):
+            doc_id = result["id"]
+            fused[doc_id] = fused.get(doc_id, 0.0) + weight / (k + rank)
+            documents.setdefault(doc_id, result)
+
+    ordered = sorted(fused, key=fused.__getitem__, reverse=True)
+    return [
+        {**documents[doc_id], "score": fused[doc_id] / best_possible}
+        for doc_id in ordered
+    ]
+
+
+def _terms(text: str) -> frozenset[str]:
+    return frozenset(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def maximal_marginal_relevance(
+    results: Sequence[SearchResult],
+    limit: int,
+    lambda_mult: float = 0.5,
+) -> list[SearchResult]:
+    """Pick results that are relevant but not redundant with each other.
+
+    Redundancy is measured as the Jaccard overlap of the results' terms, which
+    needs no stored vectors and works for sparse and dense hits alike.
+
+    Args:
+        results: Candidates ordered best first, with comparable scores.
+        limit: Number of results to select.
+        lambda_mult: Trade-off between relevance (1.0) and diversity (0.0).
+
+    Returns:
+        Up to ``limit`` results in selection order.
+    """
+    candidates = list(results)
+    terms = [_terms(result["content"]) for result in candidates]
+    selected: list[int] = []
+    remaining = list(range(len(candidates)))
+
+    while remaining and len(selected) < limit:
+        best_index = remaining[0]
+        best_value = float("-inf")
+        for index in remaining:
+            redundancy = 0.0
+            for chosen in selected:
+                union = terms[index] | terms[chosen]
+                if union:
+                    overlap = len(terms[index] & terms[chosen]) / len(union)
+                    redundancy = max(redundancy, overlap)
+            value = (
+                lambda_mult * candidates[index]["score"]
+                - (1.0 - lambda_mult) * redundancy
+            )
+            if value > best_value:
+                best_index, best_value = index, value
+        selected.append(best_index)
+        remaining.remove(best_index)
+
+    return [candidates[index] for index in selected]
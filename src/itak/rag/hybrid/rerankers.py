@@ -0,0 +1,82 @@
+"""Local rerankers applied to fused retrieval candidates."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+
+from itak.rag.types import SearchResult
+
+
+class BaseReranker(ABC):
+    """Scores candidate documents against a query, in batches.
+
+    Args:
+        batch_size: Number of ``(query, document)`` pairs scored per call.
+    """
+
+    def __init__(self, batch_size: int = 32) -> None:
+        self.batch_size = batch_size
+
+    @abstractmethod
+    def score(self, query: str, documents: Sequence[str]) -> list[float]:
+        """Return one relevance score per document, higher is better."""
+
+    def rerank(
+        self, query: str, results: Sequence[SearchResult]
+    ) -> list[SearchResult]:
+        """Reorder results by reranker score, best first.
+
+        The original retrieval ``score`` is kept on each result; only the
+        order changes.
+        """
+        scores: list[float] = []
+        for start in range(0, len(results), self.batch_size):
+            batch = results[start : start + self.batch_size]
+            scores.extend(self.score(query, [result["content"] for result in batch]))
+        order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+        return [results[index] for index in order]
+
+
+class CrossEncoderReranker(BaseReranker):
+    """Reranker backed by a local sentence-transformers cross-encoder.
+
+    Runs fully offline once the model is in the local Hugging Face cache.
+
+    Args:
+        model_name: Cross-encoder model name or local path.
+        batch_size: Number of pairs scored per forward pass.
+        device: Optional torch device, e.g. ``"cpu"`` or ``"cuda"``.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        batch_size: int = 32,
+        device: str | None = None,
+    ) -> None:
+        super().__init__(batch_size=batch_size)
+        self.model_name = model_name
+        self.device = device
+        self._model: Any = None
+
+    def _load(self) -> Any:
+        if self._model is None:
+            try:
+                from sentence_transformers import CrossEncoder
+            except ImportError as e:
+                raise ImportError(
+                    "sentence-transformers is required for CrossEncoderReranker, "
+                    "to install: uv add sentence-transformers"
+                ) from e
+            self._model = CrossEncoder(self.model_name, device=self.device)
+        return self._model
+
+    def score(self, query: str, documents: Sequence[str]) -> list[float]:
+        model = self._load()
+        scores = model.predict(
+            [(query, document) for document in documents],
+            batch_size=self.batch_size,
+        )
+        return [float(score) for score in scores]
@@ -0,0 +1,211 @@
+"""Hybrid sparse + dense retrieval over a vector store client."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from typing import Any
+import uuid
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from itak.rag.core.base_client import BaseClient
+from itak.rag.hybrid.bm25_index import BM25Index
+from itak.rag.hybrid.fusion import maximal_marginal_relevance, reciprocal_rank_fusion
+from itak.rag.hybrid.rerankers import BaseReranker
+from itak.rag.types import BaseRecord, SearchResult
+
+
+class HybridSearchConfig(BaseModel):
+    """Configuration for hybrid retrieval.
+
+    Args:
+        candidates_per_retriever (int): Candidates fetched from each retriever
+            per requested result before fusion.
+        rrf_k (int): Reciprocal-rank fusion damping constant.
+        dense_weight (float): Fusion weight of vector search results.
+        sparse_weight (float): Fusion weight of BM25 results.
+        mmr_lambda (float | None): Enables MMR diversification when set; 1.0
+            is pure relevance, 0.0 pure diversity.
+        reranker (BaseReranker | None): Optional local reranker for the fused
+            candidates.
+        index_path (str | None): BM25 database file; defaults to the iTaK
+            storage directory.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    candidates_per_retriever: int = Field(default=4, ge=1)
+    rrf_k: int = Field(default=60, ge=1)
+    dense_weight: float = Field(default=1.0, ge=0.0)
+    sparse_weight: float = Field(default=1.0, ge=0.0)
+    mmr_lambda: float | None = Field(default=None, ge=0.0, le=1.0)
+    reranker: BaseReranker | None = Field(default=None)
+    index_path: str | None = Field(default=None)
+
+
+def _record_id(record: BaseRecord) -> str:
+    """Return the record's id, deriving a content hash when it has none.
+
+    Ids are assigned before documents reach the vector store so both indexes
+    agree on them regardless of the backend's own id generation. Derived ids
+    are UUIDs, which every backend accepts (Qdrant only takes UUIDs or
+    unsigned integers as point ids).
+    """
+    if "doc_id" in record:
+        return str(record["doc_id"])
+    metadata = record.get("metadata")
+    if metadata and isinstance(metadata, dict) and "doc_id" in metadata:
+        return str(metadata["doc_id"])
+    content = record["content"]
+    if metadata:
+        content = f"{content}|{json.dumps(metadata, sort_keys=True)}"
+    digest = hashlib.sha256(content.encode()).hexdigest()
+    return str(uuid.UUID(hex=digest[:32]))
+
+
+def _record_metadata(record: BaseRecord) -> dict[str, Any]:
+    metadata = record.get("metadata") or {}
+    if isinstance(metadata, list):
+        metadata = metadata[0] if metadata else {}
+    return dict(metadata)
+
+
+class HybridRetriever:
+    """Combines a vector store client with a BM25 index over the same documents.
+
+    Documents are written to both indexes. A search runs vector and BM25
+    retrieval, merges them with reciprocal-rank fusion, then optionally
+    diversifies with MMR and reorders with a local reranker. Exact terms such
+    as identifiers and error codes are found by BM25 even when they are not
+    close in embedding space.
+
+    Args:
+        client: Vector store client holding the dense index.
+        config: Hybrid retrieval settings.
+        index: BM25 index to use; created from ``config.index_path`` if omitted.
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        config: HybridSearchConfig | None = None,
+        index: BM25Index | None = None,
+    ) -> None:
+        self.client = client
+        self.config = config or HybridSearchConfig()
+        self.index = index or BM25Index(self.config.index_path)
+
+    def _prepare(self, documents: list[BaseRecord]) -> list[BaseRecord]:
+        return [{**document, "doc_id": _record_id(document)} for document in documents]
+
+    def _index(self, collection_name: str, documents: list[BaseRecord]) -> None:
+        self.index.upsert(
+            collection_name,
+            (
+                (str(doc["doc_id"]), doc["content"], _record_metadata(doc))
+                for doc in documents
+            ),
+        )
+
+    def add_documents(self, collection_name: str, documents: list[BaseRecord]) -> None:
+        """Add documents to the vector store and the BM25 index."""
+        prepared = self._prepare(documents)
+        self.client.add_documents(collection_name=collection_name, documents=prepared)
+        self._index(collection_name, prepared)
+
+    async def aadd_documents(
+        self, collection_name: str, documents: list[BaseRecord]
+    ) -> None:
+        """Add documents to the vector store and the BM25 index asynchronously."""
+        prepared = self._prepare(documents)
+        await self.client.aadd_documents(
+            collection_name=collection_name, documents=prepared
+        )
+        await asyncio.to_thread(self._index, collection_name, prepared)
+
+    def _fuse(
+        self,
+        query: str,
+        dense: list[SearchResult],
+        sparse: list[SearchResult],
+        limit: int,
+    ) -> list[SearchResult]:
+        config = self.config
+        fused = reciprocal_rank_fusion(
+            [dense, sparse],
+            k=config.rrf_k,
+            weights=[config.dense_weight, config.sparse_weight],
+        )
+        if config.reranker is not None:
+            fused = config.reranker.rerank(query, fused)
+        if config.mmr_lambda is not None:
+            return maximal_marginal_relevance(fused, limit, config.mmr_lambda)
+        return fused[:limit]
+
+    def search(
+        self,
+        collection_name: str,
+        query: str,
+        limit: int = 5,
+        metadata_filter: dict[str, Any] | None = None,
+        score_threshold: float | None = None,
+    ) -> list[SearchResult]:
+        """Search both indexes and return the fused top results.
+
+        ``score_threshold`` applies to vector similarity only; BM25 hits are
+        kept regardless, since an exact term match is relevant on its own.
+
+        Returns:
+            Up to ``limit`` SearchResult dicts whose ``score`` is the
+            normalized fused score.
+        """
+        candidates = limit * self.config.candidates_per_retriever
+        dense_kwargs: dict[str, Any] = {
+            "collection_name": collection_name,
+            "query": query,
+            "limit": candidates,
+            "metadata_filter": metadata_filter,
+        }
+        if score_threshold is not None:
+            dense_kwargs["score_threshold"] = score_threshold
+        dense = self.client.search(**dense_kwargs)
+        sparse = self.index.search(collection_name, query, candidates, metadata_filter)
+        return self._fuse(query, dense, sparse, limit)
+
+    async def asearch(
+        self,
+        collection_name: str,
+        query: str,
+        limit: int = 5,
+        metadata_filter: dict[str, Any] | None = None,
+        score_threshold: float | None = None,
+    ) -> list[SearchResult]:
+        """Search both indexes asynchronously and return the fused top results."""
+        candidates = limit * self.config.candidates_per_retriever
+        dense_kwargs: dict[str, Any] = {
+            "collection_name": collection_name,
+            "query": query,
+            "limit": candidates,
+            "metadata_filter": metadata_filter,
+        }
+        if score_threshold is not None:
+            dense_kwargs["score_threshold"] = score_threshold
+        dense, sparse = await asyncio.gather(
+            self.client.asearch(**dense_kwargs),
+            asyncio.to_thread(
+                self.index.search, collection_name, query, candidates, metadata_filter
+            ),
+        )
+        return await asyncio.to_thread(self._fuse, query, dense, sparse, limit)
+
+    def delete_collection(self, collection_name: str) -> None:
+        """Delete the collection from the vector store and the BM25 index."""
+        self.index.delete_collection(collection_name)
+        self.client.delete_collection(collection_name=collection_name)
+
+    async def adelete_collection(self, collection_name: str) -> None:
+        """Delete the collection from both indexes asynchronously."""
+        await asyncio.to_thread(self.index.delete_collection, collection_name)
+        await self.client.adelete_collection(collection_name=collection_name)
@@ -8,6 +8,7 @@ from itak.rag.core.base_client import (
     BaseClient,
     BaseCollectionAddParams,
     BaseCollectionParams,
+    BaseCollectionSearchManyParams,
     BaseCollectionSearchParams,
 )
 from itak.rag.core.exceptions import ClientMethodMismatchError
@@ -18,12 +19,15 @@ from itak.rag.qdrant.types import (
     QdrantCollectionCreateParams,
 )
 from itak.rag.qdrant.utils import (
+    _aembed_queries,
     _create_point_from_document,
+    _embed_queries,
     _get_collection_params,
     _is_async_client,
     _is_async_embedding_function,
     _is_sync_client,
     _prepare_search_params,
+    _prepare_search_requests,
     _process_search_results,
 )
 from itak.rag.types import SearchResult
@@ -35,6 +39,9 @@ class QdrantClient(BaseClient):
     Provides vector database operations for Qdrant, supporting both
     synchronous and asynchronous clients.
 
+    Collections known to exist are cached per client, so searches and inserts
+    skip the ``collection_exists`` round trip after the first check.
+
     Attributes:
         client: Qdrant client instance (QdrantClient or AsyncQdrantClient).
         embedding_function: Function to generate embeddings for documents.
@@ -64,6 +71,25 @@ class QdrantClient(BaseClient):
         self.default_limit = default_limit
         self.default_score_threshold = default_score_threshold
         self.default_batch_size = default_batch_size
+        self._known_collections: set[str] = set()
+
+    def _collection_exists(self, collection_name: str) -> bool:
+        """Check whether a collection exists, trusting earlier positive checks."""
+        if collection_name in self._known_collections:
+            return True
+        if self.client.collection_exists(collection_name):  # type: ignore[union-attr]
+            self._known_collections.add(collection_name)
+            return True
+        return False
+
+    async def _acollection_exists(self, collection_name: str) -> bool:
+        """Async counterpart of ``_collection_exists``."""
+        if collection_name in self._known_collections:
+            return True
+        if await self.client.collection_exists(collection_name):  # type: ignore[misc]
+            self._known_collections.add(collection_name)
+            return True
+        return False
 
     def create_collection(self, **kwargs: Unpack[QdrantCollectionCreateParams]) -> None:
         """Create a new collection in Qdrant.
@@ -102,6 +128,7 @@ class QdrantClient(BaseClient):
 
         params = _get_collection_params(kwargs)
         self.client.create_collection(**params)
+        self._known_collections.add(collection_name)
 
     async def acreate_collection(
         self, **kwargs: Unpack[QdrantCollectionCreateParams]
@@ -142,6 +169,7 @@ class QdrantClient(BaseClient):
 
         params = _get_collection_params(kwargs)
         await self.client.create_collection(**params)
+        self._known_collections.add(collection_name)
 
     def get_or_create_collection(
         self, **kwargs: Unpack[QdrantCollectionCreateParams]
@@ -184,6 +212,7 @@ class QdrantClient(BaseClient):
 
         params = _get_collection_params(kwargs)
         self.client.create_collection(**params)
+        self._known_collections.add(collection_name)
 
         return self.client.get_collection(collection_name)
 
@@ -228,6 +257,7 @@ class QdrantClient(BaseClient):
 
         params = _get_collection_params(kwargs)
         await self.client.create_collection(**params)
+        self._known_collections.add(collection_name)
 
         return await self.client.get_collection(collection_name)
 
@@ -258,7 +288,7 @@ class QdrantClient(BaseClient):
         if not documents:
             raise ValueError("Documents list cannot be empty")
 
-        if not self.client.collection_exists(collection_name):
+        if not self._collection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' does not exist")
 
         for i in range(0, len(documents), batch_size):
@@ -303,7 +333,7 @@ class QdrantClient(BaseClient):
         if not documents:
             raise ValueError("Documents list cannot be empty")
 
-        if not await self.client.collection_exists(collection_name):
+        if not await self._acollection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' does not exist")
 
         for i in range(0, len(documents), batch_size):
@@ -353,7 +383,7 @@ class QdrantClient(BaseClient):
         metadata_filter = kwargs.get("metadata_filter")
         score_threshold = kwargs.get("score_threshold", self.default_score_threshold)
 
-        if not self.client.collection_exists(collection_name):
+        if not self._collection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' does not exist")
 
         if _is_async_embedding_function(self.embedding_function):
@@ -408,7 +438,7 @@ class QdrantClient(BaseClient):
         metadata_filter = kwargs.get("metadata_filter")
         score_threshold = kwargs.get("score_threshold", self.default_score_threshold)
 
-        if not await self.client.collection_exists(collection_name):
+        if not await self._acollection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' does not exist")
 
         if _is_async_embedding_function(self.embedding_function):
@@ -429,6 +459,121 @@ class QdrantClient(BaseClient):
         response = await self.client.query_points(**search_kwargs)
         return _process_search_results(response)
 
+    def search_many(
+        self, **kwargs: Unpack[BaseCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for similar documents for several queries in one round trip.
+
+        Queries are embedded together and sent as a single
+        ``query_batch_points`` request.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional filter for metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+
+        Returns:
+            One list of SearchResult dicts per query, in query order.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to Qdrant server.
+        """
+        if not _is_sync_client(self.client):
+            raise ClientMethodMismatchError(
+                method_name="search_many",
+                expected_client="QdrantClient",
+                alt_method="asearch_many",
+                alt_client="AsyncQdrantClient",
+            )
+
+        collection_name = kwargs["collection_name"]
+        queries = list(kwargs["queries"])
+        limit = kwargs.get("limit", self.default_limit)
+        metadata_filter = kwargs.get("metadata_filter")
+        score_threshold = kwargs.get("score_threshold", self.default_score_threshold)
+
+        if not queries:
+            return []
+
+        if not self._collection_exists(collection_name):
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+
+        if _is_async_embedding_function(self.embedding_function):
+            raise TypeError(
+                "Async embedding function cannot be used with sync search_many. "
+                "Use asearch_many instead."
+            )
+        sync_fn = cast(EmbeddingFunction, self.embedding_function)
+        query_embeddings = _embed_queries(sync_fn, queries)
+
+        requests = _prepare_search_requests(
+            query_embeddings=query_embeddings,
+            limit=limit,
+            score_threshold=score_threshold,
+            metadata_filter=metadata_filter,
+        )
+
+        responses = self.client.query_batch_points(
+            collection_name=collection_name, requests=requests
+        )
+        return [_process_search_results(response) for response in responses]
+
+    async def asearch_many(
+        self, **kwargs: Unpack[BaseCollectionSearchManyParams]
+    ) -> list[list[SearchResult]]:
+        """Search for similar documents for several queries asynchronously.
+
+        Keyword Args:
+            collection_name: Name of the collection to search in.
+            queries: The text queries to search for.
+            limit: Maximum number of results to return per query.
+            metadata_filter: Optional filter for metadata fields.
+            score_threshold: Optional minimum similarity score (0-1) for results.
+
+        Returns:
+            One list of SearchResult dicts per query, in query order.
+
+        Raises:
+            ValueError: If collection doesn't exist.
+            ConnectionError: If unable to connect to Qdrant server.
+        """
+        if not _is_async_client(self.client):
+            raise ClientMethodMismatchError(
+                method_name="asearch_many",
+                expected_client="AsyncQdrantClient",
+                alt_method="search_many",
+                alt_client="QdrantClient",
+            )
+
+        collection_name = kwargs["collection_name"]
+        queries = list(kwargs["queries"])
+        limit = kwargs.get("limit", self.default_limit)
+        metadata_filter = kwargs.get("metadata_filter")
+        score_threshold = kwargs.get("score_threshold", self.default_score_threshold)
+
+        if not queries:
+            return []
+
+        if not await self._acollection_exists(collection_name):
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+
+        query_embeddings = await _aembed_queries(self.embedding_function, queries)
+
+        requests = _prepare_search_requests(
+            query_embeddings=query_embeddings,
+            limit=limit,
+            score_threshold=score_threshold,
+            metadata_filter=metadata_filter,
+        )
+
+        responses = await self.client.query_batch_points(
+            collection_name=collection_name, requests=requests
+        )
+        return [_process_search_results(response) for response in responses]
+
     def delete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
         """Delete a collection and all its data.
 
@@ -452,6 +597,7 @@ class QdrantClient(BaseClient):
         if not self.client.collection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' does not exist")
 
+        self._known_collections.discard(collection_name)
         self.client.delete_collection(collection_name=collection_name)
 
     async def adelete_collection(self, **kwargs: Unpack[BaseCollectionParams]) -> None:
@@ -477,6 +623,7 @@ class QdrantClient(BaseClient):
         if not await self.client.collection_exists(collection_name):
             raise ValueError(f"Collection '{collection_name}' does not exist")
 
+        self._known_collections.discard(collection_name)
         await self.client.delete_collection(collection_name=collection_name)
 
     def reset(self) -> None:
@@ -493,6 +640,7 @@ class QdrantClient(BaseClient):
                 alt_client="AsyncQdrantClient",
             )
 
+        self._known_collections.clear()
         collections_response = self.client.get_collections()
 
         for collection in collections_response.collections:
@@ -512,6 +660,7 @@ class QdrantClient(BaseClient):
                 alt_client="QdrantClient",
             )
 
+        self._known_collections.clear()
         collections_response = await self.client.get_collections()
 
         for collection in collections_response.collections:
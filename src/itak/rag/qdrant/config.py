@@ -49,6 +49,18 @@ def _default_embedding_function() -> QdrantEmbeddingFunctionWrapper:
         embeddings = list(model.embed([text]))
         return embeddings[0].tolist() if embeddings else []
 
+    def embed_batch(texts: list[str]) -> list[list[float]]:
+        """Embed several texts in one model call.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One embedding vector per text.
+        """
+        return [embedding.tolist() for embedding in model.embed(texts)]
+
+    embed_fn.embed_batch = embed_batch  # type: ignore[attr-defined]
     return cast(QdrantEmbeddingFunctionWrapper, embed_fn)
 
 
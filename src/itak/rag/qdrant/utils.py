@@ -13,6 +13,7 @@ from qdrant_client.models import (  # type: ignore[import-not-found]
     Filter,
     MatchValue,
     PointStruct,
+    QueryRequest,
     QueryResponse,
 )
 
@@ -153,18 +154,104 @@ def _prepare_search_params(
     if score_threshold is not None:
         search_kwargs["score_threshold"] = score_threshold
 
-    if metadata_filter:
-        filter_conditions: list[FilterCondition] = []
-        for key, value in metadata_filter.items():
-            filter_conditions.append(
-                FieldCondition(key=key, match=MatchValue(value=value))
-            )
-
-        search_kwargs["query_filter"] = Filter(must=filter_conditions)
+    query_filter = _build_metadata_filter(metadata_filter)
+    if query_filter is not None:
+        search_kwargs["query_filter"] = query_filter
 
     return search_kwargs
 
 
+def _build_metadata_filter(metadata_filter: MetadataFilter | None) -> Filter | None:
+    """Build a Qdrant filter matching every key/value pair of a metadata filter.
+
+    Args:
+        metadata_filter: Optional metadata filters.
+
+    Returns:
+        A Filter, or None when there is nothing to filter on.
+    """
+    if not metadata_filter:
+        return None
+
+    filter_conditions: list[FilterCondition] = []
+    for key, value in metadata_filter.items():
+        filter_conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
+    return Filter(must=filter_conditions)
+
+
+def _prepare_search_requests(
+    query_embeddings: list[QueryEmbedding],
+    limit: int,
+    score_threshold: float | None,
+    metadata_filter: MetadataFilter | None,
+) -> list[QueryRequest]:
+    """Prepare one Qdrant query request per embedding for query_batch_points.
+
+    Args:
+        query_embeddings: Embedding vectors for the queries.
+        limit: Maximum number of results per query.
+        score_threshold: Optional minimum similarity score.
+        metadata_filter: Optional metadata filters applied to every query.
+
+    Returns:
+        List of QueryRequest objects in query order.
+    """
+    query_filter = _build_metadata_filter(metadata_filter)
+    return [
+        QueryRequest(
+            query=_ensure_list_embedding(embedding),
+            filter=query_filter,
+            score_threshold=score_threshold,
+            limit=limit,
+            with_payload=True,
+            with_vector=False,
+        )
+        for embedding in query_embeddings
+    ]
+
+
+def _embed_queries(
+    func: EmbeddingFunction, queries: list[str]
+) -> list[QueryEmbedding]:
+    """Embed several queries, in a single call when the function supports it.
+
+    Embedding functions may expose an ``embed_batch(texts)`` attribute that
+    embeds a list of texts at once; otherwise each query is embedded in turn.
+
+    Args:
+        func: The synchronous embedding function.
+        queries: Texts to embed.
+
+    Returns:
+        One embedding per query, in query order.
+    """
+    embed_batch = getattr(func, "embed_batch", None)
+    if callable(embed_batch):
+        return list(embed_batch(queries))
+    return [func(query) for query in queries]
+
+
+async def _aembed_queries(
+    func: EmbeddingFunction | AsyncEmbeddingFunction, queries: list[str]
+) -> list[QueryEmbedding]:
+    """Embed several queries asynchronously, concurrently for async functions.
+
+    Args:
+        func: The embedding function, sync or async.
+        queries: Texts to embed.
+
+    Returns:
+        One embedding per query, in query order.
+    """
+    if not _is_async_embedding_function(func):
+        return _embed_queries(func, queries)
+
+    embed_batch = getattr(func, "embed_batch", None)
+    if embed_batch is not None and asyncio.iscoroutinefunction(embed_batch):
+        return list(await embed_batch(queries))
+    return list(await asyncio.gather(*(func(query) for query in queries)))
+
+
 def _normalize_qdrant_score(score: float) -> float:
     """Normalize Qdrant cosine similarity score to [0, 1] range.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from concurrent.futures import Future
 from copy import copy as shallow_copy
 import datetime
@@ -47,6 +48,7 @@ from itak.utilities.converter import Converter, convert_to_model
 from itak.utilities.guardrail import (
     process_guardrail,
 )
+from itak.utilities.guardrail_engine import GuardrailEngine
 from itak.utilities.guardrail_types import (
     GuardrailCallable,
     GuardrailType,
@@ -180,6 +182,11 @@ class Task(BaseModel):
     guardrail_max_retries: int = Field(
         default=3, description="Maximum number of retries when guardrail fails"
     )
+    guardrail_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of LLM-backed guardrails evaluated concurrently",
+    )
     retry_count: int = Field(default=0, description="Current number of retries")
     start_time: datetime.datetime | None = Field(
         default=None, description="Start time of the task execution"
@@ -198,6 +205,7 @@ class Task(BaseModel):
     _guardrail_retry_counts: dict[int, int] = PrivateAttr(
         default_factory=dict,
     )
+    _guardrail_engine: GuardrailEngine | None = PrivateAttr(default=None)
     _original_description: str | None = PrivateAttr(default=None)
     _original_expected_output: str | None = PrivateAttr(default=None)
     _original_output_file: str | None = PrivateAttr(default=None)
@@ -343,6 +351,7 @@ class Task(BaseModel):
                     raise ValueError("Guardrail must be a callable or a string")
 
         self._guardrails = guardrails
+        self._guardrail_engine = None
         if self._guardrails:
             self.guardrail = None
             self._guardrail = None
@@ -537,10 +546,8 @@ class Task(BaseModel):
                 tools=tools,
             )
 
-            if not self._guardrails and not self._guardrail:
-                pydantic_output, json_output = self._export_output(result)
-            else:
-                pydantic_output, json_output = None, None
+            # Exported up front so guardrails can check the structured output.
+            pydantic_output, json_output = self._export_output(result)
 
             task_output = TaskOutput(
                 name=self.name or self.description,
@@ -555,14 +562,9 @@ class Task(BaseModel):
             )
 
             if self._guardrails:
-                for idx, guardrail in enumerate(self._guardrails):
-                    task_output = await self._ainvoke_guardrail_function(
-                        task_output=task_output,
-                        agent=agent,
-                        tools=tools,
-                        guardrail=guardrail,
-                        guardrail_index=idx,
-                    )
+                task_output = await self._ainvoke_guardrails(
+                    task_output=task_output, agent=agent, tools=tools
+                )
 
             if self._guardrail:
                 task_output = await self._ainvoke_guardrail_function(
@@ -629,10 +631,8 @@ class Task(BaseModel):
                 tools=tools,
             )
 
-            if not self._guardrails and not self._guardrail:
-                pydantic_output, json_output = self._export_output(result)
-            else:
-                pydantic_output, json_output = None, None
+            # Exported up front so guardrails can check the structured output.
+            pydantic_output, json_output = self._export_output(result)
 
             task_output = TaskOutput(
                 name=self.name or self.description,
@@ -647,14 +647,9 @@ class Task(BaseModel):
             )
 
             if self._guardrails:
-                for idx, guardrail in enumerate(self._guardrails):
-                    task_output = self._invoke_guardrail_function(
-                        task_output=task_output,
-                        agent=agent,
-                        tools=tools,
-                        guardrail=guardrail,
-                        guardrail_index=idx,
-                    )
+                task_output = self._invoke_guardrails(
+                    task_output=task_output, agent=agent, tools=tools
+                )
 
             # backwards support
             if self._guardrail:
@@ -960,6 +955,144 @@ Follow these guidelines:
         """
         return self.security_config.fingerprint
 
+    def _get_guardrail_engine(self) -> GuardrailEngine:
+        engine = self._guardrail_engine
+        if (
+            engine is None
+            or engine.guardrails != self._guardrails
+            or engine.max_concurrency != self.guardrail_max_concurrency
+        ):
+            engine = GuardrailEngine(
+                self._guardrails, max_concurrency=self.guardrail_max_concurrency
+            )
+            self._guardrail_engine = engine
+        return engine
+
+    def _apply_guardrail_result(
+        self, task_output: TaskOutput, result: Any
+    ) -> TaskOutput:
+        """Return ``task_output`` with a passing guardrail's result applied.
+
+        The same object is returned when the guardrail left the output as is.
+        """
+        if isinstance(result, TaskOutput):
+            return result
+        if isinstance(result, str) and result != task_output.raw:
+            pydantic_output, json_output = self._export_output(result)
+            return task_output.model_copy(
+                update={
+                    "raw": result,
+                    "pydantic": pydantic_output,
+                    "json_dict": json_output,
+                }
+            )
+        return task_output
+
+    def _finalize_guardrail_output(self, task_output: TaskOutput) -> TaskOutput:
+        if task_output.pydantic is None and task_output.json_dict is None:
+            pydantic_output, json_output = self._export_output(task_output.raw)
+            task_output.pydantic = pydantic_output
+            task_output.json_dict = json_output
+        return task_output
+
+    def _guardrail_retry_context(
+        self, guardrail_index: int, error: str | None, task_output: TaskOutput
+    ) -> str:
+        """Count a failed guardrail check and build the agent's retry context.
+
+        Each guardrail has its own budget of ``guardrail_max_retries``.
+
+        Raises:
+            Exception: If the failing guardrail has used up its retries.
+        """
+        retry_count = self._guardrail_retry_counts.get(guardrail_index, 0)
+        if retry_count >= self.guardrail_max_retries:
+            raise Exception(
+                f"Task failed guardrail {guardrail_index} validation after "
+                f"{self.guardrail_max_retries} retries. Last error: {error}"
+            )
+        self._guardrail_retry_counts[guardrail_index] = retry_count + 1
+        _printer.print(
+            content=f"Guardrail {guardrail_index} blocked (attempt "
+            f"{retry_count + 1}/{self.guardrail_max_retries + 1}), "
+            f"retrying due to: {error}\n",
+            color="yellow",
+        )
+        return self.i18n.errors("validation_error").format(
+            guardrail_result_error=error,
+            task_output=task_output.raw,
+        )
+
+    def _new_task_output(self, agent: BaseAgent, result: str) -> TaskOutput:
+        pydantic_output, json_output = self._export_output(result)
+        return TaskOutput(
+            name=self.name or self.description,
+            description=self.description,
+            expected_output=self.expected_output,
+            raw=result,
+            pydantic=pydantic_output,
+            json_dict=json_output,
+            agent=agent.role,
+            output_format=self._get_output_format(),
+            messages=agent.last_messages,  # type: ignore[attr-defined]
+        )
+
+    def _invoke_guardrails(
+        self,
+        task_output: TaskOutput,
+        agent: BaseAgent,
+        tools: list[BaseTool],
+    ) -> TaskOutput:
+        """Validate the output against all guardrails, retrying the agent on failure.
+
+        Every attempt re-checks all guardrails against the new output; verdicts
+        for outputs a guardrail has already judged come from the engine's cache.
+        """
+        engine = self._get_guardrail_engine()
+        while True:
+            verdict = engine.evaluate(
+                task_output,
+                apply=self._apply_guardrail_result,
+                retry_counts=self._guardrail_retry_counts,
+                task=self,
+                agent=agent,
+            )
+            if verdict.success:
+                return self._finalize_guardrail_output(verdict.output)
+            context = self._guardrail_retry_context(
+                cast(int, verdict.failed_index), verdict.error, verdict.output
+            )
+            result = agent.execute_task(task=self, context=context, tools=tools)
+            task_output = self._new_task_output(agent, result)
+
+    async def _ainvoke_guardrails(
+        self,
+        task_output: TaskOutput,
+        agent: BaseAgent,
+        tools: list[BaseTool],
+    ) -> TaskOutput:
+        """Validate the output against all guardrails asynchronously.
+
+        See ``_invoke_guardrails``; guardrail evaluation runs in a worker thread.
+        """
+        engine = self._get_guardrail_engine()
+        while True:
+            verdict = await asyncio.to_thread(
+                engine.evaluate,
+                task_output,
+                apply=self._apply_guardrail_result,
+                retry_counts=self._guardrail_retry_counts,
+                task=self,
+                agent=agent,
+            )
+            if verdict.success:
+                return self._finalize_guardrail_output(verdict.output)
+            context = self._guardrail_retry_context(
+                cast(int, verdict.failed_index), verdict.error, verdict.output
+            )
+            result = await agent.aexecute_task(task=self, context=context, tools=tools)
+            task_output = self._new_task_output(agent, result)
+
     def _invoke_guardrail_function(
         self,
         task_output: TaskOutput,
@@ -38,6 +38,12 @@ class LLMGuardrail:
 
         self.llm: BaseLLM = llm
 
+    @property
+    def cache_key(self) -> str:
+        """Identifies equivalent guardrails when caching verdicts."""
+        model = getattr(self.llm, "model", None) or type(self.llm).__name__
+        return f"llm_guardrail:{model}:{self.description}"
+
     def _validate_output(self, task_output: TaskOutput) -> LiteAgentOutput:
         agent = Agent(
             role="Guardrail Agent",
@@ -1,9 +1,11 @@
 from itak.tools.base_tool import BaseTool, EnvVar, tool
+from itak.tools.web_fetch import WebFetchTool
 
 
 
 __all__ = [
     "BaseTool",
     "EnvVar",
+    "WebFetchTool",
     "tool",
 ]
@@ -3,6 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from itak.tools.agent_tools.ask_question_tool import AskQuestionTool
+from itak.tools.agent_tools.delegate_work_parallel_tool import (
+    DelegateWorkParallelTool,
+)
 from itak.tools.agent_tools.delegate_work_tool import DelegateWorkTool
 from itak.utilities.i18n import get_i18n
 
@@ -16,12 +19,22 @@ if TYPE_CHECKING:
 class AgentTools:
     """Manager class for agent-related tools"""
 
-    def __init__(self, agents: list[BaseAgent], i18n: I18N | None = None) -> None:
+    def __init__(
+        self,
+        agents: list[BaseAgent],
+        i18n: I18N | None = None,
+        parallel_delegation: bool = False,
+    ) -> None:
         self.agents = agents
         self.i18n = i18n if i18n is not None else get_i18n()
+        self.parallel_delegation = parallel_delegation
 
     def tools(self) -> list[BaseTool]:
-        """Get all available agent tools"""
+        """Get all available agent tools.
+
+        The parallel delegation tool is only included when the manager was
+        created with ``parallel_delegation=True``.
+        """
         coworkers = ", ".join([f"{agent.role}" for agent in self.agents])
 
         delegate_tool = DelegateWorkTool(
@@ -36,4 +49,15 @@ class AgentTools:
             description=self.i18n.tools("ask_question").format(coworkers=coworkers),  # type: ignore
         )
 
-        return [delegate_tool, ask_tool]
+        tools: list[BaseTool] = [delegate_tool, ask_tool]
+        if self.parallel_delegation:
+            tools.append(
+                DelegateWorkParallelTool(
+                    agents=self.agents,
+                    i18n=self.i18n,
+                    description=self.i18n.tools("delegate_work_parallel").format(  # type: ignore
+                        coworkers=coworkers
+                    ),
+                )
+            )
+        return tools
@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from itak.agents.agent_builder.base_agent import BaseAgent
 from itak.task import Task
@@ -19,6 +19,8 @@ class BaseAgentTool(BaseTool):
     i18n: I18N = Field(
         default_factory=get_i18n, description="Internationalization settings"
     )
+    _role_index: dict[str, BaseAgent] = PrivateAttr(default_factory=dict)
+    _role_index_agents: tuple[int, ...] = PrivateAttr(default=())
 
     def sanitize_agent_name(self, name: str) -> str:
         """
@@ -39,29 +41,36 @@ class BaseAgentTool(BaseTool):
         # Remove quotes and convert to lowercase
         return normalized.replace('"', "").casefold()
 
-    @staticmethod
-    def _get_coworker(coworker: str | None, **kwargs: Any) -> str | None:
-        coworker = coworker or kwargs.get("co_worker") or kwargs.get("coworker")
-        if coworker:
-            is_list = coworker.startswith("[") and coworker.endswith("]")
-            if is_list:
-                coworker = coworker[1:-1].split(",")[0]
-        return coworker
+    def _agents_by_role(self) -> dict[str, BaseAgent]:
+        """Return agents keyed by sanitized role, rebuilt only when agents change.
 
-    def _execute(
-        self, agent_name: str | None, task: str, context: str | None = None
-    ) -> str:
+        Returns:
+            dict[str, BaseAgent]: First agent for each sanitized role
         """
-        Execute delegation to an agent with case-insensitive and whitespace-tolerant matching.
+        agent_ids = tuple(id(agent) for agent in self.agents)
+        if agent_ids != self._role_index_agents:
+            index: dict[str, BaseAgent] = {}
+            for agent in self.agents:
+                index.setdefault(self.sanitize_agent_name(agent.role), agent)
+            self._role_index = index
+            self._role_index_agents = agent_ids
+        return self._role_index
+
+    def _unexisting_coworker_error(self, error: str) -> str:
+        return self.i18n.errors("agent_tool_unexisting_coworker").format(
+            coworkers="\n".join(f"- {role}" for role in self._agents_by_role()),
+            error=error,
+        )
+
+    def _find_agent(self, agent_name: str | None) -> BaseAgent | str:
+        """Resolve a coworker by role, case-insensitively and whitespace-tolerant.
 
         Args:
-            agent_name: Name/role of the agent to delegate to (case-insensitive)
-            task: The specific question or task to delegate
-            context: Optional additional context for the task execution
+            agent_name: Name/role of the agent as written by the LLM
 
         Returns:
-            str: The execution result from the delegated agent or an error message
-                 if the agent cannot be found
+            BaseAgent | str: The matching agent, or an error message listing
+                the available coworkers
         """
         try:
             if agent_name is None:
@@ -79,43 +88,60 @@ class BaseAgentTool(BaseTool):
             logger.debug(
                 f"Sanitized agent name from '{agent_name}' to '{sanitized_name}'"
             )
-
-            available_agents = [agent.role for agent in self.agents]
-            logger.debug(f"Available agents: {available_agents}")
-
-            agent = [
-                available_agent
-                for available_agent in self.agents
-                if self.sanitize_agent_name(available_agent.role) == sanitized_name
-            ]
-            logger.debug(
-                f"Found {len(agent)} matching agents for role '{sanitized_name}'"
-            )
+            agent = self._agents_by_role().get(sanitized_name)
         except (AttributeError, ValueError) as e:
             # Handle specific exceptions that might occur during role name processing
-            return self.i18n.errors("agent_tool_unexisting_coworker").format(
-                coworkers="\n".join(
-                    [
-                        f"- {self.sanitize_agent_name(agent.role)}"
-                        for agent in self.agents
-                    ]
-                ),
-                error=str(e),
-            )
+            return self._unexisting_coworker_error(str(e))
 
-        if not agent:
+        if agent is None:
             # No matching agent found after sanitization
-            return self.i18n.errors("agent_tool_unexisting_coworker").format(
-                coworkers="\n".join(
-                    [
-                        f"- {self.sanitize_agent_name(agent.role)}"
-                        for agent in self.agents
-                    ]
-                ),
-                error=f"No agent found with role '{sanitized_name}'",
+            return self._unexisting_coworker_error(
+                f"No agent found with role '{sanitized_name}'"
             )
+        return agent
+
+    @staticmethod
+    def _get_coworker(coworker: str | None, **kwargs: Any) -> str | None:
+        coworker = coworker or kwargs.get("co_worker") or kwargs.get("coworker")
+        if coworker:
+            is_list = coworker.startswith("[") and coworker.endswith("]")
+            if is_list:
+                coworker = coworker[1:-1].split(",")[0]
+        return coworker
+
+    def _execute(
+        self, agent_name: str | None, task: str, context: str | None = None
+    ) -> str:
+        """
+        Execute delegation to an agent with case-insensitive and whitespace-tolerant matching.
+
+        Args:
+            agent_name: Name/role of the agent to delegate to (case-insensitive)
+            task: The specific question or task to delegate
+            context: Optional additional context for the task execution
+
+        Returns:
+            str: The execution result from the delegated agent or an error message
+                 if the agent cannot be found
+        """
+        agent = self._find_agent(agent_name)
+        if isinstance(agent, str):
+            return agent
+        return self._delegate(agent, task, context)
+
+    def _delegate(
+        self, selected_agent: BaseAgent, task: str, context: str | None = None
+    ) -> str:
+        """Run a task on an already resolved coworker.
 
-        selected_agent = agent[0]
+        Args:
+            selected_agent: The coworker to delegate to
+            task: The specific question or task to delegate
+            context: Optional additional context for the task execution
+
+        Returns:
+            str: The execution result or an error message
+        """
         try:
             task_with_assigned_agent = Task(
                 description=task,
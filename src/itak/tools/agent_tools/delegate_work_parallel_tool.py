@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from typing import Final, cast
+
+from pydantic import BaseModel, Field
+
+from itak.agents.agent_builder.base_agent import BaseAgent
+from itak.tools.agent_tools.base_agent_tools import BaseAgentTool
+
+
+DELEGATE_WORK_PARALLEL_TOOL_NAME: Final[str] = "Delegate work to coworkers in parallel"
+
+
+class DelegationItem(BaseModel):
+    coworker: str = Field(
+        ..., description="The role/name of the coworker to delegate to"
+    )
+    task: str = Field(..., description="The task to delegate")
+    context: str = Field(..., description="The context for the task")
+
+
+class DelegateWorkParallelToolSchema(BaseModel):
+    delegations: list[DelegationItem] = Field(
+        ...,
+        description=(
+            "Independent tasks to delegate, each with its coworker, task and context"
+        ),
+    )
+
+
+class DelegateWorkParallelTool(BaseAgentTool):
+    """Tool for delegating several independent tasks to coworkers at once"""
+
+    name: str = DELEGATE_WORK_PARALLEL_TOOL_NAME
+    args_schema: type[BaseModel] = DelegateWorkParallelToolSchema
+    max_concurrency: int = Field(
+        default=4, description="Maximum number of delegations running at once"
+    )
+
+    def _run(
+        self,
+        delegations: list[DelegationItem | dict],
+        **kwargs,
+    ) -> str:
+        items = [
+            item if isinstance(item, DelegationItem) else DelegationItem(**item)
+            for item in delegations
+        ]
+        if not items:
+            return "No delegations were provided."
+
+        # An agent keeps per-execution state, so tasks for the same coworker
+        # run one after another while different coworkers run concurrently.
+        resolved: list[BaseAgent | str] = []
+        results: list[str] = [""] * len(items)
+        per_agent: dict[int, list[int]] = {}
+        for index, item in enumerate(items):
+            agent = self._find_agent(self._get_coworker(item.coworker))
+            resolved.append(agent)
+            if isinstance(agent, str):
+                results[index] = agent
+            else:
+                per_agent.setdefault(id(agent), []).append(index)
+
+        def _run_agent_items(indices: list[int]) -> None:
+            for index in indices:
+                agent = cast(BaseAgent, resolved[index])
+                results[index] = self._delegate(
+                    agent, items[index].task, items[index].context
+                )
+
+        if per_agent:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_concurrency, len(per_agent))),
+                thread_name_prefix="iTaKDelegation",
+            ) as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, _run_agent_items, group)
+                    for group in per_agent.values()
+                ]
+                for future in futures:
+                    future.result()
+
+        sections = []
+        for index, (item, agent, result) in enumerate(
+            zip(items, resolved, results, strict=True), 1
+        ):
+            coworker = item.coworker if isinstance(agent, str) else agent.role
+            sections.append(f"## Result {index} ({coworker}): {item.task}\n{result}")
+        return "\n\n".join(sections)
@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable
 from inspect import Parameter, signature
-import json
 from typing import (
     Any,
     Generic,
@@ -25,7 +24,7 @@ from typing_extensions import TypeIs
 
 from itak.tools.structured_tool import CrewStructuredTool
 from itak.utilities.printer import Printer
-from itak.utilities.pydantic_schema_utils import generate_model_description
+from itak.utilities.prompt_cache import tool_args_json
 
 
 _printer = Printer()
@@ -89,6 +88,25 @@ class BaseTool(BaseModel, ABC):
         default=None,
         description="Maximum number of times this tool can be used. None means unlimited usage.",
     )
+    parallel_safe: bool = Field(
+        default=True,
+        description=(
+            "Whether calls to this tool may run concurrently with other tool "
+            "calls from the same LLM response."
+        ),
+    )
+    read_only: bool = Field(
+        default=False,
+        description="Whether the tool only reads state and has no side effects.",
+    )
+    idempotent: bool = Field(
+        default=False,
+        description=(
+            "Whether repeating a call with the same arguments gives the same "
+            "result. Read-only, idempotent tools may be started speculatively "
+            "while the LLM is still streaming."
+        ),
+    )
     current_usage_count: int = Field(
         default=0,
         description="Current number of times this tool has been used.",
@@ -299,11 +317,9 @@ class BaseTool(BaseModel, ABC):
 
     def _generate_description(self) -> None:
         """Generate the tool description with a JSON schema for arguments."""
-        schema = generate_model_description(self.args_schema)
-        args_json = json.dumps(schema["json_schema"]["schema"], indent=2)
         self.description = (
             f"Tool Name: {self.name}\n"
-            f"Tool Arguments: {args_json}\n"
+            f"Tool Arguments: {tool_args_json(self.args_schema)}\n"
             f"Tool Description: {self.description}"
         )
 
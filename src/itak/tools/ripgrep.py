@@ -3,21 +3,197 @@ import shutil
 import subprocess
 import json
 import logging
-from typing import List, Dict, Any, Optional, Type
+import asyncio
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Type
 from pydantic import BaseModel, Field
 from itak.tools.base_tool import BaseTool
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_MATCHES = 1000
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_STAMPED_FILES = 5000
+MAX_STDERR_BYTES = 4096
+
+# rg exits with 1 when nothing matched and 2 when an error occurred.
+_RG_ERROR_EXIT_CODE = 2
+
+# rg --json emits one object per line; match records always start with this
+# prefix, so every other record type can be skipped without parsing it.
+_MATCH_PREFIX = b'{"type":"match"'
+
+
+class _MatchCollector:
+    """
+    Incrementally parses rg --json lines and enforces the match/byte budget.
+    """
+
+    def __init__(self, max_matches: int, max_bytes: int):
+        self.max_matches = max_matches
+        self.max_bytes = max_bytes
+        self.matches: List[Dict[str, Any]] = []
+        self.bytes_read = 0
+        self.parse_errors = 0
+        self.truncated = False
+
+    def feed(self, line: bytes) -> bool:
+        """Consume one output line. Returns False once the budget is exhausted."""
+        self.bytes_read += len(line)
+        if self.bytes_read > self.max_bytes:
+            self.truncated = True
+            return False
+
+        if not line.startswith(_MATCH_PREFIX):
+            return True
+
+        try:
+            data = json.loads(line.decode("utf-8", errors="replace"))
+            self.matches.append({
+                "file": data['data']['path']['text'],
+                "line_number": data['data']['line_number'],
+                "content": data['data']['lines']['text'].rstrip()
+            })
+        except (json.JSONDecodeError, KeyError, TypeError):
+            self.parse_errors += 1
+            return True
+
+        if len(self.matches) >= self.max_matches:
+            self.truncated = True
+            return False
+        return True
+
+    def result(self, timed_out: bool = False) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "count": len(self.matches),
+            "matches": self.matches,
+            "truncated": self.truncated or timed_out,
+            "timed_out": timed_out,
+        }
+
+
+class RipGrepCache:
+    """
+    LRU cache of search results keyed by (pattern, path, flags).
+
+    An entry is reused only while every (non-hidden) file and directory under
+    the searched path keeps the mtime and size it had when the entry was
+    stored, so edits to files that did not match yet are caught as well as
+    added, removed or renamed files. Trees with more than `max_stamped_files`
+    entries are not cached at all, which bounds the cost of each lookup.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_stamped_files: int = DEFAULT_MAX_STAMPED_FILES,
+    ):
+        self.max_entries = max_entries
+        self.max_stamped_files = max_stamped_files
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[int, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _tree_signature(self, path: str) -> Optional[int]:
+        """Hash of the stamps of every candidate file, or None if too many."""
+        if not os.path.isdir(path):
+            return hash((path, self._stat(path)))
+
+        stamps = []
+        for root, dirs, files in os.walk(path):
+            # rg skips hidden files and directories by default, so their
+            # churn (.git, .venv, ...) must not invalidate cached results.
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            stamps.append((root, self._stat(root)))
+            for name in files:
+                if name.startswith("."):
+                    continue
+                file = os.path.join(root, name)
+                stamps.append((file, self._stat(file)))
+            if len(stamps) > self.max_stamped_files:
+                return None
+        return hash(tuple(stamps))
+
+    def get(self, key: Tuple[Any, ...], path: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        signature, result = entry
+        valid = self._tree_signature(path) == signature
+
+        with self._lock:
+            if not valid:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+        return {**result, "matches": list(result["matches"]), "cached": True}
+
+    def put(self, key: Tuple[Any, ...], path: str, result: Dict[str, Any]) -> None:
+        signature = self._tree_signature(path)
+        if signature is None:
+            return
+        with self._lock:
+            self._entries[key] = (signature, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop entries whose searched path contains `path` (all if None)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            target = os.path.abspath(path)
+            for key in [k for k in self._entries if _contains(k[1], target)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        self.invalidate()
+
+
+def _contains(root: str, path: str) -> bool:
+    try:
+        return os.path.commonpath([root, path]) == root
+    except ValueError:
+        return False
+
+
+_default_cache = RipGrepCache()
+
+
 class RipGrepSearch:
     """
     High-performance code search using ripgrep (rg).
     Ported from gemini-cli's `ripGrep.ts`.
+
+    Output is streamed from the rg process and parsed line by line; the
+    process is stopped as soon as the match budget, byte budget or timeout
+    is reached, so broad patterns never buffer the whole result set.
     """
-    
-    def __init__(self, bin_dir: Optional[str] = None):
+
+    def __init__(
+        self, bin_dir: Optional[str] = None, cache: Optional[RipGrepCache] = None
+    ):
         self.bin_dir = bin_dir or os.path.expanduser("~/.itak/bin")
         self.rg_path = self._find_binary()
+        self.cache = cache if cache is not None else _default_cache
 
     def _find_binary(self) -> Optional[str]:
         # 1. Check Module-specific bin dir
@@ -25,84 +201,287 @@ class RipGrepSearch:
             candidate = os.path.join(self.bin_dir, "rg.exe" if os.name == 'nt' else "rg")
             if os.path.exists(candidate):
                 return candidate
-                
+
         # 2. Check System PATH
         system_rg = shutil.which("rg")
         if system_rg:
             return system_rg
-            
+
         return None
 
     def is_available(self) -> bool:
         return self.rg_path is not None
 
-    def search(
-        self, 
-        pattern: str, 
-        path: str = ".", 
-        case_sensitive: bool = False,
-        fixed_strings: bool = False,
-        glob_include: Optional[str] = None,
-        context: int = 0
-    ) -> Dict[str, Any]:
-        
-        if not self.rg_path:
-            return {
-                "success": False, 
-                "error": "ripgrep (rg) binary not found. Please install it or run 'itak setup ripgrep'."
-            }
+    def _missing_binary(self) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": (
+                "ripgrep (rg) binary not found. "
+                "Please install it or run 'itak setup ripgrep'."
+            ),
+        }
 
+    def _build_command(
+        self,
+        pattern: str,
+        path: str,
+        case_sensitive: bool,
+        fixed_strings: bool,
+        glob_include: Optional[str],
+        context: int,
+    ) -> List[str]:
         cmd = [self.rg_path, "--json"]
-        
+
         if not case_sensitive:
             cmd.append("--ignore-case")
-            
+
         if fixed_strings:
             cmd.append("--fixed-strings")
-        
+
         if context > 0:
             cmd.extend(["--context", str(context)])
-            
+
         if glob_include:
             cmd.extend(["--glob", glob_include])
-            
+
         # Add pattern and path
         cmd.extend(["--", pattern, path])
-        
-        try:
-            # Run process
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                encoding='utf-8',
-                errors='replace'
+        return cmd
+
+    @staticmethod
+    def _cache_key(
+        pattern: str,
+        path: str,
+        case_sensitive: bool,
+        fixed_strings: bool,
+        glob_include: Optional[str],
+        context: int,
+        max_matches: int,
+        max_bytes: int,
+    ) -> Tuple[Any, ...]:
+        return (
+            pattern, os.path.abspath(path), case_sensitive, fixed_strings,
+            glob_include, context, max_matches, max_bytes,
+        )
+
+    @staticmethod
+    def _read_stderr(stderr: Any) -> str:
+        stderr.seek(0)
+        return stderr.read(MAX_STDERR_BYTES).decode("utf-8", errors="replace").strip()
+
+    def _finish(
+        self,
+        collector: _MatchCollector,
+        returncode: Optional[int],
+        stopped_early: bool,
+        timed_out: bool,
+        stderr: Any,
+    ) -> Dict[str, Any]:
+        """Build the result, turning an rg failure into an error result."""
+        if not stopped_early and returncode == _RG_ERROR_EXIT_CODE:
+            message = self._read_stderr(stderr) or "unknown error"
+            return {
+                "success": False,
+                "error": f"rg exited with status {returncode}: {message}",
+                "count": len(collector.matches),
+                "matches": collector.matches,
+                "truncated": False,
+                "timed_out": False,
+            }
+        return collector.result(timed_out=timed_out)
+
+    def search(
+        self,
+        pattern: str,
+        path: str = ".",
+        case_sensitive: bool = False,
+        fixed_strings: bool = False,
+        glob_include: Optional[str] = None,
+        context: int = 0,
+        max_matches: int = DEFAULT_MAX_MATCHES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        use_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Search `path` for `pattern`.
+
+        Results are cached only with `use_cache=True`; a cached result is
+        reused while no candidate file under `path` has changed.
+        """
+        if not self.rg_path:
+            return self._missing_binary()
+
+        key = self._cache_key(
+            pattern, path, case_sensitive, fixed_strings, glob_include, context,
+            max_matches, max_bytes,
+        )
+        if use_cache:
+            cached = self.cache.get(key, path)
+            if cached is not None:
+                return cached
+
+        cmd = self._build_command(
+            pattern, path, case_sensitive, fixed_strings, glob_include, context
+        )
+
+        # A file rather than a pipe, so a chatty rg can never block on stderr
+        # while stdout is being streamed.
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                )
+            except Exception as e:
+                return {"success": False, "error": f"Failed to execute rg: {str(e)}"}
+
+            collector = _MatchCollector(max_matches, max_bytes)
+            timed_out = threading.Event()
+            stopped_early = False
+
+            def _on_timeout() -> None:
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, _on_timeout) if timeout else None
+            if timer:
+                timer.daemon = True
+                timer.start()
+
+            try:
+                for line in process.stdout:
+                    if not collector.feed(line):
+                        stopped_early = True
+                        break
+            finally:
+                if timer:
+                    timer.cancel()
+                if process.poll() is None:
+                    process.kill()
+                process.stdout.close()
+                process.wait()
+
+            result = self._finish(
+                collector,
+                process.returncode,
+                stopped_early or timed_out.is_set(),
+                timed_out.is_set(),
+                stderr,
             )
-        except Exception as e:
-             return {"success": False, "error": f"Failed to execute rg: {str(e)}"}
-
-        matches = []
-        parse_errors = 0
-        
-        # Parse JSON Lines output
-        for line in result.stdout.splitlines():
+        if use_cache and result["success"] and not result["timed_out"]:
+            self.cache.put(key, path, result)
+        return result
+
+    async def asearch(
+        self,
+        pattern: str,
+        path: str = ".",
+        case_sensitive: bool = False,
+        fixed_strings: bool = False,
+        glob_include: Optional[str] = None,
+        context: int = 0,
+        max_matches: int = DEFAULT_MAX_MATCHES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        use_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """Async variant of `search` backed by an asyncio subprocess."""
+        if not self.rg_path:
+            return self._missing_binary()
+
+        key = self._cache_key(
+            pattern, path, case_sensitive, fixed_strings, glob_include, context,
+            max_matches, max_bytes,
+        )
+        if use_cache:
+            cached = await asyncio.to_thread(self.cache.get, key, path)
+            if cached is not None:
+                return cached
+
+        cmd = self._build_command(
+            pattern, path, case_sensitive, fixed_strings, glob_include, context
+        )
+
+        with tempfile.TemporaryFile() as stderr:
             try:
-                data = json.loads(line)
-                if data['type'] == 'match':
-                    matches.append({
-                        "file": data['data']['path']['text'],
-                        "line_number": data['data']['line_number'],
-                        "content": data['data']['lines']['text'].rstrip()
-                    })
-            except json.JSONDecodeError:
-                parse_errors += 1
-                
-        return {
-            "success": True,
-            "count": len(matches),
-            "matches": matches[:1000], # Hard cap for now
-            "truncated": len(matches) > 1000
-        }
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=stderr,
+                    limit=max_bytes + 1,
+                )
+            except Exception as e:
+                return {"success": False, "error": f"Failed to execute rg: {str(e)}"}
+
+            collector = _MatchCollector(max_matches, max_bytes)
+            deadline = time.monotonic() + timeout if timeout else None
+            timed_out = False
+            stopped_early = False
+
+            try:
+                while True:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        timed_out = True
+                        break
+                    try:
+                        line = await asyncio.wait_for(
+                            process.stdout.readline(), remaining
+                        )
+                    except asyncio.TimeoutError:
+                        timed_out = True
+                        break
+                    except ValueError:
+                        # A single line larger than the byte budget.
+                        collector.truncated = True
+                        stopped_early = True
+                        break
+                    if not line:
+                        break
+                    if not collector.feed(line):
+                        stopped_early = True
+                        break
+            finally:
+                if process.returncode is None:
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                # communicate() drains what is left in the pipe; a bare wait()
+                # can block forever if the reader paused the transport.
+                await process.communicate()
+
+            result = self._finish(
+                collector,
+                process.returncode,
+                stopped_early or timed_out,
+                timed_out,
+                stderr,
+            )
+        if use_cache and result["success"] and not result["timed_out"]:
+            await asyncio.to_thread(self.cache.put, key, path, result)
+        return result
+
+    async def asearch_many(
+        self,
+        queries: List[Dict[str, Any]],
+        max_concurrency: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several searches in parallel.
+
+        Each query is a dict of `asearch` keyword arguments; results are
+        returned in the same order as the queries.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(query: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.asearch(**query)
+
+        return list(await asyncio.gather(*(_run(q) for q in queries)))
 
     def install_instructions(self) -> str:
         if os.name == 'nt':
@@ -113,45 +492,91 @@ class RipGrepSearch:
 
 class RipGrepInput(BaseModel):
     """Input schema for RipGrepTool."""
-    pattern: str = Field(..., description="The search pattern (regex by default, or string if fixed_strings=True).")
-    path: str = Field(".", description="The path to search in (file or directory). Defaults to current directory.")
-    case_sensitive: bool = Field(False, description="Whether the search should be case sensitive.")
-    fixed_strings: bool = Field(False, description="Treat the pattern as a literal string instead of a regex.")
-    glob_include: Optional[str] = Field(None, description="Glob pattern to include files (e.g. '*.py').")
-    context: int = Field(0, description="Number of context lines to include around matches.")
+    pattern: str = Field(
+        ...,
+        description=(
+            "The search pattern (regex by default, or string if "
+            "fixed_strings=True)."
+        ),
+    )
+    path: str = Field(
+        ".",
+        description=(
+            "The path to search in (file or directory). "
+            "Defaults to current directory."
+        ),
+    )
+    case_sensitive: bool = Field(
+        False, description="Whether the search should be case sensitive."
+    )
+    fixed_strings: bool = Field(
+        False,
+        description="Treat the pattern as a literal string instead of a regex.",
+    )
+    glob_include: Optional[str] = Field(
+        None, description="Glob pattern to include files (e.g. '*.py')."
+    )
+    context: int = Field(
+        0, description="Number of context lines to include around matches."
+    )
 
 class RipGrepTool(BaseTool):
     name: str = "RipGrep"
     description: str = (
         "A fast code search tool using ripgrep. "
-        "Use this for finding code snippets, function definitions, or references across the codebase. "
+        "Use this for finding code snippets, function definitions, or "
+        "references across the codebase. "
         "It is much faster than standard file reading."
     )
     args_schema: Type[BaseModel] = RipGrepInput
 
-    def _run(
-        self, 
-        pattern: str, 
-        path: str = ".", 
-        case_sensitive: bool = False, 
-        fixed_strings: bool = False,
-        glob_include: Optional[str] = None,
-        context: int = 0
-    ) -> str:
-        rg = RipGrepSearch()
-        result = rg.search(pattern, path, case_sensitive, fixed_strings, glob_include, context)
-        
+    @staticmethod
+    def _format_result(result: Dict[str, Any]) -> str:
         if not result["success"]:
             return f"Search Error: {result['error']}"
-            
+
         if result["count"] == 0:
+            if result.get("timed_out"):
+                return "No matches found before the search timed out."
             return "No matches found."
-            
+
         output = [f"Found {result['count']} matches:"]
         for match in result["matches"]:
             output.append(f"{match['file']}:{match['line_number']}  {match['content']}")
-            
-        if result.get("truncated"):
+
+        if result.get("timed_out"):
+            output.append("... (search timed out, results incomplete)")
+        elif result.get("truncated"):
             output.append("... (results truncated)")
-            
+
         return "\n".join(output)
+
+    def _run(
+        self,
+        pattern: str,
+        path: str = ".",
+        case_sensitive: bool = False,
+        fixed_strings: bool = False,
+        glob_include: Optional[str] = None,
+        context: int = 0
+    ) -> str:
+        rg = RipGrepSearch()
+        result = rg.search(
+            pattern, path, case_sensitive, fixed_strings, glob_include, context
+        )
+        return self._format_result(result)
+
+    async def _arun(
+        self,
+        pattern: str,
+        path: str = ".",
+        case_sensitive: bool = False,
+        fixed_strings: bool = False,
+        glob_include: Optional[str] = None,
+        context: int = 0
+    ) -> str:
+        rg = RipGrepSearch()
+        result = await rg.asearch(
+            pattern, path, case_sensitive, fixed_strings, glob_include, context
+        )
+        return self._format_result(result)
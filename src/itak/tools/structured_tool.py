@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any, get_type_hints
 from pydantic import BaseModel, Field, create_model
 
 from itak.utilities.logger import Logger
+from itak.utilities.prompt_cache import tool_args_properties
 
 
 if TYPE_CHECKING:
@@ -292,7 +293,7 @@ class CrewStructuredTool:
     @property
     def args(self) -> dict:
         """Get the tool's input arguments schema."""
-        return self.args_schema.model_json_schema()["properties"]
+        return tool_args_properties(self.args_schema)
 
     def __repr__(self) -> str:
         return (
@@ -21,6 +21,9 @@ from itak.events.types.tool_usage_events import (
     ToolValidateInputErrorEvent,
 )
 from itak.telemetry.telemetry import Telemetry
+from itak.tools.agent_tools.delegate_work_parallel_tool import (
+    DELEGATE_WORK_PARALLEL_TOOL_NAME,
+)
 from itak.tools.structured_tool import CrewStructuredTool
 from itak.tools.tool_calling import InstructorToolCalling, ToolCalling
 from itak.utilities.agent_utils import (
@@ -241,7 +244,7 @@ class ToolUsage:
                 if self.task:
                     self.task.increment_tools_errors()
 
-        if self.agent:
+        if self.agent and iTaK_event_bus.has_handlers(ToolUsageStartedEvent):
             event_data = {
                 "agent_key": self.agent.key,
                 "agent_role": self.agent.role,
@@ -306,6 +309,19 @@ class ToolUsage:
                     )
                     if self.task:
                         self.task.increment_delegations(coworker)
+                elif calling.tool_name == DELEGATE_WORK_PARALLEL_TOOL_NAME:
+                    delegations = (
+                        calling.arguments.get("delegations")
+                        if calling.arguments
+                        else None
+                    )
+                    if self.task and isinstance(delegations, list):
+                        for delegation in delegations:
+                            self.task.increment_delegations(
+                                delegation.get("coworker")
+                                if isinstance(delegation, dict)
+                                else None
+                            )
 
                 if calling.arguments:
                     try:
@@ -428,7 +444,7 @@ class ToolUsage:
                 if self.task:
                     self.task.increment_tools_errors()
 
-        if self.agent:
+        if self.agent and iTaK_event_bus.has_handlers(ToolUsageStartedEvent):
             event_data = {
                 "agent_key": self.agent.key,
                 "agent_role": self.agent.role,
@@ -496,6 +512,19 @@ class ToolUsage:
                     )
                     if self.task:
                         self.task.increment_delegations(coworker)
+                elif calling.tool_name == DELEGATE_WORK_PARALLEL_TOOL_NAME:
+                    delegations = (
+                        calling.arguments.get("delegations")
+                        if calling.arguments
+                        else None
+                    )
+                    if self.task and isinstance(delegations, list):
+                        for delegation in delegations:
+                            self.task.increment_delegations(
+                                delegation.get("coworker")
+                                if isinstance(delegation, dict)
+                                else None
+                            )
 
                 if calling.arguments:
                     try:
@@ -879,6 +908,8 @@ class ToolUsage:
         started_at: float,
         result: Any,
     ) -> None:
+        if not iTaK_event_bus.has_handlers(ToolUsageFinishedEvent):
+            return
         finished_at = time.time()
         event_data = self._prepare_event_data(tool, tool_calling)
         event_data.update(
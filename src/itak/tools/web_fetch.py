@@ -0,0 +1,551 @@
+"""Shared web fetching layer for tools.
+
+A single ``WebFetcher`` keeps pooled keep-alive connections, limits how many
+requests run against one host at a time, revalidates cached pages with
+conditional GETs (ETag / Last-Modified) and parses HTML while it streams,
+stopping once a byte budget is reached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+import codecs
+from dataclasses import asdict, dataclass, field
+import hashlib
+from html.parser import HTMLParser
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import tempfile
+import threading
+from typing import Any
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import httpx
+from pydantic import BaseModel, Field
+
+from itak.llms.client_registry import TransportConfig
+from itak.tools.base_tool import BaseTool
+from itak.utilities.paths import db_storage_path
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_TIMEOUT = 20.0
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_USER_AGENT = "iTaK-WebFetch/1.0"
+
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template", "svg", "head"})
+_BLOCK_TAGS = frozenset(
+    {
+        "p", "div", "br", "li", "tr", "section", "article", "header", "footer",
+        "h1", "h2", "h3", "h4", "h5", "h6", "pre", "table", "ul", "ol", "blockquote",
+    }
+)  # fmt: skip
+_NO_CACHE = {"Cache-Control": "no-cache"}
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+_SPACES = re.compile(r"[ \t\r\f\v]+")
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one URL.
+
+    Attributes:
+        url: Final URL after redirects.
+        status_code: HTTP status of the response (200 for cache revalidations).
+        text: Readable text; HTML is reduced to its visible text.
+        links: Absolute links found in an HTML page, without fragments.
+        content_type: Response media type.
+        from_cache: The server answered 304 and the cached copy was used.
+        truncated: The body exceeded the byte limit and was cut off.
+        error: Error message when the request failed.
+    """
+
+    url: str
+    status_code: int = 0
+    text: str = ""
+    links: list[str] = field(default_factory=list)
+    content_type: str = ""
+    from_cache: bool = False
+    truncated: bool = False
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status_code < 300
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Incremental HTML parser collecting visible text and links."""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.links: list[str] = []
+        self._seen_links: set[str] = set()
+        self._parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href and not href.startswith(("javascript:", "mailto:", "#")):
+                link = urldefrag(urljoin(self.base_url, href))[0]
+                if link not in self._seen_links:
+                    self._seen_links.add(link)
+                    self.links.append(link)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in _BLOCK_TAGS:
+            self._parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._parts.append(data)
+
+    def text(self) -> str:
+        text = _SPACES.sub(" ", "".join(self._parts))
+        lines = (line.strip() for line in text.split("\n"))
+        return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+class ResponseCache:
+    """On-disk cache of fetched pages and their revalidation headers.
+
+    Entries are stored as one JSON file per URL, written atomically, so
+    concurrent fetchers and processes never observe partial entries.
+
+    Args:
+        directory: Cache directory. Defaults to ``web_cache`` in the iTaK
+            storage directory.
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = Path(directory or Path(db_storage_path()) / "web_cache")
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        try:
+            return json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, url: str, entry: dict[str, Any]) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, self._path(url))
+        except OSError:
+            logger.debug("Could not write web cache entry for %s", url)
+            Path(tmp).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+class WebFetcher:
+    """Pooled, cache-aware HTTP fetcher shared by web tools.
+
+    Args:
+        cache: Response cache for conditional GETs; ``None`` disables caching.
+        max_bytes: Bytes read per response before the body is cut off.
+        timeout: Request timeout in seconds.
+        max_per_host: Concurrent async requests allowed per host.
+        max_concurrency: Concurrent async requests allowed overall.
+        transport_config: Connection pool settings.
+        headers: Extra headers sent with every request.
+        transport: Optional sync httpx transport (e.g. for proxies or tests).
+        async_transport: Optional async httpx transport.
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        transport_config: TransportConfig | None = None,
+        headers: dict[str, str] | None = None,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        self.max_concurrency = max_concurrency
+        self.transport_config = transport_config or TransportConfig()
+        self.headers = {"User-Agent": DEFAULT_USER_AGENT, **(headers or {})}
+        self._transport = transport
+        self._async_transport = async_transport
+        self._client: httpx.Client | None = None
+        self._async_state: dict[int, _LoopState] = {}
+        self._lock = threading.Lock()
+
+    def _sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    transport=self._transport,
+                    limits=self.transport_config.limits(),
+                    http2=self.transport_config.http2 and self._transport is None,
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    follow_redirects=True,
+                )
+            return self._client
+
+    def _loop_state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for key in [k for k, s in self._async_state.items() if s.loop.is_closed()]:
+                del self._async_state[key]
+            state = self._async_state.get(id(loop))
+            if state is None:
+                transport = self._async_transport
+                client = httpx.AsyncClient(
+                    transport=transport,
+                    limits=self.transport_config.limits(),
+                    http2=self.transport_config.http2 and transport is None,
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    follow_redirects=True,
+                )
+                state = _LoopState(
+                    loop, client, asyncio.Semaphore(self.max_concurrency)
+                )
+                self._async_state[id(loop)] = state
+            return state
+
+    def _conditional_headers(
+        self, url: str
+    ) -> tuple[dict[str, str], dict[str, Any] | None]:
+        cached = self.cache.get(url) if self.cache else None
+        if cached is not None and _cached_result(cached) is None:
+            cached = None  # unreadable entry; fetch the page unconditionally
+        headers: dict[str, str] = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return headers, cached
+
+    def _parse(
+        self, response: httpx.Response, chunks: Iterable[bytes]
+    ) -> FetchResult:
+        """Decode and parse a streamed body until the byte limit is reached."""
+        url = str(response.url)
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        is_html = content_type in ("text/html", "application/xhtml+xml", "")
+        decoder = codecs.getincrementaldecoder(response.charset_encoding or "utf-8")(
+            errors="replace"
+        )
+        parser = _HTMLTextExtractor(url) if is_html else None
+        parts: list[str] = []
+        received = 0
+        truncated = False
+
+        for chunk in chunks:
+            if received + len(chunk) > self.max_bytes:
+                chunk = chunk[: self.max_bytes - received]
+                truncated = True
+            received += len(chunk)
+            text = decoder.decode(chunk)
+            if parser is not None:
+                parser.feed(text)
+            else:
+                parts.append(text)
+            if truncated:
+                break
+
+        tail = decoder.decode(b"", final=True)
+        if parser is not None:
+            parser.feed(tail)
+            parser.close()
+            body, links = parser.text(), parser.links
+        else:
+            body, links = "".join(parts) + tail, []
+
+        return FetchResult(
+            url=url,
+            status_code=response.status_code,
+            text=body,
+            links=links,
+            content_type=content_type,
+            truncated=truncated,
+        )
+
+    def _finish(
+        self,
+        requested_url: str,
+        response: httpx.Response,
+        cached: dict[str, Any] | None,
+        chunks: Iterable[bytes] | None,
+    ) -> FetchResult:
+        if response.status_code == 304 and cached:
+            result = _cached_result(cached)
+            if result is not None:
+                return result
+        if chunks is None:
+            return FetchResult(url=str(response.url), status_code=response.status_code)
+
+        result = self._parse(response, chunks)
+        if response.is_error:
+            result.error = f"HTTP {response.status_code}"
+        elif self.cache is not None:
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+            if etag or last_modified:
+                self.cache.put(
+                    requested_url,
+                    {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "result": asdict(result),
+                    },
+                )
+        return result
+
+    def fetch(self, url: str) -> FetchResult:
+        """Fetch one URL over the shared connection pool."""
+        headers, cached = self._conditional_headers(url)
+        client = self._sync_client()
+        try:
+            with client.stream("GET", url, headers=headers) as response:
+                if response.status_code != 304:
+                    return self._finish(url, response, cached, response.iter_bytes())
+                if headers:
+                    return self._finish(url, response, cached, None)
+            # A 304 to a request without validators (e.g. from an intermediate
+            # cache) leaves nothing to serve; ask for a fresh copy instead.
+            logger.debug("Got 304 for %s without a cached copy, refetching", url)
+            with client.stream("GET", url, headers=_NO_CACHE) as response:
+                return self._finish(url, response, None, response.iter_bytes())
+        except httpx.HTTPError as e:
+            return FetchResult(url=url, error=str(e) or type(e).__name__)
+
+    async def afetch(self, url: str) -> FetchResult:
+        """Fetch one URL asynchronously, honoring the concurrency limits."""
+        state = self._loop_state()
+        host = urlparse(url).netloc
+        host_limit = state.host_semaphore(host, self.max_per_host)
+        headers, cached = await asyncio.to_thread(self._conditional_headers, url)
+        try:
+            async with state.semaphore, host_limit:
+                async with state.client.stream("GET", url, headers=headers) as response:
+                    not_modified = response.status_code == 304
+                    if not_modified and headers:
+                        return self._finish(url, response, cached, None)
+                    body = None if not_modified else await self._aread(response)
+                if body is None:
+                    # See fetch(): an unsolicited 304 leaves nothing to serve.
+                    cached = None
+                    async with state.client.stream(
+                        "GET", url, headers=_NO_CACHE
+                    ) as response:
+                        body = await self._aread(response)
+            return await asyncio.to_thread(self._finish, url, response, cached, body)
+        except httpx.HTTPError as e:
+            return FetchResult(url=url, error=str(e) or type(e).__name__)
+
+    async def _aread(self, response: httpx.Response) -> list[bytes]:
+        """Read a streamed body up to one chunk past the byte limit."""
+        chunks: list[bytes] = []
+        received = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            received += len(chunk)
+            if received > self.max_bytes:
+                break
+        return chunks
+
+    async def afetch_many(self, urls: Iterable[str]) -> list[FetchResult]:
+        """Fetch many URLs concurrently; results are in input order."""
+        return list(await asyncio.gather(*(self.afetch(url) for url in urls)))
+
+    async def acrawl(
+        self,
+        start_url: str,
+        max_pages: int = 200,
+        path_prefix: str | None = None,
+    ) -> list[FetchResult]:
+        """Crawl pages linked from ``start_url`` on the same host.
+
+        Pages are fetched breadth-first, one level at a time, each level in
+        parallel. Unchanged pages are served from the cache after a 304.
+
+        Args:
+            start_url: First page to fetch.
+            max_pages: Maximum number of pages to fetch.
+            path_prefix: Only follow links whose path starts with this prefix;
+                defaults to the directory of ``start_url``.
+
+        Returns:
+            Fetched pages in crawl order.
+        """
+        start = urlparse(start_url)
+        if path_prefix is None:
+            path_prefix = start.path.rsplit("/", 1)[0] + "/"
+
+        seen = {start_url}
+        frontier = [start_url]
+        pages: list[FetchResult] = []
+        while frontier and len(pages) < max_pages:
+            batch = frontier[: max_pages - len(pages)]
+            frontier = []
+            for page in await self.afetch_many(batch):
+                pages.append(page)
+                for link in page.links:
+                    parsed = urlparse(link)
+                    if (
+                        link not in seen
+                        and parsed.netloc == start.netloc
+                        and parsed.path.startswith(path_prefix)
+                    ):
+                        seen.add(link)
+                        frontier.append(link)
+        return pages
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running event loop.
+
+        Call this before the loop ends (e.g. at the end of the coroutine
+        passed to ``asyncio.run``); a client whose loop is already closed can
+        no longer shut its connections down cleanly.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._async_state.pop(id(loop), None)
+        if state is not None:
+            await state.client.aclose()
+
+    def close(self) -> None:
+        """Close pooled connections.
+
+        Each async client is closed on its own event loop: right away if the
+        loop is idle, through a scheduled task if it is running.
+        """
+        with self._lock:
+            client, self._client = self._client, None
+            states, self._async_state = list(self._async_state.values()), {}
+        if client is not None:
+            client.close()
+        for state in states:
+            state.close()
+
+
+class _LoopState:
+    """Async client and semaphores bound to one event loop."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        self.loop = loop
+        self.client = client
+        self.semaphore = semaphore
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    def host_semaphore(self, host: str, limit: int) -> asyncio.Semaphore:
+        semaphore = self._hosts.get(host)
+        if semaphore is None:
+            semaphore = self._hosts[host] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def close(self) -> None:
+        """Close the client from any thread, on the loop that owns it."""
+        loop = self.loop
+        if loop.is_closed():
+            return
+        if not loop.is_running():
+            loop.run_until_complete(self.client.aclose())
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            task = loop.create_task(self.client.aclose())
+            _closing_tasks.add(task)
+            task.add_done_callback(_closing_tasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(self.client.aclose(), loop)
+
+
+# Keeps client shutdowns scheduled on a running loop from being collected.
+_closing_tasks: set[asyncio.Task[None]] = set()
+
+
+def _cached_result(cached: dict[str, Any]) -> FetchResult | None:
+    """Rebuild a cached page, or None if the entry is unusable."""
+    try:
+        result = FetchResult(**cached["result"])
+    except (KeyError, TypeError):
+        return None
+    result.from_cache = True
+    return result
+
+
+_default_fetcher: WebFetcher | None = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_web_fetcher() -> WebFetcher:
+    """Return the process-wide ``WebFetcher`` with an on-disk response cache."""
+    global _default_fetcher
+    if _default_fetcher is None:
+        with _default_fetcher_lock:
+            if _default_fetcher is None:
+                _default_fetcher = WebFetcher(cache=ResponseCache())
+    return _default_fetcher
+
+
+def _iter_text(result: FetchResult) -> Iterator[str]:
+    if not result.ok:
+        yield f"Error fetching {result.url}: {result.error or result.status_code}"
+        return
+    yield result.text
+    if result.truncated:
+        yield "... (page truncated)"
+
+
+class WebFetchInput(BaseModel):
+    """Input schema for WebFetchTool."""
+
+    url: str = Field(..., description="The URL of the web page to read.")
+
+
+class WebFetchTool(BaseTool):
+    name: str = "Read website content"
+    description: str = (
+        "Fetches a web page and returns its readable text. "
+        "Use this to read the content of a specific URL."
+    )
+    args_schema: type[BaseModel] = WebFetchInput
+
+    def _run(self, url: str) -> str:
+        return "\n".join(_iter_text(get_web_fetcher().fetch(url)))
+
+    async def _arun(self, url: str) -> str:
+        return "\n".join(_iter_text(await get_web_fetcher().afetch(url)))
@@ -17,6 +17,7 @@ class UsageMetrics(BaseModel):
         cached_prompt_tokens: Number of cached prompt tokens used.
         completion_tokens: Number of tokens used in completions.
         successful_requests: Number of successful requests made.
+        cached_responses: Number of requests served from the LLM response cache.
     """
 
     total_tokens: int = Field(default=0, description="Total number of tokens used.")
@@ -32,6 +33,10 @@ class UsageMetrics(BaseModel):
     successful_requests: int = Field(
         default=0, description="Number of successful requests made."
     )
+    cached_responses: int = Field(
+        default=0,
+        description="Number of requests served from the LLM response cache.",
+    )
 
     def add_usage_metrics(self, usage_metrics: Self) -> None:
         """Add usage metrics from another UsageMetrics object.
@@ -44,3 +49,4 @@ class UsageMetrics(BaseModel):
         self.cached_prompt_tokens += usage_metrics.cached_prompt_tokens
         self.completion_tokens += usage_metrics.completion_tokens
         self.successful_requests += usage_metrics.successful_requests
+        self.cached_responses += usage_metrics.cached_responses
@@ -27,6 +27,7 @@ from itak.utilities.exceptions.context_window_exceeding_exception import (
 )
 from itak.utilities.i18n import I18N
 from itak.utilities.printer import ColoredText, Printer
+from itak.utilities.token_accounting import get_token_accountant
 from itak.utilities.token_counter_callback import TokenCalcHandler
 from itak.utilities.types import LLMMessage
 
@@ -260,8 +261,11 @@ def get_llm_response(
     """
 
     if executor_context is not None:
-        if not _setup_before_llm_call_hooks(executor_context, printer):
+        hook_result = _setup_before_llm_call_hooks(executor_context, printer)
+        if hook_result is False:
             raise ValueError("LLM call blocked by before_llm_call hook")
+        if isinstance(hook_result, str):
+            return _setup_after_llm_call_hooks(executor_context, hook_result, printer)
         messages = executor_context.messages
 
     try:
@@ -314,8 +318,11 @@ async def aget_llm_response(
         ValueError: If the response is None or empty.
     """
     if executor_context is not None:
-        if not _setup_before_llm_call_hooks(executor_context, printer):
+        hook_result = _setup_before_llm_call_hooks(executor_context, printer)
+        if hook_result is False:
             raise ValueError("LLM call blocked by before_llm_call hook")
+        if isinstance(hook_result, str):
+            return _setup_after_llm_call_hooks(executor_context, hook_result, printer)
         messages = executor_context.messages
 
     try:
@@ -475,6 +482,19 @@ def is_context_length_exceeded(exception: Exception) -> bool:
     )
 
 
+def exceeds_context_window(messages: list[LLMMessage], llm: LLM | BaseLLM) -> bool:
+    """Check locally whether messages would overflow the LLM's context window.
+
+    Args:
+        messages: Messages about to be sent
+        llm: LLM the messages are meant for
+
+    Returns:
+        bool: True if the estimated prompt size exceeds the usable context window
+    """
+    return not get_token_accountant().fits(messages, llm)
+
+
 def handle_context_length(
     respect_context_window: bool,
     printer: Printer,
@@ -527,11 +547,14 @@ def summarize_messages(
         i18n: I18N instance for messages
     """
     messages_string = " ".join([message["content"] for message in messages])  # type: ignore[misc]
-    cut_size = llm.get_context_window_size()
+    # Leave half the window for the summarizer instructions and its answer.
+    cut_size = max(1, llm.get_context_window_size() // 2)
 
     messages_groups = [
-        {"content": messages_string[i : i + cut_size]}
-        for i in range(0, len(messages_string), cut_size)
+        {"content": group}
+        for group in get_token_accountant().split(
+            messages_string, cut_size, getattr(llm, "model", None)
+        )
     ]
 
     summarized_contents: list[SummaryContent] = []
@@ -728,7 +751,7 @@ def load_agent_from_repository(from_repository: str) -> dict[str, Any]:
 
 def _setup_before_llm_call_hooks(
     executor_context: CrewAgentExecutor | LiteAgent | None, printer: Printer
-) -> bool:
+) -> bool | str:
     """Setup and invoke before_llm_call hooks for the executor context.
 
     Args:
@@ -736,7 +759,9 @@ def _setup_before_llm_call_hooks(
         printer: Printer instance for error logging.
 
     Returns:
-        True if LLM execution should proceed, False if blocked by a hook.
+        True if LLM execution should proceed, False if blocked by a hook, or
+        the response string a hook set on the context (e.g. a cache hit), in
+        which case the LLM call should be skipped.
     """
     if executor_context and executor_context.before_llm_call_hooks:
         from itak.hooks.llm_hooks import LLMCallHookContext
@@ -773,6 +798,9 @@ def _setup_before_llm_call_hooks(
             else:
                 executor_context.messages = []
 
+        if isinstance(hook_context.response, str):
+            return hook_context.response
+
     return True
 
 
@@ -9,14 +9,19 @@ Based on the metrics.py from iTaK's this.md specification.
 
 import time
 import json
+import logging
 import os
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Optional
 from functools import wraps
 from dataclasses import dataclass, field
 
 
+logger = logging.getLogger(__name__)
+
+
 class CircuitState(Enum):
     """Circuit breaker states."""
     CLOSED = "closed"      # Normal operation
@@ -34,10 +39,13 @@ class CircuitStats:
     total_calls: int = 0
     
 
-@dataclass 
+@dataclass
 class CircuitBreaker:
     """Circuit breaker implementation for self-healing.
-    
+
+    State changes are thread-safe and timed with a monotonic clock, so
+    wall-clock adjustments cannot keep a circuit open or close it early.
+
     Attributes:
         name: Identifier for this circuit
         failure_threshold: Number of failures before opening
@@ -46,76 +54,116 @@ class CircuitBreaker:
     """
     name: str
     failure_threshold: int = 3
-    recovery_timeout: int = 30
+    recovery_timeout: float = 30
     half_open_max_calls: int = 1
-    
+
     state: CircuitState = field(default=CircuitState.CLOSED)
     stats: CircuitStats = field(default_factory=CircuitStats)
     _half_open_calls: int = field(default=0)
-    _opened_at: Optional[datetime] = field(default=None)
-    
+    _opened_at: Optional[float] = field(default=None)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
     def __post_init__(self):
         self.stats = CircuitStats()
         self._half_open_calls = 0
         self._opened_at = None
-    
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+
     def can_execute(self) -> bool:
         """Check if the circuit allows execution."""
-        if self.state == CircuitState.CLOSED:
-            return True
-        
-        if self.state == CircuitState.OPEN:
-            # Check if recovery timeout has elapsed
-            if self._opened_at and datetime.now() > self._opened_at + timedelta(seconds=self.recovery_timeout):
-                self.state = CircuitState.HALF_OPEN
-                self._half_open_calls = 0
-                print(f"🔄 [{self.name}] Circuit entering HALF-OPEN state (testing recovery)")
+        with self._lock:
+            if self.state == CircuitState.CLOSED:
                 return True
+
+            if self.state == CircuitState.OPEN:
+                # Check if recovery timeout has elapsed
+                if (
+                    self._opened_at is not None
+                    and time.monotonic() - self._opened_at >= self.recovery_timeout
+                ):
+                    self.state = CircuitState.HALF_OPEN
+                    self._half_open_calls = 0
+                    logger.info(
+                        "[%s] Circuit entering HALF-OPEN state (testing recovery)",
+                        self.name,
+                    )
+                    return True
+                return False
+
+            if self.state == CircuitState.HALF_OPEN:
+                return self._half_open_calls < self.half_open_max_calls
+
             return False
-        
-        if self.state == CircuitState.HALF_OPEN:
-            return self._half_open_calls < self.half_open_max_calls
-        
-        return False
-    
+
+    def acquire(self) -> bool:
+        """Reserve a call slot, counting half-open trial calls.
+
+        Returns:
+            Whether the call may proceed. Callers that get ``True`` must report
+            the outcome with ``record_success`` or ``record_failure``.
+        """
+        with self._lock:
+            if not self.can_execute():
+                return False
+            if self.state == CircuitState.HALF_OPEN:
+                self._half_open_calls += 1
+            return True
+
+    def release(self) -> None:
+        """Return a slot reserved with ``acquire`` without reporting an outcome.
+
+        For calls abandoned before they finished, which say nothing about the
+        service's health.
+        """
+        with self._lock:
+            if self.state == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
     def record_success(self) -> None:
         """Record a successful call."""
-        self.stats.successes += 1
-        self.stats.total_calls += 1
-        self.stats.last_success_time = datetime.now()
-        
-        if self.state == CircuitState.HALF_OPEN:
-            # Service recovered, close the circuit
-            self.state = CircuitState.CLOSED
-            self.stats.failures = 0
-            print(f"✅ [{self.name}] Circuit CLOSED (service recovered)")
-    
-    def record_failure(self, error: Exception = None) -> None:
+        with self._lock:
+            self.stats.successes += 1
+            self.stats.total_calls += 1
+            self.stats.last_success_time = datetime.now()
+
+            if self.state == CircuitState.HALF_OPEN:
+                # Service recovered, close the circuit
+                self.state = CircuitState.CLOSED
+                self.stats.failures = 0
+                logger.info("[%s] Circuit CLOSED (service recovered)", self.name)
+            elif self.state == CircuitState.CLOSED:
+                self.stats.failures = 0
+
+    def record_failure(self, error: Exception | None = None) -> None:
         """Record a failed call."""
-        self.stats.failures += 1
-        self.stats.total_calls += 1
-        self.stats.last_failure_time = datetime.now()
-        
-        if self.state == CircuitState.HALF_OPEN:
-            # Failed during recovery test, reopen
-            self.state = CircuitState.OPEN
-            self._opened_at = datetime.now()
-            print(f"🚨 [{self.name}] Circuit OPEN (recovery failed)")
-        
-        elif self.state == CircuitState.CLOSED:
-            if self.stats.failures >= self.failure_threshold:
-                self.state = CircuitState.OPEN
-                self._opened_at = datetime.now()
-                print(f"🚨 [{self.name}] Circuit OPEN ({self.stats.failures} failures)")
-    
+        with self._lock:
+            self.stats.failures += 1
+            self.stats.total_calls += 1
+            self.stats.last_failure_time = datetime.now()
+
+            if self.state == CircuitState.HALF_OPEN:
+                # Failed during recovery test, reopen
+                self._open()
+                logger.warning("[%s] Circuit OPEN (recovery failed)", self.name)
+
+            elif self.state == CircuitState.CLOSED:
+                if self.stats.failures >= self.failure_threshold:
+                    self._open()
+                    logger.warning(
+                        "[%s] Circuit OPEN (%d failures): %s",
+                        self.name,
+                        self.stats.failures,
+                        error,
+                    )
+
     def execute(self, func: Callable, *args, **kwargs) -> Any:
         """Execute a function with circuit breaker protection."""
-        if not self.can_execute():
+        if not self.acquire():
             raise CircuitOpenError(f"Circuit '{self.name}' is OPEN - rejecting request")
-        
-        if self.state == CircuitState.HALF_OPEN:
-            self._half_open_calls += 1
-        
+
         try:
             result = func(*args, **kwargs)
             self.record_success()
@@ -123,15 +171,16 @@ class CircuitBreaker:
         except Exception as e:
             self.record_failure(e)
             raise
-    
+
     def reset(self) -> None:
         """Reset the circuit breaker to initial state."""
-        self.state = CircuitState.CLOSED
-        self.stats = CircuitStats()
-        self._half_open_calls = 0
-        self._opened_at = None
-        print(f"🔄 [{self.name}] Circuit RESET")
-    
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.stats = CircuitStats()
+            self._half_open_calls = 0
+            self._opened_at = None
+        logger.info("[%s] Circuit RESET", self.name)
+
     def get_status(self) -> dict:
         """Get current circuit status."""
         return {
@@ -154,11 +203,15 @@ class CircuitOpenError(Exception):
 _circuits: dict[str, CircuitBreaker] = {}
 
 
+_circuits_lock = threading.Lock()
+
+
 def get_circuit(name: str, **kwargs) -> CircuitBreaker:
     """Get or create a named circuit breaker."""
-    if name not in _circuits:
-        _circuits[name] = CircuitBreaker(name=name, **kwargs)
-    return _circuits[name]
+    with _circuits_lock:
+        if name not in _circuits:
+            _circuits[name] = CircuitBreaker(name=name, **kwargs)
+        return _circuits[name]
 
 
 def circuit_protected(circuit_name: str, **circuit_kwargs):
@@ -0,0 +1,268 @@
+"""Concurrent, short-circuiting evaluation of task guardrails.
+
+Tasks with several guardrails used to run them one after another, paying
+one LLM round trip per LLM-backed guardrail. ``GuardrailEngine`` runs
+cheap deterministic guardrails first, then evaluates the LLM-backed ones
+concurrently, stops waiting as soon as one fails, and caches verdicts by
+``(guardrail, output)`` so an output that did not change between retries
+is not judged again.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import contextvars
+from dataclasses import dataclass
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Any, Final
+
+from itak.utilities.guardrail import GuardrailResult, process_guardrail
+from itak.utilities.guardrail_types import GuardrailCallable
+
+
+if TYPE_CHECKING:
+    from itak.agents.agent_builder.base_agent import BaseAgent
+    from itak.task import Task
+    from itak.tasks.task_output import TaskOutput
+
+
+DEFAULT_CACHE_SIZE: Final[int] = 256
+
+OutputApplier = Callable[["TaskOutput", Any], "TaskOutput"]
+
+
+def is_llm_backed(guardrail: GuardrailCallable) -> bool:
+    """Whether a guardrail calls a model (and so is worth running concurrently).
+
+    Guardrails can declare this with an ``llm_backed`` attribute; otherwise
+    any guardrail holding an ``llm`` is treated as LLM-backed.
+    """
+    declared = getattr(guardrail, "llm_backed", None)
+    if declared is not None:
+        return bool(declared)
+    return getattr(guardrail, "llm", None) is not None
+
+
+def _guardrail_key(guardrail: GuardrailCallable) -> str:
+    key = getattr(guardrail, "cache_key", None)
+    if key is not None:
+        return str(key)
+    return f"{type(guardrail).__qualname__}@{id(guardrail):x}"
+
+
+def _output_hash(output: TaskOutput) -> str:
+    return hashlib.sha256(output.raw.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+@dataclass(frozen=True)
+class GuardrailVerdict:
+    """Outcome of evaluating all guardrails against one output.
+
+    Attributes:
+        success: Whether every guardrail passed.
+        output: The output after guardrail transformations were applied.
+        error: Error of the first failing guardrail, in declaration order.
+        failed_index: Index of the failing guardrail, if any.
+    """
+
+    success: bool
+    output: TaskOutput
+    error: str | None = None
+    failed_index: int | None = None
+
+
+class GuardrailEngine:
+    """Evaluates a task's guardrails concurrently with verdict caching.
+
+    Guardrails keep their declared semantics: a guardrail that passes with a
+    transformed result feeds that result to the guardrails declared after
+    it. Transforming guardrails are rare (LLM guardrails pass the output
+    through unchanged), so guardrails are evaluated speculatively against
+    the same output and only those after a transformation are re-run.
+
+    Args:
+        guardrails: Guardrails in declaration order.
+        max_concurrency: Maximum guardrails evaluated at the same time.
+        cheap_first: Run deterministic guardrails, in order, before any
+            LLM-backed guardrail is started.
+        cache_size: Number of verdicts kept.
+    """
+
+    def __init__(
+        self,
+        guardrails: list[GuardrailCallable],
+        max_concurrency: int = 4,
+        cheap_first: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.guardrails = list(guardrails)
+        self.max_concurrency = max(1, max_concurrency)
+        self.cheap_first = cheap_first
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], GuardrailResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+
+    def _stages(self) -> list[list[int]]:
+        indices = list(range(len(self.guardrails)))
+        if not self.cheap_first:
+            return [indices]
+        cheap = [i for i in indices if not is_llm_backed(self.guardrails[i])]
+        costly = [i for i in indices if is_llm_backed(self.guardrails[i])]
+        return [stage for stage in (cheap, costly) if stage]
+
+    def _cached(self, key: tuple[str, str]) -> GuardrailResult | None:
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+            return result
+
+    def _store(self, key: tuple[str, str], result: GuardrailResult) -> None:
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _check(
+        self,
+        index: int,
+        output: TaskOutput,
+        retry_counts: Mapping[int, int],
+        task: Task | None,
+        agent: BaseAgent | None,
+    ) -> GuardrailResult:
+        guardrail = self.guardrails[index]
+        key = (_guardrail_key(guardrail), _output_hash(output))
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        result = process_guardrail(
+            output=output,
+            guardrail=guardrail,
+            retry_count=retry_counts.get(index, 0),
+            event_source=task,
+            from_task=task,
+            from_agent=agent,
+        )
+        self._store(key, result)
+        return result
+
+    def _run_stage(
+        self,
+        stage: list[int],
+        output: TaskOutput,
+        retry_counts: Mapping[int, int],
+        task: Task | None,
+        agent: BaseAgent | None,
+    ) -> tuple[dict[int, GuardrailResult], int | None]:
+        """Evaluate ``stage`` against ``output``.
+
+        Returns:
+            Results by index, and the lowest index of a failed guardrail
+            (``None`` if all passed). Once a guardrail fails, only the
+            guardrails declared before it are still waited for.
+        """
+        results: dict[int, GuardrailResult] = {}
+        concurrent = [i for i in stage if is_llm_backed(self.guardrails[i])]
+        if len(concurrent) < 2 or self.max_concurrency == 1:
+            for index in stage:
+                results[index] = self._check(index, output, retry_counts, task, agent)
+                if not results[index].success:
+                    return results, index
+            return results, None
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(stage)),
+            thread_name_prefix="itak-guardrail",
+        )
+        futures: dict[Future[GuardrailResult], int] = {}
+        try:
+            for index in stage:
+                ctx = contextvars.copy_context()
+                future = executor.submit(
+                    ctx.run, self._check, index, output, retry_counts, task, agent
+                )
+                futures[future] = index
+            pending = set(futures)
+            failed: int | None = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures[future]
+                    results[index] = future.result()
+                    if not results[index].success and (
+                        failed is None or index < failed
+                    ):
+                        failed = index
+                if failed is not None:
+                    pending = {f for f in pending if futures[f] < failed}
+            return results, failed
+        finally:
+            # Short-circuit: unstarted checks are cancelled and running ones
+            # finish in the background (their verdicts still get cached).
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def evaluate(
+        self,
+        output: TaskOutput,
+        apply: OutputApplier,
+        retry_counts: Mapping[int, int] | None = None,
+        task: Task | None = None,
+        agent: BaseAgent | None = None,
+    ) -> GuardrailVerdict:
+        """Evaluate every guardrail against ``output``.
+
+        Args:
+            output: Output to validate.
+            apply: Returns the output after a passing guardrail's result
+                (a new raw string or a ``TaskOutput``) is applied to it.
+            retry_counts: Retry count per guardrail index, reported in
+                guardrail events.
+            task: Task reported as the event source.
+            agent: Agent that produced the output.
+
+        Returns:
+            The verdict, with the transformed output on success.
+        """
+        retry_counts = retry_counts or {}
+        current = output
+        for stage in self._stages():
+            pending = stage
+            while pending:
+                results, failed = self._run_stage(
+                    pending, current, retry_counts, task, agent
+                )
+                if failed is not None:
+                    return GuardrailVerdict(
+                        success=False,
+                        output=current,
+                        error=results[failed].error,
+                        failed_index=failed,
+                    )
+                remaining: list[int] = []
+                for position, index in enumerate(pending):
+                    result = results[index].result
+                    if result is None:
+                        raise Exception(
+                            "Task guardrail returned None as result. "
+                            "This is not allowed."
+                        )
+                    updated = apply(current, result)
+                    if updated is not current:
+                        # Guardrails declared later must see the new output.
+                        current = updated
+                        remaining = pending[position + 1 :]
+                        break
+                pending = remaining
+        return GuardrailVerdict(success=True, output=current)
+
+    def clear_cache(self) -> None:
+        """Forget all cached verdicts."""
+        with self._lock:
+            self._cache.clear()
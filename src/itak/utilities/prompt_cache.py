@@ -0,0 +1,187 @@
+"""Compiled prompt segments and tool renderings reused across tasks.
+
+Building an agent executor renders the same static prompt and the same tool
+descriptions for every task, and every tool construction or ``args`` access
+used to regenerate a pydantic JSON schema. Schemas are cached per schema
+class; rendered tool text and compiled prompts are cached per agent and keyed
+by the toolset and prompt inputs, so a changed tool or template is simply a
+different key.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+import json
+import threading
+from typing import TYPE_CHECKING, Any, Final
+import weakref
+
+from pydantic import BaseModel
+
+from itak.utilities.pydantic_schema_utils import generate_model_description
+
+
+if TYPE_CHECKING:
+    from itak.tools.base_tool import BaseTool
+    from itak.tools.structured_tool import CrewStructuredTool
+    from itak.utilities.prompts import (
+        Prompts,
+        StandardPromptResult,
+        SystemPromptResult,
+    )
+
+
+DEFAULT_MAX_ENTRIES: Final[int] = 32
+
+_schema_lock = threading.Lock()
+_args_json: weakref.WeakKeyDictionary[type[BaseModel], str] = (
+    weakref.WeakKeyDictionary()
+)
+_args_properties: weakref.WeakKeyDictionary[type[BaseModel], dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def tool_args_json(model: type[BaseModel]) -> str:
+    """Return the indented JSON schema shown in a tool's description.
+
+    Args:
+        model: The tool's argument schema.
+    """
+    with _schema_lock:
+        cached = _args_json.get(model)
+    if cached is None:
+        schema = generate_model_description(model)
+        cached = json.dumps(schema["json_schema"]["schema"], indent=2)
+        with _schema_lock:
+            _args_json[model] = cached
+    return cached
+
+
+def tool_args_properties(model: type[BaseModel]) -> dict[str, Any]:
+    """Return the ``properties`` of a tool argument schema.
+
+    Args:
+        model: The tool's argument schema.
+
+    Returns:
+        A fresh dict on every call; nested values are shared with the cache.
+    """
+    with _schema_lock:
+        cached = _args_properties.get(model)
+    if cached is None:
+        cached = model.model_json_schema()["properties"]
+        with _schema_lock:
+            _args_properties[model] = cached
+    return dict(cached)
+
+
+def toolset_signature(
+    tools: Sequence[CrewStructuredTool | BaseTool],
+) -> tuple[tuple[str, str], ...]:
+    """Identify a toolset by what is rendered from it.
+
+    Parsed tools are rebuilt for every task, so the key is their names and
+    descriptions rather than their identity.
+    """
+    return tuple((tool.name, tool.description) for tool in tools)
+
+
+class PromptCompiler:
+    """Caches an agent's compiled prompts and rendered toolsets.
+
+    Args:
+        max_entries: Entries kept per cache; the least recently used go first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._prompts: OrderedDict[
+            tuple[Any, ...], SystemPromptResult | StandardPromptResult
+        ] = OrderedDict()
+        self._toolsets: OrderedDict[tuple[Any, ...], tuple[str, str]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def task_execution(
+        self, prompts: Prompts
+    ) -> SystemPromptResult | StandardPromptResult:
+        """Return ``prompts.task_execution()``, compiled once per input set.
+
+        Args:
+            prompts: The prompt builder of the agent.
+
+        Returns:
+            A copy of the compiled prompt.
+        """
+        agent = prompts.agent
+        key = (
+            id(prompts.i18n),
+            prompts.has_tools,
+            prompts.use_system_prompt,
+            prompts.system_template,
+            prompts.prompt_template,
+            prompts.response_template,
+            agent.role,
+            agent.goal,
+            agent.backstory,
+        )
+        compiled = self._get(self._prompts, key)
+        if compiled is None:
+            compiled = prompts.task_execution()
+            self._put(self._prompts, key, compiled)
+        return compiled.copy()  # type: ignore[return-value]
+
+    def render_tools(
+        self, tools: Sequence[CrewStructuredTool | BaseTool]
+    ) -> tuple[str, str]:
+        """Return the tool names and tool descriptions shown to the agent.
+
+        Args:
+            tools: The parsed tools of the executor.
+
+        Returns:
+            The comma-separated tool names and the rendered descriptions.
+        """
+        from itak.utilities.agent_utils import (
+            get_tool_names,
+            render_text_description_and_args,
+        )
+
+        key = toolset_signature(tools)
+        rendered = self._get(self._toolsets, key)
+        if rendered is None:
+            rendered = (
+                get_tool_names(tools),
+                render_text_description_and_args(tools),
+            )
+            self._put(self._toolsets, key, rendered)
+        return rendered
+
+    def clear(self) -> None:
+        """Drop every compiled prompt and rendered toolset."""
+        with self._lock:
+            self._prompts.clear()
+            self._toolsets.clear()
+
+    def _get(self, cache: OrderedDict[Any, Any], key: tuple[Any, ...]) -> Any:
+        with self._lock:
+            value = cache.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _put(
+        self, cache: OrderedDict[Any, Any], key: tuple[Any, ...], value: Any
+    ) -> None:
+        with self._lock:
+            cache[key] = value
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
@@ -0,0 +1,366 @@
+"""Offline token accounting for pre-flight context budgeting.
+
+Counting tokens locally lets callers notice that a prompt will not fit the
+model's context window before paying for a round trip that ends in
+``LLMContextLengthExceededError``. Tokenizers are resolved per model:
+
+- ``TiktokenTokenizer`` for OpenAI-style BPE models (requires ``tiktoken``
+  and, for automatic resolution, its encoding file in tiktoken's local
+  cache: resolving a tokenizer never triggers a download)
+- ``SentencePieceTokenizer`` for models shipping a sentencepiece file
+  (requires ``sentencepiece``, registered explicitly)
+- ``HeuristicTokenizer`` as a dependency-free fallback for everything else
+
+Per-message counts are memoized, so re-budgeting a growing conversation only
+pays for the messages that are new.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Final
+
+
+if TYPE_CHECKING:
+    from itak.llms.base_llm import BaseLLM
+    from itak.utilities.types import LLMMessage
+
+
+MESSAGE_OVERHEAD_TOKENS: Final[int] = 4
+REPLY_PRIMING_TOKENS: Final[int] = 3
+IMAGE_PART_TOKENS: Final[int] = 85
+
+_PROVIDER_PREFIXES: Final[tuple[str, ...]] = ("openai/", "azure/", "openrouter/")
+_O200K_MODEL_PREFIXES: Final[tuple[str, ...]] = (
+    "gpt-4o",
+    "gpt-4.1",
+    "gpt-4.5",
+    "gpt-5",
+    "o1",
+    "o3",
+    "o4",
+    "chatgpt-4o",
+)
+_CL100K_MODEL_PREFIXES: Final[tuple[str, ...]] = (
+    "gpt-4",
+    "gpt-3.5",
+    "text-embedding",
+)
+_TIKTOKEN_BLOB_URL: Final[str] = (
+    "https://openaipublic.blob.core.windows.net/encodings/{}.tiktoken"
+)
+# Message fields besides role and content that the API sends to the model.
+_FRAMED_FIELDS: Final[tuple[str, ...]] = ("name", "tool_call_id", "tool_calls")
+
+
+def _tiktoken_cached_locally(encoding_name: str) -> bool:
+    """Whether tiktoken can load an encoding without downloading it.
+
+    Mirrors the cache lookup of ``tiktoken.load.read_file_cached``.
+    """
+    try:
+        from tiktoken import registry
+    except ImportError:
+        return False
+    if encoding_name in getattr(registry, "ENCODINGS", {}):
+        return True
+
+    cache_dir = os.environ.get(
+        "TIKTOKEN_CACHE_DIR",
+        os.environ.get(
+            "DATA_GYM_CACHE_DIR", os.path.join(tempfile.gettempdir(), "data-gym-cache")
+        ),
+    )
+    if not cache_dir:
+        return False
+    url = _TIKTOKEN_BLOB_URL.format(encoding_name)
+    cache_key = hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest()
+    return os.path.exists(os.path.join(cache_dir, cache_key))
+
+
+class Tokenizer(ABC):
+    """Counts and slices text in a model's token units."""
+
+    name: str
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Return the number of tokens in ``text``."""
+
+    @abstractmethod
+    def split(self, text: str, max_tokens: int) -> list[str]:
+        """Split ``text`` into consecutive pieces of at most ``max_tokens``."""
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Return the longest prefix of ``text`` within ``max_tokens``."""
+        if max_tokens <= 0:
+            return ""
+        pieces = self.split(text, max_tokens)
+        return pieces[0] if pieces else ""
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Character-ratio estimate that needs no vocabulary.
+
+    English prose averages about four characters per BPE token. The estimate
+    costs one ``len`` call, which is what makes it suitable for budgeting hot
+    loops; it is deliberately slightly pessimistic by default.
+    """
+
+    def __init__(self, chars_per_token: float = 3.8) -> None:
+        if chars_per_token <= 0:
+            raise ValueError("chars_per_token must be positive")
+        self.chars_per_token = chars_per_token
+        self.name = f"heuristic:{chars_per_token}"
+
+    def count(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def split(self, text: str, max_tokens: int) -> list[str]:
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        size = max(1, int(max_tokens * self.chars_per_token))
+        return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class _EncodingTokenizer(Tokenizer):
+    """Shared split logic for tokenizers with an exact encode/decode pair."""
+
+    @abstractmethod
+    def _encode(self, text: str) -> list[int]: ...
+
+    @abstractmethod
+    def _decode(self, tokens: list[int]) -> str: ...
+
+    def count(self, text: str) -> int:
+        return len(self._encode(text))
+
+    def split(self, text: str, max_tokens: int) -> list[str]:
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be positive")
+        tokens = self._encode(text)
+        return [
+            self._decode(tokens[i : i + max_tokens])
+            for i in range(0, len(tokens), max_tokens)
+        ]
+
+
+class TiktokenTokenizer(_EncodingTokenizer):
+    """Exact BPE counts for OpenAI-family models via ``tiktoken``."""
+
+    def __init__(self, encoding_name: str = "cl100k_base") -> None:
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError(
+                "tiktoken is required for TiktokenTokenizer, "
+                "to install: uv add tiktoken"
+            ) from None
+
+        self._encoding = tiktoken.get_encoding(encoding_name)
+        self.name = f"tiktoken:{encoding_name}"
+
+    def _encode(self, text: str) -> list[int]:
+        return self._encoding.encode(text, disallowed_special=())
+
+    def _decode(self, tokens: list[int]) -> str:
+        return self._encoding.decode(tokens)
+
+
+class SentencePieceTokenizer(_EncodingTokenizer):
+    """Exact counts for models distributed with a sentencepiece model file."""
+
+    def __init__(self, model_file: str) -> None:
+        try:
+            import sentencepiece
+        except ImportError:
+            raise ImportError(
+                "sentencepiece is required for SentencePieceTokenizer, "
+                "to install: uv add sentencepiece"
+            ) from None
+
+        self._processor = sentencepiece.SentencePieceProcessor(model_file=model_file)
+        self.name = f"sentencepiece:{model_file}"
+
+    def _encode(self, text: str) -> list[int]:
+        return self._processor.encode(text)
+
+    def _decode(self, tokens: list[int]) -> str:
+        return self._processor.decode(tokens)
+
+
+class TokenAccountant:
+    """Resolves tokenizers per model and budgets messages against a context window.
+
+    Args:
+        cache_size: Maximum number of memoized per-message counts.
+        fallback: Tokenizer used when no exact tokenizer applies to a model.
+    """
+
+    def __init__(
+        self, cache_size: int = 8192, fallback: Tokenizer | None = None
+    ) -> None:
+        self.cache_size = cache_size
+        self.fallback = fallback or HeuristicTokenizer()
+        self._registered: list[tuple[str, Tokenizer]] = []
+        self._resolved: dict[str, Tokenizer] = {}
+        self._counts: OrderedDict[tuple[Any, ...], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, model_prefix: str, tokenizer: Tokenizer) -> None:
+        """Use ``tokenizer`` for every model whose name starts with ``model_prefix``.
+
+        Longer prefixes win over shorter ones.
+        """
+        with self._lock:
+            self._registered.append((model_prefix, tokenizer))
+            self._registered.sort(key=lambda item: len(item[0]), reverse=True)
+            self._resolved.clear()
+            self._counts.clear()
+
+    def tokenizer_for(self, model: str | None) -> Tokenizer:
+        """Return the tokenizer for ``model``, falling back to the heuristic."""
+        if not model:
+            return self.fallback
+
+        tokenizer = self._resolved.get(model)
+        if tokenizer is None:
+            tokenizer = self._resolve(model)
+            with self._lock:
+                self._resolved[model] = tokenizer
+        return tokenizer
+
+    def _resolve(self, model: str) -> Tokenizer:
+        for prefix, tokenizer in self._registered:
+            if model.startswith(prefix):
+                return tokenizer
+
+        name = model
+        for provider in _PROVIDER_PREFIXES:
+            if name.startswith(provider):
+                name = name[len(provider) :]
+                break
+
+        encoding = None
+        if name.startswith(_O200K_MODEL_PREFIXES):
+            encoding = "o200k_base"
+        elif name.startswith(_CL100K_MODEL_PREFIXES):
+            encoding = "cl100k_base"
+
+        # tiktoken downloads encodings on first use; budgeting must never
+        # block on the network, so estimate unless the file is already local.
+        if encoding is not None and _tiktoken_cached_locally(encoding):
+            try:
+                return TiktokenTokenizer(encoding)
+            except Exception:  # noqa: S110
+                pass
+        return self.fallback
+
+    def count_text(self, text: str, model: str | None = None) -> int:
+        """Count tokens in a plain string."""
+        return self.tokenizer_for(model).count(text)
+
+    def count_message(self, message: LLMMessage, model: str | None = None) -> int:
+        """Count tokens in a single chat message, including framing overhead."""
+        tokenizer = self.tokenizer_for(model)
+        content = message.get("content") or ""
+        role = message.get("role", "")
+        # Tool calls of assistant messages and the ids of tool results are
+        # sent to the model too; they are short, so serializing them is cheap.
+        framed = {
+            field: message[field]  # type: ignore[literal-required]
+            for field in _FRAMED_FIELDS
+            if message.get(field)
+        }
+        extra = json.dumps(framed, sort_keys=True, default=str) if framed else ""
+
+        if isinstance(content, str):
+            # str caches its own hash, so repeat lookups for a message that is
+            # still in the conversation cost O(1) regardless of its length.
+            key: tuple[Any, ...] = (
+                tokenizer.name, role, extra, len(content), hash(content)
+            )
+        else:
+            serialized = json.dumps(content, sort_keys=True, default=str)
+            key = (tokenizer.name, role, extra, len(serialized), hash(serialized))
+
+        cached = self._counts.get(key)
+        if cached is not None:
+            return cached
+
+        tokens = MESSAGE_OVERHEAD_TOKENS + tokenizer.count(role)
+        if extra:
+            tokens += tokenizer.count(extra)
+        if isinstance(content, str):
+            tokens += tokenizer.count(content)
+        else:
+            for part in content:
+                if isinstance(part, dict) and isinstance(part.get("text"), str):
+                    tokens += tokenizer.count(part["text"])
+                else:
+                    tokens += IMAGE_PART_TOKENS
+
+        with self._lock:
+            self._counts[key] = tokens
+            if len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def count_messages(
+        self, messages: list[LLMMessage], model: str | None = None
+    ) -> int:
+        """Count tokens for a full prompt, including reply priming."""
+        return REPLY_PRIMING_TOKENS + sum(
+            self.count_message(message, model) for message in messages
+        )
+
+    def remaining(self, messages: list[LLMMessage], llm: BaseLLM) -> int:
+        """Tokens left in ``llm``'s usable context window after ``messages``."""
+        return llm.get_context_window_size() - self.count_messages(
+            messages, getattr(llm, "model", None)
+        )
+
+    def fits(
+        self, messages: list[LLMMessage], llm: BaseLLM, reserve: int = 0
+    ) -> bool:
+        """Whether ``messages`` plus ``reserve`` tokens fit ``llm``'s context window."""
+        return self.remaining(messages, llm) >= reserve
+
+    def truncate(self, text: str, max_tokens: int, model: str | None = None) -> str:
+        """Return the longest prefix of ``text`` within ``max_tokens``."""
+        tokenizer = self.tokenizer_for(model)
+        if tokenizer.count(text) <= max_tokens:
+            return text
+        return tokenizer.truncate(text, max_tokens)
+
+    def split(
+        self, text: str, max_tokens: int, model: str | None = None
+    ) -> list[str]:
+        """Split ``text`` into consecutive pieces of at most ``max_tokens``."""
+        return self.tokenizer_for(model).split(text, max_tokens)
+
+    def clear_cache(self) -> None:
+        """Drop memoized message counts."""
+        with self._lock:
+            self._counts.clear()
+
+
+_default_accountant: TokenAccountant | None = None
+_default_lock = threading.Lock()
+
+
+def get_token_accountant() -> TokenAccountant:
+    """Return the process-wide ``TokenAccountant``."""
+    global _default_accountant
+    if _default_accountant is None:
+        with _default_lock:
+            if _default_accountant is None:
+                _default_accountant = TokenAccountant()
+    return _default_accountant
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+
+pytest.importorskip("a2a")
+
+from itak.a2a.utils.admission import (  # noqa: E402
+    AdmissionController,
+    AdmissionRejectedError,
+)
+
+
+class _FakeAgent:
+    def __init__(self, name: str = "root") -> None:
+        self.id = name
+        self.name = name
+        self.copies = 0
+
+    def copy(self) -> "_FakeAgent":
+        self.copies += 1
+        return _FakeAgent(f"{self.name}-copy{self.copies}")
+
+
+def test_concurrency_is_bounded_and_agents_are_not_shared():
+    controller = AdmissionController(_FakeAgent(), max_concurrency=2)
+    running: set[str] = set()
+    peak = 0
+
+    async def work(agent):
+        nonlocal peak
+        assert agent.name not in running
+        running.add(agent.name)
+        peak = max(peak, len(running))
+        await asyncio.sleep(0.01)
+        running.discard(agent.name)
+        return agent.name
+
+    async def main():
+        return await asyncio.gather(
+            *(controller.run(f"ctx{i}", work) for i in range(8))
+        )
+
+    names = asyncio.run(main())
+
+    assert peak == 2
+    assert set(names) == {"root-copy1", "root-copy2"}
+    snapshot = controller.metrics.snapshot()
+    assert snapshot["completed"] == 8
+    assert snapshot["max_queue_depth"] == 6
+    assert snapshot["in_flight"] == 0
+
+
+def test_full_queue_rejects_with_backpressure():
+    controller = AdmissionController(_FakeAgent(), max_concurrency=1, max_queue_size=1)
+
+    async def main():
+        gate = asyncio.Event()
+
+        async def work(agent):
+            await gate.wait()
+
+        first = asyncio.create_task(controller.run("a", work))
+        second = asyncio.create_task(controller.run("a", work))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            await controller.run("b", work)
+        gate.set()
+        await asyncio.gather(first, second)
+        return excinfo.value
+
+    error = asyncio.run(main())
+
+    assert error.queue_depth == 1
+    assert error.retry_after > 0
+    assert controller.metrics.rejected == 1
+
+
+def test_waiting_requests_are_scheduled_fairly_across_contexts():
+    controller = AdmissionController(_FakeAgent(), max_concurrency=1)
+    order: list[str] = []
+
+    async def main():
+        gate = asyncio.Event()
+
+        async def blocker(agent):
+            await gate.wait()
+
+        def record(label):
+            async def work(agent):
+                order.append(label)
+
+            return work
+
+        first = asyncio.create_task(controller.run("busy", blocker))
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(controller.run("busy", record(f"busy{i}")))
+            for i in range(3)
+        ]
+        tasks.append(asyncio.create_task(controller.run("quiet", record("quiet"))))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, *tasks)
+
+    asyncio.run(main())
+
+    assert order == ["busy0", "quiet", "busy1", "busy2"]
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    controller = AdmissionController(_FakeAgent(), max_concurrency=1)
+
+    async def main():
+        gate = asyncio.Event()
+
+        async def work(agent):
+            await gate.wait()
+
+        running = asyncio.create_task(controller.run("a", work))
+        waiting = asyncio.create_task(controller.run("b", work))
+        await asyncio.sleep(0)
+        assert controller.metrics.queue_depth == 1
+        waiting.cancel()
+        await asyncio.sleep(0)
+        assert controller.metrics.queue_depth == 0
+        gate.set()
+        await running
+
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+
+import pytest
+
+
+pytest.importorskip("a2a")
+
+from itak.a2a.utils.cancellation import CancellationHub, cancel_key  # noqa: E402
+
+
+class _MemoryCache:
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def multi_get(self, keys):
+        return [self.data.get(key) for key in keys]
+
+
+def test_signal_wakes_only_the_cancelled_task_without_polling():
+    cache = _MemoryCache()
+    hub = CancellationHub(cache)
+
+    async def main():
+        events = {task_id: await hub.watch(task_id) for task_id in ("a", "b")}
+        await asyncio.sleep(0.05)
+        assert cache.gets == 2
+        assert hub.signal("a")
+        await asyncio.wait_for(events["a"].wait(), 1)
+        assert not events["b"].is_set()
+        for task_id, event in events.items():
+            hub.unwatch(task_id, event)
+
+    asyncio.run(main())
+    assert hub.watched == 0
+    assert not hub.signal("a")
+
+
+def test_cancellation_before_watch_is_seen():
+    cache = _MemoryCache()
+    hub = CancellationHub(cache)
+
+    async def main():
+        await cache.set(cancel_key("early"), True)
+        event = await hub.watch("early")
+        assert event.is_set()
+        hub.unwatch("early", event)
+
+    asyncio.run(main())
+
+
+def test_signal_from_another_thread():
+    hub = CancellationHub(_MemoryCache())
+
+    async def main():
+        event = await hub.watch("t")
+        threading.Thread(target=hub.signal, args=("t",)).start()
+        await asyncio.wait_for(event.wait(), 1)
+        hub.unwatch("t", event)
+
+    asyncio.run(main())
+
+
+def test_pubsub_uses_one_pattern_subscription():
+    messages: asyncio.Queue = asyncio.Queue()
+    subscriptions: list[str] = []
+
+    class _PubSub:
+        async def psubscribe(self, pattern):
+            subscriptions.append(pattern)
+
+        async def listen(self):
+            while True:
+                yield await messages.get()
+
+    class _Client:
+        def pubsub(self):
+            return _PubSub()
+
+    cache = _MemoryCache()
+    cache.client = _Client()
+    hub = CancellationHub(cache, pubsub=True)
+
+    async def main():
+        events = [await hub.watch(f"task{i}") for i in range(50)]
+        await asyncio.sleep(0)
+        await messages.put({"type": "pmessage", "channel": b"cancel:task7"})
+        await asyncio.wait_for(events[7].wait(), 1)
+        assert sum(event.is_set() for event in events) == 1
+        await hub.aclose()
+
+    asyncio.run(main())
+    assert subscriptions == ["cancel:*"]
@@ -0,0 +1,127 @@
+import asyncio
+import time
+
+import pytest
+
+
+pytest.importorskip("a2a")
+
+from a2a.types import Task, TaskState, TaskStatus  # noqa: E402
+
+from itak.a2a.errors import A2APollingTimeoutError  # noqa: E402
+from itak.a2a.updates.polling.scheduler import (  # noqa: E402
+    PollBackoff,
+    PollingScheduler,
+)
+
+
+def _task(task_id: str, state: TaskState, metadata=None) -> Task:
+    return Task(
+        id=task_id,
+        context_id="ctx",
+        status=TaskStatus(state=state),
+        metadata=metadata,
+    )
+
+
+class _FakeClient:
+    """Remote tasks finish after a given number of polls."""
+
+    def __init__(self, polls_needed: dict[str, int], metadata=None) -> None:
+        self.polls_needed = polls_needed
+        self.metadata = metadata
+        self.calls: list[str] = []
+
+    def _state(self, task_id: str) -> Task:
+        self.calls.append(task_id)
+        done = self.calls.count(task_id) >= self.polls_needed[task_id]
+        state = TaskState.completed if done else TaskState.working
+        return _task(task_id, state, self.metadata)
+
+    async def get_task(self, params):
+        return self._state(params.id)
+
+
+class _BatchingClient(_FakeClient):
+    def __init__(self, polls_needed) -> None:
+        super().__init__(polls_needed)
+        self.batch_sizes: list[int] = []
+
+    async def get_tasks(self, params):
+        self.batch_sizes.append(len(params))
+        return [self._state(p.id) for p in params]
+
+
+def test_short_tasks_finish_well_before_the_max_interval():
+    client = _FakeClient({"t": 3})
+    backoff = PollBackoff(initial_interval=0.01, max_interval=2.0, jitter=0)
+
+    async def main():
+        return await PollingScheduler().poll_until_complete(
+            client, "t", backoff, timeout=10
+        )
+
+    start = time.monotonic()
+    task = asyncio.run(main())
+
+    assert task.status.state == TaskState.completed
+    assert time.monotonic() - start < 0.5
+    assert len(client.calls) == 3
+
+
+def test_backoff_grows_to_the_ceiling_with_jitter():
+    backoff = PollBackoff(initial_interval=0.25, max_interval=2.0, jitter=0.1)
+
+    delays = [backoff.delay(n) for n in range(1, 8)]
+
+    assert 0.225 <= delays[0] <= 0.275
+    assert all(d <= 2.2 for d in delays)
+    assert delays[-1] >= 1.8
+    assert backoff.delay(1, hint=5.0) == 5.0
+
+
+def test_server_hint_overrides_backoff():
+    client = _FakeClient({"t": 2}, metadata={"poll_interval": 0.0})
+    backoff = PollBackoff(initial_interval=5.0, max_interval=5.0, jitter=0)
+
+    async def main():
+        return await asyncio.wait_for(
+            PollingScheduler().poll_until_complete(client, "t", backoff, timeout=10),
+            1,
+        )
+
+    assert asyncio.run(main()).status.state == TaskState.completed
+
+
+def test_due_polls_are_batched_per_client():
+    client = _BatchingClient({f"t{i}": 2 for i in range(5)})
+    backoff = PollBackoff(initial_interval=0.01, max_interval=0.01, jitter=0)
+    scheduler = PollingScheduler()
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                scheduler.poll_until_complete(client, f"t{i}", backoff, timeout=10)
+                for i in range(5)
+            )
+        )
+
+    tasks = asyncio.run(main())
+
+    assert all(t.status.state == TaskState.completed for t in tasks)
+    assert client.batch_sizes == [5, 5]
+    assert scheduler.requests == 2
+
+
+def test_max_polls_raises_timeout():
+    client = _FakeClient({"t": 100})
+    backoff = PollBackoff(initial_interval=0.001, max_interval=0.001, jitter=0)
+
+    async def main():
+        return await PollingScheduler().poll_until_complete(
+            client, "t", backoff, timeout=10, max_polls=3
+        )
+
+    with pytest.raises(A2APollingTimeoutError):
+        asyncio.run(main())
+    assert len(client.calls) == 3
@@ -0,0 +1,77 @@
+import json
+
+from itak.rag.chunking import StructureAwareChunker, format_for_path
+from itak.utilities.token_accounting import HeuristicTokenizer
+
+
+def test_chunks_respect_token_budget_and_offsets():
+    text = "\n\n".join(f"Paragraph {i}. " + "word " * 40 for i in range(50))
+    chunker = StructureAwareChunker(max_tokens=64)
+
+    chunks = chunker.chunk(text)
+
+    tokenizer = HeuristicTokenizer()
+    assert all(tokenizer.count(c.text) <= 64 for c in chunks)
+    assert all(c.text == text[c.start : c.end] for c in chunks)
+    assert all(c.start < n.start for c, n in zip(chunks, chunks[1:]))
+    assert "".join(text.split()) == "".join(
+        "".join(c.text.split()) for c in chunks
+    )
+
+
+def test_long_line_without_breaks_falls_back_to_words_then_hard_cuts():
+    text = "x" * 1000 + " " + "y" * 10
+    chunks = StructureAwareChunker(max_tokens=50).chunk(text)
+    joined = "".join(c.text for c in chunks)
+    assert joined.replace(" ", "") == text.replace(" ", "")
+    assert all(len(c.text) <= 190 for c in chunks)
+
+
+def test_tiny_budgets_always_make_progress():
+    for max_tokens, overlap in ((1, 0), (2, 1)):
+        chunker = StructureAwareChunker(max_tokens=max_tokens, overlap_tokens=overlap)
+        for text in ("word\nword", "a\n\nb\nc", "one. two\nthree"):
+            chunks = chunker.chunk(text)
+            assert all(c.start < n.start for c, n in zip(chunks, chunks[1:]))
+            assert chunks[-1].end == len(text)
+
+
+def test_markdown_cuts_before_headings_and_keeps_code_fences_whole():
+    text = (
+        "# Guide\n\nIntro text here.\n\n## Install\n\n```\npip install x\n\n"
+        "pip install y\n```\n\n## Usage\n\n" + "Call it with care. " * 3
+    )
+    chunks = StructureAwareChunker(max_tokens=20).chunk(text, "markdown")
+
+    assert [c.metadata["heading_path"] for c in chunks] == [
+        "Guide",
+        "Guide > Install",
+        "Guide > Usage",
+    ]
+    assert chunks[1].text.startswith("## Install")
+    assert chunks[1].text.endswith("```")
+
+
+def test_csv_chunks_repeat_header_and_keep_quoted_rows_intact():
+    rows = "".join(f'{i},"multi\nline {i}"\n' for i in range(30))
+    text = "id,note\n" + rows
+    chunks = StructureAwareChunker(max_tokens=30).chunk(text, "csv")
+
+    assert len(chunks) > 1
+    assert all(c.text.startswith("id,note\n") for c in chunks)
+    body = "".join(c.text[len("id,note\n") :] + "\n" for c in chunks)
+    assert body == rows
+
+
+def test_json_chunks_follow_top_level_members():
+    data = {f"key{i}": {"value": "v" * 40} for i in range(10)}
+    chunks = StructureAwareChunker(max_tokens=30).chunk(json.dumps(data), "json")
+
+    paths = [c.metadata["json_path"] for c in chunks]
+    assert paths == [f"$.key{i}" for i in range(10)]
+
+
+def test_format_for_path():
+    assert format_for_path("docs/README.md") == "markdown"
+    assert format_for_path("data.CSV") == "csv"
+    assert format_for_path("notes.txt") == "text"
@@ -0,0 +1,103 @@
+import asyncio
+
+from itak.llms.client_registry import ClientRegistry
+from itak.llms.providers.openai.completion import OpenAICompletion
+
+
+def test_client_registry_shares_clients_per_config():
+    registry = ClientRegistry()
+    built = []
+
+    def factory(http_client):
+        built.append(http_client)
+        return object()
+
+    first = registry.client("openai", factory, {"api_key": "a"})
+    assert registry.client("openai", factory, {"api_key": "a"}) is first
+    assert registry.client("openai", factory, {"api_key": "b"}) is not first
+    assert len(built) == 2
+
+    async def get_async():
+        return registry.async_client(
+            "openai", lambda http_client: http_client, {"api_key": "a"}
+        )
+
+    async def same_loop():
+        return await get_async(), await get_async()
+
+    one, two = asyncio.run(same_loop())
+    assert one is two
+    assert asyncio.run(get_async()) is not one
+
+    registry.close()
+    assert built[0].is_closed
+
+
+def test_openai_llms_share_sync_client():
+    first = OpenAICompletion(model="gpt-4o", api_key="sk-test")
+    second = OpenAICompletion(model="gpt-4o-mini", api_key="sk-test")
+    other = OpenAICompletion(model="gpt-4o", api_key="sk-other")
+
+    assert first.client is second.client
+    assert first.client is not other.client
+
+
+def test_async_client_outside_a_loop_is_shared_and_pools_per_loop():
+    import httpx
+
+    from itak.llms.client_registry import _PerLoopAsyncTransport
+
+    registry = ClientRegistry()
+    first = registry.async_client("openai", lambda http: http, {"api_key": "a"})
+    assert registry.async_client("openai", lambda http: http, {"api_key": "a"}) is first
+
+    built = []
+
+    def build():
+        built.append(httpx.MockTransport(lambda request: httpx.Response(200)))
+        return built[-1]
+
+    client = httpx.AsyncClient(transport=_PerLoopAsyncTransport(build))
+
+    async def get():
+        return (await client.get("https://example.com/")).status_code
+
+    assert [asyncio.run(get()), asyncio.run(get())] == [200, 200]
+    assert len(built) == 2
+    registry.close()
+
+
+def test_interceptor_entries_are_released_when_it_is_collected():
+    import gc
+    import weakref
+
+    from itak.llms.hooks.base import BaseInterceptor
+
+    class Interceptor(BaseInterceptor):
+        def on_outbound(self, message):
+            return message
+
+        def on_inbound(self, message):
+            return message
+
+    registry = ClientRegistry()
+    http_clients = []
+
+    def factory(http_client):
+        http_clients.append(http_client)
+        return object()
+
+    interceptor = Interceptor()
+    watcher = weakref.ref(interceptor)
+    registry.client("openai", factory, {"api_key": "a"}, interceptor)
+    assert registry.client("openai", factory, {"api_key": "a"}, interceptor)
+    assert len(http_clients) == 1
+
+    del interceptor
+    gc.collect()
+    assert watcher() is None
+
+    registry.client("openai", factory, {"api_key": "b"})
+    assert http_clients[0].is_closed
+    assert len(registry._clients) == 1
+    registry.close()
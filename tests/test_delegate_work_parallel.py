@@ -0,0 +1,118 @@
+from contextvars import ContextVar
+import threading
+import time
+from unittest.mock import MagicMock
+
+from itak.agent import Agent
+from itak.crew import Crew
+from itak.process import Process
+from itak.task import Task
+from itak.tools.agent_tools.agent_tools import AgentTools
+from itak.tools.agent_tools.delegate_work_parallel_tool import (
+    DelegateWorkParallelTool,
+)
+
+
+def _agent(role: str) -> MagicMock:
+    agent = MagicMock()
+    agent.role = role
+    return agent
+
+
+def test_parallel_delegation_runs_coworkers_concurrently(monkeypatch):
+    researcher, writer = _agent("Senior Researcher"), _agent("Writer")
+    tool = DelegateWorkParallelTool.model_construct(
+        agents=[researcher, writer], description="delegate", max_concurrency=4
+    )
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_delegate(self, agent, task, context=None):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return f"{agent.role} did {task}"
+
+    monkeypatch.setattr(DelegateWorkParallelTool, "_delegate", fake_delegate)
+
+    result = tool._run(
+        delegations=[
+            {"coworker": "senior  researcher", "task": "topic A", "context": ""},
+            {"coworker": '"Writer"', "task": "topic B", "context": ""},
+            {"coworker": "Senior Researcher", "task": "topic C", "context": ""},
+            {"coworker": "Editor", "task": "topic D", "context": ""},
+        ]
+    )
+
+    assert peak == 2
+    assert "Senior Researcher did topic A" in result
+    assert "Writer did topic B" in result
+    assert "Senior Researcher did topic C" in result
+    assert "coworker mentioned not found" in result
+    assert "## Result 1 (Senior Researcher): topic A" in result
+    assert result.index("topic A") < result.index("topic B") < result.index("topic D")
+
+
+def test_parallel_delegation_tool_is_opt_in(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    agents = [Agent(role="Writer", goal="Write", backstory="Writes.")]
+
+    default = AgentTools(agents=agents).tools()
+    enabled = AgentTools(agents=agents, parallel_delegation=True).tools()
+
+    assert not any(isinstance(t, DelegateWorkParallelTool) for t in default)
+    assert isinstance(enabled[-1], DelegateWorkParallelTool)
+
+
+def test_parallel_delegation_propagates_context(monkeypatch):
+    request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+    tool = DelegateWorkParallelTool.model_construct(
+        agents=[_agent("Researcher"), _agent("Writer")],
+        description="delegate",
+        max_concurrency=4,
+    )
+    monkeypatch.setattr(
+        DelegateWorkParallelTool,
+        "_delegate",
+        lambda self, agent, task, context=None: f"{request_id.get()}",
+    )
+
+    request_id.set("req-1")
+    result = tool._run(
+        delegations=[
+            {"coworker": "Researcher", "task": "a", "context": ""},
+            {"coworker": "Writer", "task": "b", "context": ""},
+        ]
+    )
+
+    assert result.count("req-1") == 2
+
+
+def test_crew_manager_can_opt_into_parallel_delegation(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    writer = Agent(role="Writer", goal="Write", backstory="Writes.")
+    task = Task(description="Write", expected_output="Text")
+
+    def manager_tools(**crew_kwargs):
+        crew = Crew(
+            agents=[writer],
+            tasks=[task],
+            process=Process.hierarchical,
+            manager_llm="gpt-4o",
+            **crew_kwargs,
+        )
+        crew._create_manager_agent()
+        return crew.manager_agent.tools
+
+    assert not any(
+        isinstance(t, DelegateWorkParallelTool) for t in manager_tools()
+    )
+    assert any(
+        isinstance(t, DelegateWorkParallelTool)
+        for t in manager_tools(allow_parallel_delegation=True)
+    )
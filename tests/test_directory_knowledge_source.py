@@ -0,0 +1,91 @@
+import asyncio
+import os
+import uuid
+
+from itak.knowledge.source import directory_loader
+from itak.knowledge.source.directory_knowledge_source import (
+    DirectoryKnowledgeSource,
+)
+from itak.knowledge.source.directory_loader import DirectoryLoader, IgnoreRules
+from itak.knowledge.storage.knowledge_storage import KnowledgeStorage
+
+
+class _RecordingStorage(KnowledgeStorage):
+    def __init__(self) -> None:
+        super().__init__(collection_name="docs")
+        self.saved: list = []
+
+    def save(self, documents) -> None:
+        self.saved.extend(documents)
+
+    async def asave(self, documents) -> None:
+        self.saved.extend(documents)
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_ignore_rules_follow_gitignore_semantics():
+    rules = IgnoreRules.from_lines(["*.log", "build/", "/top.txt", "!keep.log"])
+    assert rules.is_ignored("a/b/debug.log", False)
+    assert not rules.is_ignored("a/keep.log", False)
+    assert rules.is_ignored("x/build", True)
+    assert not rules.is_ignored("x/build", False)
+    assert rules.is_ignored("top.txt", False)
+    assert not rules.is_ignored("sub/top.txt", False)
+
+
+def test_loader_streams_per_file_results_and_respects_gitignore(tmp_path):
+    _write(tmp_path / ".gitignore", "ignored/\n*.tmp\n")
+    _write(tmp_path / "a.md", "alpha")
+    _write(tmp_path / "nested" / "b.md", "beta")
+    _write(tmp_path / "nested" / ".gitignore", "secret.md\n")
+    _write(tmp_path / "nested" / "secret.md", "hidden")
+    _write(tmp_path / "ignored" / "c.md", "gamma")
+    _write(tmp_path / "scratch.tmp", "tmp")
+    (tmp_path / "blob.bin").write_bytes(b"\x00\x01binary")
+
+    results = list(DirectoryLoader(tmp_path, max_workers=2).load())
+
+    ok = {r.relative_path: r for r in results if r.ok}
+    assert set(ok) == {"a.md", "nested/b.md"}
+    assert ok["nested/b.md"].content == "beta"
+    assert ok["a.md"].doc_id != ok["nested/b.md"].doc_id
+    assert [r.relative_path for r in results if not r.ok] == ["blob.bin"]
+
+
+def test_incremental_ingest_skips_unchanged_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        directory_loader, "db_storage_path", lambda: str(tmp_path / "storage")
+    )
+    root = tmp_path / "repo"
+    _write(root / "a.txt", "first file")
+    _write(root / "b.txt", "second file")
+
+    storage = _RecordingStorage()
+    source = DirectoryKnowledgeSource(directory=str(root), storage=storage)
+    source.add()
+    assert {r["metadata"]["source"] for r in storage.saved} == {"a.txt", "b.txt"}
+    first_ids = {r["doc_id"] for r in storage.saved}
+    # Chunk ids must be UUIDs: Qdrant rejects other string point ids.
+    assert all(str(uuid.UUID(doc_id)) == doc_id for doc_id in first_ids)
+
+    storage.saved.clear()
+    source.add()
+    assert storage.saved == []
+    assert source.skipped_unchanged == 2
+
+    _write(root / "b.txt", "second file, edited")
+    stat = os.stat(root / "b.txt")
+    os.utime(root / "b.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    asyncio.run(source.aadd())
+    assert [r["metadata"]["source"] for r in storage.saved] == ["b.txt"]
+    assert storage.saved[0]["doc_id"] in first_ids
+    assert source.skipped_unchanged == 1
+
+    directory_loader.clear_manifests("knowledge_docs")
+    storage.saved.clear()
+    source.add()
+    assert len(storage.saved) == 2
@@ -0,0 +1,144 @@
+import numpy as np
+
+from itak.rag.embedded.client import EmbeddedClient
+from itak.rag.embedded.store import EmbeddedVectorStore
+from itak.rag.factory import create_client
+
+
+def _axis_embedding(texts):
+    """Embeds 'x', 'y' and 'z' texts onto the matching axis."""
+    return [[float(t.startswith(axis)) for axis in "xyz"] for t in texts]
+
+
+def _client(path, index_threshold=1000):
+    return EmbeddedClient(
+        client=EmbeddedVectorStore(str(path), index_threshold),
+        embedding_function=_axis_embedding,
+        default_score_threshold=0.0,
+    )
+
+
+def test_embedded_client_persists_upserts_and_filters(tmp_path):
+    client = _client(tmp_path)
+    client.add_documents(
+        collection_name="agent memory",
+        documents=[
+            {"doc_id": "1", "content": "x first", "metadata": {"kind": "a"}},
+            {"doc_id": "2", "content": "y second", "metadata": {"kind": "b"}},
+        ],
+    )
+    client.add_documents(
+        collection_name="agent memory",
+        documents=[{"doc_id": "1", "content": "z replaced", "metadata": {"kind": "a"}}],
+    )
+
+    reopened = _client(tmp_path)
+    results = reopened.search(collection_name="agent memory", query="z?", limit=1)
+    assert results[0]["id"] == "1"
+    assert results[0]["content"] == "z replaced"
+    assert results[0]["score"] > 0.99
+    collection = reopened.get_or_create_collection(collection_name="agent memory")
+    assert collection.count() == 2
+
+    filtered = reopened.search(
+        collection_name="agent memory", query="z?", metadata_filter={"kind": "b"}
+    )
+    assert [r["id"] for r in filtered] == ["2"]
+
+    batched = reopened.search_many(
+        collection_name="agent memory", queries=["y", "z"], limit=1
+    )
+    assert [r[0]["id"] for r in batched] == ["2", "1"]
+
+    reopened.delete_collection(collection_name="agent memory")
+    assert not reopened.client.names()
+
+
+def test_embedded_store_ivf_index_matches_brute_force(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(600, 16)).astype(np.float32)
+    store = EmbeddedVectorStore(str(tmp_path), index_threshold=500)
+    collection = store.create("big")
+    collection.upsert(
+        [str(i) for i in range(600)], ["doc"] * 600, [{}] * 600, vectors
+    )
+
+    query = vectors[42] + 0.01
+    indexed = collection.query(query, 5, nprobe=24)[0]
+    collection.index_threshold = 10_000
+    brute = collection.query(query, 5)[0]
+
+    assert indexed[0][0] == brute[0][0] == 42
+
+
+def test_create_client_supports_embedded_provider(tmp_path):
+    from itak.rag.embedded.config import EmbeddedConfig
+
+    client = create_client(
+        EmbeddedConfig(path=str(tmp_path), embedding_function=_axis_embedding)
+    )
+    assert isinstance(client, EmbeddedClient)
+
+
+def test_embedded_store_recovers_from_a_torn_log_tail(tmp_path):
+    from itak.rag.embedded.constants import LOG_FILE, VECTORS_FILE
+
+    def upsert(doc_id, vector):
+        store = EmbeddedVectorStore(str(tmp_path), 1000)
+        collection = store.get("docs") if store.exists("docs") else store.create("docs")
+        collection.upsert([doc_id], [f"{doc_id} text"], [{}], np.array([vector]))
+
+    upsert("a", [1.0, 0.0, 0.0])
+    # Crash halfway through upserting "b": its vector and part of its entry.
+    with (tmp_path / "docs" / VECTORS_FILE).open("ab") as f:
+        f.write(np.array([[0.0, 1.0, 0.0]], dtype=np.float32).tobytes())
+    with (tmp_path / "docs" / LOG_FILE).open("a") as f:
+        f.write('{"op": "upsert", "id": "b", "cont')
+
+    upsert("c", [0.0, 0.0, 1.0])
+
+    collection = EmbeddedVectorStore(str(tmp_path), 1000).get("docs")
+    assert collection.count() == 2
+    matches = collection.search(np.array([0.0, 0.0, 1.0]), 2)[0]
+    assert [(doc_id, content) for doc_id, content, _, _ in matches] == [
+        ("c", "c text"),
+        ("a", "a text"),
+    ]
+
+
+def test_embedded_store_compacts_tombstones(tmp_path, monkeypatch):
+    from itak.rag.embedded import store as store_module
+    from itak.rag.embedded.constants import VECTORS_FILE
+
+    monkeypatch.setattr(store_module, "COMPACTION_MIN_TOMBSTONES", 4)
+    collection = EmbeddedVectorStore(str(tmp_path), 1000).create("docs")
+    collection.upsert(["keep"], ["kept"], [{"kind": "a"}], np.array([[1.0, 0.0]]))
+    vectors = tmp_path / "docs" / VECTORS_FILE
+    for i in range(4):
+        collection.upsert(["hot"], [f"v{i}"], [{}], np.array([[0.0, 1.0]]))
+    assert vectors.stat().st_size == 5 * 2 * 4
+
+    # The fourth tombstone triggers a rewrite down to the two live rows.
+    collection.upsert(["hot"], ["v4"], [{}], np.array([[0.0, 1.0]]))
+    assert vectors.stat().st_size == 2 * 2 * 4
+
+    collection.upsert(["hot"], ["v5"], [{}], np.array([[0.0, 1.0]]))
+    collection.compact()
+    assert vectors.stat().st_size == 2 * 2 * 4
+
+    reopened = EmbeddedVectorStore(str(tmp_path), 1000).get("docs")
+    matches = reopened.search(np.array([[1.0, 0.0], [0.0, 1.0]]), 1)
+    assert [m[0][:3] for m in matches] == [
+        ("keep", "kept", {"kind": "a"}),
+        ("hot", "v5", {}),
+    ]
+
+
+def test_embedded_default_embedding_needs_no_model():
+    from itak.rag.embedded.config import EmbeddedConfig
+
+    embed = EmbeddedConfig().embedding_function
+    vectors = np.array(embed(["memory store", "memory stores", "weather report"]))
+
+    assert vectors.shape == (3, 512)
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
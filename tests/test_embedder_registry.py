@@ -0,0 +1,140 @@
+import threading
+import time
+
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+import pytest
+
+from itak.rag.embeddings.providers.custom.embedding_callable import (
+    CustomEmbeddingFunction,
+)
+from itak.rag.embeddings.providers.openai.openai_provider import OpenAIProvider
+from itak.rag.embeddings.providers.sentence_transformer.sentence_transformer_provider import (
+    SentenceTransformerProvider,
+)
+from itak.rag.embeddings.registry import (
+    EmbedderRegistry,
+    MicroBatchingEmbeddingFunction,
+    _provider_name,
+)
+
+
+class _CountingEmbedding(EmbeddingFunction[Documents]):
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+        self.calls: list[int] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(len(input))
+        time.sleep(0.02)
+        return [[float(len(text)), 1.0] for text in input]
+
+    @staticmethod
+    def name() -> str:
+        return "counting-test"
+
+
+class _CustomCounting(CustomEmbeddingFunction):
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+        self.calls: list[int] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(len(input))
+        return [[1.0, 0.0] for _ in input]
+
+
+def test_registry_shares_one_embedder_per_spec():
+    registry = EmbedderRegistry()
+    spec = {"provider": "custom", "config": {"embedding_callable": _CustomCounting}}
+
+    first = registry.get(spec, warm_up=True)
+    second = registry.get(dict(spec), warm_up=True)
+    batched = registry.get(spec, micro_batching=True)
+
+    assert first is second
+    assert _CustomCounting.instances == 2
+    assert first.calls == [1]
+    assert isinstance(batched, MicroBatchingEmbeddingFunction)
+    registry.clear()
+
+
+def test_micro_batching_coalesces_concurrent_calls():
+    inner = _CountingEmbedding()
+    batcher = MicroBatchingEmbeddingFunction(inner, max_batch_size=64)
+    results: dict[int, list] = {}
+
+    def embed(i: int) -> None:
+        results[i] = batcher(["x" * i])
+
+    threads = [threading.Thread(target=embed, args=(i,)) for i in range(1, 17)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert sum(inner.calls) == 16
+    assert len(inner.calls) < 16
+    assert all(results[i][0][0] == float(i) for i in results)
+
+
+def test_micro_batching_propagates_errors_to_every_caller():
+    class _Failing(_CountingEmbedding):
+        def __call__(self, input: Documents) -> Embeddings:
+            raise RuntimeError("model down")
+
+    batcher = MicroBatchingEmbeddingFunction(_Failing())
+    with pytest.raises(RuntimeError, match="model down"):
+        batcher(["a"])
+    batcher.close()
+
+
+def test_wrapper_is_transparent_to_chromadb(tmp_path):
+    import chromadb
+
+    client = chromadb.PersistentClient(path=str(tmp_path))
+    batcher = MicroBatchingEmbeddingFunction(_CountingEmbedding())
+    collection = client.get_or_create_collection("docs", embedding_function=batcher)
+    collection.add(ids=["a", "b"], documents=["one", "three"])
+
+    result = collection.query(query_texts=["three"], n_results=1)
+
+    assert result["ids"] == [["b"]]
+    assert batcher.name() == "counting-test"
+    batcher.close()
+
+
+class _StubSentenceTransformer(EmbeddingFunction[Documents]):
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [[1.0, 0.0] for _ in input]
+
+    @staticmethod
+    def name() -> str:
+        return "stub-sentence-transformer"
+
+
+def test_local_provider_instances_and_classes_are_micro_batched():
+    provider = SentenceTransformerProvider.model_construct(
+        embedding_callable=_StubSentenceTransformer,
+        model_name="all-MiniLM-L6-v2",
+        device="cpu",
+        normalize_embeddings=False,
+    )
+
+    assert _provider_name(provider) == "sentence-transformer"
+    assert _provider_name(SentenceTransformerProvider) == "sentence-transformer"
+    assert _provider_name(OpenAIProvider) == "openai"
+    assert _provider_name({"provider": "onnx"}) == "onnx"
+
+    registry = EmbedderRegistry()
+    embedder = registry.get(provider)
+    assert isinstance(embedder, MicroBatchingEmbeddingFunction)
+    assert [list(vector) for vector in embedder(["hi"])] == [[1.0, 0.0]]
+    registry.clear()
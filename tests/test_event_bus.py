@@ -0,0 +1,49 @@
+import threading
+
+from itak.events.event_bus import iTaK_event_bus
+from itak.events.types.llm_events import LLMCallStartedEvent, LLMStreamChunkEvent
+
+
+def test_has_handlers_tracks_registration():
+    with iTaK_event_bus.scoped_handlers():
+        assert not iTaK_event_bus.has_handlers(LLMStreamChunkEvent)
+        assert iTaK_event_bus.emit(None, LLMStreamChunkEvent(chunk="x")) is None
+
+        received = []
+
+        def handler(source, event):
+            received.append(event.chunk)
+
+        iTaK_event_bus.register_handler(LLMStreamChunkEvent, handler)
+        assert iTaK_event_bus.has_handlers(LLMStreamChunkEvent)
+
+        iTaK_event_bus.emit(None, LLMStreamChunkEvent(chunk="y"))
+        assert received == ["y"]
+
+        iTaK_event_bus.unregister_handler(LLMStreamChunkEvent, handler)
+        assert not iTaK_event_bus.has_handlers(LLMStreamChunkEvent)
+
+
+def test_inline_handlers_run_in_the_emitting_thread():
+    event = LLMCallStartedEvent(messages="hi", model="gpt-4o")
+    with iTaK_event_bus.scoped_handlers():
+        threads = {}
+
+        @iTaK_event_bus.on(LLMCallStartedEvent, inline=True)
+        def inline_handler(source, event):
+            threads["inline"] = threading.current_thread()
+
+        assert iTaK_event_bus.emit(None, event) is None
+        assert threads["inline"] is threading.current_thread()
+
+        @iTaK_event_bus.on(LLMCallStartedEvent)
+        def pooled_handler(source, event):
+            threads["pooled"] = threading.current_thread()
+
+        iTaK_event_bus.emit(None, event).result(timeout=5)
+        assert threads["pooled"] is not threading.current_thread()
+
+        iTaK_event_bus.unregister_handler(LLMCallStartedEvent, inline_handler)
+        threads.clear()
+        iTaK_event_bus.emit(None, event).result(timeout=5)
+        assert "inline" not in threads
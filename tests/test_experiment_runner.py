@@ -0,0 +1,183 @@
+from hashlib import md5
+from unittest.mock import MagicMock
+
+from itak.experimental.evaluation.experiment.result import ExperimentResult
+from itak.experimental.evaluation.experiment.runner import ExperimentRunner
+
+
+def test_experiment_runner_parallel_resume(tmp_path, monkeypatch):
+    dataset = [
+        {"identifier": f"case-{i}", "inputs": {"i": i}, "expected_score": 5}
+        for i in range(6)
+    ]
+    results_path = tmp_path / "results.jsonl"
+    calls = []
+
+    def fake_run_test_case(self, test_case, agents, crew=None, identifier=None):
+        calls.append(identifier)
+        return ExperimentResult(
+            identifier=identifier,
+            inputs=test_case["inputs"],
+            score=7.0,
+            expected_score=test_case["expected_score"],
+            passed=True,
+        )
+
+    monkeypatch.setattr(ExperimentRunner, "_run_test_case", fake_run_test_case)
+
+    runner = ExperimentRunner(dataset[:3], max_workers=3, results_path=str(results_path))
+    runner.run(agents=[MagicMock()])
+    assert len(results_path.read_text().splitlines()) == 3
+
+    calls.clear()
+    runner = ExperimentRunner(dataset, max_workers=3, results_path=str(results_path))
+    results = runner.run(agents=[MagicMock()])
+
+    assert sorted(calls) == ["case-3", "case-4", "case-5"]
+    assert [r.identifier for r in results.results] == [c["identifier"] for c in dataset]
+    assert len(results_path.read_text().splitlines()) == 6
+
+
+def _fake_result(self, test_case, agents, crew=None, identifier=None):
+    return ExperimentResult(
+        identifier=identifier,
+        inputs=test_case["inputs"],
+        score=7.0,
+        expected_score=test_case["expected_score"],
+        passed=True,
+    )
+
+
+def test_experiment_runner_keeps_duplicate_cases(tmp_path, monkeypatch):
+    dataset = [{"inputs": {"q": "same"}, "expected_score": 5}] * 2
+    results_path = tmp_path / "results.jsonl"
+    calls = []
+
+    def fake_run_test_case(self, test_case, agents, crew=None, identifier=None):
+        calls.append(identifier)
+        return _fake_result(self, test_case, agents, crew, identifier)
+
+    monkeypatch.setattr(ExperimentRunner, "_run_test_case", fake_run_test_case)
+
+    runner = ExperimentRunner(dataset, max_workers=2, results_path=str(results_path))
+    results = runner.run(agents=[MagicMock()])
+    assert len(results.results) == 2
+    assert len(set(calls)) == 2
+
+    calls.clear()
+    resumed = ExperimentRunner(dataset, results_path=str(results_path))
+    assert len(resumed.run(agents=[MagicMock()]).results) == 2
+    assert calls == []
+
+
+def test_experiment_runner_skips_torn_result_lines(tmp_path, monkeypatch):
+    dataset = [
+        {"identifier": f"case-{i}", "inputs": {"i": i}, "expected_score": 5}
+        for i in range(2)
+    ]
+    results_path = tmp_path / "results.jsonl"
+    monkeypatch.setattr(ExperimentRunner, "_run_test_case", _fake_result)
+    ExperimentRunner(dataset[:1], results_path=str(results_path)).run(
+        agents=[MagicMock()]
+    )
+    with results_path.open("a") as f:
+        f.write('{"identifier": "case-1", "inp')
+
+    results = ExperimentRunner(dataset, results_path=str(results_path)).run(
+        agents=[MagicMock()]
+    )
+
+    assert [r.identifier for r in results.results] == ["case-0", "case-1"]
+
+
+def test_experiment_runner_isolates_agents_per_case(monkeypatch):
+    from itak.agent import Agent
+    from itak.experimental.evaluation.experiment import runner as runner_module
+
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    agent = Agent(role="Researcher", goal="Find", backstory="Curious", llm="gpt-4o")
+    evaluated, kicked_off = [], []
+
+    def fake_evaluator(agents):
+        evaluated.append([a.id for a in agents])
+        return MagicMock(get_agent_evaluation=MagicMock(return_value={}))
+
+    monkeypatch.setattr(runner_module, "create_default_evaluator", fake_evaluator)
+    monkeypatch.setattr(
+        Agent, "kickoff", lambda self, **inputs: kicked_off.append(self.id)
+    )
+
+    dataset = [{"inputs": {"i": i}, "expected_score": 0} for i in range(3)]
+    ExperimentRunner(dataset, max_workers=3).run(agents=[agent])
+
+    assert len(set(kicked_off)) == 3
+    assert agent.id not in kicked_off
+    assert sorted(ids[0] for ids in evaluated) == sorted(kicked_off)
+
+
+def test_agent_evaluator_only_scores_its_own_agents():
+    from types import SimpleNamespace
+
+    from itak.experimental.evaluation.agent_evaluator import AgentEvaluator
+    from itak.experimental.evaluation.base_evaluator import (
+        EvaluationScore,
+        MetricCategory,
+    )
+
+    metric = SimpleNamespace(
+        metric_category=MetricCategory.GOAL_ALIGNMENT,
+        evaluate=lambda **kwargs: EvaluationScore(score=8.0),
+    )
+    mine = SimpleNamespace(id="mine", role="Mine")
+    other = SimpleNamespace(id="other", role="Other")
+    evaluator = AgentEvaluator(agents=[mine], evaluators=[metric])
+    try:
+        for agent in (other, mine):
+            task = SimpleNamespace(id=f"task-{agent.id}", agent=agent)
+            evaluator._handle_task_completed(
+                None, SimpleNamespace(task=task, output="done")
+            )
+    finally:
+        evaluator.close()
+
+    results = evaluator.get_evaluation_results()
+    assert list(results) == ["Mine"]
+    assert results["Mine"][0].metrics[MetricCategory.GOAL_ALIGNMENT].score == 8.0
+
+
+def test_lite_agent_traces_follow_event_ids():
+    from types import SimpleNamespace
+
+    from itak.experimental.evaluation.evaluation_listener import (
+        EvaluationTraceCallback,
+    )
+
+    callback = EvaluationTraceCallback()
+    callback.on_lite_agent_start({"id": "agent-a"})
+    # A second run starts concurrently and takes over the "current" ids.
+    callback.on_lite_agent_start({"id": "agent-b"})
+
+    event = SimpleNamespace(agent_id="agent-a", task_id=None)
+    callback.on_tool_use(
+        "search", {}, "result", trace_key=callback._event_trace_key(event)
+    )
+    callback.on_lite_agent_finish("answer a", agent_id="agent-a")
+
+    trace_a = callback.get_trace("agent-a", "lite_task")
+    trace_b = callback.get_trace("agent-b", "lite_task")
+    assert [use["tool"] for use in trace_a["tool_uses"]] == ["search"]
+    assert trace_a["final_output"] == "answer a"
+    assert trace_b["tool_uses"] == []
+    assert trace_b["final_output"] is None
+
+
+def test_generated_identifiers_match_saved_baselines():
+    case = {"inputs": {"q": "same"}, "expected_score": 5}
+    digest = md5(str(case).encode(), usedforsecurity=False).hexdigest()
+
+    runner = ExperimentRunner([case, {"inputs": {"q": "other"}}, case])
+
+    identifiers = runner._identifiers()
+    assert identifiers[0] == digest
+    assert identifiers[2] == f"{digest}-1"
+    assert len(set(identifiers)) == 3
@@ -0,0 +1,182 @@
+import threading
+import time
+
+from pydantic import BaseModel
+
+from itak.agent import Agent
+from itak.task import Task
+from itak.tasks.llm_guardrail import LLMGuardrail
+from itak.tasks.task_output import TaskOutput
+from itak.utilities.guardrail_engine import GuardrailEngine
+
+
+def _output(raw: str) -> TaskOutput:
+    return TaskOutput(description="d", raw=raw, agent="a")
+
+
+def _apply(output: TaskOutput, result):
+    if isinstance(result, str) and result != output.raw:
+        return output.model_copy(update={"raw": result})
+    return output
+
+
+class _SlowLLMCheck(LLMGuardrail):
+    """LLM guardrail whose model call is replaced by a sleep."""
+
+    def __init__(self, delay: float, passes: bool = True) -> None:
+        super().__init__(description=f"check {id(self)}", llm=object())
+        self.delay = delay
+        self.passes = passes
+        self.calls = 0
+        self.finished = threading.Event()
+
+    def __call__(self, output: TaskOutput):
+        self.calls += 1
+        time.sleep(self.delay)
+        self.finished.set()
+        return (True, output.raw) if self.passes else (False, "rejected")
+
+
+def test_llm_guardrails_run_concurrently():
+    checks = [_SlowLLMCheck(0.2) for _ in range(4)]
+    engine = GuardrailEngine(checks, max_concurrency=4)
+
+    start = time.perf_counter()
+    verdict = engine.evaluate(_output("text"), _apply)
+
+    assert verdict.success
+    assert time.perf_counter() - start < 0.6
+    assert all(check.calls == 1 for check in checks)
+
+
+def test_first_failure_short_circuits():
+    fast_fail = _SlowLLMCheck(0.01, passes=False)
+    slow = _SlowLLMCheck(2.0)
+    engine = GuardrailEngine([fast_fail, slow], max_concurrency=2)
+
+    start = time.perf_counter()
+    verdict = engine.evaluate(_output("text"), _apply)
+
+    assert not verdict.success
+    assert verdict.failed_index == 0
+    assert verdict.error == "rejected"
+    assert time.perf_counter() - start < 1.0
+
+
+def test_concurrent_failure_reports_first_declared_guardrail():
+    slow_fail = _SlowLLMCheck(0.2, passes=False)
+    fast_fail = _SlowLLMCheck(0.01, passes=False)
+    engine = GuardrailEngine([slow_fail, fast_fail], max_concurrency=2)
+
+    verdict = engine.evaluate(_output("text"), _apply)
+
+    assert verdict.failed_index == 0
+
+
+def test_cheap_guardrails_run_first_and_gate_llm_calls():
+    order: list[str] = []
+
+    def cheap(output):
+        order.append("cheap")
+        return (False, "too short")
+
+    llm_check = _SlowLLMCheck(0.0)
+    engine = GuardrailEngine([llm_check, cheap])
+
+    verdict = engine.evaluate(_output("x"), _apply)
+
+    assert not verdict.success
+    assert verdict.failed_index == 1
+    assert order == ["cheap"]
+    assert llm_check.calls == 0
+
+
+def test_verdicts_are_cached_for_unchanged_output():
+    llm_check = _SlowLLMCheck(0.0)
+    engine = GuardrailEngine([llm_check])
+
+    engine.evaluate(_output("same"), _apply)
+    engine.evaluate(_output("same"), _apply)
+    engine.evaluate(_output("different"), _apply)
+
+    assert llm_check.calls == 2
+    assert engine.cache_hits == 1
+
+
+def test_transformations_apply_in_declared_order():
+    seen: list[str] = []
+
+    def upper(output):
+        seen.append(f"upper:{output.raw}")
+        return (True, output.raw.upper())
+
+    def suffix(output):
+        seen.append(f"suffix:{output.raw}")
+        return (True, output.raw + "!")
+
+    verdict = GuardrailEngine([upper, suffix]).evaluate(_output("hi"), _apply)
+
+    assert verdict.success
+    assert verdict.output.raw == "HI!"
+    # ``suffix`` is evaluated speculatively on the original output, then
+    # re-run on the transformed one.
+    assert seen[0] == "upper:hi"
+    assert seen[-1] == "suffix:HI"
+
+
+def test_task_retries_only_rejudge_changed_outputs(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    llm_check = _SlowLLMCheck(0.0)
+    attempts = iter(["short", "a long enough answer"])
+
+    def min_length(output):
+        return (len(output.raw) > 10, output.raw if len(output.raw) > 10 else "short")
+
+    agent = Agent(role="writer", goal="g", backstory="b", llm="gpt-4o-mini")
+    monkeypatch.setattr(
+        Agent, "execute_task", lambda self, **_: next(attempts), raising=False
+    )
+
+    task = Task(
+        description="Write",
+        expected_output="Text",
+        agent=agent,
+        guardrails=[min_length, llm_check],
+    )
+    output = task._execute_core(agent, None, [])
+
+    assert output.raw == "a long enough answer"
+    assert task._guardrail_retry_counts == {0: 1}
+    assert llm_check.calls == 1
+
+
+class _Answer(BaseModel):
+    value: int
+
+
+def test_retried_outputs_are_exported_before_guardrails_run(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "fake-key")
+    attempts = iter(['{"value": 0}', '{"value": 2}'])
+    seen = []
+
+    def positive(output):
+        seen.append(output.pydantic)
+        ok = output.pydantic is not None and output.pydantic.value > 0
+        return (ok, output.raw if ok else "value must be positive")
+
+    agent = Agent(role="writer", goal="g", backstory="b", llm="gpt-4o-mini")
+    monkeypatch.setattr(
+        Agent, "execute_task", lambda self, **_: next(attempts), raising=False
+    )
+
+    task = Task(
+        description="Count",
+        expected_output="A number",
+        agent=agent,
+        output_pydantic=_Answer,
+        guardrails=[positive],
+    )
+    output = task._execute_core(agent, None, [])
+
+    assert seen == [_Answer(value=0), _Answer(value=2)]
+    assert output.pydantic == _Answer(value=2)
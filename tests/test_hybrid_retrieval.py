@@ -0,0 +1,87 @@
+import uuid
+
+import chromadb
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+from itak.rag.chromadb.client import ChromaDBClient
+from itak.rag.hybrid import (
+    BaseReranker,
+    BM25Index,
+    HybridRetriever,
+    HybridSearchConfig,
+    reciprocal_rank_fusion,
+)
+
+
+class _ConstantEmbedding(EmbeddingFunction[Documents]):
+    """Puts every text at the same point, so dense search cannot tell them apart."""
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [[1.0, 0.0] for _ in input]
+
+    @staticmethod
+    def name() -> str:
+        return "constant-test"
+
+
+class _OverlapReranker(BaseReranker):
+    def __init__(self) -> None:
+        super().__init__(batch_size=2)
+        self.batches: list[int] = []
+
+    def score(self, query, documents):
+        self.batches.append(len(documents))
+        terms = set(query.split())
+        return [len(terms & set(document.split())) for document in documents]
+
+
+def test_bm25_index_upserts_and_filters(tmp_path):
+    index = BM25Index(str(tmp_path / "bm25.db"))
+    index.upsert(
+        "docs",
+        [
+            ("a", "raise ERR_CONN_RESET when the socket closes", {"source": "net"}),
+            ("b", "call get_user_id before saving", {"source": "api"}),
+        ],
+    )
+    index.upsert("docs", [("a", "timeouts are retried", {"source": "net"})])
+
+    assert index.count("docs") == 2
+    assert index.search("docs", "ERR_CONN_RESET", 5) == []
+    assert [r["id"] for r in index.search("docs", "get_user_id", 5)] == ["b"]
+    assert index.search("docs", "get_user_id", 5, {"source": "net"}) == []
+    index.delete_collection("docs")
+    assert index.count("docs") == 0
+
+
+def test_hybrid_retriever_finds_exact_identifiers(tmp_path):
+    reranker = _OverlapReranker()
+    retriever = HybridRetriever(
+        ChromaDBClient(
+            client=chromadb.EphemeralClient(),
+            embedding_function=_ConstantEmbedding(),
+        ),
+        HybridSearchConfig(reranker=reranker),
+        index=BM25Index(str(tmp_path / "bm25.db")),
+    )
+    documents = [{"content": f"general note number {i}"} for i in range(8)]
+    documents.append({"content": "error E4012 means the quota was exceeded"})
+    retriever.add_documents("kb", documents)
+
+    results = retriever.search("kb", "what does E4012 mean", limit=3)
+
+    assert "E4012" in results[0]["content"]
+    assert len(results) == 3
+    assert max(reranker.batches) <= 2
+    # Derived ids are UUIDs, which Qdrant accepts as point ids.
+    assert all(str(uuid.UUID(r["id"])) == r["id"] for r in results)
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    def hit(doc_id):
+        return {"id": doc_id, "content": doc_id, "metadata": {}, "score": 0.5}
+
+    fused = reciprocal_rank_fusion([[hit("a"), hit("b")], [hit("b"), hit("c")]])
+
+    assert [r["id"] for r in fused] == ["b", "a", "c"]
+    assert 0 < fused[-1]["score"] < fused[0]["score"] <= 1
@@ -0,0 +1,155 @@
+import time
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from itak.hooks.llm_hooks import LLMCallHookContext
+from itak.llm import LLM
+from itak.llms.cache import LLMResponseCache
+
+
+def test_llm_cache_serves_hits_and_replays(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = LLMResponseCache(db_path=db_path)
+    llm = LLM(model="gpt-4o-mini", api_key="test")
+
+    cache.install()
+    try:
+        miss = LLMCallHookContext(messages=[{"role": "user", "content": "hi"}], llm=llm)
+        cache.before_llm_call(miss)
+        assert miss.response is None
+
+        miss.response = "hello"
+        cache.after_llm_call(miss)
+
+        # Served from the cache without reaching the provider.
+        assert llm.call("hi") == "hello"
+        assert llm.get_token_usage_summary().cached_responses == 1
+    finally:
+        cache.uninstall()
+
+    replay = LLMResponseCache(db_path=db_path, mode="replay")
+    unseen = LLMCallHookContext(messages=[{"role": "user", "content": "new"}], llm=llm)
+    assert replay.before_llm_call(unseen) is False
+
+
+class _Args(BaseModel):
+    query: str
+
+
+class _OtherArgs(BaseModel):
+    query: str
+    limit: int
+
+
+def _fake_embedder(texts):
+    # Prompts mentioning "cats" point one way, everything else the other.
+    return [[1.0, 0.0] if "cats" in text else [0.0, 1.0] for text in texts]
+
+
+def test_exact_hits_and_misses(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"))
+    key, scope = cache.build_key("gpt-4o", [{"role": "user", "content": "hi"}])
+    other_key, _ = cache.build_key("gpt-4o", [{"role": "user", "content": "bye"}])
+
+    assert cache.get(key, scope) is None
+    cache.set(key, "hello", scope=scope)
+
+    assert cache.get(key, scope) == "hello"
+    assert cache.get(other_key, scope) is None
+
+
+def test_key_covers_params_and_tool_schemas():
+    messages = [{"role": "user", "content": "hi"}]
+    tool = SimpleNamespace(name="search", description="Search.", args_schema=_Args)
+    changed = SimpleNamespace(
+        name="search", description="Search.", args_schema=_OtherArgs
+    )
+
+    def key_for(tools, params=None):
+        context = LLMCallHookContext(messages=messages, llm="gpt-4o", tools=tools)
+        model, described, _ = LLMResponseCache._describe_request(context)
+        return LLMResponseCache.build_key(model, messages, described, params)
+
+    assert key_for([tool]) == key_for([tool])
+    assert key_for([tool]) != key_for([changed])
+    assert key_for([tool]) != key_for([tool], {"temperature": 0.5})
+
+
+def test_expired_and_cleared_entries_are_invalidated(tmp_path, monkeypatch):
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"), ttl_seconds=10)
+    key, scope = cache.build_key("gpt-4o", [{"role": "user", "content": "hi"}])
+    cache.set(key, "hello", scope=scope)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+    assert cache.get(key, scope) is None
+
+    monkeypatch.undo()
+    cache.set(key, "hello", scope=scope)
+    cache.clear()
+    assert cache.get(key, scope) is None
+
+
+def test_semantic_tier_respects_threshold(tmp_path):
+    cache = LLMResponseCache(
+        db_path=str(tmp_path / "cache.db"),
+        embedder=_fake_embedder,
+        similarity_threshold=0.9,
+    )
+    key, scope = cache.build_key("gpt-4o", [{"role": "user", "content": "cats?"}])
+    cache.set(key, "meow", scope=scope, prompt="user: cats?")
+
+    similar, _ = cache.build_key("gpt-4o", [{"role": "user", "content": "cats!"}])
+    unrelated, _ = cache.build_key("gpt-4o", [{"role": "user", "content": "dogs"}])
+
+    assert cache.get(similar, scope, "user: cats!") == "meow"
+    assert cache.get(unrelated, scope, "user: dogs") is None
+    assert cache.get(similar, "other-scope", "user: cats!") is None
+
+
+def test_semantic_scan_is_capped_to_recent_entries(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(time, "time", lambda: float(next(clock)))
+    cache = LLMResponseCache(
+        db_path=str(tmp_path / "cache.db"),
+        embedder=_fake_embedder,
+        semantic_scan_limit=2,
+    )
+    cache.set("old", "meow", scope="s", prompt="cats")
+    cache.set("newer", "woof", scope="s", prompt="dogs")
+    cache.set("newest", "woof", scope="s", prompt="dogs")
+
+    assert cache.get("miss", "s", "cats") is None
+    cache.semantic_scan_limit = 3
+    assert cache.get("miss", "s", "cats") == "meow"
+
+
+def _schema(name):
+    return {"type": "function", "function": {"name": name, "parameters": {}}}
+
+
+def test_direct_calls_with_different_tools_do_not_share_entries(tmp_path):
+    cache = LLMResponseCache(db_path=str(tmp_path / "cache.db"))
+    messages = [{"role": "user", "content": "weather?"}]
+
+    def before(tools, functions=None):
+        context = LLMCallHookContext(
+            messages=messages,
+            llm="gpt-4o",
+            tools=tools,
+            available_functions=functions,
+        )
+        cache.before_llm_call(context)
+        return context.response
+
+    assert before([_schema("weather")]) is None
+    # Direct-call after hooks get no tools; the before hook's key is reused.
+    cache.after_llm_call(
+        LLMCallHookContext(messages=messages, llm="gpt-4o", response="sunny")
+    )
+
+    assert before([_schema("weather")]) == "sunny"
+    assert before([_schema("forecast")]) is None
+    assert before([_schema("weather")], {"weather": print}) is None
+    assert before(None) is None
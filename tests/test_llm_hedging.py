@@ -0,0 +1,152 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from itak.llms.base_llm import BaseLLM
+from itak.llms.hedging import HedgedLLM, LatencyHistogram
+from itak.utilities.circuit_breaker import CircuitOpenError, CircuitState
+
+
+class _FakeProvider(BaseLLM):
+    """Local stand-in for a provider with scripted latency and failures."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        super().__init__(model=f"fake-{uuid.uuid4().hex[:8]}", provider="fake")
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def call(self, messages, *args, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.model} unavailable")
+        return self.model
+
+    async def acall(self, messages, *args, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.model} unavailable")
+        return self.model
+
+
+def test_histogram_percentiles_are_within_a_bucket():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 100)
+
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.2)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.2)
+    assert LatencyHistogram().percentile(50) is None
+
+
+def test_slow_primary_is_hedged_to_the_fallback():
+    slow, fast = _FakeProvider(delay=1.0), _FakeProvider(delay=0.01)
+    llm = HedgedLLM(slow, fallbacks=[fast], hedge_delay=0.05)
+
+    start = time.perf_counter()
+    result = llm.call("hi")
+
+    assert result == fast.model
+    assert time.perf_counter() - start < 0.5
+    assert llm.hedges_sent == 1
+    assert llm.hedge_wins == 1
+
+
+def test_hedge_delay_follows_primary_latency_percentile():
+    primary, backup = _FakeProvider(delay=0.01), _FakeProvider()
+    llm = HedgedLLM(primary, fallbacks=[backup], min_samples=5)
+    for _ in range(5):
+        llm.call("hi")
+
+    delay = llm._hedge_after(llm.routes[0])
+
+    assert delay is not None
+    assert 0.01 <= delay < 0.1
+    assert backup.calls == 0
+
+
+def test_failures_fail_over_and_open_the_circuit():
+    broken, healthy = _FakeProvider(fail=True), _FakeProvider()
+    llm = HedgedLLM(broken, fallbacks=[healthy], failure_threshold=2)
+
+    assert [llm.call("hi") for _ in range(3)] == [healthy.model] * 3
+
+    assert llm.routes[0].circuit.state == CircuitState.OPEN
+    assert broken.calls == 2
+    assert llm.failovers == 2
+
+
+def test_all_failing_routes_raise():
+    llm = HedgedLLM(_FakeProvider(fail=True), fallbacks=[_FakeProvider(fail=True)])
+
+    with pytest.raises(RuntimeError):
+        llm.call("hi")
+
+
+def test_open_circuits_reject_calls():
+    primary = _FakeProvider(fail=True)
+    llm = HedgedLLM(primary, failure_threshold=1, recovery_timeout=60)
+    with pytest.raises(RuntimeError):
+        llm.call("hi")
+
+    with pytest.raises(CircuitOpenError):
+        llm.call("hi")
+
+
+def test_async_hedge_cancels_the_loser():
+    slow, fast = _FakeProvider(delay=5.0), _FakeProvider(delay=0.01)
+    llm = HedgedLLM(slow, fallbacks=[fast], hedge_delay=0.05)
+
+    async def main():
+        start = time.perf_counter()
+        result = await llm.acall("hi")
+        return result, time.perf_counter() - start
+
+    result, elapsed = asyncio.run(main())
+
+    assert result == fast.model
+    assert elapsed < 1.0
+
+
+def test_tool_executing_calls_are_not_hedged():
+    slow, fast = _FakeProvider(delay=0.2), _FakeProvider()
+    llm = HedgedLLM(slow, fallbacks=[fast], hedge_delay=0.01)
+
+    assert llm.call("hi", available_functions={"tool": print}) == slow.model
+    assert fast.calls == 0
+
+
+def test_stop_words_reach_every_route():
+    primary, backup = _FakeProvider(), _FakeProvider()
+    backup.stop = ["\nEnd"]
+    llm = HedgedLLM(primary, fallbacks=[backup])
+
+    llm.stop = ["\nObservation:"]
+
+    assert primary.stop == ["\nObservation:"]
+    assert backup.stop == ["\nEnd", "\nObservation:"]
+    assert llm.stop == ["\nObservation:"]
+
+
+def test_cancelled_loser_does_not_close_a_half_open_circuit():
+    slow, fast = _FakeProvider(fail=True), _FakeProvider(delay=0.01)
+    llm = HedgedLLM(
+        slow,
+        fallbacks=[fast],
+        hedge_delay=0.05,
+        failure_threshold=1,
+        recovery_timeout=0.01,
+    )
+    assert llm.call("hi") == fast.model
+    time.sleep(0.02)
+    slow.fail, slow.delay = False, 5.0
+
+    assert asyncio.run(llm.acall("hi")) == fast.model
+
+    circuit = llm.routes[0].circuit
+    assert circuit.state == CircuitState.HALF_OPEN
+    assert circuit.can_execute()
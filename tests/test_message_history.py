@@ -0,0 +1,80 @@
+import json
+
+from itak.agents.message_history import MessageHistory
+from itak.agents.parser import AgentAction
+
+
+def _step(n: int, size: int = 2000) -> AgentAction:
+    observation = f"result {n} " + "x" * size
+    text = f"Thought: step {n}\nAction: search\nAction Input: {{\"q\": {n}}}"
+    return AgentAction(
+        thought=f"step {n}",
+        tool="search",
+        tool_input=f'{{"q": {n}}}',
+        text=f"{text}\nObservation: {observation}",
+        result=observation,
+    )
+
+
+def _prompt_size(messages) -> int:
+    return sum(len(m["content"]) for m in messages)
+
+
+def test_prompt_size_stays_bounded_over_many_iterations():
+    history = MessageHistory(keep_last=3, keep_stubs=2, max_summary_lines=4)
+    messages = [{"role": "user", "content": "task"}]
+    sizes = []
+    for n in range(20):
+        history.append_step(messages, _step(n))
+        sizes.append(_prompt_size(messages))
+
+    assert messages[0]["content"] == "task"
+    assert len(messages) == 1 + 1 + 2 + 3
+    assert "(11 earlier steps omitted)" in messages[1]["content"]
+    # Once the summary is full the prompt stops growing.
+    assert max(sizes[10:]) - min(sizes[10:]) < 50
+    assert sizes[-1] < 3 * 2100 + 2 * 600 + 600
+
+
+def test_recent_observations_stay_verbatim_and_old_ones_are_stubbed():
+    history = MessageHistory(keep_last=2, keep_stubs=5)
+    messages = []
+    steps = [_step(n) for n in range(4)]
+    for step in steps:
+        history.append_step(messages, step)
+
+    assert [m["content"] for m in messages[-2:]] == [s.text for s in steps[-2:]]
+    assert "obs-1, 2009 chars elided" in messages[0]["content"]
+    assert "recall_observation" in messages[0]["content"]
+    assert messages[0]["content"].startswith("Thought: step 0")
+
+
+def test_elided_observation_can_be_recalled():
+    history = MessageHistory(keep_last=1, keep_stubs=0)
+    messages = []
+    for n in range(5):
+        history.append_step(messages, _step(n))
+
+    summary = messages[0]["content"]
+    assert summary.count("\n- search(") == 4
+    assert history.recall(json.dumps({"observation_id": "obs-1"})) == _step(0).result
+    assert history.recall("obs-2") == _step(1).result
+    assert "No stored observation" in history.recall("obs-99")
+
+
+def test_short_observations_are_not_elided():
+    history = MessageHistory(keep_last=1, keep_stubs=5)
+    messages = []
+    steps = [_step(n, size=10) for n in range(3)]
+    for step in steps:
+        history.append_step(messages, step)
+
+    assert [m["content"] for m in messages] == [s.text for s in steps]
+
+
+def test_store_evicts_oldest_observations():
+    history = MessageHistory(max_stored=2)
+    ids = [history.store(str(n)) for n in range(3)]
+
+    assert "No stored observation" in history.recall(ids[0])
+    assert history.recall(ids[2]) == "2"
@@ -0,0 +1,139 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from itak.events.event_bus import iTaK_event_bus
+from itak.events.types.tool_usage_events import ToolUsageFinishedEvent
+from itak.llms.base_llm import BaseLLM, NativeToolCall
+from itak.tools.base_tool import BaseTool
+
+
+class _FakeLLM(BaseLLM):
+    def call(self, messages, *args, **kwargs):
+        return ""
+
+
+class _SlowSearch(BaseTool):
+    name: str = "search"
+    description: str = "Slow search."
+
+    def _run(self, query: str) -> str:
+        time.sleep(0.2)
+        return f"results for {query}"
+
+
+class _Counter(BaseTool):
+    name: str = "counter"
+    description: str = "Not safe to run concurrently."
+    parallel_safe: bool = False
+    active: int = 0
+    peak: int = 0
+
+    def _run(self, step: int) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        self.active -= 1
+        return f"step {step}"
+
+
+def _calls(name: str, key: str, count: int) -> list[NativeToolCall]:
+    return [NativeToolCall(f"call_{i}", name, {key: i}) for i in range(count)]
+
+
+def test_independent_calls_run_concurrently_in_call_order():
+    search = _SlowSearch()
+    llm = _FakeLLM(model="fake")
+
+    start = time.perf_counter()
+    results = llm._handle_tool_executions(
+        _calls("search", "query", 4), {"search": search.to_structured_tool().func}
+    )
+
+    assert time.perf_counter() - start < 0.6
+    assert results == [f"results for {i}" for i in range(4)]
+
+
+def test_combined_result_labels_each_call():
+    search = _SlowSearch()
+    llm = _FakeLLM(model="fake")
+
+    result = llm._handle_tool_calls(
+        _calls("search", "query", 2), {"search": search._run}
+    )
+
+    assert result == (
+        "Result of search (call call_0):\nresults for 0\n\n"
+        "Result of search (call call_1):\nresults for 1"
+    )
+    single = llm._handle_tool_calls(
+        _calls("search", "query", 1), {"search": search._run}
+    )
+    assert single == "results for 0"
+
+
+def test_unsafe_tools_run_one_at_a_time():
+    counter = _Counter()
+    llm = _FakeLLM(model="fake")
+
+    results = llm._handle_tool_executions(
+        _calls("counter", "step", 4), {"counter": counter._run}
+    )
+
+    assert results == [f"step {i}" for i in range(4)]
+    assert counter.peak == 1
+
+
+def test_agent_cap_limits_concurrency():
+    seen: set[int] = set()
+    lock = threading.Lock()
+
+    def record(query: int) -> str:
+        with lock:
+            seen.add(threading.get_ident())
+        time.sleep(0.05)
+        return str(query)
+
+    llm = _FakeLLM(model="fake")
+    agent = SimpleNamespace(id="a1", role="tester", max_parallel_tool_calls=1)
+
+    results = llm._handle_tool_executions(
+        _calls("record", "query", 3), {"record": record}, from_agent=agent
+    )
+
+    assert results == ["0", "1", "2"]
+    assert seen == {threading.get_ident()}
+
+
+def test_each_call_emits_tool_events():
+    search = _SlowSearch()
+    llm = _FakeLLM(model="fake")
+    finished: list[str] = []
+    done = threading.Event()
+
+    with iTaK_event_bus.scoped_handlers():
+
+        @iTaK_event_bus.on(ToolUsageFinishedEvent)
+        def _on_finished(source, event):
+            finished.append(event.output)
+            if len(finished) == 3:
+                done.set()
+
+        llm._handle_tool_executions(
+            _calls("search", "query", 3), {"search": search._run}
+        )
+        assert done.wait(5)
+
+    assert sorted(finished) == [f"results for {i}" for i in range(3)]
+
+
+def test_usage_limited_tools_run_one_at_a_time():
+    counter = _Counter(parallel_safe=True, max_usage_count=2)
+    llm = _FakeLLM(model="fake")
+
+    results = llm._handle_tool_executions(
+        _calls("counter", "step", 3), {"counter": counter.to_structured_tool().func}
+    )
+
+    assert results == [f"step {i}" for i in range(3)]
+    assert counter.peak == 1
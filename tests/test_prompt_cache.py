@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from itak.tools.base_tool import BaseTool
+from itak.utilities import prompt_cache
+from itak.utilities.agent_utils import parse_tools
+from itak.utilities.prompt_cache import PromptCompiler, tool_args_json
+from itak.utilities.prompts import Prompts
+
+
+class _SearchArgs(BaseModel):
+    query: str
+
+
+class _Search(BaseTool):
+    name: str = "search"
+    description: str = "Search the web."
+    args_schema: type[BaseModel] = _SearchArgs
+
+    def _run(self, query: str) -> str:
+        return query
+
+
+def _agent(goal: str = "Find things") -> SimpleNamespace:
+    return SimpleNamespace(role="Researcher", goal=goal, backstory="Curious.")
+
+
+def test_tool_schema_is_generated_once_per_schema_class(monkeypatch):
+    class Args(BaseModel):
+        value: int
+
+    calls = []
+    generate = prompt_cache.generate_model_description
+    monkeypatch.setattr(
+        prompt_cache,
+        "generate_model_description",
+        lambda model: calls.append(model) or generate(model),
+    )
+
+    first = tool_args_json(Args)
+    assert tool_args_json(Args) is first
+    assert calls == [Args]
+    assert '"value"' in first
+
+
+def test_structured_tool_args_are_cached_but_not_shared():
+    tool = _Search().to_structured_tool()
+
+    args = tool.args
+    args["extra"] = {}
+
+    assert tool.args == {"query": {"title": "Query", "type": "string"}}
+
+
+def test_rendered_tools_survive_reparsing_and_follow_changes():
+    compiler = PromptCompiler()
+    search = _Search()
+
+    first = compiler.render_tools(parse_tools([search]))
+    second = compiler.render_tools(parse_tools([search]))
+
+    assert second is first
+    assert first[0] == "search"
+    assert compiler.hits == 1
+
+    search.description = "Changed."
+    assert compiler.render_tools(parse_tools([search]))[1] == "Changed."
+
+
+def test_compiled_prompt_is_keyed_by_agent_inputs():
+    compiler = PromptCompiler()
+
+    first = compiler.task_execution(Prompts(agent=_agent(), has_tools=True))
+    again = compiler.task_execution(Prompts(agent=_agent(), has_tools=True))
+    other = compiler.task_execution(Prompts(agent=_agent("Other"), has_tools=True))
+
+    assert again == first
+    assert again is not first
+    assert "Find things" in first["prompt"]
+    assert "Other" in other["prompt"]
+    assert compiler.hits == 1
+    assert compiler.misses == 2
+
+
+def test_cache_is_bounded():
+    compiler = PromptCompiler(max_entries=2)
+    for goal in ("a", "b", "c"):
+        compiler.task_execution(Prompts(agent=_agent(goal)))
+
+    compiler.task_execution(Prompts(agent=_agent("a")))
+
+    assert compiler.hits == 0
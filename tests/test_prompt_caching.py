@@ -0,0 +1,114 @@
+import json
+
+import httpx
+import pytest
+
+from itak.llms.providers.utils.prompt_caching import (
+    PromptCachePlanner,
+    apply_anthropic_cache_control,
+    apply_bedrock_cache_points,
+)
+
+
+def _agent_messages(turns: int) -> list[dict]:
+    messages = [{"role": "user", "content": "Task: research the topic."}]
+    for i in range(turns):
+        messages.append({"role": "assistant", "content": f"Thought {i}"})
+        messages.append({"role": "user", "content": f"Observation {i}"})
+    return messages
+
+
+def test_anthropic_breakpoints_follow_stable_prefix():
+    planner = PromptCachePlanner()
+    params = {
+        "model": "claude-sonnet-4",
+        "system": "You are a researcher.",
+        "tools": [{"name": "a"}, {"name": "b"}],
+        "messages": _agent_messages(1),
+    }
+
+    sent = apply_anthropic_cache_control(params, planner)
+
+    assert sent["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in sent["tools"][0]
+    assert sent["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert sent["messages"][-1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert params["messages"][-1]["content"] == "Observation 0"
+
+    rewritten = _agent_messages(3)
+    rewritten[2] = {"role": "user", "content": "Summary of observations"}
+    sent = apply_anthropic_cache_control({**params, "messages": rewritten}, planner)
+
+    marked = [
+        i
+        for i, m in enumerate(sent["messages"])
+        if isinstance(m["content"], list) and "cache_control" in m["content"][-1]
+    ]
+    assert marked == [1, len(rewritten) - 1]
+
+
+def test_bedrock_cache_points_respect_model_support():
+    body = {
+        "system": [{"text": "You are a researcher."}],
+        "toolConfig": {"tools": [{"toolSpec": {"name": "a"}}]},
+    }
+    messages = [{"role": "user", "content": [{"text": "hi"}]}]
+
+    sent_messages, sent_body = apply_bedrock_cache_points(
+        "anthropic.claude-3-7-sonnet", messages, body, PromptCachePlanner()
+    )
+    assert sent_body["system"][-1] == {"cachePoint": {"type": "default"}}
+    assert sent_body["toolConfig"]["tools"][-1] == {"cachePoint": {"type": "default"}}
+    assert sent_messages[0]["content"][-1] == {"cachePoint": {"type": "default"}}
+    assert messages[0]["content"] == [{"text": "hi"}]
+
+    _, nova_body = apply_bedrock_cache_points(
+        "amazon.nova-pro-v1:0", messages, body, PromptCachePlanner()
+    )
+    assert nova_body["toolConfig"] is body["toolConfig"]
+
+
+def test_anthropic_request_payload_and_cache_usage(monkeypatch):
+    pytest.importorskip("anthropic")
+    from itak.llms.providers.anthropic.completion import AnthropicCompletion
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "model": "claude-sonnet-4",
+                "content": [{"type": "text", "text": "done"}],
+                "stop_reason": "end_turn",
+                "usage": {
+                    "input_tokens": 10,
+                    "output_tokens": 5,
+                    "cache_read_input_tokens": 1000,
+                    "cache_creation_input_tokens": 200,
+                },
+            },
+        )
+
+    llm = AnthropicCompletion(
+        model="claude-sonnet-4",
+        api_key="test",
+        client_params={"http_client": httpx.Client(transport=httpx.MockTransport(handler))},
+    )
+    llm.call(
+        [
+            {"role": "system", "content": "You are a researcher."},
+            {"role": "user", "content": "Research the topic."},
+        ]
+    )
+
+    payload = requests[0]
+    assert payload["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert payload["messages"][-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    usage = llm.get_token_usage_summary()
+    assert usage.cached_prompt_tokens == 1200
+    assert usage.prompt_tokens == 1210
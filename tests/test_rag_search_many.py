@@ -0,0 +1,81 @@
+import chromadb
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+from itak.knowledge.storage.knowledge_storage import KnowledgeStorage
+from itak.rag.chromadb.client import ChromaDBClient
+
+
+class _KeywordEmbedding(EmbeddingFunction[Documents]):
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(len(input))
+        vectors = []
+        for text in input:
+            text = text.lower()
+            vectors.append(
+                [1.0 if "cat" in text else 0.0, 1.0 if "dog" in text else 0.0, 0.1]
+            )
+        return vectors
+
+    @staticmethod
+    def name() -> str:
+        return "keyword-test"
+
+
+def test_search_many_issues_one_batched_query():
+    embedding = _KeywordEmbedding()
+    client = ChromaDBClient(
+        client=chromadb.EphemeralClient(),
+        embedding_function=embedding,
+        default_score_threshold=0.0,
+    )
+    client.add_documents(
+        collection_name="pets",
+        documents=[
+            {"doc_id": "cat", "content": "a cat sleeps"},
+            {"doc_id": "dog", "content": "a dog barks"},
+        ],
+    )
+    embedding.calls.clear()
+
+    results = client.search_many(
+        collection_name="pets", queries=["cat?", "dog?", "cat and dog"], limit=1
+    )
+
+    assert embedding.calls == [3]
+    assert [r[0]["id"] for r in results[:2]] == ["cat", "dog"]
+    assert len(results) == 3
+    assert client.search_many(collection_name="pets", queries=[]) == []
+
+    single = client.search(collection_name="pets", query="dog?", limit=1)
+    assert single[0]["id"] == results[1][0]["id"]
+    assert len(client._collections) == 1
+
+    client.delete_collection(collection_name="pets")
+    assert client._collections == {}
+
+
+def test_knowledge_storage_batches_multiple_queries():
+    embedding = _KeywordEmbedding()
+    storage = KnowledgeStorage(collection_name="pets")
+    storage._client = ChromaDBClient(
+        client=chromadb.EphemeralClient(),
+        embedding_function=embedding,
+        default_score_threshold=0.0,
+    )
+    storage.save(
+        [
+            {"doc_id": "cat", "content": "a cat sleeps"},
+            {"doc_id": "dog", "content": "a dog barks"},
+        ]
+    )
+    embedding.calls.clear()
+
+    results = storage.search(["cat?", "dog?"], limit=2, score_threshold=0.0)
+
+    assert embedding.calls == [2]
+    assert sorted(r["id"] for r in results) == ["cat", "dog"]
+    merged = storage.search(["cat?", "a cat"], limit=5, score_threshold=0.0)
+    assert [r["id"] for r in merged] == ["cat", "dog"]
@@ -31,3 +31,124 @@ def test_ripgrep_wrapper():
 
 if __name__ == "__main__":
     test_ripgrep_wrapper()
+
+
+FAKE_RG = """#!{python}
+import json, sys
+pattern, path = sys.argv[-2], sys.argv[-1]
+if pattern == "(":
+    sys.stderr.write("regex parse error: unclosed group\\n")
+    sys.exit(2)
+for i in range(10_000_000):
+    print(json.dumps({{"type": "match", "data": {{
+        "path": {{"text": path + "/a.py"}},
+        "line_number": i + 1,
+        "lines": {{"text": pattern + "\\n"}},
+    }}}}, separators=(",", ":")), flush=True)
+"""
+
+
+def _fake_rg(tmp_path):
+    import sys
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    rg = bin_dir / "rg"
+    rg.write_text(FAKE_RG.format(python=sys.executable))
+    rg.chmod(0o755)
+    return str(bin_dir)
+
+
+def _tree(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("def helper():\n")
+    (src / "notes.txt").write_text("nothing here\n")
+    return src
+
+
+def test_ripgrep_stops_at_match_budget_and_caches(tmp_path):
+    from itak.tools.ripgrep import RipGrepCache
+
+    src = _tree(tmp_path)
+    rg = RipGrepSearch(bin_dir=_fake_rg(tmp_path), cache=RipGrepCache())
+    result = rg.search("def helper", str(src), max_matches=50, use_cache=True)
+
+    assert result["success"]
+    assert result["count"] == 50
+    assert result["truncated"]
+
+    assert rg.search("def helper", str(src), max_matches=50, use_cache=True).get(
+        "cached"
+    )
+    assert not rg.search("def helper", str(src), max_matches=50).get("cached")
+
+    (src / "b.py").write_text("def other():\n")
+    assert not rg.search(
+        "def helper", str(src), max_matches=50, use_cache=True
+    ).get("cached")
+
+
+def test_ripgrep_cache_sees_edits_to_files_without_matches(tmp_path):
+    from itak.tools.ripgrep import RipGrepCache
+
+    src = _tree(tmp_path)
+    rg = RipGrepSearch(bin_dir=_fake_rg(tmp_path), cache=RipGrepCache())
+    rg.search("def helper", str(src), max_matches=5, use_cache=True)
+    assert rg.search("def helper", str(src), max_matches=5, use_cache=True).get(
+        "cached"
+    )
+
+    # notes.txt never matched, but an edit could make it match.
+    (src / "notes.txt").write_text("def helper(): now it matches\n")
+    assert not rg.search(
+        "def helper", str(src), max_matches=5, use_cache=True
+    ).get("cached")
+
+
+def test_ripgrep_cache_is_skipped_for_large_trees(tmp_path):
+    from itak.tools.ripgrep import RipGrepCache
+
+    src = _tree(tmp_path)
+    rg = RipGrepSearch(
+        bin_dir=_fake_rg(tmp_path), cache=RipGrepCache(max_stamped_files=1)
+    )
+    rg.search("def helper", str(src), max_matches=5, use_cache=True)
+
+    assert not rg.search(
+        "def helper", str(src), max_matches=5, use_cache=True
+    ).get("cached")
+
+
+def test_ripgrep_errors_are_reported_and_not_cached(tmp_path):
+    import asyncio
+    from itak.tools.ripgrep import RipGrepCache
+
+    src = _tree(tmp_path)
+    rg = RipGrepSearch(bin_dir=_fake_rg(tmp_path), cache=RipGrepCache())
+
+    for result in (
+        rg.search("(", str(src), use_cache=True),
+        asyncio.run(rg.asearch("(", str(src), use_cache=True)),
+    ):
+        assert not result["success"]
+        assert "unclosed group" in result["error"]
+        assert not result.get("cached")
+    assert "unclosed group" in RipGrepTool()._format_result(result)
+
+
+def test_ripgrep_async_many(tmp_path):
+    import asyncio
+    from itak.tools.ripgrep import RipGrepCache
+
+    rg = RipGrepSearch(bin_dir=_fake_rg(tmp_path), cache=RipGrepCache())
+    results = asyncio.run(rg.asearch_many([
+        {"pattern": "x", "path": str(tmp_path), "max_matches": 5},
+        {"pattern": "y", "path": str(tmp_path), "max_matches": 3},
+        {"pattern": "z", "path": str(tmp_path), "max_bytes": 1024},
+    ]))
+
+    assert [r["count"] for r in results[:2]] == [5, 3]
+    for pattern, result in zip("xyz", results):
+        assert result["success"]
+        assert result["truncated"]
+        assert {m["content"] for m in result["matches"]} == {pattern}
@@ -0,0 +1,51 @@
+from itak.events.utils.console_formatter import ConsoleFormatter
+from itak.events.utils.stream_renderer import StreamRenderer
+
+
+def test_chunks_accumulate_across_line_boundaries():
+    renderer = StreamRenderer(max_lines=5)
+    for chunk in ["Hel", "lo\nwor", "ld", "\n", "!"]:
+        renderer.append(chunk)
+
+    assert renderer.render() == "Hello\nworld\n!"
+    assert renderer.version == 5
+
+
+def test_oldest_lines_are_evicted():
+    renderer = StreamRenderer(max_lines=3)
+    renderer.append("\n".join(f"line {i}" for i in range(10)))
+
+    assert renderer.render() == "...\nline 7\nline 8\nline 9"
+
+
+def test_long_partial_line_is_joined_once():
+    renderer = StreamRenderer()
+    for _ in range(1000):
+        renderer.append("x")
+
+    assert renderer.render() == "x" * 1000
+    assert renderer._partial == ["x" * 1000]
+    renderer.append("y\nz")
+    assert renderer.render() == "x" * 1000 + "y\nz"
+
+
+def test_reset_clears_text_and_truncation():
+    renderer = StreamRenderer(max_lines=2)
+    renderer.append("a\nb\nc\nd")
+    version = renderer.version
+
+    renderer.reset()
+
+    assert renderer.render() == ""
+    assert renderer.version > version
+    renderer.append("e")
+    assert renderer.render() == "e"
+
+
+def test_new_llm_call_starts_from_an_empty_stream():
+    formatter = ConsoleFormatter(verbose=False)
+    formatter._stream_renderer.append("previous answer")
+
+    formatter.handle_llm_call_started()
+
+    assert formatter._stream_renderer.render() == ""
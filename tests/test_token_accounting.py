@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock
+
+from itak.utilities.token_accounting import HeuristicTokenizer, TokenAccountant
+
+
+def test_token_accountant_budgets_messages():
+    accountant = TokenAccountant(fallback=HeuristicTokenizer(chars_per_token=4))
+    messages = [
+        {"role": "system", "content": "a" * 400},
+        {"role": "user", "content": "b" * 4000},
+    ]
+
+    total = accountant.count_messages(messages, "local-model")
+    assert total > 1100
+    assert accountant.count_messages(messages, "local-model") == total
+
+    llm = MagicMock(model="local-model")
+    llm.get_context_window_size.return_value = 2000
+    assert accountant.fits(messages, llm)
+    llm.get_context_window_size.return_value = 1000
+    assert not accountant.fits(messages, llm)
+
+    pieces = accountant.split("x" * 1000, 100, "local-model")
+    assert len(pieces) == 3
+    assert "".join(pieces) == "x" * 1000
+    assert accountant.truncate("short", 100, "local-model") == "short"
+
+
+def test_token_accountant_registered_tokenizer_wins():
+    accountant = TokenAccountant()
+    exact = HeuristicTokenizer(chars_per_token=1)
+    accountant.register("custom/", exact)
+
+    assert accountant.tokenizer_for("custom/model") is exact
+    assert accountant.count_text("abcd", "custom/model") == 4
+    assert accountant.tokenizer_for("other") is accountant.fallback
+
+
+def test_tool_calls_are_counted():
+    accountant = TokenAccountant(fallback=HeuristicTokenizer(chars_per_token=1))
+    call = {
+        "id": "call_1",
+        "type": "function",
+        "function": {"name": "search", "arguments": '{"query": "weather"}'},
+    }
+    plain = {"role": "assistant", "content": None}
+    with_call = {"role": "assistant", "content": None, "tool_calls": [call]}
+    other_call = {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [{**call, "function": {"name": "search", "arguments": "{}"}}],
+    }
+
+    assert accountant.count_message(with_call) > accountant.count_message(plain) + 40
+    assert accountant.count_message(other_call) < accountant.count_message(with_call)
+    assert accountant.count_message(
+        {"role": "tool", "content": "sunny", "tool_call_id": "call_1"}
+    ) > accountant.count_message({"role": "tool", "content": "sunny"})
+
+
+def test_tiktoken_is_only_used_when_cached_locally(tmp_path, monkeypatch):
+    import hashlib
+    import sys
+    import types
+
+    loaded = []
+    tiktoken = types.ModuleType("tiktoken")
+    tiktoken.registry = types.ModuleType("tiktoken.registry")
+    tiktoken.registry.ENCODINGS = {}
+
+    def get_encoding(name):
+        loaded.append(name)
+        return MagicMock(encode=lambda text, **kwargs: list(text.split()))
+
+    tiktoken.get_encoding = get_encoding
+    monkeypatch.setitem(sys.modules, "tiktoken", tiktoken)
+    monkeypatch.setitem(sys.modules, "tiktoken.registry", tiktoken.registry)
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+
+    accountant = TokenAccountant()
+    assert accountant.tokenizer_for("gpt-4o") is accountant.fallback
+    assert loaded == []
+
+    url = "https://openaipublic.blob.core.windows.net/encodings/o200k_base.tiktoken"
+    (tmp_path / hashlib.sha1(url.encode()).hexdigest()).write_bytes(b"")
+
+    tokenizer = TokenAccountant().tokenizer_for("openai/gpt-4o-mini")
+    assert tokenizer.name == "tiktoken:o200k_base"
+    assert tokenizer.count("three word sentence") == 3
+    assert loaded == ["o200k_base"]
@@ -0,0 +1,111 @@
+import time
+
+from itak.llm import LLM
+from itak.llms.tool_prefetch import MISSING, ToolPrefetcher, is_speculable
+from itak.tools.base_tool import BaseTool
+
+
+class _Lookup(BaseTool):
+    name: str = "lookup"
+    description: str = "Read-only lookup."
+    read_only: bool = True
+    idempotent: bool = True
+
+    def _run(self, key: str) -> str:
+        time.sleep(0.2)
+        return f"value of {key}"
+
+
+class _Write(BaseTool):
+    name: str = "write"
+    description: str = "Has side effects."
+
+    def _run(self, key: str) -> str:
+        return key
+
+
+def _prefetcher(functions):
+    calls: list[tuple[str, dict]] = []
+
+    def execute(name, arguments):
+        calls.append((name, arguments))
+        return functions[name](**arguments)
+
+    return ToolPrefetcher(execute, functions), calls
+
+
+def test_only_read_only_idempotent_tools_are_speculable():
+    assert is_speculable(_Lookup()._run)
+    assert is_speculable(_Lookup().to_structured_tool().func)
+    assert not is_speculable(_Write()._run)
+    assert not is_speculable(print)
+
+
+def test_complete_arguments_start_the_call_before_the_stream_ends():
+    prefetcher, calls = _prefetcher({"lookup": _Lookup()._run})
+
+    assert not prefetcher.offer(0, "lookup", '{"key": ')
+    assert prefetcher.offer(0, "lookup", '{"key": "a"}')
+    # Simulate the rest of the stream while the tool runs.
+    time.sleep(0.25)
+    start = time.perf_counter()
+    result = prefetcher.result(0, "lookup", '{"key": "a"}')
+
+    assert result == "value of a"
+    assert time.perf_counter() - start < 0.1
+    assert calls == [("lookup", {"key": "a"})]
+    assert prefetcher.hits == 1
+    prefetcher.close()
+
+
+def test_calls_are_started_once():
+    prefetcher, calls = _prefetcher({"lookup": _Lookup()._run})
+
+    for _ in range(3):
+        prefetcher.offer(0, "lookup", '{"key": "a"}')
+    prefetcher.result(0, "lookup", '{"key": "a"}')
+
+    assert len(calls) == 1
+    prefetcher.close()
+
+
+def test_tools_with_side_effects_wait_for_the_stream():
+    prefetcher, calls = _prefetcher({"write": _Write()._run})
+
+    assert not prefetcher.offer(0, "write", '{"key": "a"}')
+    assert prefetcher.result(0, "write", '{"key": "a"}') is MISSING
+    assert calls == []
+
+
+def test_changed_arguments_discard_the_speculative_result():
+    prefetcher, _ = _prefetcher({"lookup": _Lookup()._run})
+
+    prefetcher.offer(0, "lookup", '{"key": "a"}')
+
+    assert prefetcher.result(0, "lookup", '{"key": "b"}') is MISSING
+    assert prefetcher.misses == 1
+    prefetcher.close()
+
+
+def test_prefetched_calls_run_concurrently():
+    prefetcher, _ = _prefetcher({"lookup": _Lookup()._run})
+
+    start = time.perf_counter()
+    for i in range(3):
+        prefetcher.offer(i, "lookup", f'{{"key": "{i}"}}')
+    results = [prefetcher.result(i, "lookup", f'{{"key": "{i}"}}') for i in range(3)]
+
+    assert results == ["value of 0", "value of 1", "value of 2"]
+    assert time.perf_counter() - start < 0.5
+    prefetcher.close()
+
+
+def test_native_providers_do_not_forward_speculative_flag():
+    llm = LLM(
+        model="gpt-4o", stream=True, speculative_tool_calls=True, api_key="test"
+    )
+
+    assert not isinstance(llm, LLM)
+    assert "speculative_tool_calls" not in llm.additional_params
+    params = llm._prepare_completion_params([{"role": "user", "content": "hi"}])
+    assert "speculative_tool_calls" not in params
@@ -0,0 +1,186 @@
+import asyncio
+import threading
+
+import httpx
+
+from itak.tools.web_fetch import ResponseCache, WebFetcher
+
+
+PAGES = {
+    "/docs/": '<html><head><title>t</title></head><body><h1>Index</h1>'
+    '<a href="a.html">A</a><a href="b.html#x">B</a><a href="/blog/">Blog</a>'
+    "<script>ignored()</script></body></html>",
+    "/docs/a.html": '<p>Page A</p><a href="b.html">B</a>'
+    '<a href="https://other.example/docs/c.html">C</a>',
+    "/docs/b.html": "<p>Page B</p>" + "<p>filler</p>" * 1000,
+}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    body = PAGES.get(request.url.path)
+    if body is None:
+        return httpx.Response(404)
+    etag = f'"{hash(body)}"'
+    if request.headers.get("if-none-match") == etag:
+        return httpx.Response(304, headers={"etag": etag})
+    return httpx.Response(
+        200, text=body, headers={"etag": etag, "content-type": "text/html"}
+    )
+
+
+def test_fetch_revalidates_with_etag(tmp_path):
+    fetcher = WebFetcher(
+        cache=ResponseCache(str(tmp_path)), transport=httpx.MockTransport(_handler)
+    )
+
+    first = fetcher.fetch("https://example.com/docs/")
+    second = fetcher.fetch("https://example.com/docs/")
+
+    assert first.ok and not first.from_cache
+    assert "Index" in first.text and "ignored" not in first.text
+    assert "https://example.com/docs/b.html" in first.links
+    assert second.from_cache and second.text == first.text
+
+
+def test_crawl_limits_per_host_concurrency(tmp_path):
+    active = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return _handler(request)
+
+    fetcher = WebFetcher(
+        cache=ResponseCache(str(tmp_path)),
+        max_bytes=2000,
+        max_per_host=1,
+        async_transport=httpx.MockTransport(handler),
+    )
+
+    pages = asyncio.run(fetcher.acrawl("https://example.com/docs/"))
+    assert sorted(p.url for p in pages) == [
+        "https://example.com/docs/",
+        "https://example.com/docs/a.html",
+        "https://example.com/docs/b.html",
+    ]
+    assert peak == 1
+    truncated = next(p for p in pages if p.url.endswith("b.html"))
+    assert truncated.truncated
+
+    again = asyncio.run(fetcher.acrawl("https://example.com/docs/"))
+    assert all(p.from_cache for p in again)
+
+
+def test_crawl_stays_on_host_and_under_prefix(tmp_path):
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return _handler(request)
+
+    fetcher = WebFetcher(
+        cache=ResponseCache(str(tmp_path)),
+        async_transport=httpx.MockTransport(handler),
+    )
+    asyncio.run(fetcher.acrawl("https://example.com/docs/"))
+
+    assert sorted(requested) == [
+        "https://example.com/docs/",
+        "https://example.com/docs/a.html",
+        "https://example.com/docs/b.html",
+    ]
+
+
+def test_per_host_limit_does_not_serialize_other_hosts():
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    overall = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal overall
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        overall = max(overall, sum(active.values()))
+        await asyncio.sleep(0.02)
+        active[host] -= 1
+        return httpx.Response(200, text="ok")
+
+    fetcher = WebFetcher(max_per_host=1, async_transport=httpx.MockTransport(handler))
+    urls = [f"https://{host}/{i}" for host in ("a.test", "b.test") for i in range(3)]
+    results = asyncio.run(fetcher.afetch_many(urls))
+
+    assert all(r.ok for r in results)
+    assert peak == {"a.test": 1, "b.test": 1}
+    assert overall == 2
+
+
+def test_fetch_truncates_at_max_bytes():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, text="x" * 10_000, headers={"content-type": "text/plain"}
+        )
+
+    fetcher = WebFetcher(max_bytes=1000, transport=httpx.MockTransport(handler))
+    result = fetcher.fetch("https://example.com/big.txt")
+
+    assert result.truncated
+    assert result.text == "x" * 1000
+
+
+def test_unsolicited_304_is_refetched(tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.headers))
+        if len(requests) == 1:
+            return httpx.Response(304)
+        return httpx.Response(200, text="fresh", headers={"etag": '"v1"'})
+
+    cache = ResponseCache(str(tmp_path))
+    # An entry from an older format: it has validators but no page.
+    cache.put("https://example.com/", {"etag": '"v0"'})
+    fetcher = WebFetcher(cache=cache, transport=httpx.MockTransport(handler))
+
+    result = fetcher.fetch("https://example.com/")
+
+    assert result.ok and result.text == "fresh"
+    assert "if-none-match" not in requests[0]
+    assert requests[1]["cache-control"] == "no-cache"
+
+
+def test_close_releases_async_clients():
+    fetcher = WebFetcher(
+        async_transport=httpx.MockTransport(lambda r: httpx.Response(200, text="ok"))
+    )
+
+    async def fetch_and_close() -> httpx.AsyncClient:
+        await fetcher.afetch("https://example.com/")
+        client = fetcher._loop_state().client
+        await fetcher.aclose()
+        return client
+
+    assert asyncio.run(fetch_and_close()).is_closed
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(
+            fetcher.afetch("https://example.com/"), loop
+        ).result(5)
+        client = next(iter(fetcher._async_state.values())).client
+
+        fetcher.close()
+
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(5)
+        assert client.is_closed
+        assert not fetcher._async_state
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()